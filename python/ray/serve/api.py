@@ -18,7 +18,7 @@ from uvicorn.lifespan.on import LifespanOn
 from ray.actor import ActorHandle
 from ray.serve.common import DeploymentInfo, GoalId, ReplicaTag
 from ray.serve.config import (AutoscalingConfig, DeploymentConfig, HTTPOptions,
-                              ReplicaConfig)
+                              ReplicaConfig, ResponseCacheConfig)
 from ray.serve.constants import (DEFAULT_CHECKPOINT_PATH, HTTP_PROXY_TIMEOUT,
                                  SERVE_CONTROLLER_NAME, MAX_CACHED_HANDLES,
                                  CONTROLLER_MAX_CONCURRENCY)
@@ -393,6 +393,8 @@ def start(
                 - "NoServer" or None: disable HTTP server.
             - num_cpus (int): The number of CPU cores to reserve for each
               internal Serve HTTP proxy actor.  Defaults to 0.
+            - grpc_port (int, None): If set, a gRPC proxy listening on this
+              port is started next to each HTTP proxy. Defaults to None.
         dedicated_cpu (bool): Whether to reserve a CPU core for the internal
           Serve controller actor.  Defaults to False.
     """
@@ -447,11 +449,14 @@ def start(
         detached=detached,
     )
 
-    proxy_handles = ray.get(controller.get_http_proxies.remote())
+    proxy_handles = list(
+        ray.get(controller.get_http_proxies.remote()).values())
+    proxy_handles.extend(
+        ray.get(controller.get_grpc_proxies.remote()).values())
     if len(proxy_handles) > 0:
         try:
             ray.get(
-                [handle.ready.remote() for handle in proxy_handles.values()],
+                [handle.ready.remote() for handle in proxy_handles],
                 timeout=HTTP_PROXY_TIMEOUT,
             )
         except ray.exceptions.GetTimeoutError:
@@ -837,8 +842,9 @@ class Deployment:
                 _autoscaling_config: Optional[Union[Dict,
                                                     AutoscalingConfig]] = None,
                 _graceful_shutdown_wait_loop_s: Optional[float] = None,
-                _graceful_shutdown_timeout_s: Optional[float] = None
-                ) -> "Deployment":
+                _graceful_shutdown_timeout_s: Optional[float] = None,
+                _response_cache_config: Optional[Union[
+                    Dict, ResponseCacheConfig]] = None) -> "Deployment":
         """Return a copy of this deployment with updated options.
 
         Only those options passed in will be updated, all others will remain
@@ -887,6 +893,9 @@ class Deployment:
             new_config.graceful_shutdown_timeout_s = (
                 _graceful_shutdown_timeout_s)
 
+        if _response_cache_config is not None:
+            new_config.response_cache_config = _response_cache_config
+
         return Deployment(
             func_or_class,
             name,
@@ -942,7 +951,9 @@ def deployment(
         max_concurrent_queries: Optional[int] = None,
         _autoscaling_config: Optional[Union[Dict, AutoscalingConfig]] = None,
         _graceful_shutdown_wait_loop_s: Optional[float] = None,
-        _graceful_shutdown_timeout_s: Optional[float] = None
+        _graceful_shutdown_timeout_s: Optional[float] = None,
+        _response_cache_config: Optional[Union[Dict,
+                                               ResponseCacheConfig]] = None
 ) -> Callable[[Callable], Deployment]:
     pass
 
@@ -962,7 +973,9 @@ def deployment(
         max_concurrent_queries: Optional[int] = None,
         _autoscaling_config: Optional[Union[Dict, AutoscalingConfig]] = None,
         _graceful_shutdown_wait_loop_s: Optional[float] = None,
-        _graceful_shutdown_timeout_s: Optional[float] = None
+        _graceful_shutdown_timeout_s: Optional[float] = None,
+        _response_cache_config: Optional[Union[Dict,
+                                               ResponseCacheConfig]] = None
 ) -> Callable[[Callable], Deployment]:
     """Define a Serve deployment.
 
@@ -1006,6 +1019,10 @@ def deployment(
         max_concurrent_queries (Optional[int]): The maximum number of queries
             that will be sent to a replica of this deployment without receiving
             a response. Defaults to 100.
+        _response_cache_config (Optional[Dict, ResponseCacheConfig]):
+            [experimental] Cache responses on each node. Only requests that
+            carry a cache key, set with `handle.options(cache_key=...)` or
+            the `X-Serve-Cache-Key` HTTP header, are cached.
 
     Example:
 
@@ -1044,6 +1061,9 @@ def deployment(
     if _graceful_shutdown_timeout_s is not None:
         config.graceful_shutdown_timeout_s = _graceful_shutdown_timeout_s
 
+    if _response_cache_config is not None:
+        config.response_cache_config = _response_cache_config
+
     def decorator(_func_or_class):
         return Deployment(
             _func_or_class,
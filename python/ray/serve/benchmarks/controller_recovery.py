@@ -0,0 +1,54 @@
+# Measures how long the Serve controller takes to recover its state from the
+# checkpoint after a crash, with a large number of deployments.
+
+import time
+
+import click
+
+import ray
+from ray import serve
+
+
+@click.command()
+@click.option("--num-deployments", type=int, default=1000)
+@click.option("--num-trials", type=int, default=3)
+def main(num_deployments: int, num_trials: int):
+    ray.init(address="auto")
+    client = serve.start(detached=True)
+
+    @serve.deployment(ray_actor_options={"num_cpus": 0})
+    def noop(_):
+        return "hello world"
+
+    start = time.perf_counter()
+    for i in range(num_deployments):
+        noop.options(name=f"noop_{i}").deploy(_blocking=False)
+    print(f"Submitted {num_deployments} deployments in "
+          f"{time.perf_counter() - start:.2f}s")
+
+    while ray.get(client._controller._num_pending_goals.remote()) > 0:
+        time.sleep(1)
+    print(f"All deployments running after "
+          f"{time.perf_counter() - start:.2f}s")
+
+    for trial in range(num_trials):
+        ray.kill(client._controller, no_restart=False)
+        start = time.perf_counter()
+        # Calls block until the restarted controller's constructor, which
+        # recovers the checkpoint, has finished.
+        while True:
+            try:
+                deployments = ray.get(
+                    client._controller.list_deployments.remote())
+                break
+            except ray.exceptions.RayActorError:
+                time.sleep(0.01)
+        assert len(deployments) == num_deployments
+        print(f"Trial {trial}: controller recovered {num_deployments} "
+              f"deployments in {time.perf_counter() - start:.2f}s")
+
+    serve.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# Compares the throughput and latency of the HTTP and gRPC proxies for a noop
+# deployment. Each proxy is given a single CPU so the numbers are per proxy
+# core.
+
+import asyncio
+import time
+
+import aiohttp
+import click
+import grpc
+import pandas as pd
+
+import ray
+from ray import serve
+
+try:
+    from grpc import aio as aiogrpc
+except ImportError:
+    from grpc.experimental import aio as aiogrpc
+
+HTTP_PORT = 8000
+GRPC_PORT = 9000
+
+
+def _identity(x):
+    return x
+
+
+async def run_http_client(num_queries: int, payload: bytes):
+    latency = []
+    async with aiohttp.ClientSession() as session:
+        for _ in range(num_queries):
+            start = time.perf_counter()
+            async with session.post(
+                    f"http://localhost:{HTTP_PORT}/noop",
+                    data=payload) as response:
+                await response.read()
+            latency.append(time.perf_counter() - start)
+    return latency
+
+
+async def run_grpc_client(num_queries: int, payload: bytes):
+    latency = []
+    async with aiogrpc.insecure_channel(f"localhost:{GRPC_PORT}") as channel:
+        stub = channel.unary_unary(
+            "/noop/Call",
+            request_serializer=_identity,
+            response_deserializer=_identity)
+        for _ in range(num_queries):
+            start = time.perf_counter()
+            await stub(payload)
+            latency.append(time.perf_counter() - start)
+    return latency
+
+
+async def run_trial(client_fn, num_clients: int, num_queries: int,
+                    payload: bytes):
+    # Warm up.
+    await asyncio.gather(*[client_fn(10, payload) for _ in range(num_clients)])
+
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *[client_fn(num_queries, payload) for _ in range(num_clients)])
+    duration = time.perf_counter() - start
+
+    latency = pd.Series([t for result in results for t in result]) * 1000
+    return {
+        "throughput_qps": len(latency) / duration,
+        "p50_ms": latency.quantile(0.5),
+        "p99_ms": latency.quantile(0.99),
+    }
+
+
+@click.command()
+@click.option("--num-clients", type=int, default=32)
+@click.option("--num-queries", type=int, default=500)
+@click.option("--payload-size", type=int, default=100)
+@click.option("--num-replicas", type=int, default=4)
+def main(num_clients: int, num_queries: int, payload_size: int,
+         num_replicas: int):
+    ray.init()
+    serve.start(http_options={
+        "port": HTTP_PORT,
+        "grpc_port": GRPC_PORT,
+        "num_cpus": 1,
+    })
+
+    @serve.deployment(
+        num_replicas=num_replicas,
+        route_prefix="/noop",
+        max_concurrent_queries=1000)
+    class Noop:
+        async def __call__(self, request):
+            # HTTP requests are passed as starlette requests, gRPC requests as
+            # the raw request bytes.
+            if isinstance(request, bytes):
+                return request
+            return await request.body()
+
+    Noop.deploy()
+
+    payload = b"x" * payload_size
+    rows = []
+    for protocol, client_fn in [("http", run_http_client),
+                                ("grpc", run_grpc_client)]:
+        result = asyncio.get_event_loop().run_until_complete(
+            run_trial(client_fn, num_clients, num_queries, payload))
+        result["protocol"] = protocol
+        rows.append(result)
+
+    print(f"{num_clients} concurrent clients, {payload_size} byte payloads, "
+          "1 CPU per proxy")
+    print(
+        pd.DataFrame(rows)[["protocol", "throughput_qps", "p50_ms",
+                            "p99_ms"]].to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+# Open-loop load test for a local deployment.
+#
+# Unlike the closed-loop benchmarks in this directory, requests are sent on a
+# fixed arrival schedule (Poisson or bursty) regardless of how many requests
+# are still in flight, so queueing shows up in the measured latencies instead
+# of throttling the client. Latency is measured from the scheduled arrival
+# time to avoid coordinated omission.
+#
+# Each request is broken down using timestamps taken by the client and the
+# replica. All processes run on the same node, so their clocks are shared:
+#   - router_queue: time until the router assigned the request to a replica
+#     (handle traffic only, for HTTP this happens inside the proxy).
+#   - ingress: scheduled arrival until the replica started executing.
+#   - replica_exec: time spent executing inside the replica.
+#   - egress: replica finished executing until the client got the result.
+# The proxy overhead is estimated by comparing HTTP and handle traffic at the
+# same arrival rate.
+
+import asyncio
+import json
+import sys
+import time
+from typing import Dict, List, Optional
+
+import aiohttp
+import click
+import numpy as np
+
+import ray
+from ray import serve
+
+# Percentiles reported for every latency histogram.
+PERCENTILES = {"p50": 50, "p90": 90, "p99": 99, "p999": 99.9}
+# Upper bounds of the reported histogram buckets, in milliseconds.
+HISTOGRAM_BUCKETS_MS = [
+    0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000
+]
+
+
+def arrival_times(pattern: str, rate: float, duration_s: float,
+                  burst_factor: float, burst_period_s: float,
+                  rng: np.random.RandomState) -> List[float]:
+    """Return the arrival offsets (in seconds) of all requests in a trial.
+
+    "poisson" arrivals have exponentially distributed gaps with mean
+    1 / rate. "bursty" arrivals are Poisson at `rate * burst_factor` for the
+    first 1 / burst_factor of every `burst_period_s`, and idle otherwise, so
+    the average rate is the same.
+    """
+    if pattern == "poisson":
+        burst_rate = rate
+        on_duration_s = burst_period_s
+    elif pattern == "bursty":
+        burst_rate = rate * burst_factor
+        on_duration_s = burst_period_s / burst_factor
+    else:
+        raise ValueError(f"Unknown arrival pattern '{pattern}'.")
+
+    times = []
+    t = 0.0
+    while True:
+        t += rng.exponential(1 / burst_rate)
+        # Skip over the idle part of the period.
+        if t % burst_period_s >= on_duration_s:
+            t += burst_period_s - t % burst_period_s
+        if t >= duration_s:
+            return times
+        times.append(t)
+
+
+def summarize(latencies_s: List[float]) -> Dict:
+    if len(latencies_s) == 0:
+        return {}
+
+    latencies_ms = np.array(latencies_s) * 1000
+    summary = {
+        name: float(np.percentile(latencies_ms, q))
+        for name, q in PERCENTILES.items()
+    }
+    summary["mean"] = float(latencies_ms.mean())
+    summary["max"] = float(latencies_ms.max())
+    counts, _ = np.histogram(
+        latencies_ms, bins=[0] + HISTOGRAM_BUCKETS_MS + [np.inf])
+    summary["histogram"] = {
+        "le_ms": HISTOGRAM_BUCKETS_MS + ["inf"],
+        "counts": counts.tolist(),
+    }
+    return summary
+
+
+@serve.deployment(route_prefix="/open_loop")
+class Sleeper:
+    def __init__(self, exec_ms: float):
+        self.exec_s = exec_ms / 1000
+
+    async def __call__(self, *args):
+        start = time.time()
+        if self.exec_s > 0:
+            await asyncio.sleep(self.exec_s)
+        return {"start": start, "end": time.time()}
+
+
+class OpenLoopClient:
+    def __init__(self, protocol: str, session: aiohttp.ClientSession,
+                 http_address: str):
+        self.protocol = protocol
+        self.session = session
+        self.http_address = http_address
+        self.handle = Sleeper.get_handle(sync=False)
+        self.samples = []
+        self.num_errors = 0
+
+    async def send(self, scheduled: float):
+        try:
+            assigned: Optional[float] = None
+            if self.protocol == "handle":
+                ref = await self.handle.remote()
+                assigned = time.time()
+                stamps = await ref
+            else:
+                async with self.session.get(
+                        f"{self.http_address}/open_loop") as response:
+                    response.raise_for_status()
+                    stamps = await response.json()
+            done = time.time()
+        except Exception:
+            self.num_errors += 1
+            return
+
+        self.samples.append({
+            "e2e": done - scheduled,
+            "router_queue": (assigned - scheduled
+                             if assigned is not None else None),
+            "ingress": stamps["start"] - scheduled,
+            "replica_exec": stamps["end"] - stamps["start"],
+            "egress": done - stamps["end"],
+        })
+
+    async def run(self, arrivals: List[float]) -> float:
+        tasks = []
+        start = time.time()
+        for offset in arrivals:
+            delay = start + offset - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(self.send(start + offset)))
+        await asyncio.gather(*tasks)
+        return time.time() - start
+
+
+async def run_trial(protocol: str, pattern: str, rate: float,
+                    arrivals: List[float], http_address: str) -> Dict:
+    connector = aiohttp.TCPConnector(limit=0)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        client = OpenLoopClient(protocol, session, http_address)
+        duration_s = await client.run(arrivals)
+
+    latency_ms = {}
+    for component in [
+            "e2e", "router_queue", "ingress", "replica_exec", "egress"
+    ]:
+        values = [
+            sample[component] for sample in client.samples
+            if sample[component] is not None
+        ]
+        if len(values) > 0:
+            latency_ms[component] = summarize(values)
+
+    return {
+        "protocol": protocol,
+        "pattern": pattern,
+        "target_rate": rate,
+        "num_requests": len(arrivals),
+        "num_errors": client.num_errors,
+        "achieved_rate": len(client.samples) / duration_s,
+        "latency_ms": latency_ms,
+    }
+
+
+def proxy_overhead(results: List[Dict]) -> List[Dict]:
+    """Estimate the HTTP proxy overhead as the difference between HTTP and
+    handle latency outside of the replica, percentile by percentile."""
+    by_key = {(r["protocol"], r["pattern"], r["target_rate"]): r
+              for r in results}
+    overheads = []
+    for (protocol, pattern, rate), http_result in by_key.items():
+        handle_result = by_key.get(("handle", pattern, rate))
+        if protocol != "http" or handle_result is None:
+            continue
+        http_latency = http_result["latency_ms"]
+        handle_latency = handle_result["latency_ms"]
+        if "e2e" not in http_latency or "e2e" not in handle_latency:
+            continue
+
+        overhead = {}
+        for name in PERCENTILES:
+            overhead[name] = (
+                (http_latency["e2e"][name] -
+                 http_latency["replica_exec"][name]) -
+                (handle_latency["e2e"][name] -
+                 handle_latency["replica_exec"][name]))
+        overheads.append({
+            "pattern": pattern,
+            "target_rate": rate,
+            "proxy_overhead_ms": overhead,
+        })
+    return overheads
+
+
+@click.command()
+@click.option(
+    "--rate",
+    "rates",
+    type=float,
+    multiple=True,
+    default=[100, 500],
+    help="Average request rate (requests/s). Can be passed multiple times.")
+@click.option(
+    "--pattern",
+    "patterns",
+    type=click.Choice(["poisson", "bursty"]),
+    multiple=True,
+    default=["poisson", "bursty"])
+@click.option(
+    "--protocol",
+    "protocols",
+    type=click.Choice(["handle", "http"]),
+    multiple=True,
+    default=["handle", "http"])
+@click.option("--duration-s", type=float, default=30)
+@click.option("--burst-factor", type=float, default=5)
+@click.option("--burst-period-s", type=float, default=2)
+@click.option("--exec-ms", type=float, default=1)
+@click.option("--num-replicas", type=int, default=4)
+@click.option("--max-concurrent-queries", type=int, default=100)
+@click.option("--seed", type=int, default=0)
+@click.option(
+    "--output",
+    type=click.Path(),
+    default=None,
+    help="Path to write the JSON results to. Defaults to stdout.")
+def main(rates: List[float], patterns: List[str], protocols: List[str],
+         duration_s: float, burst_factor: float, burst_period_s: float,
+         exec_ms: float, num_replicas: int, max_concurrent_queries: int,
+         seed: int, output: Optional[str]):
+    ray.init()
+    client = serve.start()
+    http_address = client.root_url
+
+    Sleeper.options(
+        num_replicas=num_replicas,
+        max_concurrent_queries=max_concurrent_queries).deploy(exec_ms)
+
+    rng = np.random.RandomState(seed)
+    loop = asyncio.get_event_loop()
+    results = []
+    for pattern in patterns:
+        for rate in rates:
+            # Use the same arrivals for every protocol so they're comparable.
+            arrivals = arrival_times(pattern, rate, duration_s, burst_factor,
+                                     burst_period_s, rng)
+            for protocol in protocols:
+                results.append(
+                    loop.run_until_complete(
+                        run_trial(protocol, pattern, rate, arrivals,
+                                  http_address)))
+
+    report = {
+        "config": {
+            "duration_s": duration_s,
+            "burst_factor": burst_factor,
+            "burst_period_s": burst_period_s,
+            "exec_ms": exec_ms,
+            "num_replicas": num_replicas,
+            "max_concurrent_queries": max_concurrent_queries,
+            "seed": seed,
+        },
+        "results": results,
+        "proxy_overhead": proxy_overhead(results),
+    }
+
+    if output is None:
+        json.dump(report, sys.stdout, indent=2)
+    else:
+        with open(output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# Measures end-to-end latency of sequential pipelines with 3-5 steps, with
+# and without fusing adjacent steps into a single executor.
+
+import asyncio
+import time
+
+import click
+import pandas as pd
+
+import ray
+from ray.serve import pipeline
+from ray.serve.pipeline import node
+from ray.serve.pipeline.common import str_to_execution_mode
+
+
+def build_sequential_pipeline(num_steps: int,
+                              execution_mode: pipeline.ExecutionMode):
+    @pipeline.step(execution_mode=execution_mode)
+    def noop(input_arg):
+        return input_arg
+
+    output = pipeline.INPUT
+    for _ in range(num_steps):
+        output = noop(output)
+    return output.deploy()
+
+
+def run_sync_benchmark(deployed, num_queries: int):
+    latency = []
+    for _ in range(num_queries + 100):
+        start = time.perf_counter()
+        deployed.call(b"hello")
+        latency.append(time.perf_counter() - start)
+
+    # Remove initial samples
+    return latency[100:]
+
+
+async def run_async_benchmark(deployed, num_queries: int):
+    latency = []
+    for _ in range(num_queries + 100):
+        start = time.perf_counter()
+        await deployed.call_async(b"hello")
+        latency.append(time.perf_counter() - start)
+
+    # Remove initial samples
+    return latency[100:]
+
+
+@click.command()
+@click.option("--num-queries", type=int, default=1000)
+@click.option("--execution-mode", type=str, default="actors")
+@click.option("--use-async", is_flag=True, required=False)
+def main(num_queries: int, execution_mode: str, use_async: bool):
+    ray.init()
+
+    execution_mode = str_to_execution_mode(execution_mode)
+    rows = []
+    for num_steps in [3, 4, 5]:
+        for fusion_enabled in [False, True]:
+            node._STEP_FUSION_ENABLED = fusion_enabled
+            deployed = build_sequential_pipeline(num_steps, execution_mode)
+            if use_async:
+                latency = asyncio.get_event_loop().run_until_complete(
+                    run_async_benchmark(deployed, num_queries))
+            else:
+                latency = run_sync_benchmark(deployed, num_queries)
+
+            series = pd.Series(latency) * 1000
+            rows.append({
+                "num_steps": num_steps,
+                "fused": fusion_enabled,
+                "p50_ms": series.quantile(0.5),
+                "p90_ms": series.quantile(0.9),
+                "p99_ms": series.quantile(0.99),
+                "mean_ms": series.mean(),
+            })
+
+    node._STEP_FUSION_ENABLED = True
+    print(f"End-to-end pipeline latency ({execution_mode}, "
+          f"{'async' if use_async else 'sync'} calls)")
+    print(pd.DataFrame(rows).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
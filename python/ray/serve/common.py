@@ -4,7 +4,8 @@ from uuid import UUID
 
 import ray
 from ray.actor import ActorHandle
-from ray.serve.config import DeploymentConfig, ReplicaConfig
+from ray.serve.config import (DeploymentConfig, ReplicaConfig,
+                              ResponseCacheConfig)
 from ray.serve.autoscaling_policy import AutoscalingPolicy
 
 str = str
@@ -107,3 +108,7 @@ class RunningReplicaInfo:
     replica_tag: ReplicaTag
     actor_handle: ActorHandle
     max_concurrent_queries: int
+    response_cache_config: Optional[ResponseCacheConfig] = None
+    # Hash of the DeploymentVersion of the replica. Cached responses are
+    # only served while the running replicas have the same versions.
+    version_hash: Optional[int] = None
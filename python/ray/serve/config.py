@@ -9,7 +9,7 @@ from pydantic import BaseModel, NonNegativeFloat, PositiveInt, validator
 from ray.serve.constants import DEFAULT_HTTP_HOST, DEFAULT_HTTP_PORT
 from ray.serve.generated.serve_pb2 import (
     DeploymentConfig as DeploymentConfigProto, AutoscalingConfig as
-    AutoscalingConfigProto)
+    AutoscalingConfigProto, ResponseCacheConfig as ResponseCacheConfigProto)
 from ray.serve.generated.serve_pb2 import DeploymentLanguage
 
 from ray import cloudpickle as cloudpickle
@@ -56,6 +56,29 @@ class AutoscalingConfig(BaseModel):
     # TODO(architkulkarni): Add pydantic validation.  E.g. max_replicas>=min
 
 
+class ResponseCacheConfig(BaseModel):
+    """Configuration of the per-node response cache of a deployment.
+
+    Requests are only served from the cache if they carry a cache key, set
+    using `handle.options(cache_key=...)` or the `X-Serve-Cache-Key` HTTP
+    header. Please keep these options in sync with those in
+    `src/ray/protobuf/serve.proto`.
+
+    Args:
+        max_entries (int): Maximum number of responses cached per node. The
+            least recently used response is evicted first. Defaults to 1000.
+        ttl_s (float): How long a cached response stays valid. 0 means
+            cached responses never expire. Defaults to 0.
+    """
+
+    max_entries: PositiveInt = 1000
+    ttl_s: NonNegativeFloat = 0.0
+
+    class Config:
+        # Hashable so that it can be part of RunningReplicaInfo.
+        frozen = True
+
+
 class DeploymentConfig(BaseModel):
     """Configuration options for a deployment, to be set by the user.
 
@@ -74,6 +97,8 @@ class DeploymentConfig(BaseModel):
         graceful_shutdown_timeout_s (Optional[float]):
             Controller waits for this duration to forcefully kill the replica
             for shutdown. Defaults to 20s.
+        response_cache_config (Optional[ResponseCacheConfig]): If set,
+            responses to requests with a cache key are cached on each node.
     """
 
     num_replicas: PositiveInt = 1
@@ -85,6 +110,8 @@ class DeploymentConfig(BaseModel):
 
     autoscaling_config: Optional[AutoscalingConfig] = None
 
+    response_cache_config: Optional[ResponseCacheConfig] = None
+
     class Config:
         validate_assignment = True
         extra = "forbid"
@@ -107,6 +134,9 @@ class DeploymentConfig(BaseModel):
         if data.get("autoscaling_config"):
             data["autoscaling_config"] = AutoscalingConfigProto(
                 **data["autoscaling_config"])
+        if data.get("response_cache_config"):
+            data["response_cache_config"] = ResponseCacheConfigProto(
+                **data["response_cache_config"])
         return DeploymentConfigProto(
             is_cross_language=False,
             deployment_language=DeploymentLanguage.PYTHON,
@@ -128,6 +158,9 @@ class DeploymentConfig(BaseModel):
         if "autoscaling_config" in data:
             data["autoscaling_config"] = AutoscalingConfig(
                 **data["autoscaling_config"])
+        if "response_cache_config" in data:
+            data["response_cache_config"] = ResponseCacheConfig(
+                **data["response_cache_config"])
 
         # Delete fields which are only used in protobuf, not in Python.
         del data["is_cross_language"]
@@ -251,6 +284,7 @@ class HTTPOptions(pydantic.BaseModel):
     root_url: str = ""
     fixed_number_replicas: Optional[int] = None
     fixed_number_selection_seed: int = 0
+    grpc_port: Optional[int] = None
 
     @validator("location", always=True)
     def location_backfill_no_server(cls, v, values):
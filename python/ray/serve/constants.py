@@ -4,6 +4,12 @@ SERVE_CONTROLLER_NAME = "SERVE_CONTROLLER_ACTOR"
 #: Actor name used to register HTTP proxy actor
 SERVE_PROXY_NAME = "SERVE_PROXY_ACTOR"
 
+#: Actor name used to register gRPC proxy actor
+SERVE_GRPC_PROXY_NAME = "SERVE_GRPC_PROXY_ACTOR"
+
+#: Actor name used to register the per-node response cache
+SERVE_RESPONSE_CACHE_NAME = "SERVE_RESPONSE_CACHE_ACTOR"
+
 #: HTTP Address
 DEFAULT_HTTP_ADDRESS = "http://127.0.0.1:8000"
 
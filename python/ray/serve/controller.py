@@ -96,6 +96,10 @@ class ServeController:
             controller_name, detached, self.kv_store, self.long_poll_host,
             self.goal_manager, all_current_actor_names)
 
+        # Version of the deployment state that the last serve snapshot was
+        # generated from. The snapshot is only regenerated when it changes.
+        self._snapshot_version: Optional[int] = None
+
         # TODO(simon): move autoscaling related stuff into a manager.
         self.autoscaling_metrics_store = InMemoryMetricsStore()
 
@@ -137,6 +141,10 @@ class ServeController:
         """Returns a dictionary of node ID to http_proxy actor handles."""
         return self.http_state.get_http_proxy_handles()
 
+    def get_grpc_proxies(self) -> Dict[NodeId, ActorHandle]:
+        """Returns a dictionary of node ID to grpc_proxy actor handles."""
+        return self.http_state.get_grpc_proxy_handles()
+
     def autoscale(self) -> None:
         """Updates autoscaling deployments with calculated num_replicas."""
         for deployment_name, (deployment_info,
@@ -207,6 +215,10 @@ class ServeController:
             await asyncio.sleep(CONTROL_LOOP_PERIOD_S)
 
     def _put_serve_snapshot(self) -> None:
+        snapshot_version = self.deployment_state_manager.snapshot_version
+        if snapshot_version == self._snapshot_version:
+            return
+
         val = dict()
         for deployment_name, (deployment_info,
                               route_prefix) in self.list_deployments(
@@ -252,6 +264,7 @@ class ServeController:
 
             val[deployment_name] = entry
         self.snapshot_store.put(SNAPSHOT_KEY, json.dumps(val).encode("utf-8"))
+        self._snapshot_version = snapshot_version
 
     def _all_running_replicas(self) -> Dict[str, List[RunningReplicaInfo]]:
         """Used for testing."""
@@ -3,9 +3,10 @@ import json
 import pickle
 import time
 from collections import defaultdict, OrderedDict
+from contextlib import contextmanager
 from enum import Enum
 import os
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 import ray
 from ray import ObjectRef
@@ -13,7 +14,7 @@ from ray.actor import ActorHandle
 from ray.serve.async_goal_manager import AsyncGoalManager
 from ray.serve.common import (DeploymentInfo, Duration, GoalId, ReplicaTag,
                               ReplicaName, RunningReplicaInfo)
-from ray.serve.config import DeploymentConfig
+from ray.serve.config import DeploymentConfig, ResponseCacheConfig
 from ray.serve.constants import (MAX_DEPLOYMENT_CONSTRUCTOR_RETRY_COUNT,
                                  MAX_NUM_DELETED_DEPLOYMENTS)
 from ray.serve.storage.kv_store import KVStoreBase
@@ -46,7 +47,13 @@ class GoalStatus(Enum):
     FAILED = 5
 
 
+# Legacy key holding a single checkpoint of all deployments. Only read to
+# recover from checkpoints written by older versions.
 CHECKPOINT_KEY = "serve-deployment-state-checkpoint"
+# Names of all checkpointed deployments, each stored under its own key.
+CHECKPOINT_INDEX_KEY = "serve-deployment-state-checkpoint-index"
+DELETED_DEPLOYMENTS_CHECKPOINT_KEY = (
+    "serve-deployment-state-checkpoint-deleted")
 SLOW_STARTUP_WARNING_S = 30
 SLOW_STARTUP_WARNING_PERIOD_S = 30
 
@@ -55,6 +62,10 @@ USE_PLACEMENT_GROUP = os.environ.get("SERVE_USE_PLACEMENT_GROUP", "1") != "0"
 _SCALING_LOG_ENABLED = os.environ.get("SERVE_ENABLE_SCALING_LOG", "0") != "0"
 
 
+def _deployment_checkpoint_key(deployment_name: str) -> str:
+    return f"serve-deployment-state-checkpoint-deployment-{deployment_name}"
+
+
 def print_verbose_scaling_log():
     assert _SCALING_LOG_ENABLED
 
@@ -101,6 +112,7 @@ class ActorReplicaWrapper:
 
         self._actor_resources: Dict[str, float] = None
         self._max_concurrent_queries: int = None
+        self._response_cache_config: Optional[ResponseCacheConfig] = None
         self._graceful_shutdown_timeout_s: float = 0.0
         self._health_check_ref: ObjectRef = None
         # NOTE: storing these is necessary to keep the actor and PG alive in
@@ -134,6 +146,10 @@ class ActorReplicaWrapper:
     def max_concurrent_queries(self) -> int:
         return self._max_concurrent_queries
 
+    @property
+    def response_cache_config(self) -> Optional[ResponseCacheConfig]:
+        return self._response_cache_config
+
     def create_placement_group(self, placement_group_name: str,
                                actor_resources: dict) -> PlacementGroup:
         # Only need one placement group per actor
@@ -170,6 +186,8 @@ class ActorReplicaWrapper:
         self._actor_resources = deployment_info.replica_config.resource_dict
         self._max_concurrent_queries = (
             deployment_info.deployment_config.max_concurrent_queries)
+        self._response_cache_config = (
+            deployment_info.deployment_config.response_cache_config)
         self._graceful_shutdown_timeout_s = (
             deployment_info.deployment_config.graceful_shutdown_timeout_s)
         if USE_PLACEMENT_GROUP:
@@ -271,6 +289,8 @@ class ActorReplicaWrapper:
                 deployment_config, version = ray.get(ready)[0]
                 self._max_concurrent_queries = (
                     deployment_config.max_concurrent_queries)
+                self._response_cache_config = (
+                    deployment_config.response_cache_config)
                 self._graceful_shutdown_timeout_s = (
                     deployment_config.graceful_shutdown_timeout_s)
             except Exception:
@@ -368,6 +388,8 @@ class DeploymentReplica(VersionedReplica):
             replica_tag=self._replica_tag,
             actor_handle=self._actor.actor_handle,
             max_concurrent_queries=self._actor.max_concurrent_queries,
+            response_cache_config=self._actor.response_cache_config,
+            version_hash=hash(self._version),
         )
         return self._actor.get_running_replica_info()
 
@@ -640,6 +662,13 @@ class DeploymentState:
         self._prev_startup_warning: float = time.time()
         self._replica_constructor_retry_counter: int = 0
         self._replicas: ReplicaStateContainer = ReplicaStateContainer()
+        # Incremented whenever the goal or the set of running replicas
+        # changes, used to detect when the serve snapshot is outdated.
+        self._state_version: int = 0
+
+    @property
+    def state_version(self) -> int:
+        return self._state_version
 
     def get_target_state_checkpoint_data(self):
         """
@@ -701,6 +730,7 @@ class DeploymentState:
         ]
 
     def _notify_running_replicas_changed(self):
+        self._state_version += 1
         self._long_poll_host.notify_changed(
             (LongPollNamespace.RUNNING_REPLICAS, self._name),
             self.get_running_replica_infos(),
@@ -718,6 +748,7 @@ class DeploymentState:
         """
         existing_goal_id = self._curr_goal
         new_goal_id = self._goal_manager.create_goal()
+        self._state_version += 1
 
         if deployment_info is not None:
             self._target_info = deployment_info
@@ -1197,12 +1228,24 @@ class DeploymentStateManager:
         self._long_poll_host = long_poll_host
         self._goal_manager = goal_manager
         self._create_deployment_state: Callable = lambda name: DeploymentState(
-            name, controller_name, detached,
-            long_poll_host, goal_manager, self._save_checkpoint_func)
+            name, controller_name, detached, long_poll_host, goal_manager,
+            lambda: self._save_checkpoint_func(name))
         self._deployment_states: Dict[str, DeploymentState] = dict()
         self._deleted_deployment_metadata: Dict[
             str, DeploymentInfo] = OrderedDict()
 
+        # Each deployment is checkpointed under its own key so that a state
+        # change only rewrites the deployments it touched. Writes made while
+        # checkpoints are coalesced are flushed together at the end.
+        self._dirty_deployments: Set[str] = set()
+        self._deleted_deployments_dirty: bool = False
+        self._checkpointed_deployments: Set[str] = set()
+        self._coalescing_checkpoints: bool = False
+
+        # Incremented whenever the state reported in the serve snapshot
+        # changes, so the controller only regenerates it when needed.
+        self._snapshot_version: int = 0
+
         self._recover_from_checkpoint(all_current_actor_names)
 
     def _map_actor_names_to_deployment(
@@ -1247,11 +1290,8 @@ class DeploymentStateManager:
         """
         deployment_to_current_replicas = self._map_actor_names_to_deployment(
             all_current_actor_names)
-        checkpoint = self._kv_store.get(CHECKPOINT_KEY)
-        if checkpoint is not None:
-            (deployment_state_info,
-             self._deleted_deployment_metadata) = pickle.loads(checkpoint)
-
+        deployment_state_info = self._load_checkpoint()
+        if deployment_state_info is not None:
             for deployment_tag, checkpoint_data in deployment_state_info.items(
             ):
                 deployment_state = self._create_deployment_state(
@@ -1265,6 +1305,45 @@ class DeploymentStateManager:
                         deployment_to_current_replicas[deployment_tag])
                 self._deployment_states[deployment_tag] = deployment_state
 
+        # Migrate a legacy checkpoint to per-deployment keys.
+        if self._kv_store.get(CHECKPOINT_KEY) is not None:
+            self._save_checkpoint_func()
+            self._kv_store.delete(CHECKPOINT_KEY)
+
+    def _load_checkpoint(self) -> Optional[Dict[str, Any]]:
+        """Load the checkpoint data of all deployments from the KV store.
+
+        Returns None if no checkpoint was found.
+        """
+        index = self._kv_store.get(CHECKPOINT_INDEX_KEY)
+        if index is None:
+            checkpoint = self._kv_store.get(CHECKPOINT_KEY)
+            if checkpoint is None:
+                return None
+            (deployment_state_info,
+             self._deleted_deployment_metadata) = pickle.loads(checkpoint)
+            return deployment_state_info
+
+        deleted_checkpoint = self._kv_store.get(
+            DELETED_DEPLOYMENTS_CHECKPOINT_KEY)
+        if deleted_checkpoint is not None:
+            self._deleted_deployment_metadata = pickle.loads(
+                deleted_checkpoint)
+
+        deployment_state_info = {}
+        for deployment_name in pickle.loads(index):
+            checkpoint = self._kv_store.get(
+                _deployment_checkpoint_key(deployment_name))
+            if checkpoint is not None:
+                deployment_state_info[deployment_name] = pickle.loads(
+                    checkpoint)
+        self._checkpointed_deployments = set(deployment_state_info.keys())
+        return deployment_state_info
+
+    @property
+    def snapshot_version(self) -> int:
+        return self._snapshot_version
+
     def shutdown(self) -> List[GoalId]:
         """
         Shutdown all running replicas by notifying the controller, and leave
@@ -1278,33 +1357,86 @@ class DeploymentStateManager:
         """
 
         shutdown_goals = []
-        for deployment_state in self._deployment_states.values():
-            goal = deployment_state.delete()
-            if goal is not None:
-                shutdown_goals.append(goal)
+        with self._coalesce_checkpoints():
+            for deployment_state in self._deployment_states.values():
+                goal = deployment_state.delete()
+                if goal is not None:
+                    shutdown_goals.append(goal)
+        self._snapshot_version += 1
 
         # TODO(jiaodong): This might not be 100% safe since we deleted
         # everything without ensuring all shutdown goals are completed
         # yet. Need to address in follow-up PRs.
+        for deployment_name in self._checkpointed_deployments:
+            self._kv_store.delete(_deployment_checkpoint_key(deployment_name))
+        self._checkpointed_deployments = set()
+        self._kv_store.delete(CHECKPOINT_INDEX_KEY)
+        self._kv_store.delete(DELETED_DEPLOYMENTS_CHECKPOINT_KEY)
         self._kv_store.delete(CHECKPOINT_KEY)
 
         # TODO(jiaodong): Need to add some logic to prevent new replicas
         # from being created once shutdown signal is sent.
         return shutdown_goals
 
-    def _save_checkpoint_func(self) -> None:
-        deployment_state_info = {
-            deployment_name: deployment_state.get_checkpoint_data()
-            for deployment_name, deployment_state in
-            self._deployment_states.items()
-        }
-        self._kv_store.put(
-            CHECKPOINT_KEY,
-            # NOTE(simon): Make sure to use pickle so we don't save any ray
-            # object that relies on external state (e.g. gcs). For code object,
-            # we are explicitly using cloudpickle to serialize them.
-            pickle.dumps((deployment_state_info,
-                          self._deleted_deployment_metadata)))
+    def _save_checkpoint_func(self,
+                              deployment_name: Optional[str] = None) -> None:
+        """Checkpoint the given deployment, or all of them if None.
+
+        The checkpoint is written before returning unless checkpoints are
+        being coalesced, in which case it's written at the end of the
+        enclosing _coalesce_checkpoints() block.
+        """
+        if deployment_name is None:
+            self._dirty_deployments.update(self._deployment_states.keys())
+            self._deleted_deployments_dirty = True
+        else:
+            self._dirty_deployments.add(deployment_name)
+
+        if not self._coalescing_checkpoints:
+            self._flush_checkpoint()
+
+    @contextmanager
+    def _coalesce_checkpoints(self):
+        """Batch all checkpoint writes made in this block into one flush."""
+        self._coalescing_checkpoints = True
+        try:
+            yield
+        finally:
+            self._coalescing_checkpoints = False
+            self._flush_checkpoint()
+
+    def _flush_checkpoint(self) -> None:
+        """Write the dirty parts of the checkpoint to the KV store.
+
+        Deployment keys are written before the index and only deleted after
+        it, so the index never references a missing deployment.
+        """
+        # NOTE(simon): Make sure to use pickle so we don't save any ray
+        # object that relies on external state (e.g. gcs). For code object,
+        # we are explicitly using cloudpickle to serialize them.
+        for deployment_name in self._dirty_deployments:
+            if deployment_name in self._deployment_states:
+                self._kv_store.put(
+                    _deployment_checkpoint_key(deployment_name),
+                    pickle.dumps(self._deployment_states[deployment_name]
+                                 .get_checkpoint_data()))
+        self._dirty_deployments.clear()
+
+        if self._deleted_deployments_dirty:
+            self._kv_store.put(
+                DELETED_DEPLOYMENTS_CHECKPOINT_KEY,
+                pickle.dumps(self._deleted_deployment_metadata))
+            self._deleted_deployments_dirty = False
+
+        deployment_names = set(self._deployment_states.keys())
+        if deployment_names != self._checkpointed_deployments:
+            self._kv_store.put(CHECKPOINT_INDEX_KEY,
+                               pickle.dumps(sorted(deployment_names)))
+            for deployment_name in (self._checkpointed_deployments -
+                                    deployment_names):
+                self._kv_store.delete(
+                    _deployment_checkpoint_key(deployment_name))
+            self._checkpointed_deployments = deployment_names
 
     def get_running_replica_infos(
             self,
@@ -1363,13 +1495,18 @@ class DeploymentStateManager:
         """
         if deployment_name in self._deleted_deployment_metadata:
             del self._deleted_deployment_metadata[deployment_name]
+            self._deleted_deployments_dirty = True
 
         if deployment_name not in self._deployment_states:
             self._deployment_states[
                 deployment_name] = self._create_deployment_state(
                     deployment_name)
 
-        return self._deployment_states[deployment_name].deploy(deployment_info)
+        goal_id, updating = self._deployment_states[deployment_name].deploy(
+            deployment_info)
+        if updating:
+            self._snapshot_version += 1
+        return goal_id, updating
 
     def delete_deployment(self, deployment_name: str) -> Optional[GoalId]:
         # This method must be idempotent. We should validate that the
@@ -1378,23 +1515,32 @@ class DeploymentStateManager:
             return None
 
         deployment_state = self._deployment_states[deployment_name]
+        self._snapshot_version += 1
         return deployment_state.delete()
 
     def update(self) -> bool:
         """Updates the state of all deployments to match their goal state."""
         deleted_tags = []
-        for deployment_name, deployment_state in self._deployment_states.items(
-        ):
-            deleted = deployment_state.update()
-            if deleted:
-                deleted_tags.append(deployment_name)
-                deployment_info = deployment_state.target_info
-                deployment_info.end_time_ms = int(time.time() * 1000)
-                if (len(self._deleted_deployment_metadata) >
-                        MAX_NUM_DELETED_DEPLOYMENTS):
-                    self._deleted_deployment_metadata.popitem(last=False)
-                self._deleted_deployment_metadata[
-                    deployment_name] = deployment_info
-
-        for tag in deleted_tags:
-            del self._deployment_states[tag]
+        with self._coalesce_checkpoints():
+            for deployment_name, deployment_state in (
+                    self._deployment_states.items()):
+                prev_state_version = deployment_state.state_version
+                deleted = deployment_state.update()
+                if deployment_state.state_version != prev_state_version:
+                    self._snapshot_version += 1
+                if deleted:
+                    deleted_tags.append(deployment_name)
+                    deployment_info = deployment_state.target_info
+                    deployment_info.end_time_ms = int(time.time() * 1000)
+                    if (len(self._deleted_deployment_metadata) >
+                            MAX_NUM_DELETED_DEPLOYMENTS):
+                        self._deleted_deployment_metadata.popitem(last=False)
+                    self._deleted_deployment_metadata[
+                        deployment_name] = deployment_info
+
+            for tag in deleted_tags:
+                del self._deployment_states[tag]
+
+            if len(deleted_tags) > 0:
+                self._deleted_deployments_dirty = True
+                self._snapshot_version += 1
@@ -6,7 +6,15 @@ from ray.serve.long_poll import LongPollNamespace
 from ray.serve.storage.kv_store import KVStoreBase
 from ray.serve.long_poll import LongPollHost
 
+# Legacy key holding a single checkpoint of all endpoints. Only read to
+# recover from checkpoints written by older versions.
 CHECKPOINT_KEY = "serve-endpoint-state-checkpoint"
+# Tags of all checkpointed endpoints, each stored under its own key.
+CHECKPOINT_INDEX_KEY = "serve-endpoint-state-checkpoint-index"
+
+
+def _endpoint_checkpoint_key(endpoint: EndpointTag) -> str:
+    return f"serve-endpoint-state-checkpoint-endpoint-{endpoint}"
 
 
 class EndpointState:
@@ -21,17 +29,48 @@ class EndpointState:
         self._long_poll_host = long_poll_host
         self._endpoints: Dict[EndpointTag, EndpointInfo] = dict()
 
-        checkpoint = self._kv_store.get(CHECKPOINT_KEY)
-        if checkpoint is not None:
-            self._endpoints = cloudpickle.loads(checkpoint)
+        index = self._kv_store.get(CHECKPOINT_INDEX_KEY)
+        if index is not None:
+            for endpoint in cloudpickle.loads(index):
+                checkpoint = self._kv_store.get(
+                    _endpoint_checkpoint_key(endpoint))
+                if checkpoint is not None:
+                    self._endpoints[endpoint] = cloudpickle.loads(checkpoint)
+        else:
+            checkpoint = self._kv_store.get(CHECKPOINT_KEY)
+            if checkpoint is not None:
+                self._endpoints = cloudpickle.loads(checkpoint)
+                # Migrate the legacy checkpoint to per-endpoint keys.
+                for endpoint in self._endpoints:
+                    self._checkpoint(endpoint, index_changed=False)
+                self._kv_store.put(
+                    CHECKPOINT_INDEX_KEY,
+                    cloudpickle.dumps(list(self._endpoints.keys())))
+                self._kv_store.delete(CHECKPOINT_KEY)
 
         self._notify_route_table_changed()
 
     def shutdown(self):
+        for endpoint in self._endpoints:
+            self._kv_store.delete(_endpoint_checkpoint_key(endpoint))
+        self._kv_store.delete(CHECKPOINT_INDEX_KEY)
         self._kv_store.delete(CHECKPOINT_KEY)
 
-    def _checkpoint(self):
-        self._kv_store.put(CHECKPOINT_KEY, cloudpickle.dumps(self._endpoints))
+    def _checkpoint(self, endpoint: EndpointTag, index_changed: bool):
+        """Checkpoint a single endpoint that was created, updated or deleted.
+
+        The endpoint's own key is written before the index and only deleted
+        after it, so the index never references a missing endpoint.
+        """
+        if endpoint in self._endpoints:
+            self._kv_store.put(
+                _endpoint_checkpoint_key(endpoint),
+                cloudpickle.dumps(self._endpoints[endpoint]))
+        if index_changed:
+            self._kv_store.put(CHECKPOINT_INDEX_KEY,
+                               cloudpickle.dumps(list(self._endpoints.keys())))
+        if endpoint not in self._endpoints:
+            self._kv_store.delete(_endpoint_checkpoint_key(endpoint))
 
     def _notify_route_table_changed(self):
         self._long_poll_host.notify_changed(LongPollNamespace.ROUTE_TABLE,
@@ -60,13 +99,14 @@ class EndpointState:
             raise ValueError(
                 f"route_prefix '{endpoint_info.route}' is already registered.")
 
-        if endpoint in self._endpoints:
+        is_new_endpoint = endpoint not in self._endpoints
+        if not is_new_endpoint:
             if (self._endpoints[endpoint] == endpoint_info):
                 return
 
         self._endpoints[endpoint] = endpoint_info
 
-        self._checkpoint()
+        self._checkpoint(endpoint, index_changed=is_new_endpoint)
         self._notify_route_table_changed()
 
     def get_endpoint_route(self, endpoint: EndpointTag) -> Optional[str]:
@@ -90,5 +130,5 @@ class EndpointState:
 
         del self._endpoints[endpoint]
 
-        self._checkpoint()
+        self._checkpoint(endpoint, index_changed=True)
         self._notify_route_table_changed()
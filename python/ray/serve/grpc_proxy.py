@@ -0,0 +1,190 @@
+import asyncio
+import time
+from typing import Dict
+
+import grpc
+try:
+    from grpc import aio as aiogrpc
+except ImportError:
+    from grpc.experimental import aio as aiogrpc
+
+import ray
+from ray import serve
+from ray.exceptions import RayActorError, RayTaskError
+from ray.serve.common import EndpointInfo, EndpointTag
+from ray.serve.handle import DEFAULT
+from ray.serve.http_proxy import (LongestPrefixRouter,
+                                  MAX_REPLICA_FAILURE_RETRIES)
+from ray.serve.long_poll import LongPollClient, LongPollNamespace
+from ray.serve.utils import logger
+from ray.util import metrics
+
+
+class GRPCProxy:
+    """Routes unary gRPC calls to deployments.
+
+    Requests are matched against the route table using the gRPC method path
+    (e.g. `/my.package.Service/Method`), or the `x-serve-route` metadata key
+    if provided. The request message is passed to the deployment as raw
+    protobuf bytes without being decoded, and the deployment must return the
+    serialized response message as bytes.
+    """
+
+    def __init__(self, controller_name: str, controller_namespace: str):
+        # Set the controller name so that serve will connect to the
+        # controller instance this proxy is running in.
+        ray.serve.api._set_internal_replica_context(None, None,
+                                                    controller_name, None)
+
+        # Used only for displaying the route table.
+        self.route_info: Dict[str, EndpointTag] = dict()
+
+        def get_handle(name):
+            return serve.api._get_global_client().get_handle(
+                name, sync=False, missing_ok=True)
+
+        self.prefix_router = LongestPrefixRouter(get_handle)
+        self.long_poll_client = LongPollClient(
+            ray.get_actor(controller_name, namespace=controller_namespace), {
+                LongPollNamespace.ROUTE_TABLE: self._update_routes,
+            },
+            call_in_event_loop=asyncio.get_event_loop())
+        self.request_counter = metrics.Counter(
+            "serve_num_grpc_requests",
+            description="The number of gRPC requests processed.",
+            tag_keys=("route", ))
+
+    def _update_routes(self,
+                       endpoints: Dict[EndpointTag, EndpointInfo]) -> None:
+        self.route_info: Dict[str, EndpointTag] = dict()
+        for endpoint, info in endpoints.items():
+            route = info.route if info.route is not None else f"/{endpoint}"
+            self.route_info[route] = endpoint
+
+        self.prefix_router.update_routes(endpoints)
+
+    async def block_until_endpoint_exists(self, endpoint: EndpointTag,
+                                          timeout_s: float):
+        start = time.time()
+        while True:
+            if time.time() - start > timeout_s:
+                raise TimeoutError(
+                    f"Waited {timeout_s} for {endpoint} to propagate.")
+            for existing_endpoint in self.route_info.values():
+                if existing_endpoint == endpoint:
+                    return
+            await asyncio.sleep(0.2)
+
+    async def handle_request(self, method: str, request: bytes,
+                             context: aiogrpc.ServicerContext) -> bytes:
+        metadata = dict(context.invocation_metadata())
+        route = metadata.get("x-serve-route", method)
+        self.request_counter.inc(tags={"route": route})
+
+        route_prefix, handle = self.prefix_router.match_route(route)
+        if route_prefix is None:
+            await context.abort(grpc.StatusCode.NOT_FOUND,
+                                f"Route '{route}' not found.")
+
+        handle = handle.options(
+            method_name=metadata.get("x-serve-call-method", DEFAULT.VALUE),
+            shard_key=metadata.get("x-serve-shard-key", DEFAULT.VALUE),
+            cache_key=metadata.get("x-serve-cache-key", DEFAULT.VALUE),
+        )
+
+        retries = 0
+        backoff_time_s = 0.05
+        while retries < MAX_REPLICA_FAILURE_RETRIES:
+            object_ref = await handle.remote(request)
+            try:
+                result = await object_ref
+                break
+            except RayTaskError as error:
+                await context.abort(grpc.StatusCode.INTERNAL,
+                                    f"Task Error. Traceback: {error}.")
+            except RayActorError:
+                logger.warning("Request failed due to replica failure. There "
+                               f"are {MAX_REPLICA_FAILURE_RETRIES - retries} "
+                               "retries remaining.")
+                await asyncio.sleep(backoff_time_s)
+                backoff_time_s *= 1.5
+                retries += 1
+        else:
+            await context.abort(
+                grpc.StatusCode.UNAVAILABLE,
+                f"Task failed with {MAX_REPLICA_FAILURE_RETRIES} retries.")
+
+        if not isinstance(result, bytes):
+            await context.abort(
+                grpc.StatusCode.INTERNAL,
+                "Deployments called through gRPC must return the serialized "
+                f"response message as bytes, got {type(result)}.")
+        return result
+
+
+class _GenericRPCHandler(grpc.GenericRpcHandler):
+    """Handles every unary-unary method, without (de)serializing messages."""
+
+    def __init__(self, proxy: GRPCProxy):
+        self._proxy = proxy
+
+    def service(self, handler_call_details: grpc.HandlerCallDetails
+                ) -> grpc.RpcMethodHandler:
+        method = handler_call_details.method
+
+        async def handle(request: bytes,
+                         context: aiogrpc.ServicerContext) -> bytes:
+            return await self._proxy.handle_request(method, request, context)
+
+        return grpc.unary_unary_rpc_method_handler(handle)
+
+
+@ray.remote(num_cpus=0)
+class GRPCProxyActor:
+    def __init__(self, host: str, port: int, controller_name: str,
+                 controller_namespace: str):
+        self.host = host
+        self.port = port
+
+        self.setup_complete = asyncio.Event()
+
+        self.app = GRPCProxy(controller_name, controller_namespace)
+
+        # Start running the gRPC server on the event loop.
+        # This task should be running forever. We track it in case of failure.
+        self.running_task = asyncio.get_event_loop().create_task(self.run())
+
+    async def ready(self):
+        """Returns when gRPC proxy is ready to serve traffic.
+        Or throw exception when it is not able to serve traffic.
+        """
+        done_set, _ = await asyncio.wait(
+            [
+                # Either the gRPC setup has completed.
+                # The event is set inside self.run.
+                self.setup_complete.wait(),
+                # Or self.run errored.
+                self.running_task,
+            ],
+            return_when=asyncio.FIRST_COMPLETED)
+
+        # Return None, or re-throw the exception from self.running_task.
+        return await done_set.pop()
+
+    async def block_until_endpoint_exists(self, endpoint: EndpointTag,
+                                          timeout_s: float):
+        await self.app.block_until_endpoint_exists(endpoint, timeout_s)
+
+    async def run(self):
+        # Allow multiple processes to bind the same port, like the HTTP proxy.
+        server = aiogrpc.server(options=[("grpc.so_reuseport", 1)])
+        server.add_generic_rpc_handlers((_GenericRPCHandler(self.app), ))
+        if server.add_insecure_port(f"{self.host}:{self.port}") == 0:
+            raise ValueError(
+                f"Failed to bind Ray Serve gRPC proxy to "
+                f"'{self.host}:{self.port}'. Please make sure your host and "
+                "grpc_port are specified correctly.")
+
+        await server.start()
+        self.setup_complete.set()
+        await server.wait_for_termination()
@@ -31,6 +31,7 @@ class HandleOptions:
     """Options for each ServeHandle instances. These fields are immutable."""
     method_name: str = "__call__"
     shard_key: Optional[str] = None
+    cache_key: Optional[str] = None
     http_method: str = "GET"
     http_headers: Dict[str, str] = field(default_factory=dict)
 
@@ -121,6 +122,7 @@ class RayServeHandle:
             *,
             method_name: Union[str, DEFAULT] = DEFAULT.VALUE,
             shard_key: Union[str, DEFAULT] = DEFAULT.VALUE,
+            cache_key: Union[str, DEFAULT] = DEFAULT.VALUE,
             http_method: Union[str, DEFAULT] = DEFAULT.VALUE,
             http_headers: Union[Dict[str, str], DEFAULT] = DEFAULT.VALUE,
     ):
@@ -131,13 +133,17 @@ class RayServeHandle:
             http_method(str): The HTTP method to use for the request.
             shard_key(str): A string to use to deterministically map this
                 request to a deployment if there are multiple.
+            cache_key(str): A hash of the request identifying its response
+                in the deployment's response cache. Only used if the
+                deployment has a response cache configured.
         """
         new_options_dict = self.handle_options.__dict__.copy()
         user_modified_options_dict = {
             key: value
-            for key, value in
-            zip(["method_name", "shard_key", "http_method", "http_headers"],
-                [method_name, shard_key, http_method, http_headers])
+            for key, value in zip([
+                "method_name", "shard_key", "cache_key", "http_method",
+                "http_headers"
+            ], [method_name, shard_key, cache_key, http_method, http_headers])
             if value != DEFAULT.VALUE
         }
         new_options_dict.update(user_modified_options_dict)
@@ -158,6 +164,7 @@ class RayServeHandle:
             endpoint_name,
             call_method=handle_options.method_name,
             shard_key=handle_options.shard_key,
+            cache_key=handle_options.cache_key,
             http_method=handle_options.http_method,
             http_headers=handle_options.http_headers,
             http_arg_is_pickled=self._pickled_http_request,
@@ -30,6 +30,7 @@ async def _send_request_to_handle(handle, scope, receive, send):
     handle = handle.options(
         method_name=headers.get("X-SERVE-CALL-METHOD".lower(), DEFAULT.VALUE),
         shard_key=headers.get("X-SERVE-SHARD-KEY".lower(), DEFAULT.VALUE),
+        cache_key=headers.get("X-SERVE-CACHE-KEY".lower(), DEFAULT.VALUE),
         http_method=scope["method"].upper(),
         http_headers=headers,
     )
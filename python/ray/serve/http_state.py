@@ -1,11 +1,14 @@
 import asyncio
+import itertools
 import random
 from typing import Dict, List, Tuple
 
 import ray
 from ray.actor import ActorHandle
 from ray.serve.config import HTTPOptions, DeploymentMode
-from ray.serve.constants import ASYNC_CONCURRENCY, SERVE_PROXY_NAME
+from ray.serve.constants import (ASYNC_CONCURRENCY, SERVE_GRPC_PROXY_NAME,
+                                 SERVE_PROXY_NAME)
+from ray.serve.grpc_proxy import GRPCProxyActor
 from ray.serve.http_proxy import HTTPProxyActor
 from ray.serve.utils import (format_actor_name, logger, get_all_node_ids,
                              get_current_node_resource_key)
@@ -33,6 +36,8 @@ class HTTPState:
         self._detached = detached
         self._config = config
         self._proxy_actors: Dict[NodeId, ActorHandle] = dict()
+        # Only populated if config.grpc_port is set.
+        self._grpc_proxy_actors: Dict[NodeId, ActorHandle] = dict()
 
         # Will populate self.proxy_actors with existing actors.
         if _start_proxies_on_init:
@@ -41,6 +46,8 @@ class HTTPState:
     def shutdown(self) -> None:
         for proxy in self.get_http_proxy_handles().values():
             ray.kill(proxy, no_restart=True)
+        for proxy in self.get_grpc_proxy_handles().values():
+            ray.kill(proxy, no_restart=True)
 
     def get_config(self):
         return self._config
@@ -48,6 +55,9 @@ class HTTPState:
     def get_http_proxy_handles(self) -> Dict[NodeId, ActorHandle]:
         return self._proxy_actors
 
+    def get_grpc_proxy_handles(self) -> Dict[NodeId, ActorHandle]:
+        return self._grpc_proxy_actors
+
     def update(self):
         self._start_proxies_if_needed()
         self._stop_proxies_if_needed()
@@ -118,6 +128,43 @@ class HTTPState:
 
             self._proxy_actors[node_id] = proxy
 
+        if self._config.grpc_port is not None:
+            self._start_grpc_proxies_if_needed()
+
+    def _start_grpc_proxies_if_needed(self) -> None:
+        """Start a gRPC proxy next to every HTTP proxy if it doesn't exist."""
+        for node_id, node_resource in self._get_target_nodes():
+            if node_id in self._grpc_proxy_actors:
+                continue
+
+            name = format_actor_name(SERVE_GRPC_PROXY_NAME,
+                                     self._controller_name, node_id)
+            try:
+                proxy = ray.get_actor(
+                    name, namespace=self._controller_namespace)
+            except ValueError:
+                logger.info("Starting gRPC proxy with name '{}' on node '{}' "
+                            "listening on '{}:{}'".format(
+                                name, node_id, self._config.host,
+                                self._config.grpc_port))
+                proxy = GRPCProxyActor.options(
+                    num_cpus=self._config.num_cpus,
+                    name=name,
+                    lifetime="detached" if self._detached else None,
+                    max_concurrency=ASYNC_CONCURRENCY,
+                    max_restarts=-1,
+                    max_task_retries=-1,
+                    resources={
+                        node_resource: 0.01
+                    },
+                ).remote(
+                    self._config.host,
+                    self._config.grpc_port,
+                    controller_name=self._controller_name,
+                    controller_namespace=self._controller_namespace)
+
+            self._grpc_proxy_actors[node_id] = proxy
+
     def _stop_proxies_if_needed(self) -> bool:
         """Removes proxy actors from any nodes that no longer exist."""
         all_node_ids = {node_id for node_id, _ in get_all_node_ids()}
@@ -132,6 +179,13 @@ class HTTPState:
             proxy = self._proxy_actors.pop(node_id)
             ray.kill(proxy, no_restart=True)
 
+        for node_id in list(self._grpc_proxy_actors.keys()):
+            if node_id not in all_node_ids:
+                logger.info("Removing gRPC proxy on removed node '{}'.".format(
+                    node_id))
+                proxy = self._grpc_proxy_actors.pop(node_id)
+                ray.kill(proxy, no_restart=True)
+
     async def ensure_http_route_exists(self, endpoint: EndpointTag,
                                        timeout_s: float):
         """Block until the route has been propagated to all HTTP proxies.
@@ -141,5 +195,6 @@ class HTTPState:
         await asyncio.gather(*[
             proxy.block_until_endpoint_exists.remote(
                 endpoint, timeout_s=timeout_s)
-            for proxy in self._proxy_actors.values()
+            for proxy in itertools.chain(self._proxy_actors.values(),
+                                         self._grpc_proxy_actors.values())
         ])
@@ -1,4 +1,5 @@
 from abc import ABC
+import asyncio
 import random
 from typing import Any, Callable, List, Tuple, Union
 
@@ -34,8 +35,9 @@ class LocalExecutor(Executor):
             for arg in args)
         return self._callable(*args)
 
-    async def call_async(self, input_arg: Tuple[Any]) -> Any:
-        raise NotImplementedError("No async support yet.")
+    async def call_async(self, *args: Tuple[Any]) -> Any:
+        args = await asyncio.gather(*[_resolve_async(arg) for arg in args])
+        return self._callable(*args)
 
 
 class TasksExecutor(Executor):
@@ -51,8 +53,8 @@ class TasksExecutor(Executor):
     def call(self, *args: Tuple[Any]) -> ObjectRef:
         return self._remote_function.remote(*args)
 
-    async def call_async(self) -> ObjectRef:
-        raise NotImplementedError("No async support yet.")
+    async def call_async(self, *args: Tuple[Any]) -> ObjectRef:
+        return self._remote_function.remote(*args)
 
 
 @ray.remote
@@ -85,8 +87,42 @@ class ActorsExecutor(Executor):
     def call(self, *args: Tuple[Any]) -> ObjectRef:
         return random.choice(self._actors).call.remote(*args)
 
-    async def call_async(self) -> ObjectRef:
-        raise NotImplementedError("No async support yet.")
+    async def call_async(self, *args: Tuple[Any]) -> ObjectRef:
+        return random.choice(self._actors).call.remote(*args)
+
+
+async def _resolve_async(arg: Any) -> Any:
+    if isinstance(arg, ObjectRef):
+        return await arg
+    return arg
+
+
+def fuse_callable_factories(
+        serialized_callable_factories: List[bytes]) -> bytes:
+    """Compose a chain of serialized callable factories into a single one.
+
+    The resulting callable runs each step in-process, passing the output of
+    one step as the sole input of the next. This is used by the pipeline
+    compiler to co-locate adjacent steps in one executor so that intermediate
+    results don't cross a Ray call boundary.
+    """
+    assert len(serialized_callable_factories) > 0
+
+    def fused_callable_factory():
+        callables = [
+            cloudpickle.loads(factory)()
+            for factory in serialized_callable_factories
+        ]
+
+        def fused_callable(*args):
+            result = callables[0](*args)
+            for next_callable in callables[1:]:
+                result = next_callable(result)
+            return result
+
+        return fused_callable
+
+    return cloudpickle.dumps(fused_callable_factory)
 
 
 def create_executor_from_step_config(serialized_callable_factory: bytes,
@@ -1,18 +1,29 @@
 from abc import ABC
-from typing import Any, Callable, Tuple
+import asyncio
+from collections import defaultdict
+from typing import Any, Callable, Dict, Tuple
 
 import ray
 from ray import cloudpickle, ObjectRef
 
 from ray.serve.pipeline.common import StepConfig
 from ray.serve.pipeline.executor import (create_executor_from_step_config,
-                                         Executor)
+                                         Executor, fuse_callable_factories)
+
+# Whether adjacent steps with identical configs are fused into one executor.
+_STEP_FUSION_ENABLED = True
 
 
 class PipelineNode(ABC):
     def deploy(self):
         pass
 
+    def _deploy(self, num_consumers: Dict[int, int]):
+        pass
+
+    def _count_consumers(self, num_consumers: Dict[int, int]):
+        pass
+
     def call(self, input_arg: Tuple[Any]) -> Any:
         pass
 
@@ -37,7 +48,11 @@ class Pipeline:
         return result
 
     async def call_async(self, input_arg: Tuple[Any]) -> Any:
-        raise NotImplementedError("No async support yet.")
+        result = await self._entry_node.call_async(input_arg)
+        if isinstance(result, ObjectRef):
+            result = await result
+
+        return result
 
 
 class ExecutorPipelineNode(PipelineNode):
@@ -56,19 +71,72 @@ class ExecutorPipelineNode(PipelineNode):
 
         # Populated in .deploy().
         self._executor: Executor = None
+        self._num_fused_steps: int = 1
 
         assert len(self._incoming_edges) > 0
 
     def deploy(self) -> Pipeline:
         """Instantiates executors for this and all dependent nodes.
 
+        Before instantiating executors, adjacent steps with the same config
+        are fused so that they run in-process in a single executor (see
+        ._fuse_upstream_steps()).
+
         After the pipeline is deployed, .call() and .call_async() can be used.
         """
-        [node.deploy() for node in self._incoming_edges]
+        num_consumers = defaultdict(int)
+        self._count_consumers(num_consumers)
+        self._deploy(num_consumers)
+
+        return Pipeline(self)
+
+    def _count_consumers(self, num_consumers: Dict[int, int]):
+        """Count the number of downstream nodes consuming each node's output.
+
+        Nodes that are reachable through multiple paths are only traversed
+        once.
+        """
+        for node in self._incoming_edges:
+            num_consumers[id(node)] += 1
+            if num_consumers[id(node)] == 1:
+                node._count_consumers(num_consumers)
+
+    def _deploy(self, num_consumers: Dict[int, int]):
+        # Nodes whose output is shared by multiple consumers are reached more
+        # than once, but only need a single executor.
+        if self._executor is not None:
+            return
+
+        self._fuse_upstream_steps(num_consumers)
+        [node._deploy(num_consumers) for node in self._incoming_edges]
         self._executor = create_executor_from_step_config(
             self._serialized_callable_factory, self._config)
 
-        return Pipeline(self)
+    def _fuse_upstream_steps(self, num_consumers: Dict[int, int]):
+        """Absorb the chain of upstream steps that can share our executor.
+
+        An upstream step is fused if it's our only incoming edge, its config
+        is identical to ours, and we are the only consumer of its output.
+        The fused steps are called in-process one after the other, so the
+        intermediate results never cross a Ray call boundary.
+        """
+        serialized_callable_factories = [self._serialized_callable_factory]
+        while _STEP_FUSION_ENABLED and len(self._incoming_edges) == 1:
+            upstream = self._incoming_edges[0]
+            if (not isinstance(upstream, ExecutorPipelineNode)
+                    or upstream._executor is not None
+                    or upstream._config != self._config
+                    or num_consumers[id(upstream)] != 1):
+                break
+
+            serialized_callable_factories.insert(
+                0, upstream._serialized_callable_factory)
+            self._incoming_edges = upstream._incoming_edges
+
+        if len(serialized_callable_factories) > 1:
+            self._serialized_callable_factory = fuse_callable_factories(
+                serialized_callable_factories)
+        self._num_fused_steps = len(serialized_callable_factories)
 
     def call(self, input_arg: Tuple[Any]) -> Any:
         if self._executor is None:
@@ -77,17 +145,26 @@ class ExecutorPipelineNode(PipelineNode):
         args = tuple(node.call(input_arg) for node in self._incoming_edges)
         return self._executor.call(*args)
 
-    async def call_async(self):
+    async def call_async(self, input_arg: Tuple[Any]) -> Any:
         if self._executor is None:
             raise RuntimeError(
                 "Pipeline hasn't been deployed, call .deploy() first.")
-        raise NotImplementedError("No async support yet.")
+        # Fan out to all incoming edges concurrently.
+        args = await asyncio.gather(
+            *[node.call_async(input_arg) for node in self._incoming_edges])
+        return await self._executor.call_async(*args)
 
 
 class InputPipelineNode(PipelineNode):
     def deploy(self) -> PipelineNode:
         pass
 
+    def _deploy(self, num_consumers: Dict[int, int]):
+        pass
+
+    def _count_consumers(self, num_consumers: Dict[int, int]):
+        pass
+
     def call(self, input_arg: Tuple[Any]) -> Any:
         return input_arg
 
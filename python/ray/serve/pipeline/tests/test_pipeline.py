@@ -1,10 +1,12 @@
+import os
 import sys
 import tempfile
 
 import pytest
 
 from ray.serve import pipeline
-from ray.serve.pipeline.test_utils import enable_local_execution_mode_only
+from ray.serve.pipeline.test_utils import (enable_local_execution_mode_only,
+                                           LOCAL_EXECUTION_ONLY)
 
 ALL_EXECUTION_MODES = list(pipeline.ExecutionMode)
 
@@ -145,5 +147,103 @@ def test_mix_classes_and_functions(execution_mode, shared_ray_instance):
     assert greeter.call("Teddy") == "Howdy Teddy!|How's it hanging, Teddy?"
 
 
+@pytest.mark.parametrize("execution_mode", ALL_EXECUTION_MODES)
+@enable_local_execution_mode_only
+def test_adjacent_steps_fused(execution_mode, shared_ray_instance):
+    @pipeline.step(execution_mode=execution_mode)
+    def step1(input_arg: str):
+        return (input_arg, os.getpid())
+
+    @pipeline.step(execution_mode=execution_mode)
+    def step2(step1_output):
+        input_arg, step1_pid = step1_output
+        return (input_arg, step1_pid, os.getpid())
+
+    @pipeline.step(execution_mode=execution_mode)
+    def step3(step2_output):
+        input_arg, step1_pid, step2_pid = step2_output
+        return (input_arg, step1_pid, step2_pid, os.getpid())
+
+    entry_node = step3(step2(step1(pipeline.INPUT)))
+    fused = entry_node.deploy()
+    assert entry_node._num_fused_steps == 3
+    input_arg, *pids = fused.call("HELLO")
+    assert input_arg == "HELLO"
+    assert len(set(pids)) == 1
+
+
+@pytest.mark.parametrize("execution_mode", ALL_EXECUTION_MODES)
+@enable_local_execution_mode_only
+def test_shared_steps_not_fused(execution_mode, shared_ray_instance):
+    @pipeline.step(execution_mode=execution_mode)
+    def step1(input_arg: str):
+        return input_arg
+
+    @pipeline.step(execution_mode=execution_mode)
+    def step2_1(input_arg: str):
+        return f"step2_1_{input_arg}"
+
+    @pipeline.step(execution_mode=execution_mode)
+    def step2_2(input_arg: str):
+        return f"step2_2_{input_arg}"
+
+    @pipeline.step(execution_mode=execution_mode)
+    def step3(step2_1_output: str, step2_2_output: str):
+        return f"{step2_1_output}|{step2_2_output}"
+
+    step1_output = step1(pipeline.INPUT)
+    step2_1_output = step2_1(step1_output)
+    step2_2_output = step2_2(step1_output)
+    parallel = step3(step2_1_output, step2_2_output).deploy()
+    assert step1_output._num_fused_steps == 1
+    assert step2_1_output._num_fused_steps == 1
+    assert step2_2_output._num_fused_steps == 1
+    assert parallel.call("HELLO") == "step2_1_HELLO|step2_2_HELLO"
+
+
+@pytest.mark.skipif(
+    LOCAL_EXECUTION_ONLY, reason="local execution-only testing enabled")
+def test_steps_with_different_configs_not_fused(shared_ray_instance):
+    @pipeline.step(execution_mode=pipeline.ExecutionMode.LOCAL)
+    def step1(input_arg: str):
+        return input_arg + "|step1"
+
+    @pipeline.step(execution_mode=pipeline.ExecutionMode.LOCAL)
+    def step2(input_arg: str):
+        return input_arg + "|step2"
+
+    @pipeline.step(execution_mode=pipeline.ExecutionMode.TASKS)
+    def step3(input_arg: str):
+        return input_arg + "|step3"
+
+    entry_node = step3(step2(step1(pipeline.INPUT)))
+    sequential = entry_node.deploy()
+    assert entry_node._num_fused_steps == 1
+    assert entry_node._incoming_edges[0]._num_fused_steps == 2
+    assert sequential.call("HELLO") == "HELLO|step1|step2|step3"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("execution_mode", ALL_EXECUTION_MODES)
+@enable_local_execution_mode_only
+async def test_call_async(execution_mode, shared_ray_instance):
+    @pipeline.step(execution_mode=execution_mode)
+    def step1(input_arg: str):
+        return f"step1_{input_arg}"
+
+    @pipeline.step(execution_mode=execution_mode)
+    def step2(input_arg: str):
+        return f"step2_{input_arg}"
+
+    @pipeline.step(execution_mode=execution_mode)
+    def step3(step1_output: str, step2_output: str):
+        return f"{step1_output}|{step2_output}"
+
+    multiple_inputs = step3(step1(pipeline.INPUT),
+                            step2(pipeline.INPUT)).deploy()
+    assert await multiple_inputs.call_async(
+        "HELLO") == "step1_HELLO|step2_HELLO"
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", "-s", __file__]))
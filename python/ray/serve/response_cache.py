@@ -0,0 +1,190 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, Hashable, List, Optional
+
+import ray
+from ray.actor import ActorHandle
+from ray.serve.config import ResponseCacheConfig
+from ray.serve.constants import ASYNC_CONCURRENCY, SERVE_RESPONSE_CACHE_NAME
+from ray.serve.utils import (format_actor_name, get_current_node_resource_key,
+                             logger)
+from ray.util import metrics
+
+# Namespace that all per-node response cache actors are registered in. The
+# actor names are scoped by controller, so this doesn't cause collisions.
+RESPONSE_CACHE_NAMESPACE = "serve_response_cache"
+
+
+class ResponseCache:
+    """Size-bounded LRU cache whose entries optionally expire after a TTL.
+
+    The cache holds the responses of the given versions of a deployment.
+    """
+
+    def __init__(self,
+                 config: ResponseCacheConfig,
+                 versions: FrozenSet[Optional[int]] = frozenset(),
+                 _time: Callable[[], float] = time.time):
+        self.config = config
+        self.versions = versions
+        self._time = _time
+        # Map cache key -> (expiration time, value). Ordered from least to
+        # most recently used.
+        self._entries: Dict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value cached for the key, or None if there is none."""
+        if key not in self._entries:
+            return None
+
+        expiration_time, value = self._entries[key]
+        if expiration_time is not None and self._time() >= expiration_time:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        expiration_time = None
+        if self.config.ttl_s > 0:
+            expiration_time = self._time() + self.config.ttl_s
+
+        self._entries[key] = (expiration_time, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.config.max_entries:
+            self._entries.popitem(last=False)
+
+
+@ray.remote(num_cpus=0)
+class ResponseCacheActor:
+    """Holds the response caches of all deployments for a single node.
+
+    Responses are stored as ObjectRefs owned by this actor, so cache hits
+    don't copy the result through this actor and stay valid after the
+    process that made the original request exits.
+
+    Each deployment's cache is tied to the versions of the replicas that
+    were running when the responses were cached. Once a redeployment
+    changes them, the cached responses are dropped.
+    """
+
+    def __init__(self):
+        self._caches: Dict[str, ResponseCache] = dict()
+
+    def get(self, deployment_name: str, versions: FrozenSet[Optional[int]],
+            key: Hashable) -> Optional[List[ray.ObjectRef]]:
+        cache = self._caches.get(deployment_name)
+        if cache is None:
+            return None
+        if cache.versions != versions:
+            del self._caches[deployment_name]
+            return None
+        return cache.get(key)
+
+    async def put(self, deployment_name: str, config: ResponseCacheConfig,
+                  versions: FrozenSet[Optional[int]], key: Hashable,
+                  result_refs: List[ray.ObjectRef]) -> None:
+        # Only cache successful responses.
+        try:
+            result = await result_refs[0]
+        except Exception:
+            return
+
+        cache = self._caches.get(deployment_name)
+        if (cache is None or cache.config != config
+                or cache.versions != versions):
+            cache = ResponseCache(config, versions)
+            self._caches[deployment_name] = cache
+        cache.put(key, [ray.put(result)])
+
+
+def _get_or_create_response_cache_actor(
+        controller_handle: ActorHandle) -> ActorHandle:
+    """Get the response cache actor of the current node, creating it if it
+    doesn't exist yet."""
+    node_id = ray.get_runtime_context().node_id.hex()
+    name = format_actor_name(SERVE_RESPONSE_CACHE_NAME,
+                             controller_handle._ray_actor_id.hex(), node_id)
+    try:
+        return ray.get_actor(name, namespace=RESPONSE_CACHE_NAMESPACE)
+    except ValueError:
+        pass
+
+    try:
+        return ResponseCacheActor.options(
+            name=name,
+            namespace=RESPONSE_CACHE_NAMESPACE,
+            max_concurrency=ASYNC_CONCURRENCY,
+            resources={
+                get_current_node_resource_key(): 0.01
+            },
+        ).remote()
+    except ValueError:
+        # Another process on this node created it concurrently.
+        return ray.get_actor(name, namespace=RESPONSE_CACHE_NAMESPACE)
+
+
+class ResponseCacheClient:
+    """Looks up and stores responses of a deployment in the node's cache.
+
+    Failures to reach the cache are logged and treated as misses, so the
+    cache never fails a request.
+    """
+
+    def __init__(self, controller_handle: ActorHandle, deployment_name: str):
+        self._controller_handle = controller_handle
+        self._deployment_name = deployment_name
+        # Populated lazily on the first request with a cache key.
+        self._cache_actor: Optional[ActorHandle] = None
+
+        self.num_cache_hits = metrics.Counter(
+            "serve_response_cache_hits",
+            description=("The number of requests to this deployment that "
+                         "were served from the response cache."),
+            tag_keys=("deployment", ))
+        self.num_cache_hits.set_default_tags({"deployment": deployment_name})
+        self.num_cache_misses = metrics.Counter(
+            "serve_response_cache_misses",
+            description=("The number of requests to this deployment with a "
+                         "cache key that weren't found in the response "
+                         "cache."),
+            tag_keys=("deployment", ))
+        self.num_cache_misses.set_default_tags({
+            "deployment": deployment_name
+        })
+
+    def _get_cache_actor(self) -> ActorHandle:
+        if self._cache_actor is None:
+            self._cache_actor = _get_or_create_response_cache_actor(
+                self._controller_handle)
+        return self._cache_actor
+
+    async def get(self, versions: FrozenSet[Optional[int]],
+                  key: Hashable) -> Optional[ray.ObjectRef]:
+        try:
+            result_refs = await self._get_cache_actor().get.remote(
+                self._deployment_name, versions, key)
+        except Exception:
+            logger.exception("Failed to read from the response cache.")
+            # The actor might have died, look it up again next time.
+            self._cache_actor = None
+            result_refs = None
+
+        if result_refs is None:
+            self.num_cache_misses.inc()
+            return None
+
+        self.num_cache_hits.inc()
+        return result_refs[0]
+
+    def put(self, config: ResponseCacheConfig,
+            versions: FrozenSet[Optional[int]], key: Hashable,
+            result_ref: ray.ObjectRef) -> None:
+        # The ObjectRef is wrapped in a list so it isn't resolved before
+        # being passed to the actor.
+        self._get_cache_actor().put.remote(self._deployment_name, config,
+                                           versions, key, [result_ref])
@@ -3,12 +3,14 @@ import asyncio
 import pickle
 import itertools
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 import random
 
 from ray.actor import ActorHandle
 from ray.serve.common import str, ReplicaTag, RunningReplicaInfo
+from ray.serve.config import ResponseCacheConfig
 from ray.serve.long_poll import LongPollClient, LongPollNamespace
+from ray.serve.response_cache import ResponseCacheClient
 from ray.serve.utils import compute_iterable_delta, logger
 
 import ray
@@ -22,6 +24,7 @@ class RequestMetadata:
 
     call_method: str = "__call__"
     shard_key: Optional[str] = None
+    cache_key: Optional[str] = None
 
     http_method: str = "GET"
     http_headers: Dict[str, str] = field(default_factory=dict)
@@ -60,6 +63,11 @@ class ReplicaSet:
         # the same node.
         self.replica_iterator = itertools.cycle(self.in_flight_queries.keys())
         self.replica_infos: Dict[ReplicaTag, RunningReplicaInfo] = dict()
+        # Response cache config of the deployment, None if caching is off.
+        self.response_cache_config: Optional[ResponseCacheConfig] = None
+        # Versions of the running replicas, responses cached for other
+        # versions are not served.
+        self.replica_versions: FrozenSet[Optional[int]] = frozenset()
 
         # Used to unblock this replica set waiting for free replicas. A newly
         # added replica or updated max_concurrent_queries value means the
@@ -88,6 +96,12 @@ class ReplicaSet:
         added, removed, _ = compute_iterable_delta(
             self.in_flight_queries.keys(), running_replicas)
 
+        if len(running_replicas) > 0:
+            self.response_cache_config = running_replicas[
+                0].response_cache_config
+            self.replica_versions = frozenset(
+                replica.version_hash for replica in running_replicas)
+
         for new_replica in added:
             self.in_flight_queries[new_replica] = set()
 
@@ -196,6 +210,9 @@ class Router:
             "deployment": deployment_name
         })
 
+        self._response_cache = ResponseCacheClient(controller_handle,
+                                                   deployment_name)
+
         self.long_poll_client = LongPollClient(
             controller_handle,
             {
@@ -214,9 +231,25 @@ class Router:
         """Assign a query and returns an object ref represent the result"""
 
         self.num_router_requests.inc()
-        return await self._replica_set.assign_replica(
+
+        cache_config = self._replica_set.response_cache_config
+        use_cache = (cache_config is not None
+                     and request_meta.cache_key is not None)
+        if use_cache:
+            versions = self._replica_set.replica_versions
+            cache_key = (request_meta.call_method, request_meta.cache_key)
+            cached_ref = await self._response_cache.get(versions, cache_key)
+            if cached_ref is not None:
+                return cached_ref
+
+        result_ref = await self._replica_set.assign_replica(
             Query(
                 args=list(request_args),
                 kwargs=request_kwargs,
                 metadata=request_meta,
             ))
+
+        if use_cache:
+            self._response_cache.put(cache_config, versions, cache_key,
+                                     result_ref)
+        return result_ref
@@ -2,7 +2,7 @@ import pytest
 from pydantic import ValidationError
 
 from ray.serve.config import (DeploymentConfig, DeploymentMode, HTTPOptions,
-                              ReplicaConfig)
+                              ReplicaConfig, ResponseCacheConfig)
 from ray.serve.config import AutoscalingConfig
 
 
@@ -116,6 +116,22 @@ def test_with_proto():
     assert config == DeploymentConfig.from_proto_bytes(config.to_proto_bytes())
 
 
+def test_response_cache_config_proto():
+    config = DeploymentConfig(response_cache_config={
+        "max_entries": 10,
+        "ttl_s": 0.5
+    })
+    deserialized_config = DeploymentConfig.from_proto_bytes(
+        config.to_proto_bytes())
+    assert deserialized_config.response_cache_config == ResponseCacheConfig(
+        max_entries=10, ttl_s=0.5)
+
+    config = DeploymentConfig()
+    deserialized_config = DeploymentConfig.from_proto_bytes(
+        config.to_proto_bytes())
+    assert deserialized_config.response_cache_config is None
+
+
 def test_zero_default_proto():
     # Test that options set to zero (protobuf default value) still retain their
     # original value after being serialized and deserialized.
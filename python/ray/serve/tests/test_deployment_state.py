@@ -24,6 +24,7 @@ from ray.serve.deployment_state import (
     ReplicaStateContainer,
     VersionedReplica,
     CHECKPOINT_KEY,
+    CHECKPOINT_INDEX_KEY,
 )
 from ray.serve.async_goal_manager import AsyncGoalManager
 from ray.serve.storage.kv_store import RayLocalKVStore
@@ -74,6 +75,10 @@ class MockReplicaActorWrapper:
     def max_concurrent_queries(self) -> int:
         return 100
 
+    @property
+    def response_cache_config(self) -> None:
+        return None
+
     def set_ready(self):
         self.ready = ReplicaStartupStatus.SUCCEEDED
 
@@ -1785,6 +1790,7 @@ def mock_deployment_state_manager(
         yield deployment_state_manager, timer, goal_manager
         # Clear checkpoint at the end of each test
         kv_store.delete(CHECKPOINT_KEY)
+        kv_store.delete(CHECKPOINT_INDEX_KEY)
         if sys.platform != "win32":
             # This line fails on windows with a PermissionError.
             os.remove("test_kv_store.db")
@@ -1907,5 +1913,67 @@ def test_resume_deployment_state_from_replica_tags(
         0].replica_tag == mocked_replica.replica_tag
 
 
+def test_incremental_checkpoint(mock_deployment_state_manager):
+    """Only the deployments that changed should be rewritten."""
+    deployment_state_manager, timer, goal_manager = (
+        mock_deployment_state_manager)
+    kv_store = deployment_state_manager._kv_store
+
+    info_1, _ = deployment_info(version="1")
+    info_2, _ = deployment_info(version="1")
+    deployment_state_manager.deploy("test_1", info_1)
+    deployment_state_manager.deploy("test_2", info_2)
+
+    written_keys = []
+    original_put = kv_store.put
+
+    def recording_put(key, val):
+        written_keys.append(key)
+        return original_put(key, val)
+
+    with patch.object(kv_store, "put", new=recording_put):
+        # Redeploying the same version is a no-op and shouldn't write.
+        deployment_state_manager.deploy("test_1", info_1)
+        assert written_keys == []
+
+        # Updating an existing deployment only rewrites its own key.
+        info_1_updated, _ = deployment_info(version="2")
+        deployment_state_manager.deploy("test_1", info_1_updated)
+        assert len(written_keys) == 1
+        assert written_keys[0].endswith("test_1")
+
+    # Recovering from the checkpoint restores both deployments.
+    deployment_state_manager._deployment_states = dict()
+    deployment_state_manager._recover_from_checkpoint([])
+    assert set(deployment_state_manager._deployment_states.keys()) == {
+        "test_1", "test_2"
+    }
+    assert deployment_state_manager.get_deployment(
+        "test_1").version == "2"
+
+
+def test_snapshot_version(mock_deployment_state_manager):
+    deployment_state_manager, timer, goal_manager = (
+        mock_deployment_state_manager)
+
+    version = deployment_state_manager.snapshot_version
+    info_1, _ = deployment_info(version="1")
+    deployment_state_manager.deploy("test", info_1)
+    assert deployment_state_manager.snapshot_version > version
+
+    # Replica transitioning to RUNNING changes the snapshot.
+    deployment_state_manager.update()
+    version = deployment_state_manager.snapshot_version
+    deployment_state = deployment_state_manager._deployment_states["test"]
+    deployment_state._replicas.get()[0]._actor.set_ready()
+    deployment_state_manager.update()
+    assert deployment_state_manager.snapshot_version > version
+
+    # No changes, no new snapshot.
+    version = deployment_state_manager.snapshot_version
+    deployment_state_manager.update()
+    assert deployment_state_manager.snapshot_version == version
+
+
 if __name__ == "__main__":
     sys.exit(pytest.main(["-v", "-s", __file__]))
@@ -0,0 +1,86 @@
+import sys
+
+import grpc
+import pytest
+
+import ray
+from ray import serve
+
+
+def _identity(x):
+    return x
+
+
+@pytest.fixture
+def serve_with_grpc():
+    ray.init(num_cpus=4, namespace="grpc_proxy_test")
+    serve.start(http_options={"grpc_port": 9001})
+    channel = grpc.insecure_channel("localhost:9001")
+    yield channel
+    channel.close()
+    serve.shutdown()
+    ray.shutdown()
+
+
+def _call(channel, method, request, metadata=None):
+    stub = channel.unary_unary(
+        method, request_serializer=_identity, response_deserializer=_identity)
+    return stub(request, metadata=metadata, timeout=30)
+
+
+def test_grpc_route_by_method(serve_with_grpc):
+    @serve.deployment(route_prefix="/test.Echo")
+    def echo(request: bytes) -> bytes:
+        return b"echo:" + request
+
+    echo.deploy()
+
+    assert _call(serve_with_grpc, "/test.Echo/Call", b"hi") == b"echo:hi"
+
+
+def test_grpc_route_by_metadata(serve_with_grpc):
+    @serve.deployment(route_prefix="/model")
+    class Model:
+        def __call__(self, request: bytes) -> bytes:
+            return b"call"
+
+        def predict(self, request: bytes) -> bytes:
+            return b"predict:" + request
+
+    Model.deploy()
+
+    metadata = (("x-serve-route", "/model"), )
+    assert _call(serve_with_grpc, "/pkg.Service/Method", b"",
+                 metadata) == b"call"
+
+    metadata += (("x-serve-call-method", "predict"), )
+    assert _call(serve_with_grpc, "/pkg.Service/Method", b"x",
+                 metadata) == b"predict:x"
+
+
+def test_grpc_errors(serve_with_grpc):
+    @serve.deployment(route_prefix="/test.Bad")
+    def bad(request: bytes):
+        if request == b"raise":
+            raise RuntimeError("oops")
+        return "not bytes"
+
+    bad.deploy()
+
+    with pytest.raises(grpc.RpcError) as e:
+        _call(serve_with_grpc, "/does.not.Exist/Call", b"")
+    assert e.value.code() == grpc.StatusCode.NOT_FOUND
+
+    with pytest.raises(grpc.RpcError) as e:
+        _call(serve_with_grpc, "/test.Bad/Call", b"raise")
+    assert e.value.code() == grpc.StatusCode.INTERNAL
+    assert "oops" in e.value.details()
+
+    with pytest.raises(grpc.RpcError) as e:
+        _call(serve_with_grpc, "/test.Bad/Call", b"")
+    assert e.value.code() == grpc.StatusCode.INTERNAL
+    assert "bytes" in e.value.details()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", "-s", __file__]))
@@ -0,0 +1,178 @@
+import sys
+
+import pytest
+import requests
+
+import ray
+from ray import serve
+from ray._private.test_utils import wait_for_condition
+from ray.serve.config import ResponseCacheConfig
+from ray.serve.response_cache import ResponseCache
+
+
+@ray.remote
+class Counter:
+    def __init__(self):
+        self.count = 0
+
+    def inc(self):
+        self.count += 1
+
+    def get(self):
+        return self.count
+
+
+class MockTimer:
+    def __init__(self):
+        self._curr = 0
+
+    def time(self):
+        return self._curr
+
+    def advance(self, by):
+        self._curr += by
+
+
+def test_response_cache_lru_eviction():
+    cache = ResponseCache(ResponseCacheConfig(max_entries=2))
+    cache.put("a", 1)
+    cache.put("b", 2)
+    # Accessing "a" makes "b" the least recently used entry.
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_response_cache_ttl():
+    timer = MockTimer()
+    cache = ResponseCache(
+        ResponseCacheConfig(max_entries=10, ttl_s=1), _time=timer.time)
+    cache.put("a", 1)
+    timer.advance(0.5)
+    assert cache.get("a") == 1
+
+    timer.advance(0.5)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_response_cache_no_ttl():
+    timer = MockTimer()
+    cache = ResponseCache(ResponseCacheConfig(), _time=timer.time)
+    cache.put("a", 1)
+    timer.advance(1e6)
+    assert cache.get("a") == 1
+
+
+def test_handle_response_cache(serve_instance):
+    counter = Counter.remote()
+
+    @serve.deployment(_response_cache_config={"max_entries": 10})
+    def f(x):
+        ray.get(counter.inc.remote())
+        return x
+
+    f.deploy()
+    handle = f.get_handle()
+
+    assert ray.get(handle.options(cache_key="1").remote(1)) == 1
+    # Responses are cached asynchronously. Once cached, the same cache key is
+    # served from the cache, even if the request differs.
+    wait_for_condition(
+        lambda: ray.get(handle.options(cache_key="1").remote(2)) == 1)
+    num_calls = ray.get(counter.get.remote())
+    assert ray.get(handle.options(cache_key="1").remote(2)) == 1
+    assert ray.get(counter.get.remote()) == num_calls
+
+    assert ray.get(handle.options(cache_key="2").remote(2)) == 2
+    assert ray.get(counter.get.remote()) == num_calls + 1
+
+    # Requests without a cache key always go to a replica.
+    assert ray.get(handle.remote(3)) == 3
+    assert ray.get(handle.remote(3)) == 3
+    assert ray.get(counter.get.remote()) == num_calls + 3
+
+
+def test_http_response_cache(serve_instance):
+    counter = Counter.remote()
+
+    @serve.deployment(_response_cache_config={"max_entries": 10})
+    def f(request):
+        ray.get(counter.inc.remote())
+        return "hello"
+
+    f.deploy()
+
+    def get():
+        resp = requests.get(
+            "http://127.0.0.1:8000/f", headers={"X-Serve-Cache-Key": "key"})
+        assert resp.text == "hello"
+
+    # Wait until the response is cached, then requests stop reaching the
+    # replica.
+    num_calls = None
+    while num_calls != ray.get(counter.get.remote()):
+        num_calls = ray.get(counter.get.remote())
+        get()
+    for _ in range(3):
+        get()
+    assert ray.get(counter.get.remote()) == num_calls
+
+
+def test_response_cache_redeploy(serve_instance):
+    counter = Counter.remote()
+
+    @serve.deployment(
+        version="1", _response_cache_config={"max_entries": 10})
+    def f(*args):
+        ray.get(counter.inc.remote())
+        return "1"
+
+    f.deploy()
+    handle = f.get_handle()
+
+    def get():
+        return ray.get(handle.options(cache_key="key").remote())
+
+    # Wait until the response is cached.
+    num_calls = None
+    while num_calls != ray.get(counter.get.remote()):
+        num_calls = ray.get(counter.get.remote())
+        assert get() == "1"
+
+    def g(*args):
+        return "2"
+
+    # Responses cached for the old version are not served anymore.
+    f.options(version="2", func_or_class=g).deploy()
+    wait_for_condition(lambda: get() == "2")
+    for _ in range(3):
+        assert get() == "2"
+
+
+def test_failed_responses_not_cached(serve_instance):
+    @serve.deployment(_response_cache_config={"max_entries": 10})
+    class FailOnce:
+        def __init__(self):
+            self.failed = False
+
+        def __call__(self, *args):
+            if not self.failed:
+                self.failed = True
+                raise RuntimeError("failed")
+            return "ok"
+
+    FailOnce.deploy()
+    handle = FailOnce.get_handle()
+
+    with pytest.raises(ray.exceptions.RayTaskError):
+        ray.get(handle.options(cache_key="key").remote())
+    assert ray.get(handle.options(cache_key="key").remote()) == "ok"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main(["-v", "-s", __file__]))
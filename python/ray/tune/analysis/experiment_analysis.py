@@ -17,11 +17,13 @@ except ImportError:
     pd = None
     DataFrame = None
 
+from ray.tune.analysis.result_cache import load_trial_dataframes
 from ray.tune.error import TuneError
 from ray.tune.result import DEFAULT_METRIC, EXPR_PROGRESS_FILE, \
     EXPR_RESULT_FILE, EXPR_PARAM_FILE, CONFIG_PREFIX, TRAINING_ITERATION
 from ray.tune.trial import Trial
 from ray.tune.trial_runner import (find_newest_experiment_checkpoint,
+                                   load_experiment_checkpoint,
                                    load_trials_from_experiment_checkpoint)
 from ray.tune.utils.trainable import TrainableUtil
 from ray.tune.utils.util import unflattened_lookup
@@ -39,6 +41,10 @@ class Analysis:
 
     To use this class, the experiment must be executed with the JsonLogger.
 
+    The results of the trials are loaded when they are first needed. They
+    are read in parallel and cached in the experiment directory (if
+    ``pyarrow`` is installed), see ``TUNE_ANALYSIS_CACHE_RESULTS``.
+
     Args:
         experiment_dir (str): Directory of the experiment to load.
         default_metric (str): Default metric for comparing results. Can be
@@ -63,7 +69,8 @@ class Analysis:
                 "{} is not a valid directory.".format(experiment_dir))
         self._experiment_dir = experiment_dir
         self._configs = {}
-        self._trial_dataframes = {}
+        # Loaded when first accessed.
+        self._trial_dataframes = None
 
         self.default_metric = default_metric
         if default_mode and default_mode not in ["min", "max"]:
@@ -81,7 +88,8 @@ class Analysis:
                 "pandas not installed. Run `pip install pandas` for "
                 "Analysis utilities.")
         else:
-            self.fetch_trial_dataframes()
+            # Results are loaded lazily, but fail early if there are none.
+            self._get_trial_paths()
 
     def _validate_filetype(self, file_type: Optional[str] = None):
         if file_type not in {None, "json", "csv"}:
@@ -97,7 +105,7 @@ class Analysis:
                 of [None, json, csv]. Defaults to csv.
         """
         self._file_type = self._validate_filetype(file_type)
-        self.fetch_trial_dataframes()
+        self._trial_dataframes = None
         return True
 
     def _validate_metric(self, metric: str) -> str:
@@ -169,7 +177,7 @@ class Analysis:
         metric = self._validate_metric(metric)
         mode = self._validate_mode(mode)
 
-        rows = self._retrieve_rows(metric=metric, mode=mode)
+        rows = self._retrieve_rows(metric=metric, mode=mode, columns=[metric])
         if not rows:
             # only nans encountered when retrieving rows
             logger.warning("Not able to retrieve the best config for {} "
@@ -196,19 +204,17 @@ class Analysis:
         mode = self._validate_mode(mode)
 
         assert mode in ["max", "min"]
-        df = self.dataframe(metric=metric, mode=mode)
-        mode_idx = pd.Series.idxmax if mode == "max" else pd.Series.idxmin
-        try:
-            return df.iloc[mode_idx(df[metric])].logdir
-        except KeyError:
+        rows = self._retrieve_rows(metric=metric, mode=mode, columns=[metric])
+        if not rows:
             # all dirs contains only nan values
             # for the specified metric
-            # -> df is an empty dataframe
             logger.warning("Not able to retrieve the best logdir for {} "
                            "according to the specified metric "
                            "(only nans encountered).".format(
                                self._experiment_dir))
             return None
+        compare_op = max if mode == "max" else min
+        return compare_op(rows, key=lambda k: rows[k][metric])
 
     def fetch_trial_dataframes(self) -> Dict[str, DataFrame]:
         """Fetches trial dataframes from files.
@@ -216,26 +222,19 @@ class Analysis:
         Returns:
             A dictionary containing "trial dir" to Dataframe.
         """
-        fail_count = 0
-        force_dtype = {"trial_id": str}  # Never convert trial_id to float.
-        for path in self._get_trial_paths():
-            try:
-                if self._file_type == "json":
-                    with open(os.path.join(path, EXPR_RESULT_FILE), "r") as f:
-                        json_list = [json.loads(line) for line in f if line]
-                    df = pd.json_normalize(json_list, sep="/")
-                elif self._file_type == "csv":
-                    df = pd.read_csv(
-                        os.path.join(path, EXPR_PROGRESS_FILE),
-                        dtype=force_dtype)
-                self.trial_dataframes[path] = df
-            except Exception:
-                fail_count += 1
+        self._trial_dataframes = self._load_trial_dataframes()
+        return self._trial_dataframes
 
+    def _load_trial_dataframes(self, columns: Optional[List[str]] = None
+                               ) -> Dict[str, DataFrame]:
+        paths = self._get_trial_paths()
+        dataframes = load_trial_dataframes(
+            self._experiment_dir, paths, self._file_type, columns=columns)
+        fail_count = len(paths) - len(dataframes)
         if fail_count:
             logger.debug(
                 "Couldn't read results from {} paths".format(fail_count))
-        return self.trial_dataframes
+        return dataframes
 
     def get_all_configs(self, prefix: bool = False) -> Dict[str, Dict]:
         """Returns a list of all configurations.
@@ -357,11 +356,17 @@ class Analysis:
 
     def _retrieve_rows(self,
                        metric: Optional[str] = None,
-                       mode: Optional[str] = None) -> Dict[str, Any]:
+                       mode: Optional[str] = None,
+                       columns: Optional[List[str]] = None) -> Dict[str, Any]:
         assert mode is None or mode in ["max", "min"]
         assert not mode or metric
+        if columns is None or self._trial_dataframes is not None:
+            dataframes = self.trial_dataframes
+        else:
+            # Only read the required columns if the results aren't loaded.
+            dataframes = self._load_trial_dataframes(columns)
         rows = {}
-        for path, df in self.trial_dataframes.items():
+        for path, df in dataframes.items():
             if mode == "max":
                 idx = df[metric].idxmax()
             elif mode == "min":
@@ -395,6 +400,10 @@ class Analysis:
     @property
     def trial_dataframes(self) -> Dict[str, DataFrame]:
         """List of all dataframes of the trials."""
+        if self._trial_dataframes is None:
+            if not pd:
+                return {}
+            self.fetch_trial_dataframes()
         return self._trial_dataframes
 
 
@@ -448,9 +457,8 @@ class ExperimentAnalysis(Analysis):
             # Case 3: File specified, use as latest checkpoint.
             latest_checkpoint = experiment_checkpoint_path
 
-        with open(latest_checkpoint) as f:
-            _experiment_state = json.load(f, cls=TuneFunctionDecoder)
-            self._experiment_state = _experiment_state
+        _experiment_state = load_experiment_checkpoint(latest_checkpoint)
+        self._experiment_state = _experiment_state
 
         if "checkpoints" not in _experiment_state:
             raise TuneError("Experiment state invalid; no checkpoints found.")
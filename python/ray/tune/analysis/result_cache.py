@@ -0,0 +1,335 @@
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ray.tune.result import EXPR_PROGRESS_FILE, EXPR_RESULT_FILE
+from ray.util.debug import log_once
+
+try:
+    import pandas as pd
+    from pandas import DataFrame
+except ImportError:
+    pd = None
+    DataFrame = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+logger = logging.getLogger(__name__)
+
+# Directory within the experiment directory holding the cached results.
+CACHE_DIR = ".analysis_cache"
+# Column holding the trial path (relative to the experiment directory).
+TRIAL_COLUMN = "__trial_path__"
+# Number of files the cache may be split into before it is compacted.
+MAX_CACHE_PARTS = 8
+# Fewer result files are read in the calling thread, as starting worker
+# threads would take longer.
+MIN_FILES_PER_THREAD_POOL = 16
+
+
+def result_file(path: str, file_type: str) -> str:
+    """Returns the path of the result file of a trial."""
+    return os.path.join(
+        path, EXPR_RESULT_FILE if file_type == "json" else EXPR_PROGRESS_FILE)
+
+
+def read_result_file(path: str, file_type: str) -> DataFrame:
+    """Reads the results of the trial at path into a dataframe."""
+    if file_type == "json":
+        with open(result_file(path, file_type), "r") as f:
+            json_list = [json.loads(line) for line in f if line]
+        return pd.json_normalize(json_list, sep="/")
+    # Never convert trial_id to float.
+    return pd.read_csv(result_file(path, file_type), dtype={"trial_id": str})
+
+
+def _try_read_result_file(args: Tuple[str, str]) -> Optional[DataFrame]:
+    try:
+        return read_result_file(*args)
+    except Exception:
+        return None
+
+
+def read_result_files(paths: Sequence[str],
+                      file_type: str) -> Dict[str, Optional[DataFrame]]:
+    """Reads the results of many trials, in a pool of threads if there
+    are enough of them. Results that can't be read are None.
+
+    Threads are used instead of processes, as forking the driver while
+    Ray's threads are running can deadlock the children, and spawned
+    children would run the driver script again."""
+    max_workers = int(
+        os.environ.get("TUNE_ANALYSIS_MAX_WORKERS",
+                       os.cpu_count() or 1))
+    args = [(path, file_type) for path in paths]
+    if max_workers <= 1 or len(paths) < MIN_FILES_PER_THREAD_POOL:
+        return dict(zip(paths, map(_try_read_result_file, args)))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(paths, pool.map(_try_read_result_file, args)))
+
+
+class ResultCache:
+    """Columnar cache of the results of the trials of an experiment.
+
+    The results of all trials are stored in a few Parquet files, next to
+    an index of the size and modification time of the result file each
+    trial was read from. Cached results are only used while these match,
+    and selected columns can be read without reading the others.
+
+    New results are added as a new file, which is merged with the existing
+    ones once the cache is split into more than ``MAX_CACHE_PARTS`` files.
+    The dtypes of the columns of every trial are recorded, so the cached
+    dataframes are the same as the ones read from the result files.
+
+    Args:
+        experiment_dir (str): Directory of the experiment.
+        file_type (str): Type of the result files, json or csv.
+    """
+
+    def __init__(self, experiment_dir: str, file_type: str):
+        self._experiment_dir = experiment_dir
+        self._file_type = file_type
+        self._cache_dir = os.path.join(experiment_dir, CACHE_DIR, file_type)
+        self._index_path = os.path.join(self._cache_dir, "index.json")
+        self._index = self._load_index()
+
+    @staticmethod
+    def is_available() -> bool:
+        return pd is not None and pyarrow is not None
+
+    def key(self, path: str) -> Optional[List[int]]:
+        """Returns the size and modification time of the result file of
+        the trial, or None if it does not exist."""
+        try:
+            stat = os.stat(result_file(path, self._file_type))
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def read(self,
+             keys: Dict[str, List[int]],
+             columns: Optional[List[str]] = None) -> Dict[str, DataFrame]:
+        """Returns the cached dataframes of the trials whose result files
+        still have the given keys.
+
+        Args:
+            keys (dict): Trial paths to the current keys of their files.
+            columns (list): Columns to read. If None, all columns are read.
+        """
+        parts = {}
+        for path, key in keys.items():
+            entry = self._index["trials"].get(self._relpath(path))
+            if entry and key and entry["key"] == key:
+                parts.setdefault(entry["part"], []).append(path)
+
+        dataframes = {}
+        for part, paths in parts.items():
+            try:
+                dataframes.update(self._read_part(part, paths, columns))
+            except Exception:
+                logger.debug(f"Could not read cached results from {part}.")
+        return dataframes
+
+    def write(self, dataframes: Dict[str, DataFrame],
+              keys: Dict[str, List[int]]):
+        """Adds the dataframes of the trials read from files with the given
+        keys, replacing the cached ones."""
+        if not dataframes:
+            return
+        try:
+            os.makedirs(self._cache_dir, exist_ok=True)
+            part = "part-{:06d}.parquet".format(self._index["next_part"])
+            columns = self._write_part(part, dataframes)
+        except Exception as e:
+            if log_once("tune_analysis_cache_write"):
+                logger.warning(
+                    f"Could not cache the results of the experiment in "
+                    f"{self._cache_dir}: {e}")
+            return
+
+        self._index["next_part"] += 1
+        self._index["parts"][part] = columns
+        for path, dataframe in dataframes.items():
+            self._index["trials"][self._relpath(path)] = {
+                "key": keys[path],
+                "part": part,
+                "schema": self._schema_id(dataframe),
+            }
+        self._remove_unused_parts()
+        if len(self._index["parts"]) > MAX_CACHE_PARTS:
+            self._compact()
+        self._save_index()
+
+    def _relpath(self, path: str) -> str:
+        return os.path.relpath(path, self._experiment_dir)
+
+    def _load_index(self) -> Dict:
+        index = {"next_part": 0, "parts": {}, "schemas": [], "trials": {}}
+        try:
+            with open(self._index_path, "r") as f:
+                loaded = json.load(f)
+            if set(loaded) == set(index):
+                index = loaded
+        except Exception:
+            pass
+        return index
+
+    def _save_index(self):
+        tmp_path = self._index_path + ".tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, self._index_path)
+        except Exception:
+            logger.debug(f"Could not save the index of {self._cache_dir}.")
+
+    def _schema_id(self, dataframe: DataFrame) -> int:
+        schema = [[str(name), str(dtype)]
+                  for name, dtype in dataframe.dtypes.items()]
+        schemas = self._index["schemas"]
+        if schema not in schemas:
+            schemas.append(schema)
+        return schemas.index(schema)
+
+    def _read_part(self, part: str, paths: List[str],
+                   columns: Optional[List[str]]) -> Dict[str, DataFrame]:
+        part_columns = self._index["parts"][part]
+        if columns is not None:
+            columns = [TRIAL_COLUMN] + [
+                column for column in columns if column in part_columns
+            ]
+        table = pd.read_parquet(
+            os.path.join(self._cache_dir, part), columns=columns)
+        relpaths = {self._relpath(path): path for path in paths}
+        table = table[table[TRIAL_COLUMN].isin(list(relpaths))]
+
+        dataframes = {}
+        for relpath, rows in table.groupby(TRIAL_COLUMN, sort=False):
+            entry = self._index["trials"][relpath]
+            schema = self._index["schemas"][entry["schema"]]
+            dataframe = rows[[
+                name for name, _ in schema
+                if columns is None or name in columns
+            ]].reset_index(drop=True)
+            # Columns missing in other trials are read as floats or objects.
+            for name, dtype in schema:
+                if name in dataframe and str(dataframe[name].dtype) != dtype:
+                    try:
+                        dataframe[name] = dataframe[name].astype(dtype)
+                    except (TypeError, ValueError):
+                        pass
+            dataframes[relpaths[relpath]] = dataframe
+        return dataframes
+
+    def _write_part(self, part: str,
+                    dataframes: Dict[str, DataFrame]) -> List[str]:
+        table = pd.concat(
+            [
+                dataframe.assign(**{TRIAL_COLUMN: self._relpath(path)})
+                for path, dataframe in dataframes.items()
+            ],
+            ignore_index=True,
+            sort=False)
+        tmp_path = os.path.join(self._cache_dir, part + ".tmp")
+        table.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, os.path.join(self._cache_dir, part))
+        return [column for column in table.columns if column != TRIAL_COLUMN]
+
+    def _remove_unused_parts(self):
+        used = {entry["part"] for entry in self._index["trials"].values()}
+        for part in list(self._index["parts"]):
+            if part not in used:
+                del self._index["parts"][part]
+                try:
+                    os.remove(os.path.join(self._cache_dir, part))
+                except OSError:
+                    pass
+
+    def _compact(self):
+        """Merges all parts into a single one."""
+        paths = [
+            os.path.join(self._experiment_dir, relpath)
+            for relpath in self._index["trials"]
+        ]
+        keys = {
+            path: self._index["trials"][self._relpath(path)]["key"]
+            for path in paths
+        }
+        dataframes = self.read(keys)
+        self._index["trials"] = {
+            self._relpath(path): self._index["trials"][self._relpath(path)]
+            for path in dataframes
+        }
+        if not dataframes:
+            self._remove_unused_parts()
+            return
+        try:
+            part = "part-{:06d}.parquet".format(self._index["next_part"])
+            columns = self._write_part(part, dataframes)
+        except Exception:
+            logger.debug(f"Could not compact {self._cache_dir}.")
+            return
+        self._index["next_part"] += 1
+        self._index["parts"][part] = columns
+        for relpath in self._index["trials"]:
+            self._index["trials"][relpath]["part"] = part
+        self._remove_unused_parts()
+
+
+def load_trial_dataframes(experiment_dir: str,
+                          paths: List[str],
+                          file_type: str,
+                          columns: Optional[List[str]] = None
+                          ) -> Dict[str, DataFrame]:
+    """Loads the results of the trials at the given paths.
+
+    Results are read from the cache of the experiment if their files did
+    not change since they were cached. The others are read from their files
+    in parallel and added to the cache. Set ``TUNE_ANALYSIS_CACHE_RESULTS=0``
+    to disable the cache.
+
+    Args:
+        experiment_dir (str): Directory of the experiment.
+        paths (list): Trial directories to load the results of.
+        file_type (str): Read results from json or csv files.
+        columns (list): Columns to load. If None, all columns are loaded.
+
+    Returns:
+        Dict of trial paths to their dataframes. Trials whose results
+        could not be read are left out.
+    """
+    cache = None
+    if int(os.environ.get("TUNE_ANALYSIS_CACHE_RESULTS", "1")):
+        if ResultCache.is_available():
+            cache = ResultCache(experiment_dir, file_type)
+        elif log_once("tune_analysis_cache_pyarrow"):
+            logger.info("Install pyarrow to cache the results of trials "
+                        "when they are loaded for analysis.")
+
+    dataframes = {}
+    keys = {}
+    if cache:
+        keys = {path: cache.key(path) for path in paths}
+        dataframes = cache.read(keys, columns)
+
+    stale = [path for path in paths if path not in dataframes]
+    loaded = {
+        path: dataframe
+        for path, dataframe in read_result_files(stale, file_type).items()
+        if dataframe is not None
+    }
+    if cache:
+        cache.write(loaded, keys)
+    for path, dataframe in loaded.items():
+        if columns is not None:
+            dataframe = dataframe[[
+                column for column in columns if column in dataframe
+            ]]
+        dataframes[path] = dataframe
+    return {path: dataframes[path] for path in paths if path in dataframes}
@@ -17,7 +17,7 @@ from six.moves import queue
 from ray.util.debug import log_once
 from ray.tune import TuneError, session
 from ray.tune.trainable import Trainable, TrainableUtil
-from ray.tune.result import (DEFAULT_METRIC, TIME_THIS_ITER_S,
+from ray.tune.result import (DEFAULT_METRIC, DONE, TIME_THIS_ITER_S,
                              RESULT_DUPLICATE, SHOULD_CHECKPOINT)
 from ray.tune.utils import (detect_checkpoint_function, detect_config_single,
                             detect_reporter)
@@ -35,6 +35,9 @@ ERROR_FETCH_TIMEOUT = 1
 NULL_MARKER = ".null_marker"
 TEMP_MARKER = ".temp_marker"
 
+# Key of the checkpoint passed along with a result reported ahead.
+RESULT_CHECKPOINT = "__checkpoint__"
+
 
 class FuncCheckpointUtil:
     """Utility class holding various function-checkpointing mechanisms.
@@ -114,6 +117,11 @@ class FuncCheckpointUtil:
 class StatusReporter:
     """Object passed into your function that you can report status through.
 
+    By default, reporting a result blocks until the result has been returned
+    to Tune. If ``report_async`` is set, only reporting a result with a new
+    checkpoint blocks, and the function continues training while the other
+    results are buffered in the result queue.
+
     Example:
         >>> def trainable_function(config, reporter):
         >>>     assert isinstance(reporter, StatusReporter)
@@ -127,7 +135,8 @@ class StatusReporter:
                  trial_name=None,
                  trial_id=None,
                  logdir=None,
-                 trial_resources=None):
+                 trial_resources=None,
+                 report_async=False):
         self._queue = result_queue
         self._last_report_time = None
         self._continue_semaphore = continue_semaphore
@@ -138,6 +147,7 @@ class StatusReporter:
         self._last_checkpoint = None
         self._fresh_checkpoint = False
         self._trial_resources = trial_resources
+        self._report_async = report_async
 
     def reset(self,
               trial_name=None,
@@ -182,13 +192,22 @@ class StatusReporter:
             kwargs[TIME_THIS_ITER_S] = report_time - self._last_report_time
         self._last_report_time = report_time
 
+        result = kwargs.copy()
+        if self._report_async and self._fresh_checkpoint:
+            # The checkpoint belongs to this result and not to the results
+            # buffered before it.
+            result[SHOULD_CHECKPOINT] = True
+            result[RESULT_CHECKPOINT] = self._last_checkpoint
+            self._fresh_checkpoint = False
+
         # add results to a thread-safe queue
-        self._queue.put(kwargs.copy(), block=True)
+        self._queue.put(result, block=True)
 
-        # This blocks until notification from the FunctionRunner that the last
-        # result has been returned to Tune and that the function is safe to
-        # resume training.
-        self._continue_semaphore.acquire()
+        if not self._report_async or result.get(SHOULD_CHECKPOINT):
+            # This blocks until notification from the FunctionRunner that the
+            # last result has been returned to Tune and that the function is
+            # safe to resume training.
+            self._continue_semaphore.acquire()
 
         # If the trial should be terminated, exit gracefully.
         if self._end_event.is_set():
@@ -284,7 +303,14 @@ class _RunnerThread(threading.Thread):
 class FunctionRunner(Trainable):
     """Trainable that runs a user function reporting results.
 
-    This mode of execution does not support checkpoint/restore."""
+    By default, the function is paused on every reported result until Tune
+    has processed it. If the ``TUNE_FUNCTION_RESULT_BUFFER_LENGTH``
+    environment variable is set to a positive number, up to this many
+    results are buffered instead, and the function only pauses on results
+    with a new checkpoint. All buffered results are then returned by one
+    ``train_buffered()`` call, so scheduler decisions take effect after the
+    function already reported the following results of the batch.
+    """
 
     _name = "func"
 
@@ -297,8 +323,13 @@ class FunctionRunner(Trainable):
         # the thread.
         self._end_event = threading.Event()
 
+        # Maximum number of results the function can report ahead of the
+        # results returned by step(). If 0, every report blocks.
+        self._result_buffer_length = int(
+            os.environ.get("TUNE_FUNCTION_RESULT_BUFFER_LENGTH", 0))
+
         # Queue for passing results between threads
-        self._results_queue = queue.Queue(1)
+        self._results_queue = queue.Queue(max(1, self._result_buffer_length))
 
         # Queue for passing errors back from the thread runner. The error queue
         # has a max size of one to prevent stacking error and force error
@@ -312,8 +343,16 @@ class FunctionRunner(Trainable):
             trial_name=self.trial_name,
             trial_id=self.trial_id,
             logdir=self.logdir,
-            trial_resources=self.trial_resources)
+            trial_resources=self.trial_resources,
+            report_async=self._result_buffer_length > 0)
         self._last_result = {}
+        # Whether the reporter waits for the continue semaphore after
+        # reporting the last result returned by step().
+        self._reporter_waiting = False
+        # If the results are reported ahead, the checkpoint of the last
+        # result returned by step(). The checkpoint of the reporter may
+        # belong to a result which has not been returned yet.
+        self._returned_checkpoint = None
 
         session.init(self._status_reporter)
         self._runner = None
@@ -327,6 +366,8 @@ class FunctionRunner(Trainable):
 
     def _start(self):
         def entrypoint():
+            # Trainables can share a process when run in a pooled actor.
+            session.init_thread(self._status_reporter)
             return self._trainable_func(self.config, self._status_reporter,
                                         self._status_reporter.get_checkpoint())
 
@@ -352,8 +393,10 @@ class FunctionRunner(Trainable):
         if self._runner and self._runner.is_alive():
             # if started and alive, inform the reporter to continue and
             # generate the next result
-            self._continue_semaphore.release()
-        else:
+            if self._reporter_waiting:
+                self._continue_semaphore.release()
+        elif self._runner is None or self._results_queue.empty():
+            # Results buffered before the runner finished are returned first.
             self._start()
 
         result = None
@@ -395,6 +438,9 @@ class FunctionRunner(Trainable):
                     ("Runner error waiting to be raised in main thread. "
                      "Logging all available results first."))
 
+        if RESULT_CHECKPOINT in result:
+            self._returned_checkpoint = result.pop(RESULT_CHECKPOINT)
+
         # This keyword appears if the train_func using the Function API
         # finishes without "done=True". This duplicates the last result, but
         # the TrialRunner will not log this result again.
@@ -404,10 +450,30 @@ class FunctionRunner(Trainable):
             result = new_result
 
         self._last_result = result
-        if self._status_reporter.has_new_checkpoint():
+        # If the results are reported ahead, the reporter marks the result
+        # the new checkpoint belongs to.
+        if (not self._result_buffer_length
+                and self._status_reporter.has_new_checkpoint()):
             result[SHOULD_CHECKPOINT] = True
+        self._reporter_waiting = (not self._result_buffer_length
+                                  or result.get(SHOULD_CHECKPOINT, False))
         return result
 
+    def train_buffered(self,
+                       buffer_time_s: float,
+                       max_buffer_length: int = 1000):
+        results = super().train_buffered(buffer_time_s, max_buffer_length)
+        if not self._result_buffer_length:
+            return results
+        # Also return the results the function reported ahead, up to the
+        # next result that ends a batch.
+        while (len(results) < max_buffer_length
+               and not self._results_queue.empty()
+               and not any(results[-1].get(key) for key in
+                           (DONE, SHOULD_CHECKPOINT, RESULT_DUPLICATE))):
+            results.append(self.train())
+        return results
+
     def execute(self, fn):
         return fn(self)
 
@@ -416,7 +482,10 @@ class FunctionRunner(Trainable):
             raise ValueError(
                 "Checkpoint path should not be used with function API.")
 
-        checkpoint = self._status_reporter.get_checkpoint()
+        if self._result_buffer_length:
+            checkpoint = self._returned_checkpoint
+        else:
+            checkpoint = self._status_reporter.get_checkpoint()
         state = self.get_state()
 
         if not checkpoint:
@@ -470,6 +539,7 @@ class FunctionRunner(Trainable):
         # we will not return the checkpoint path
         # as a new checkpoint.
         self._status_reporter.set_checkpoint(checkpoint, is_new=False)
+        self._returned_checkpoint = checkpoint
 
     def restore_from_object(self, obj):
         self.temp_checkpoint_dir = (FuncCheckpointUtil.mk_temp_checkpoint_dir(
@@ -485,7 +555,8 @@ class FunctionRunner(Trainable):
         # Do not wait for thread termination here.
 
         # If everything stayed in synch properly, this should never happen.
-        if not self._results_queue.empty():
+        # Buffered results are expected if the results are reported ahead.
+        if not self._result_buffer_length and not self._results_queue.empty():
             logger.warning(
                 ("Some results were added after the trial stop condition. "
                  "These results won't be logged."))
@@ -504,6 +575,9 @@ class FunctionRunner(Trainable):
         if self._runner and self._runner.is_alive():
             self._end_event.set()
             self._continue_semaphore.release()
+            # Discard the buffered results, so that a reporter waiting for
+            # space in the queue can exit.
+            self._discard_results()
             # Wait for thread termination so it is save to re-use the same
             # actor.
             thread_timeout = int(
@@ -513,8 +587,17 @@ class FunctionRunner(Trainable):
                 # Did not finish within timeout, reset unsuccessful.
                 return False
 
+        if self._result_buffer_length:
+            # The reporter may not have been waiting for the signals above.
+            self._discard_results()
+            while self._continue_semaphore.acquire(blocking=False):
+                pass
+            self._end_event.clear()
+
         self._runner = None
         self._last_result = {}
+        self._reporter_waiting = False
+        self._returned_checkpoint = None
 
         self._status_reporter.reset(
             trial_name=self.trial_name,
@@ -524,6 +607,13 @@ class FunctionRunner(Trainable):
 
         return True
 
+    def _discard_results(self):
+        try:
+            while True:
+                self._results_queue.get(block=False)
+        except queue.Empty:
+            pass
+
     def _report_thread_runner_error(self, block=False):
         try:
             err_tb_str = self._error_queue.get(
@@ -1,11 +1,12 @@
 import csv
+import io
 import json
 import logging
 import numpy as np
 import os
 import yaml
 
-from typing import Iterable, TYPE_CHECKING, Dict, List, Optional, TextIO, Type
+from typing import Iterable, TYPE_CHECKING, Dict, List, Optional, Type
 
 import ray.cloudpickle as cloudpickle
 
@@ -16,6 +17,7 @@ from ray.tune.result import (TRAINING_ITERATION, TIME_TOTAL_S, TIMESTEPS_TOTAL,
                              EXPR_PARAM_FILE, EXPR_PARAM_PICKLE_FILE,
                              EXPR_PROGRESS_FILE, EXPR_RESULT_FILE)
 from ray.tune.utils import flatten_dict
+from ray.tune.utils.file_writer import AsyncFileWriter
 from ray.util.annotations import PublicAPI
 
 if TYPE_CHECKING:
@@ -342,6 +344,13 @@ class UnifiedLogger(Logger):
             _logger.flush()
 
 
+def _create_file_writer() -> AsyncFileWriter:
+    """Creates the writer of the result files of the logger callbacks."""
+    return AsyncFileWriter(
+        flush_period_s=float(os.getenv("TUNE_LOGGER_FLUSH_PERIOD_S", "5")),
+        max_open_files=int(os.getenv("TUNE_LOGGER_MAX_OPEN_FILES", "256")))
+
+
 @PublicAPI
 class LoggerCallback(Callback):
     """Base class for experiment-level logger callbacks
@@ -479,38 +488,52 @@ class JsonLoggerCallback(LoggerCallback):
     Also writes to a results file and param.json file when results or
     configurations are updated. Experiments must be executed with the
     JsonLoggerCallback to be compatible with the ExperimentAnalysis tool.
+
+    Results are written in batches from a background thread, at the latest
+    after ``TUNE_LOGGER_FLUSH_PERIOD_S`` seconds and when the trial saves
+    or restores a checkpoint or ends.
     """
 
     def __init__(self):
         self._trial_configs: Dict["Trial", Dict] = {}
-        self._trial_files: Dict["Trial", TextIO] = {}
+        self._trial_files: Dict["Trial", str] = {}
+        self._file_writer = _create_file_writer()
 
     def log_trial_start(self, trial: "Trial"):
         if trial in self._trial_files:
-            self._trial_files[trial].close()
+            self._file_writer.close(self._trial_files[trial])
 
         # Update config
         self.update_config(trial, trial.config)
 
         # Make sure logdir exists
         trial.init_logdir()
-        local_file = os.path.join(trial.logdir, EXPR_RESULT_FILE)
-        self._trial_files[trial] = open(local_file, "at")
+        self._trial_files[trial] = os.path.join(trial.logdir,
+                                                EXPR_RESULT_FILE)
+
+    def log_trial_restore(self, trial: "Trial"):
+        self._file_writer.flush()
+
+    def log_trial_save(self, trial: "Trial"):
+        self._file_writer.flush()
 
     def log_trial_result(self, iteration: int, trial: "Trial", result: Dict):
         if trial not in self._trial_files:
             self.log_trial_start(trial)
-        json.dump(result, self._trial_files[trial], cls=SafeFallbackEncoder)
-        self._trial_files[trial].write("\n")
-        self._trial_files[trial].flush()
+        self._file_writer.write(
+            self._trial_files[trial],
+            json.dumps(result, cls=SafeFallbackEncoder) + "\n")
 
     def log_trial_end(self, trial: "Trial", failed: bool = False):
         if trial not in self._trial_files:
             return
 
-        self._trial_files[trial].close()
+        self._file_writer.close(self._trial_files[trial])
         del self._trial_files[trial]
 
+    def on_experiment_end(self, trials: List["Trial"], **info):
+        self._file_writer.shutdown()
+
     def update_config(self, trial: "Trial", config: Dict):
         self._trial_configs[trial] = config
 
@@ -536,24 +559,39 @@ class CSVLoggerCallback(LoggerCallback):
 
         {"a": {"b": 1, "c": 2}} -> {"a/b": 1, "a/c": 2}
 
+    Results are written in batches from a background thread, at the latest
+    after ``TUNE_LOGGER_FLUSH_PERIOD_S`` seconds and when the trial saves
+    or restores a checkpoint or ends.
     """
 
     def __init__(self):
         self._trial_continue: Dict["Trial", bool] = {}
-        self._trial_files: Dict["Trial", TextIO] = {}
+        self._trial_files: Dict["Trial", str] = {}
+        # The rows of a trial are formatted into its buffer, which is then
+        # passed to the file writer.
+        self._trial_buffers: Dict["Trial", io.StringIO] = {}
         self._trial_csv: Dict["Trial", csv.DictWriter] = {}
+        self._file_writer = _create_file_writer()
 
     def log_trial_start(self, trial: "Trial"):
         if trial in self._trial_files:
-            self._trial_files[trial].close()
+            # Make sure all rows are written before checking the file.
+            self._file_writer.close(self._trial_files[trial])
 
         # Make sure logdir exists
         trial.init_logdir()
         local_file = os.path.join(trial.logdir, EXPR_PROGRESS_FILE)
         self._trial_continue[trial] = os.path.exists(local_file)
-        self._trial_files[trial] = open(local_file, "at")
+        self._trial_files[trial] = local_file
+        self._trial_buffers[trial] = io.StringIO()
         self._trial_csv[trial] = None
 
+    def log_trial_restore(self, trial: "Trial"):
+        self._file_writer.flush()
+
+    def log_trial_save(self, trial: "Trial"):
+        self._file_writer.flush()
+
     def log_trial_result(self, iteration: int, trial: "Trial", result: Dict):
         if trial not in self._trial_files:
             self.log_trial_start(trial)
@@ -562,9 +600,9 @@ class CSVLoggerCallback(LoggerCallback):
         tmp.pop("config", None)
         result = flatten_dict(tmp, delimiter="/")
 
+        buffer = self._trial_buffers[trial]
         if not self._trial_csv[trial]:
-            self._trial_csv[trial] = csv.DictWriter(self._trial_files[trial],
-                                                    result.keys())
+            self._trial_csv[trial] = csv.DictWriter(buffer, result.keys())
             if not self._trial_continue[trial]:
                 self._trial_csv[trial].writeheader()
 
@@ -573,16 +611,22 @@ class CSVLoggerCallback(LoggerCallback):
             for k, v in result.items()
             if k in self._trial_csv[trial].fieldnames
         })
-        self._trial_files[trial].flush()
+        self._file_writer.write(self._trial_files[trial], buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
 
     def log_trial_end(self, trial: "Trial", failed: bool = False):
         if trial not in self._trial_files:
             return
 
         del self._trial_csv[trial]
-        self._trial_files[trial].close()
+        del self._trial_buffers[trial]
+        self._file_writer.close(self._trial_files[trial])
         del self._trial_files[trial]
 
+    def on_experiment_end(self, trials: List["Trial"], **info):
+        self._file_writer.shutdown()
+
 
 class TBXLoggerCallback(LoggerCallback):
     """TensorBoardX Logger.
@@ -591,6 +635,11 @@ class TBXLoggerCallback(LoggerCallback):
     This logger automatically flattens nested dicts to show on TensorBoard:
 
         {"a": {"b": 1, "c": 2}} -> {"a/b": 1, "a/c": 2}
+
+    The summary writers write events from a background thread and are
+    flushed when a trial saves or restores a checkpoint. Each writer is
+    kept open until its trial ends, as reopening it would start a new
+    event file.
     """
 
     VALID_HPARAMS = (str, bool, int, float, list, type(None))
@@ -616,9 +665,18 @@ class TBXLoggerCallback(LoggerCallback):
             trial.logdir, flush_secs=30)
         self._trial_result[trial] = {}
 
+    def log_trial_restore(self, trial: "Trial"):
+        if trial in self._trial_writer:
+            self._trial_writer[trial].flush()
+
+    def log_trial_save(self, trial: "Trial"):
+        if trial in self._trial_writer:
+            self._trial_writer[trial].flush()
+
     def log_trial_result(self, iteration: int, trial: "Trial", result: Dict):
         if trial not in self._trial_writer:
             self.log_trial_start(trial)
+        writer = self._trial_writer[trial]
 
         step = result.get(TIMESTEPS_TOTAL) or result[TRAINING_ITERATION]
 
@@ -638,21 +696,19 @@ class TBXLoggerCallback(LoggerCallback):
             if (isinstance(value, tuple(VALID_SUMMARY_TYPES))
                     and not np.isnan(value)):
                 valid_result[full_attr] = value
-                self._trial_writer[trial].add_scalar(
-                    full_attr, value, global_step=step)
+                writer.add_scalar(full_attr, value, global_step=step)
             elif ((isinstance(value, list) and len(value) > 0)
                   or (isinstance(value, np.ndarray) and value.size > 0)):
                 valid_result[full_attr] = value
 
                 # Must be video
                 if isinstance(value, np.ndarray) and value.ndim == 5:
-                    self._trial_writer[trial].add_video(
+                    writer.add_video(
                         full_attr, value, global_step=step, fps=20)
                     continue
 
                 try:
-                    self._trial_writer[trial].add_histogram(
-                        full_attr, value, global_step=step)
+                    writer.add_histogram(full_attr, value, global_step=step)
                 # In case TensorboardX still doesn't think it's a valid value
                 # (e.g. `[[]]`), warn and move on.
                 except (ValueError, TypeError):
@@ -663,7 +719,6 @@ class TBXLoggerCallback(LoggerCallback):
                                              type(self).__name__))
 
         self._trial_result[trial] = valid_result
-        self._trial_writer[trial].flush()
 
     def log_trial_end(self, trial: "Trial", failed: bool = False):
         if trial in self._trial_writer:
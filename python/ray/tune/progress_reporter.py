@@ -1,9 +1,13 @@
 from __future__ import print_function
 
 import datetime
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import collections
+import heapq
+import itertools
+import math
+import numbers
 import os
 import sys
 import numpy as np
@@ -172,6 +176,8 @@ class TuneReporterBase(ProgressReporter):
         else:
             self._sort_by_metric = sort_by_metric
 
+        self._trial_tracker = _TrialTracker()
+
     def set_search_properties(self, metric: Optional[str],
                               mode: Optional[str]):
         if self._metric and metric:
@@ -275,8 +281,12 @@ class TuneReporterBase(ProgressReporter):
             fmt (str): Table format. See `tablefmt` in tabulate API.
             delim (str): Delimiter between messages.
         """
+        # Only the trials that changed since the last report are indexed
+        # again and checked for new metrics.
+        changed_trials = self._trial_tracker.update(trials)
         if not self._metrics_override:
-            user_metrics = self._infer_user_metrics(trials, self._infer_limit)
+            user_metrics = self._infer_user_metrics(changed_trials,
+                                                    self._infer_limit)
             self._metric_columns.update(user_metrics)
         messages = [
             "== Status ==",
@@ -310,17 +320,25 @@ class TuneReporterBase(ProgressReporter):
                     done=done,
                     metric=self._metric,
                     mode=self._mode,
-                    sort_by_metric=self._sort_by_metric))
+                    sort_by_metric=self._sort_by_metric,
+                    trial_tracker=self._trial_tracker))
             messages.append(
-                trial_errors_str(trials, fmt=fmt, max_rows=max_error))
+                trial_errors_str(
+                    trials,
+                    fmt=fmt,
+                    max_rows=max_error,
+                    trial_tracker=self._trial_tracker))
 
         return delim.join(messages) + delim
 
     def _infer_user_metrics(self, trials: List[Trial], limit: int = 4):
-        """Try to infer the metrics to print out."""
+        """Try to infer the metrics to print out.
+
+        Metrics inferred from earlier trials are kept, so only the trials
+        that reported new results have to be passed.
+        """
         if len(self._inferred_metrics) >= limit:
             return self._inferred_metrics
-        self._inferred_metrics = {}
         for t in trials:
             if not t.last_result:
                 continue
@@ -348,19 +366,9 @@ class TuneReporterBase(ProgressReporter):
         if not metric or not mode:
             return None, metric
 
-        metric_op = 1. if mode == "max" else -1.
-        best_metric = float("-inf")
-        best_trial = None
-        for t in trials:
-            if not t.last_result:
-                continue
-            if metric not in t.last_result:
-                continue
-            if not best_metric or \
-               t.last_result[metric] * metric_op > best_metric:
-                best_metric = t.last_result[metric] * metric_op
-                best_trial = t
-        return best_trial, metric
+        # The trials were indexed by `_progress_str`.
+        self._trial_tracker.set_metric(metric, mode)
+        return self._trial_tracker.best_trial(), metric
 
 
 @PublicAPI
@@ -576,6 +584,177 @@ def _get_trials_by_state(trials: List[Trial]):
     return trials_by_state
 
 
+class _LazyHeap:
+    """Heap of items whose priorities can be updated and removed.
+
+    Replaced entries are left in the heap and skipped when they come up,
+    so updates take ``O(log n)``. The heap is rebuilt once most of its
+    entries are outdated.
+    """
+
+    def __init__(self):
+        self._heap = []
+        # Item -> current [priority, insertion count, item] entry.
+        self._entries = {}
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def push(self, item: Any, priority: Any):
+        entry = self._entries.get(item)
+        if entry is not None and entry[0] == priority:
+            return
+        # The insertion count breaks ties, so items are never compared.
+        entry = [priority, next(self._counter), item]
+        self._entries[item] = entry
+        heapq.heappush(self._heap, entry)
+        self._maybe_compact()
+
+    def remove(self, item: Any):
+        if self._entries.pop(item, None) is not None:
+            self._maybe_compact()
+
+    def first(self) -> Optional[List]:
+        """Returns the entry with the smallest priority, or None."""
+        entries = self.smallest_entries(1)
+        return entries[0] if entries else None
+
+    def smallest(self, n: int) -> List[Any]:
+        """Returns the ``n`` items with the smallest priorities, in order."""
+        return [entry[2] for entry in self.smallest_entries(n)]
+
+    def smallest_entries(self, n: int) -> List[List]:
+        entries = []
+        while self._heap and len(entries) < n:
+            entry = heapq.heappop(self._heap)
+            if self._entries.get(entry[2]) is entry:
+                entries.append(entry)
+        for entry in entries:
+            heapq.heappush(self._heap, entry)
+        return entries
+
+    def _maybe_compact(self):
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+
+class _TrialTracker:
+    """Incrementally indexes the trials of a progress report.
+
+    Keeps the number of trials per status, and heaps of the trials of each
+    status ordered by trial ID and by a metric. Each update only indexes
+    the trials whose status or last result changed, and the rows of a
+    truncated progress table are selected from the heaps in time bounded
+    by the number of rows instead of the number of trials.
+    """
+
+    def __init__(self):
+        # Trial -> status and last result when it was indexed.
+        self._trials: Dict[Trial, tuple] = {}
+        self.num_trials_by_state = collections.Counter()
+        self.local_dirs = collections.Counter()
+        # Trials with an error file, in the order they were indexed.
+        self.errored_trials: Dict[Trial, None] = {}
+        self._by_id = collections.defaultdict(_LazyHeap)
+        self._by_metric = collections.defaultdict(_LazyHeap)
+        self._metric = None
+        self._mode = None
+
+    @classmethod
+    def from_trials(cls,
+                    trials: List[Trial],
+                    metric: Optional[str] = None,
+                    mode: Optional[str] = None) -> "_TrialTracker":
+        tracker = cls()
+        tracker.set_metric(metric, mode)
+        tracker.update(trials)
+        return tracker
+
+    def update(self, trials: List[Trial]) -> List[Trial]:
+        """Indexes the trials that changed since the last update.
+
+        Returns:
+            The trials that are new or changed.
+        """
+        changed = []
+        for trial in trials:
+            status, result = trial.status, trial.last_result
+            indexed = self._trials.get(trial)
+            if indexed is not None:
+                if indexed[0] == status and indexed[1] is result:
+                    continue
+                self._remove(trial)
+            self._add(trial, status, result)
+            changed.append(trial)
+        if len(self._trials) > len(trials):
+            current = set(trials)
+            for trial in [t for t in self._trials if t not in current]:
+                self._remove(trial)
+        return changed
+
+    def set_metric(self, metric: Optional[str], mode: Optional[str]):
+        """Sets the metric to order the trials by."""
+        if (metric, mode) == (self._metric, self._mode):
+            return
+        self._metric, self._mode = metric, mode
+        self._by_metric.clear()
+        for trial, (status, result) in self._trials.items():
+            self._index_metric(trial, status, result)
+
+    def best_trial(self) -> Optional[Trial]:
+        """Returns the trial with the best value of the metric."""
+        entries = [heap.first() for heap in self._by_metric.values()]
+        entries = [entry for entry in entries if entry is not None]
+        return min(entries)[2] if entries else None
+
+    def first_trials(self, state: str, n: int) -> List[Trial]:
+        """Returns the ``n`` trials of the state with the lowest IDs."""
+        return self._by_id[state].smallest(n)
+
+    def best_trials(self, state: str, n: int) -> List[Trial]:
+        """Returns the ``n`` trials of the state with the best values of the
+        metric. Trials that did not report the metric come last."""
+        trials = self._by_metric[state].smallest(n)
+        if len(trials) < n:
+            ranked = set(trials)
+            trials += [
+                trial for trial in self.first_trials(state, n + len(ranked))
+                if trial not in ranked
+            ][:n - len(trials)]
+        return trials
+
+    def _add(self, trial: Trial, status: str, result: Dict):
+        self._trials[trial] = (status, result)
+        self.num_trials_by_state[status] += 1
+        self.local_dirs[trial.local_dir] += 1
+        if trial.error_file:
+            self.errored_trials[trial] = None
+        self._by_id[status].push(trial, trial.trial_id)
+        self._index_metric(trial, status, result)
+
+    def _remove(self, trial: Trial):
+        status, _ = self._trials.pop(trial)
+        for counter, key in ((self.num_trials_by_state, status),
+                             (self.local_dirs, trial.local_dir)):
+            counter[key] -= 1
+            if counter[key] <= 0:
+                del counter[key]
+        self.errored_trials.pop(trial, None)
+        self._by_id[status].remove(trial)
+        self._by_metric[status].remove(trial)
+
+    def _index_metric(self, trial: Trial, status: str, result: Dict):
+        if not self._metric or not self._mode:
+            return
+        value = result.get(self._metric) if result else None
+        if not isinstance(value, numbers.Number) or math.isnan(value):
+            return
+        self._by_metric[status].push(
+            trial, -value if self._mode == "max" else value)
+
+
 def trial_progress_str(
         trials: List[Trial],
         metric_columns: Union[List[str], Dict[str, str]],
@@ -587,7 +766,8 @@ def trial_progress_str(
         done: bool = False,
         metric: Optional[str] = None,
         mode: Optional[str] = None,
-        sort_by_metric: bool = False):
+        sort_by_metric: bool = False,
+        trial_tracker: Optional[_TrialTracker] = None):
     """Returns a human readable message for printing to the console.
 
     This contains a table where each row represents a trial, its parameters
@@ -617,6 +797,8 @@ def trial_progress_str(
             minimizing or maximizing the metric attribute.
         sort_by_metric (bool): Sort terminated trials by metric in the
             intermediate table. Defaults to False.
+        trial_tracker (_TrialTracker): Index of the trials, updated with
+            ``trials``. If not set, the trials are indexed.
     """
     messages = []
     delim = "<br>" if fmt == "html" else "\n"
@@ -624,14 +806,16 @@ def trial_progress_str(
         return delim.join(messages)
 
     num_trials = len(trials)
-    trials_by_state = _get_trials_by_state(trials)
+    if trial_tracker is None:
+        trial_tracker = _TrialTracker.from_trials(trials)
 
-    for local_dir in sorted({t.local_dir for t in trials}):
+    for local_dir in sorted(trial_tracker.local_dirs):
         messages.append("Result logdir: {}".format(local_dir))
 
+    num_trials_by_state = trial_tracker.num_trials_by_state
     num_trials_strs = [
-        "{} {}".format(len(trials_by_state[state]), state)
-        for state in sorted(trials_by_state)
+        "{} {}".format(num_trials_by_state[state], state)
+        for state in sorted(num_trials_by_state)
     ]
 
     if total_samples and total_samples >= sys.maxsize:
@@ -642,9 +826,9 @@ def trial_progress_str(
         if total_samples else "", ", ".join(num_trials_strs)))
 
     if force_table or (has_verbosity(Verbosity.V2_TRIAL_NORM) and done):
-        messages += trial_progress_table(trials, metric_columns,
-                                         parameter_columns, fmt, max_rows,
-                                         metric, mode, sort_by_metric)
+        messages += trial_progress_table(
+            trials, metric_columns, parameter_columns, fmt, max_rows, metric,
+            mode, sort_by_metric, trial_tracker)
 
     return delim.join(messages)
 
@@ -657,17 +841,10 @@ def trial_progress_table(
         max_rows: Optional[int] = None,
         metric: Optional[str] = None,
         mode: Optional[str] = None,
-        sort_by_metric: bool = False):
+        sort_by_metric: bool = False,
+        trial_tracker: Optional[_TrialTracker] = None):
     messages = []
     num_trials = len(trials)
-    trials_by_state = _get_trials_by_state(trials)
-
-    # Sort terminated trials by metric and mode, descending if mode is "max"
-    if sort_by_metric:
-        trials_by_state[Trial.TERMINATED] = sorted(
-            trials_by_state[Trial.TERMINATED],
-            reverse=(mode == "max"),
-            key=lambda t: t.last_result[metric])
 
     state_tbl_order = [
         Trial.RUNNING, Trial.PAUSED, Trial.PENDING, Trial.TERMINATED,
@@ -676,22 +853,43 @@ def trial_progress_table(
     max_rows = max_rows or float("inf")
     if num_trials > max_rows:
         # TODO(ujvl): suggestion for users to view more rows.
-        trials_by_state_trunc = _fair_filter_trials(trials_by_state, max_rows,
-                                                    sort_by_metric)
+        # Select the rows from the index, so that the time taken does not
+        # grow with the number of trials.
+        if trial_tracker is None:
+            trial_tracker = _TrialTracker.from_trials(trials)
+        if sort_by_metric:
+            trial_tracker.set_metric(metric, mode)
+        num_trials_by_state = trial_tracker.num_trials_by_state
+        num_rows_by_state = _fair_num_rows(num_trials_by_state, max_rows)
         trials = []
         overflow_strs = []
         for state in state_tbl_order:
-            if state not in trials_by_state:
+            if state not in num_trials_by_state:
                 continue
-            trials += trials_by_state_trunc[state]
-            num = len(trials_by_state[state]) - len(
-                trials_by_state_trunc[state])
+            num_rows = num_rows_by_state[state]
+            # Sort terminated trials by metric and mode, descending if mode
+            # is "max"
+            if state == Trial.TERMINATED and sort_by_metric:
+                trials += trial_tracker.best_trials(state, num_rows)
+            else:
+                trials += trial_tracker.first_trials(state, num_rows)
+            num = num_trials_by_state[state] - num_rows
             if num > 0:
                 overflow_strs.append("{} {}".format(num, state))
         # Build overflow string.
         overflow = num_trials - max_rows
         overflow_str = ", ".join(overflow_strs)
     else:
+        trials_by_state = _get_trials_by_state(trials)
+
+        # Sort terminated trials by metric and mode, descending if mode is
+        # "max"
+        if sort_by_metric:
+            trials_by_state[Trial.TERMINATED] = sorted(
+                trials_by_state[Trial.TERMINATED],
+                reverse=(mode == "max"),
+                key=lambda t: t.last_result[metric])
+
         overflow = False
         overflow_str = ""
         trials = []
@@ -748,7 +946,8 @@ def trial_progress_table(
 
 def trial_errors_str(trials: List[Trial],
                      fmt: str = "psql",
-                     max_rows: Optional[int] = None):
+                     max_rows: Optional[int] = None,
+                     trial_tracker: Optional[_TrialTracker] = None):
     """Returns a readable message regarding trial errors.
 
     Args:
@@ -756,9 +955,14 @@ def trial_errors_str(trials: List[Trial],
         fmt (str): Output format (see tablefmt in tabulate API).
         max_rows (int): Maximum number of rows in the error table. Defaults to
             unlimited.
+        trial_tracker (_TrialTracker): Index of the trials, updated with
+            ``trials``. If not set, all trials are checked for errors.
     """
     messages = []
-    failed = [t for t in trials if t.error_file]
+    if trial_tracker is None:
+        failed = [t for t in trials if t.error_file]
+    else:
+        failed = trial_tracker.errored_trials
     num_failed = len(failed)
     if num_failed > 0:
         messages.append("Number of errored trials: {}".format(num_failed))
@@ -766,7 +970,7 @@ def trial_errors_str(trials: List[Trial],
             messages.append("Table truncated to {} rows ({} overflow)".format(
                 max_rows, num_failed - max_rows))
         error_table = []
-        for trial in failed[:max_rows]:
+        for trial in itertools.islice(failed, max_rows):
             row = [str(trial), trial.num_failures, trial.error_file]
             error_table.append(row)
         columns = ["Trial name", "# failures", "error file"]
@@ -792,45 +996,20 @@ def best_trial_str(
            f"parameters={params}"
 
 
-def _fair_filter_trials(trials_by_state: Dict[str, List[Trial]],
-                        max_trials: int,
-                        sort_by_metric: bool = False):
-    """Filters trials such that each state is represented fairly.
-
-    The oldest trials are truncated if necessary.
-
-    Args:
-        trials_by_state (dict[str, list[Trial]]: Trials by state.
-        max_trials (int): Maximum number of trials to return.
-    Returns:
-        Dict mapping state to List of fairly represented trials.
-    """
-    num_trials_by_state = collections.defaultdict(int)
+def _fair_num_rows(num_trials_by_state: Dict[str, int],
+                   max_trials: int) -> Dict[str, int]:
+    """Returns the number of trials of each state to keep, such that each
+    state is represented fairly."""
+    num_rows_by_state = collections.defaultdict(int)
     no_change = False
-    # Determine number of trials to keep per state.
     while max_trials > 0 and not no_change:
         no_change = True
-        for state in sorted(trials_by_state):
-            if num_trials_by_state[state] < len(trials_by_state[state]):
+        for state in sorted(num_trials_by_state):
+            if num_rows_by_state[state] < num_trials_by_state[state]:
                 no_change = False
                 max_trials -= 1
-                num_trials_by_state[state] += 1
-    # Sort by start time, descending if the trails is not sorted by metric.
-    sorted_trials_by_state = dict()
-    for state in sorted(trials_by_state):
-        if state == Trial.TERMINATED and sort_by_metric:
-            sorted_trials_by_state[state] = trials_by_state[state]
-        else:
-            sorted_trials_by_state[state] = sorted(
-                trials_by_state[state],
-                reverse=False,
-                key=lambda t: t.trial_id)
-    # Truncate oldest trials.
-    filtered_trials = {
-        state: sorted_trials_by_state[state][:num_trials_by_state[state]]
-        for state in sorted(trials_by_state)
-    }
-    return filtered_trials
+                num_rows_by_state[state] += 1
+    return num_rows_by_state
 
 
 def _get_trial_location(trial: Trial, result: dict) -> Location:
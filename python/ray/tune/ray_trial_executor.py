@@ -28,6 +28,7 @@ from ray.tune.resources import Resources
 from ray.tune.utils.placement_groups import PlacementGroupManager, \
     get_tune_pg_prefix
 from ray.tune.utils.trainable import TrainableUtil
+from ray.tune.utils.trainable_pool import TrainablePool
 from ray.tune.trial import Trial, Checkpoint, Location, TrialInfo
 from ray.tune.trial_executor import TrialExecutor
 from ray.tune.utils import warn_if_slow
@@ -155,10 +156,10 @@ class _TrialCleanup:
                 del self._cleanup_map[done]
 
 
-def noop_logger_creator(config, logdir):
+def noop_logger_creator(config, logdir, chdir=True):
     # Set the working dir in the remote process, for user file writes
     os.makedirs(logdir, exist_ok=True)
-    if not ray.worker._mode() == ray.worker.LOCAL_MODE:
+    if chdir and not ray.worker._mode() == ray.worker.LOCAL_MODE:
         os.chdir(logdir)
     return NoopLogger(config, logdir)
 
@@ -171,7 +172,8 @@ class RayTrialExecutor(TrialExecutor):
                  reuse_actors: bool = False,
                  result_buffer_length: Optional[int] = None,
                  refresh_period: Optional[float] = None,
-                 wait_for_placement_group: Optional[float] = None):
+                 wait_for_placement_group: Optional[float] = None,
+                 trials_per_actor: Optional[int] = None):
         super(RayTrialExecutor, self).__init__()
         self._running = {}
         # Since trial resume after paused should not run
@@ -189,6 +191,14 @@ class RayTrialExecutor(TrialExecutor):
 
         self._avail_resources = Resources(cpu=0, gpu=0)
         self._pg_manager = PlacementGroupManager(prefix=get_tune_pg_prefix())
+
+        # Trials that can share an actor are run in a pool of actors
+        # instead of an actor and placement group each.
+        if trials_per_actor is None:
+            trials_per_actor = int(
+                os.environ.get("TUNE_TRIALS_PER_ACTOR", "0"))
+        self._trainable_pool = TrainablePool(
+            trials_per_actor) if trials_per_actor > 0 else None
         self._staged_trials = set()
         self._just_staged_trials = set()
         self._trial_just_finished = False
@@ -257,6 +267,8 @@ class RayTrialExecutor(TrialExecutor):
                 continue
             if trial in self._staged_trials:
                 continue
+            if self._is_pooled(trial):
+                continue
             if self._pg_manager.trial_in_use(trial):
                 continue
 
@@ -283,10 +295,19 @@ class RayTrialExecutor(TrialExecutor):
 
         return None
 
+    def _is_pooled(self, trial: Trial) -> bool:
+        """Returns True if the trial runs in a slot of a pooled actor."""
+        return (self._trainable_pool is not None
+                and self._trainable_pool.supports(trial))
+
     def _setup_remote_runner(self, trial):
         trial.init_logdir()
         # We checkpoint metadata here to try mitigating logdir duplication
         self.try_checkpoint_metadata(trial)
+
+        if self._is_pooled(trial):
+            return self._setup_pooled_runner(trial)
+
         logger_creator = partial(noop_logger_creator, logdir=trial.logdir)
 
         if self._reuse_actors and len(self._cached_actor_pg) > 0:
@@ -317,12 +338,7 @@ class RayTrialExecutor(TrialExecutor):
             with self._change_working_directory(trial):
                 self._trial_cleanup.add(trial, actor=existing_runner)
 
-        trainable_cls = trial.get_trainable_cls()
-        if not trainable_cls:
-            raise AbortTrialExecution(
-                f"Invalid trainable: {trial.trainable_name}. If you passed "
-                f"a string, make sure the trainable was registered before.")
-        _actor_cls = _class_cache.get(trainable_cls)
+        _actor_cls = _class_cache.get(self._get_trainable_cls(trial))
 
         if not self._pg_manager.has_ready(trial, update=True):
             if trial not in self._staged_trials:
@@ -366,6 +382,36 @@ class RayTrialExecutor(TrialExecutor):
         # since we don't know where the remote runner is placed.
         trial.set_location(Location())
         logger.debug("Trial %s: Setting up new remote runner.", trial)
+        kwargs = self._get_trainable_kwargs(trial, logger_creator)
+
+        with self._change_working_directory(trial):
+            return full_actor_class.remote(**kwargs)
+
+    def _setup_pooled_runner(self, trial):
+        self._get_trainable_cls(trial)
+        runner = self._trainable_pool.acquire(trial)
+        if runner is None:
+            return None
+
+        trial.set_location(Location())
+        logger.debug("Trial %s: Setting up trainable in pooled actor %s.",
+                     trial, runner)
+        # Trainables sharing a process can't change its working directory.
+        logger_creator = partial(
+            noop_logger_creator, logdir=trial.logdir, chdir=False)
+        runner.create(trial.trainable_name,
+                      self._get_trainable_kwargs(trial, logger_creator))
+        return runner
+
+    def _get_trainable_cls(self, trial):
+        trainable_cls = trial.get_trainable_cls()
+        if not trainable_cls:
+            raise AbortTrialExecution(
+                f"Invalid trainable: {trial.trainable_name}. If you passed "
+                f"a string, make sure the trainable was registered before.")
+        return trainable_cls
+
+    def _get_trainable_kwargs(self, trial, logger_creator) -> Dict:
         # Logging for trials is handled centrally by TrialRunner, so
         # configure the remote runner to use a noop-logger.
         trial_config = copy.deepcopy(trial.config)
@@ -383,9 +429,7 @@ class RayTrialExecutor(TrialExecutor):
             # with trainables that don't provide these keyword arguments
             kwargs["remote_checkpoint_dir"] = trial.remote_checkpoint_dir
             kwargs["sync_function_tpl"] = trial.sync_function_tpl
-
-        with self._change_working_directory(trial):
-            return full_actor_class.remote(**kwargs)
+        return kwargs
 
     def _train(self, trial):
         """Start one iteration of training and save remote id."""
@@ -530,7 +574,14 @@ class RayTrialExecutor(TrialExecutor):
         try:
             trial.write_error_log(error_msg)
             if hasattr(trial, "runner") and trial.runner:
-                if (not error and self._reuse_actors
+                if self._is_pooled(trial):
+                    logger.debug("Trial %s: Stopping pooled trainable.",
+                                 trial)
+                    trial.runner.stop.remote()
+                    # The actor is kept for the next trial using the slot.
+                    self._trainable_pool.release(trial, healthy=not error)
+                    should_destroy_actor = False
+                elif (not error and self._reuse_actors
                         and (len(self._cached_actor_pg) <
                              (self._cached_actor_pg.maxlen or float("inf")))):
                     logger.debug("Reusing actor for %s", trial.runner)
@@ -727,8 +778,39 @@ class RayTrialExecutor(TrialExecutor):
 
     def get_next_available_trial(
             self, timeout: Optional[float] = None) -> Optional[Trial]:
-        if not self._running:
+        ready = self._wait_for_results(timeout, drain=False)
+        if not ready:
             return None
+        return self._running[ready[0]]
+
+    def get_next_available_trials(
+            self, timeout: Optional[float] = None) -> List[Trial]:
+        """Blocks until a result is ready, then returns the trials of all
+        results ready.
+
+        This lets the trial runner process the results of many concurrent
+        trials in a single step of its event loop.
+        """
+        trials = []
+        seen = set()
+        for result_id in self._wait_for_results(timeout, drain=True):
+            trial = self._running[result_id]
+            if trial not in seen:
+                seen.add(trial)
+                trials.append(trial)
+        return trials
+
+    def _wait_for_results(self, timeout: Optional[float],
+                          drain: bool) -> List[ray.ObjectRef]:
+        """Waits until a result is ready.
+
+        Args:
+            timeout: Maximum time to wait for the first result.
+            drain: Whether to return all results ready once the first
+                result is, instead of only the first one.
+        """
+        if not self._running:
+            return []
         shuffled_results = list(self._running.keys())
         random.shuffle(shuffled_results)
 
@@ -737,11 +819,14 @@ class RayTrialExecutor(TrialExecutor):
         # trials (i.e. trials that run remotely) also get fairly reported.
         # See https://github.com/ray-project/ray/issues/4211 for details.
         start = time.time()
-        ready, _ = ray.wait(shuffled_results, timeout=timeout)
+        ready, not_ready = ray.wait(shuffled_results, timeout=timeout)
         if not ready:
-            return None
-        result_id = ready[0]
+            return []
         wait_time = time.time() - start
+        if drain and not_ready:
+            more_ready, _ = ray.wait(
+                not_ready, num_returns=len(not_ready), timeout=0)
+            ready.extend(more_ready)
         if wait_time > NONTRIVIAL_WAIT_TIME_THRESHOLD_S:
             self._last_nontrivial_wait = time.time()
         if time.time() - self._last_nontrivial_wait > BOTTLENECK_WARN_PERIOD_S:
@@ -752,7 +837,7 @@ class RayTrialExecutor(TrialExecutor):
                     BOTTLENECK_WARN_PERIOD_S))
 
             self._last_nontrivial_wait = time.time()
-        return self._running[result_id]
+        return ready
 
     def fetch_result(self, trial) -> List[Dict]:
         """Fetches result list of the running trials.
@@ -799,6 +884,11 @@ class RayTrialExecutor(TrialExecutor):
                            "You can resume this experiment by passing in "
                            "`resume=True` to `run`.")
 
+        if self._trainable_pool:
+            self._trainable_pool.set_cluster_resources(
+                resources,
+                [node["Resources"] for node in ray.nodes() if node["Alive"]])
+
         resources = resources.copy()
         num_cpus = resources.pop("CPU", 0)
         num_gpus = resources.pop("GPU", 0)
@@ -830,6 +920,8 @@ class RayTrialExecutor(TrialExecutor):
             boolean
 
         """
+        if self._is_pooled(trial):
+            return self._trainable_pool.has_free_slot(trial)
         return trial in self._staged_trials or self._pg_manager.can_stage(
         ) or self._pg_manager.has_ready(
             trial, update=True)
@@ -837,6 +929,10 @@ class RayTrialExecutor(TrialExecutor):
     def debug_string(self) -> str:
         """Returns a human readable message for printing to the console."""
         total_resources = self._pg_manager.occupied_resources()
+        if self._trainable_pool:
+            for name, amount in (
+                    self._trainable_pool.occupied_resources().items()):
+                total_resources[name] = total_resources.get(name, 0) + amount
 
         if self._resources_initialized:
             status = ("Resources requested: {}/{} CPUs, {}/{} GPUs, "
@@ -876,7 +972,8 @@ class RayTrialExecutor(TrialExecutor):
         if time.time() > self.last_pg_recon + self.pg_recon_interval:
             # Only do this every now and then - usually the placement groups
             # should not get out of sync, and calling this often is inefficient
-            self._pg_manager.reconcile_placement_groups(trials)
+            self._pg_manager.reconcile_placement_groups(
+                self._unpooled_trials(trials))
             self.last_pg_recon = time.time()
 
         self._pg_manager.cleanup()
@@ -986,9 +1083,18 @@ class RayTrialExecutor(TrialExecutor):
 
     def cleanup(self, trials: List[Trial]) -> None:
         self._trial_cleanup.cleanup(partial=False)
-        self._pg_manager.reconcile_placement_groups(trials)
+        self._pg_manager.reconcile_placement_groups(
+            self._unpooled_trials(trials))
         self._pg_manager.cleanup(force=True)
         self._pg_manager.cleanup_existing_pg(block=True)
+        if self._trainable_pool:
+            self._trainable_pool.shutdown()
+
+    def _unpooled_trials(self, trials: List[Trial]) -> List[Trial]:
+        """Returns the trials that require placement groups."""
+        if not self._trainable_pool:
+            return trials
+        return [trial for trial in trials if not self._is_pooled(trial)]
 
     @contextmanager
     def _change_working_directory(self, trial):
@@ -1,11 +1,12 @@
 import logging
-from typing import Dict, Optional, Union
+from typing import Dict, Optional
 
 import numpy as np
 import pickle
 
 from ray.tune import trial_runner
 from ray.tune.result import DEFAULT_METRIC
+from ray.tune.schedulers.order_statistics import OrderStatistics
 from ray.tune.schedulers.trial_scheduler import FIFOScheduler, TrialScheduler
 from ray.tune.trial import Trial
 
@@ -182,14 +183,13 @@ class _Bracket():
                  s: int):
         self.rf = reduction_factor
         MAX_RUNGS = int(np.log(max_t / min_t) / np.log(self.rf) - s + 1)
-        self._rungs = [(min_t * self.rf**(k + s), {})
+        # Each rung keeps the rewards recorded at its milestone in sorted
+        # order, so that the cutoff doesn't have to sort them on each result.
+        self._rungs = [(min_t * self.rf**(k + s), OrderStatistics())
                        for k in reversed(range(MAX_RUNGS))]
 
-    def cutoff(self, recorded) -> Union[None, int, float, complex, np.ndarray]:
-        if not recorded:
-            return None
-        return np.nanpercentile(
-            list(recorded.values()), (1 - 1 / self.rf) * 100)
+    def cutoff(self, recorded: OrderStatistics) -> Optional[float]:
+        return recorded.percentile((1 - 1 / self.rf) * 100)
 
     def on_result(self, trial: Trial, cur_iter: int,
                   cur_rew: Optional[float]) -> str:
@@ -225,4 +225,7 @@ if __name__ == "__main__":
         grace_period=1, max_t=10, reduction_factor=2)
     print(sched.debug_string())
     bracket = sched._brackets[0]
-    print(bracket.cutoff({str(i): i for i in range(20)}))
+    recorded = OrderStatistics()
+    for i in range(20):
+        recorded[str(i)] = i
+    print(bracket.cutoff(recorded))
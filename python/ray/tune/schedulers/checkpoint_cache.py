@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+import ray
+from ray.experimental import get_object_locations
+from ray.tune.checkpoint_manager import Checkpoint
+
+
+class CheckpointCache:
+    """Memory checkpoints of recent trials, kept within a byte budget.
+
+    Used by PBT to keep the checkpoints of donor trials. The checkpoint
+    values are object refs, which are passed to the actors of the recipient
+    trials directly. Once the budget is exceeded, the least recently added
+    checkpoints are evicted, except for the newest one.
+
+    The size of a checkpoint is looked up in the object store once it is
+    ready. Until then, it is assumed to be as large as the last checkpoint
+    of the same trial, or the largest known checkpoint.
+
+    Args:
+        max_bytes (int): Byte budget. If None, no checkpoints are evicted.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self._max_bytes = max_bytes
+        # Trial -> checkpoint, least recently added first.
+        self._checkpoints: "OrderedDict[Hashable, Checkpoint]" = OrderedDict()
+        # Trial -> size of its last checkpoint with a known size.
+        self._sizes: Dict[Hashable, int] = {}
+        # Trials whose current checkpoint has not been measured yet.
+        self._unsized: Set[Hashable] = set()
+
+    def __len__(self) -> int:
+        return len(self._checkpoints)
+
+    def get(self, trial: Hashable) -> Optional[Checkpoint]:
+        return self._checkpoints.get(trial)
+
+    def put(self, trial: Hashable,
+            checkpoint: Checkpoint) -> List[Tuple[Hashable, Checkpoint]]:
+        """Adds the checkpoint of the trial, replacing its previous one.
+
+        Returns:
+            The evicted trials and checkpoints.
+        """
+        self._checkpoints.pop(trial, None)
+        self._checkpoints[trial] = checkpoint
+        self._unsized.add(trial)
+        return self._evict()
+
+    def remove(self, trial: Hashable) -> Optional[Checkpoint]:
+        """Removes and returns the checkpoint of the trial, if any."""
+        self._sizes.pop(trial, None)
+        self._unsized.discard(trial)
+        return self._checkpoints.pop(trial, None)
+
+    def total_bytes(self) -> int:
+        """Returns the (estimated) size of all checkpoints in bytes."""
+        self._update_sizes()
+        return sum(self._size(trial) for trial in self._checkpoints)
+
+    def _size(self, trial: Hashable) -> int:
+        if trial in self._sizes:
+            return self._sizes[trial]
+        return max(self._sizes.values(), default=0)
+
+    def _evict(self) -> List[Tuple[Hashable, Checkpoint]]:
+        evicted = []
+        if self._max_bytes is None:
+            return evicted
+        total_bytes = self.total_bytes()
+        while total_bytes > self._max_bytes and len(self._checkpoints) > 1:
+            trial, checkpoint = self._checkpoints.popitem(last=False)
+            total_bytes -= self._size(trial)
+            self._sizes.pop(trial, None)
+            self._unsized.discard(trial)
+            evicted.append((trial, checkpoint))
+        return evicted
+
+    def _update_sizes(self):
+        refs = {}
+        for trial in list(self._unsized):
+            value = self._checkpoints[trial].value
+            if isinstance(value, ray.ObjectRef):
+                refs[value] = trial
+                continue
+            self._sizes[trial] = len(value) if isinstance(value, bytes) else 0
+            self._unsized.remove(trial)
+        if not refs:
+            return
+
+        ready, _ = ray.wait(list(refs), num_returns=len(refs), timeout=0)
+        if not ready:
+            return
+        locations = get_object_locations(ready)
+        for ref in ready:
+            trial = refs[ref]
+            # Small objects are stored inline and have no location.
+            self._sizes[trial] = locations.get(ref, {}).get("object_size", 0)
+            self._unsized.remove(trial)
@@ -1,3 +1,4 @@
+import bisect
 import collections
 import logging
 from typing import Dict, List, Optional
@@ -7,6 +8,7 @@ import numpy as np
 from ray.tune import trial_runner
 from ray.tune.result import DEFAULT_METRIC
 from ray.tune.trial import Trial
+from ray.tune.schedulers.order_statistics import OrderStatistics
 from ray.tune.schedulers.trial_scheduler import FIFOScheduler, TrialScheduler
 
 logger = logging.getLogger(__name__)
@@ -70,7 +72,13 @@ class MedianStoppingRule(FIFOScheduler):
         self._hard_stop = hard_stop
         self._trial_state = {}
         self._last_pause = collections.defaultdict(lambda: float("-inf"))
-        self._results = collections.defaultdict(list)
+        # The time of the last result of each trial.
+        self._last_times = OrderStatistics()
+        # The times and cumulative sums of the metric of the results of
+        # each trial after the grace period, to compute running means.
+        self._scoped_times = collections.defaultdict(list)
+        self._scoped_sums = collections.defaultdict(list)
+        self._best_results = {}
 
     def set_search_properties(self, metric: Optional[str],
                               mode: Optional[str]) -> bool:
@@ -122,7 +130,7 @@ class MedianStoppingRule(FIFOScheduler):
             return TrialScheduler.CONTINUE
 
         time = result[self._time_attr]
-        self._results[trial].append(result)
+        self._record_result(trial, result)
 
         if time < self._grace_period:
             return TrialScheduler.CONTINUE
@@ -160,7 +168,8 @@ class MedianStoppingRule(FIFOScheduler):
 
     def on_trial_complete(self, trial_runner: "trial_runner.TrialRunner",
                           trial: Trial, result: Dict):
-        self._results[trial].append(result)
+        if self._time_attr in result and self._metric in result:
+            self._record_result(trial, result)
 
     def debug_string(self) -> str:
         return "Using MedianStoppingRule: num_stopped={}.".format(
@@ -176,26 +185,37 @@ class MedianStoppingRule(FIFOScheduler):
         ]
         return TrialScheduler.PAUSE if pause else TrialScheduler.CONTINUE
 
+    def _record_result(self, trial: Trial, result: Dict):
+        time = result[self._time_attr]
+        value = result[self._metric]
+        self._last_times[trial] = time
+        if trial in self._best_results:
+            value = self._compare_op(self._best_results[trial], value)
+        self._best_results[trial] = value
+        if time >= self._grace_period:
+            times = self._scoped_times[trial]
+            sums = self._scoped_sums[trial]
+            if times and time < times[-1]:
+                # The trial was restored from an earlier point in time.
+                num_results = bisect.bisect_right(times, time)
+                del times[num_results:]
+                del sums[num_results:]
+            times.append(time)
+            sums.append(result[self._metric] + (sums[-1] if sums else 0))
+
     def _trials_beyond_time(self, time: float) -> List[Trial]:
-        trials = [
-            trial for trial in self._results
-            if self._results[trial][-1][self._time_attr] >= time
-        ]
-        return trials
+        return self._last_times.at_least(time)
 
     def _median_result(self, trials: List[Trial], time: float):
         return np.median([self._running_mean(trial, time) for trial in trials])
 
-    def _running_mean(self, trial: Trial, time: float) -> np.ndarray:
-        results = self._results[trial]
+    def _running_mean(self, trial: Trial, time: float) -> float:
         # TODO(ekl) we could do interpolation to be more precise, but for now
         # assume len(results) is large and the time diffs are roughly equal
-        scoped_results = [
-            r for r in results
-            if self._grace_period <= r[self._time_attr] <= time
-        ]
-        return np.mean([r[self._metric] for r in scoped_results])
+        num_results = bisect.bisect_right(self._scoped_times[trial], time)
+        if num_results == 0:
+            return float("nan")
+        return self._scoped_sums[trial][num_results - 1] / num_results
 
     def _best_result(self, trial):
-        results = self._results[trial]
-        return self._compare_op([r[self._metric] for r in results])
+        return self._best_results[trial]
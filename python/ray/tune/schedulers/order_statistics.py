@@ -0,0 +1,175 @@
+import bisect
+import itertools
+import math
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+# The target number of values per sublist. Sublists are split in half when
+# they grow beyond twice this size.
+DEFAULT_LOAD = 256
+
+
+class OrderStatistics:
+    """Keyed values kept in sorted order for order statistic queries.
+
+    Used by the schedulers to compute cutoffs and quantiles incrementally,
+    instead of sorting all recorded values on every result.
+
+    The values are stored in a list of sorted sublists of bounded size, so
+    that setting or removing a value takes O(log n) comparisons plus moving
+    at most ``2 * load`` items. Queries by rank take O(log n) after an
+    index of the sublist sizes has been rebuilt, which is done lazily once
+    per batch of modifications.
+
+    NaN values are kept but ignored by the order statistics, the same as
+    ``np.nanpercentile``. Values of equal keys are ordered by the time the
+    key was first set.
+
+    Example:
+        >>> stats = OrderStatistics()
+        >>> for i, value in enumerate([3., 1., 2., 4.]):
+        >>>     stats[i] = value
+        >>> stats.percentile(50)  # 2.5
+        >>> stats.lowest(1)  # [1]
+        >>> stats.highest(2)  # [0, 3]
+    """
+
+    def __init__(self, load: int = DEFAULT_LOAD):
+        self._load = load
+        # Sorted sublists of (value, ordinal, key).
+        self._lists: List[List[Tuple[float, int, Hashable]]] = []
+        # The last item of each sublist.
+        self._maxes: List[Tuple[float, int, Hashable]] = []
+        # Cumulative sizes of the sublists, None if outdated.
+        self._offsets: Optional[List[int]] = None
+        # Key -> (value, ordinal).
+        self._items: Dict[Hashable, Tuple[float, int]] = {}
+        self._next_ordinal = 0
+        self._num_nan = 0
+
+    def __len__(self) -> int:
+        """The number of non-NaN values."""
+        return len(self._items) - self._num_nan
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def __getitem__(self, key: Hashable) -> float:
+        return self._items[key][0]
+
+    def __setitem__(self, key: Hashable, value: float) -> None:
+        if key in self._items:
+            _, ordinal = self._items[key]
+            self.remove(key)
+        else:
+            ordinal = self._next_ordinal
+            self._next_ordinal += 1
+        self._items[key] = (value, ordinal)
+        if math.isnan(value):
+            self._num_nan += 1
+        else:
+            self._insert((value, ordinal, key))
+
+    def __iter__(self) -> Iterator[Hashable]:
+        """Iterates over the keys of the non-NaN values in ascending order of
+        their values."""
+        for sublist in self._lists:
+            for _, _, key in sublist:
+                yield key
+
+    def remove(self, key: Hashable) -> None:
+        """Removes the value of the key, if set."""
+        if key not in self._items:
+            return
+        value, ordinal = self._items.pop(key)
+        if math.isnan(value):
+            self._num_nan -= 1
+            return
+        item = (value, ordinal, key)
+        i = bisect.bisect_left(self._maxes, item)
+        sublist = self._lists[i]
+        del sublist[bisect.bisect_left(sublist, item)]
+        if sublist:
+            self._maxes[i] = sublist[-1]
+        else:
+            del self._lists[i]
+            del self._maxes[i]
+        self._offsets = None
+
+    def select(self, rank: int) -> Tuple[Hashable, float]:
+        """Returns the key and value with the given rank, starting at 0 for
+        the lowest value."""
+        if not 0 <= rank < len(self):
+            raise IndexError(f"Rank {rank} is out of range.")
+        if self._offsets is None:
+            self._offsets = list(
+                itertools.accumulate(len(sublist) for sublist in self._lists))
+        i = bisect.bisect_right(self._offsets, rank)
+        start = self._offsets[i - 1] if i > 0 else 0
+        value, _, key = self._lists[i][rank - start]
+        return key, value
+
+    def rank(self, value: float) -> int:
+        """Returns the number of values lower than the given value."""
+        item = (value, -1)
+        i = bisect.bisect_left(self._maxes, item)
+        if i == len(self._lists):
+            return len(self)
+        if self._offsets is None:
+            self._offsets = list(
+                itertools.accumulate(len(sublist) for sublist in self._lists))
+        start = self._offsets[i - 1] if i > 0 else 0
+        return start + bisect.bisect_left(self._lists[i], item)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Computes the q-th percentile of the non-NaN values, interpolating
+        linearly like ``np.nanpercentile``. Returns None if there are none.
+        """
+        num_values = len(self)
+        if num_values == 0:
+            return None
+        position = q / 100 * (num_values - 1)
+        lower_rank = int(math.floor(position))
+        _, lower = self.select(lower_rank)
+        if lower_rank + 1 >= num_values:
+            return lower
+        _, upper = self.select(lower_rank + 1)
+        return lower + (position - lower_rank) * (upper - lower)
+
+    def lowest(self, n: int) -> List[Hashable]:
+        """Returns the keys of the n lowest values, in ascending order."""
+        return list(itertools.islice(iter(self), n))
+
+    def highest(self, n: int) -> List[Hashable]:
+        """Returns the keys of the n highest values, in ascending order."""
+        keys = []
+        for sublist in reversed(self._lists):
+            for _, _, key in reversed(sublist):
+                if len(keys) >= n:
+                    return keys[::-1]
+                keys.append(key)
+        return keys[::-1]
+
+    def at_least(self, value: float) -> List[Hashable]:
+        """Returns the keys of the values greater than or equal to the given
+        value, in ascending order."""
+        return self.highest(len(self) - self.rank(value))
+
+    def _insert(self, item: Tuple[float, int, Any]) -> None:
+        self._offsets = None
+        if not self._lists:
+            self._lists.append([item])
+            self._maxes.append(item)
+            return
+        i = bisect.bisect_left(self._maxes, item)
+        if i == len(self._lists):
+            i -= 1
+            self._lists[i].append(item)
+        else:
+            bisect.insort(self._lists[i], item)
+        sublist = self._lists[i]
+        self._maxes[i] = sublist[-1]
+        if len(sublist) > 2 * self._load:
+            self._lists[i:i + 1] = [
+                sublist[:self._load], sublist[self._load:]
+            ]
+            self._maxes[i:i + 1] = [sublist[self._load - 1], sublist[-1]]
@@ -15,6 +15,8 @@ from ray.tune.suggest import SearchGenerator
 from ray.tune.utils.util import SafeFallbackEncoder
 from ray.tune.sample import Domain, Function
 from ray.tune.schedulers import FIFOScheduler, TrialScheduler
+from ray.tune.schedulers.checkpoint_cache import CheckpointCache
+from ray.tune.schedulers.order_statistics import OrderStatistics
 from ray.tune.suggest.variant_generator import format_vars
 from ray.tune.trial import Trial, Checkpoint
 from ray.util.debug import log_once
@@ -193,6 +195,13 @@ class PopulationBasedTraining(FIFOScheduler):
             synced at the same time_attr every perturbation_interval.
             Defaults to False. See Appendix A.1 here
             https://arxiv.org/pdf/1711.09846.pdf.
+        checkpoint_cache_bytes (int): Maximum size in bytes of the in-memory
+            checkpoints kept for exploitation. The checkpoints of the trials
+            that were least recently in the upper quantile are dropped
+            first, so these trials can't be cloned until they are
+            checkpointed again. A dropped checkpoint is released once its
+            trial no longer needs it for failure recovery. Defaults to None
+            (no limit).
 
     .. code-block:: python
 
@@ -235,7 +244,8 @@ class PopulationBasedTraining(FIFOScheduler):
                  custom_explore_fn: Optional[Callable] = None,
                  log_config: bool = True,
                  require_attrs: bool = True,
-                 synch: bool = False):
+                 synch: bool = False,
+                 checkpoint_cache_bytes: Optional[int] = None):
         hyperparam_mutations = hyperparam_mutations or {}
         for value in hyperparam_mutations.values():
             if not (isinstance(value,
@@ -282,11 +292,16 @@ class PopulationBasedTraining(FIFOScheduler):
         self._quantile_fraction = quantile_fraction
         self._resample_probability = resample_probability
         self._trial_state = {}
+        # The last scores of the unfinished trials, in sorted order.
+        self._trial_scores = OrderStatistics()
         self._custom_explore_fn = custom_explore_fn
         self._log_config = log_config
         self._require_attrs = require_attrs
         self._synch = synch
         self._next_perturbation_sync = self._perturbation_interval
+        # The memory checkpoints of recent upper quantile trials, which are
+        # passed to the exploiting trials as object refs.
+        self._checkpoint_cache = CheckpointCache(checkpoint_cache_bytes)
 
         # Metrics
         self._num_checkpoints = 0
@@ -457,6 +472,8 @@ class PopulationBasedTraining(FIFOScheduler):
         # Record new state in the state object.
         score = self._metric_op * result[self._metric]
         state.last_score = score
+        if not trial.is_finished():
+            self._trial_scores[trial] = score
         state.last_train_time = time
         state.last_result = result
 
@@ -472,13 +489,21 @@ class PopulationBasedTraining(FIFOScheduler):
             # callback. So, we override with the current result.
             logger.debug("Trial {} is in upper quantile".format(trial))
             logger.debug("Checkpointing {}".format(trial))
+            cached = self._checkpoint_cache.get(trial)
             if trial.status == Trial.PAUSED:
                 # Paused trial will always have an in-memory checkpoint.
                 state.last_checkpoint = trial.checkpoint
+                self._num_checkpoints += 1
+            elif cached and cached.result.get(
+                    TRAINING_ITERATION) == state.last_result.get(
+                        TRAINING_ITERATION):
+                # The trial did not train since it was last checkpointed.
+                state.last_checkpoint = cached
             else:
                 state.last_checkpoint = trial_runner.trial_executor.save(
                     trial, Checkpoint.MEMORY, result=state.last_result)
-            self._num_checkpoints += 1
+                self._num_checkpoints += 1
+            self._cache_checkpoint(trial, state.last_checkpoint)
         else:
             state.last_checkpoint = None  # not a top trial
 
@@ -492,6 +517,24 @@ class PopulationBasedTraining(FIFOScheduler):
                 return
             self._exploit(trial_runner.trial_executor, trial, trial_to_clone)
 
+    def _cache_checkpoint(self, trial: Trial, checkpoint: Checkpoint):
+        """Adds the checkpoint to the cache and drops the references to the
+        evicted ones.
+
+        The trials keep their own reference to their newest checkpoint for
+        failure recovery, so the checkpoint is only released once the trial
+        is checkpointed again.
+        """
+        if checkpoint.storage != Checkpoint.MEMORY:
+            return
+        for evicted_trial, evicted in self._checkpoint_cache.put(
+                trial, checkpoint):
+            logger.debug("Dropping memory checkpoint of {}".format(
+                evicted_trial))
+            evicted_state = self._trial_state.get(evicted_trial)
+            if evicted_state and evicted_state.last_checkpoint is evicted:
+                evicted_state.last_checkpoint = None
+
     def _log_config_on_step(self, trial_state: PBTTrialState,
                             new_state: PBTTrialState, trial: Trial,
                             trial_to_clone: Trial, new_config: Dict):
@@ -564,6 +607,8 @@ class PopulationBasedTraining(FIFOScheduler):
 
         new_tag = make_experiment_tag(trial_state.orig_tag, new_config,
                                       self._hyperparam_mutations)
+        # The cached checkpoint of the trial is outdated once it is restored.
+        self._checkpoint_cache.remove(trial)
         if trial.status == Trial.PAUSED:
             # If trial is paused we update it with a new checkpoint.
             # When the trial is started again, the new checkpoint is used.
@@ -612,24 +657,43 @@ class PopulationBasedTraining(FIFOScheduler):
 
         If there is not enough data to compute this, returns empty lists.
         """
-        trials = []
-        for trial, state in self._trial_state.items():
-            logger.debug("Trial {}, state {}".format(trial, state))
-            if trial.is_finished():
-                logger.debug("Trial {} is finished".format(trial))
-            if state.last_score is not None and not trial.is_finished():
-                trials.append(trial)
-        trials.sort(key=lambda t: self._trial_state[t].last_score)
-
-        if len(trials) <= 1:
-            return [], []
-        else:
+        while True:
+            if len(self._trial_scores) <= 1:
+                return [], []
             num_trials_in_quantile = int(
-                math.ceil(len(trials) * self._quantile_fraction))
-            if num_trials_in_quantile > len(trials) / 2:
-                num_trials_in_quantile = int(math.floor(len(trials) / 2))
-            return (trials[:num_trials_in_quantile],
-                    trials[-num_trials_in_quantile:])
+                math.ceil(len(self._trial_scores) * self._quantile_fraction))
+            if num_trials_in_quantile > len(self._trial_scores) / 2:
+                num_trials_in_quantile = int(
+                    math.floor(len(self._trial_scores) / 2))
+            lower_quantile = self._trial_scores.lowest(num_trials_in_quantile)
+            upper_quantile = self._trial_scores.highest(
+                num_trials_in_quantile)
+            # Finished trials are removed when the trial runner notifies the
+            # scheduler. Drop the ones finished without a notification.
+            finished = [
+                trial for trial in lower_quantile + upper_quantile
+                if trial.is_finished()
+            ]
+            if not finished:
+                return lower_quantile, upper_quantile
+            for trial in finished:
+                logger.debug("Trial {} is finished".format(trial))
+                self._trial_scores.remove(trial)
+
+    def on_trial_complete(self, trial_runner: "trial_runner.TrialRunner",
+                          trial: Trial, result: Dict):
+        self._trial_scores.remove(trial)
+        self._checkpoint_cache.remove(trial)
+
+    def on_trial_error(self, trial_runner: "trial_runner.TrialRunner",
+                       trial: Trial):
+        self._trial_scores.remove(trial)
+        self._checkpoint_cache.remove(trial)
+
+    def on_trial_remove(self, trial_runner: "trial_runner.TrialRunner",
+                        trial: Trial):
+        self._trial_scores.remove(trial)
+        self._checkpoint_cache.remove(trial)
 
     def choose_trial_to_run(
             self, trial_runner: "trial_runner.TrialRunner") -> Optional[Trial]:
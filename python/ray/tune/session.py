@@ -2,6 +2,7 @@ from contextlib import contextmanager
 import inspect
 import os
 import logging
+import threading
 import traceback
 
 from ray.util.debug import log_once
@@ -10,18 +11,25 @@ from ray.util.annotations import PublicAPI, DeveloperAPI
 logger = logging.getLogger(__name__)
 
 _session = None
+# Sessions of single threads, which take precedence over the session of the
+# process. Used by trainables sharing a process in a pooled actor.
+_thread_session = threading.local()
+
+
+def _current_session():
+    reporter = getattr(_thread_session, "reporter", None)
+    return reporter if reporter is not None else _session
 
 
 @PublicAPI
 def is_session_enabled() -> bool:
     """Returns True if running within an Tune process."""
-    global _session
-    return _session is not None
+    return _current_session() is not None
 
 
 @PublicAPI
 def get_session():
-    global _session
+    _session = _current_session()
     if not _session:
         function_name = inspect.stack()[1].function
         # Log traceback so the user knows where the offending func is called.
@@ -72,6 +80,11 @@ def shutdown():
     _session = None
 
 
+def init_thread(reporter):
+    """Sets the trial context of the current thread."""
+    _thread_session.reporter = reporter
+
+
 @PublicAPI
 def report(_metric=None, **kwargs):
     """Logs all keyword arguments.
@@ -1,13 +1,20 @@
 import distutils
 import distutils.spawn
+import fnmatch
+import hashlib
 import inspect
 import logging
+import os
+import shutil
 import subprocess
 import tempfile
+import threading
+import time
 import types
 import warnings
+from concurrent.futures import Future, ThreadPoolExecutor
 
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 
 from shlex import quote
 
@@ -24,6 +31,9 @@ ALLOWED_REMOTE_PREFIXES = (S3_PREFIX, GS_PREFIX, HDFS_PREFIX)
 
 noop_template = ": {target}"  # noop in bash
 
+# Size of the blocks read when hashing files.
+HASH_BLOCK_SIZE = 1 << 20
+
 
 def noop(*args):
     return
@@ -76,6 +86,8 @@ def get_cloud_sync_client(remote_path):
         delete_template = ("aws s3 rm {target} --recursive "
                            "--only-show-errors {options}")
         exclude_template = "--exclude '{pattern}'"
+        upload_template = ("aws s3 cp {source} {target} --recursive "
+                           "--only-show-errors")
     elif remote_path.startswith(GS_PREFIX):
         if not distutils.spawn.find_executable("gsutil"):
             raise ValueError(
@@ -85,6 +97,8 @@ def get_cloud_sync_client(remote_path):
         sync_down_template = sync_up_template
         delete_template = "gsutil rm -r {options} {target}"
         exclude_template = "-x '{regex_pattern}'"
+        # Without -d, rsync never deletes remote files.
+        upload_template = "gsutil -m -q rsync -r {source} {target}"
     elif remote_path.startswith(HDFS_PREFIX):
         if not distutils.spawn.find_executable("hdfs"):
             raise ValueError("Upload uri starting with '{}' requires hdfs tool"
@@ -93,10 +107,19 @@ def get_cloud_sync_client(remote_path):
         sync_down_template = "hdfs dfs -get -f {source} {target}"
         delete_template = "hdfs dfs -rm -r {target}"
         exclude_template = None
+        upload_template = None
     else:
         raise ValueError(
             f"Upload uri must start with one of: {ALLOWED_REMOTE_PREFIXES} "
             f"(is: `{remote_path}`)")
+    if upload_template and int(os.environ.get("TUNE_INCREMENTAL_SYNC",
+                                              "0")):
+        return IncrementalSyncClient(
+            sync_up_template,
+            sync_down_template,
+            delete_template,
+            exclude_template,
+            upload_template=upload_template)
     return CommandBasedClient(sync_up_template, sync_down_template,
                               delete_template, exclude_template)
 
@@ -367,3 +390,271 @@ class CommandBasedClient(SyncClient):
                 raise ValueError(
                     "Neither `{pattern}` nor `{regex_pattern}` found in "
                     f"exclude string `{exclude_template}`")
+
+
+def _hash_file(path: str) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _is_excluded(relpath: str, exclude: Optional[List]) -> bool:
+    return bool(exclude) and any(
+        fnmatch.fnmatch(relpath, pattern) for pattern in exclude)
+
+
+class FileManifest:
+    """Sizes, modification times and content hashes of the files in a
+    directory.
+
+    Files are only hashed again if their size or modification time changed
+    since the last scan, so scanning an unchanged directory only stats its
+    files.
+
+    Args:
+        path (str): Directory to scan.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        # Relative path -> (size, modification time in ns, hash).
+        self.files: Dict[str, Tuple[int, int, str]] = {}
+
+    def scan(self, exclude: Optional[List] = None
+             ) -> Dict[str, Tuple[int, int, str]]:
+        """Updates and returns the files of the directory.
+
+        Args:
+            exclude (List[str]): Pattern of files to exclude, e.g.
+                ``["*/checkpoint_*]`` to exclude trial checkpoints.
+        """
+        files = {}
+        for root, dirs, names in os.walk(self.path):
+            reldir = os.path.relpath(root, self.path)
+            dirs[:] = [
+                name for name in dirs if not _is_excluded(
+                    os.path.normpath(os.path.join(reldir, name)), exclude)
+            ]
+            for name in names:
+                relpath = os.path.normpath(os.path.join(reldir, name))
+                if _is_excluded(relpath, exclude):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                    previous = self.files.get(relpath)
+                    if previous and previous[:2] == (stat.st_size,
+                                                     stat.st_mtime_ns):
+                        files[relpath] = previous
+                    else:
+                        files[relpath] = (stat.st_size, stat.st_mtime_ns,
+                                          _hash_file(path))
+                except OSError:
+                    # The file was removed while scanning.
+                    continue
+        self.files = files
+        return files
+
+
+_upload_executor = None
+_upload_executor_lock = threading.Lock()
+
+
+def _get_upload_executor() -> ThreadPoolExecutor:
+    """Returns the threads running the uploads of all incremental sync
+    clients of the process."""
+    global _upload_executor
+    with _upload_executor_lock:
+        if _upload_executor is None:
+            max_workers = int(os.environ.get("TUNE_SYNC_MAX_CONCURRENCY", 8))
+            _upload_executor = ThreadPoolExecutor(
+                max_workers=max(1, max_workers),
+                thread_name_prefix="tune_sync")
+        return _upload_executor
+
+
+def _stage_files(source: str, relpaths: List[str]) -> Tuple[str, List[str]]:
+    """Links the files into a new temporary directory, keeping their
+    relative paths. Files are copied if they can't be linked.
+
+    Returns:
+        The directory, and the files staged. Files removed in the meantime
+        are left out.
+    """
+    staging_dir = tempfile.mkdtemp(prefix="tune_sync_")
+    staged = []
+    for relpath in relpaths:
+        path = os.path.join(staging_dir, relpath)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            try:
+                os.link(os.path.join(source, relpath), path)
+            except OSError:
+                shutil.copy2(os.path.join(source, relpath), path)
+        except OSError:
+            continue
+        staged.append(relpath)
+    return staging_dir, staged
+
+
+def _run_upload(cmd: str, staging_dir: str):
+    try:
+        logger.debug("Running upload: {}".format(cmd))
+        process = subprocess.run(
+            cmd,
+            shell=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    if process.returncode != 0:
+        raise TuneError("Sync error. Ran command: {}\n"
+                        "Error message ({}): {}".format(
+                            cmd, process.returncode,
+                            process.stderr.decode("ascii", "replace")))
+
+
+class IncrementalSyncClient(CommandBasedClient):
+    def __init__(self,
+                 sync_up_template: str,
+                 sync_down_template: str,
+                 delete_template: Optional[str] = noop_template,
+                 exclude_template: Optional[str] = None,
+                 upload_template: Optional[str] = None):
+        """Syncs up only the files that changed since the last sync.
+
+        Instead of running ``sync_up_template`` on the whole directory,
+        the sizes and modification times of the local files are compared
+        with the last sync, and the files that changed are hashed. The
+        files whose content changed since they were last uploaded are
+        linked into a temporary directory, which is uploaded by a single
+        run of ``upload_template``. Uploads run on up to
+        ``TUNE_SYNC_MAX_CONCURRENCY`` threads shared by all clients of the
+        process. Like the ``CommandBasedClient``, a sync up is skipped
+        while the previous one is still running; the files are uploaded
+        by the next one.
+
+        Syncing down and deleting run the command templates, like the
+        ``CommandBasedClient``. Once an upload is done, the number of
+        files and bytes uploaded and the sync lag (the time since the
+        oldest uploaded change was made) are logged at debug level and kept
+        in ``stats``. Failed uploads are logged by the next sync up, and
+        raised by ``wait()``.
+
+        Arguments:
+            sync_up_template (str): See ``CommandBasedClient``.
+            sync_down_template (str): See ``CommandBasedClient``.
+            delete_template (Optional[str]): See ``CommandBasedClient``.
+            exclude_template (Optional[str]): See ``CommandBasedClient``.
+            upload_template (str): A runnable string template uploading
+                the content of a local directory into a remote directory;
+                needs to include replacement fields ``{source}`` and
+                ``{target}``. It must not delete remote files.
+        """
+        super(IncrementalSyncClient, self).__init__(
+            sync_up_template, sync_down_template, delete_template,
+            exclude_template)
+        self._validate_sync_string(upload_template)
+        self.upload_template = upload_template
+        self._manifests: Dict[str, FileManifest] = {}
+        # Source and target -> relative path -> hash of the content last
+        # uploaded.
+        self._uploaded: Dict[Tuple[str, str], Dict[str, str]] = {}
+        # The future of the running upload, its source and target, and the
+        # sizes, modification times and hashes of its files.
+        self._upload: Optional[Tuple[Future, Tuple[str, str], Dict[
+            str, Tuple[int, int, str]]]] = None
+        self.stats = self._compute_stats({})
+
+    def sync_up(self, source, target, exclude: Optional[List] = None):
+        error = self._finish_upload()
+        if error is not None:
+            logger.warning(f"Last sync up failed, its files are uploaded "
+                           f"again by the next sync up: {error}")
+        if self.is_running:
+            logger.warning("Last sync client cmd still in progress, skipping.")
+            return False
+
+        source = os.path.normpath(source)
+        target = target.rstrip("/")
+        if source not in self._manifests:
+            self._manifests[source] = FileManifest(source)
+        files = self._manifests[source].scan(exclude)
+        uploaded = self._uploaded.setdefault((source, target), {})
+        changed = [
+            relpath for relpath, (_, _, digest) in files.items()
+            if uploaded.get(relpath) != digest
+        ]
+        if not changed:
+            self.stats = self._compute_stats({})
+            return True
+
+        staging_dir, staged = _stage_files(source, changed)
+        cmd = self.upload_template.format(
+            source=quote(staging_dir), target=quote(target))
+        future = _get_upload_executor().submit(_run_upload, cmd, staging_dir)
+        self._upload = (future, (source, target),
+                        {relpath: files[relpath]
+                         for relpath in staged})
+        return True
+
+    def delete(self, target):
+        target = target.rstrip("/")
+        for key in list(self._uploaded):
+            if key[1] == target or key[1].startswith(target + "/"):
+                del self._uploaded[key]
+        return super(IncrementalSyncClient, self).delete(target)
+
+    def wait(self):
+        super(IncrementalSyncClient, self).wait()
+        if self._upload is not None:
+            self._upload[0].exception()
+        error = self._finish_upload()
+        if error is not None:
+            raise error
+
+    def _finish_upload(self) -> Optional[Exception]:
+        """Records the files of the last upload if it is done.
+
+        Returns:
+            The error of the upload, if it failed.
+        """
+        if self._upload is None or not self._upload[0].done():
+            return None
+        (future, key, files), self._upload = self._upload, None
+        error = future.exception()
+        if error is not None:
+            return error
+        uploaded = self._uploaded.setdefault(key, {})
+        for relpath, (_, _, digest) in files.items():
+            uploaded[relpath] = digest
+        self.stats = self._compute_stats(files)
+        logger.debug("Uploaded {num_files} changed files ({num_bytes} bytes), "
+                     "sync lag {sync_lag_s:.2f} seconds.".format(**self.stats))
+        return None
+
+    @staticmethod
+    def _compute_stats(
+            files: Dict[str, Tuple[int, int, str]]) -> Dict[str, float]:
+        sync_lag_s = 0.
+        if files:
+            oldest_change = min(mtime_ns for _, mtime_ns, _ in files.values())
+            sync_lag_s = max(0., time.time() - oldest_change / 1e9)
+        return {
+            "num_files": len(files),
+            "num_bytes": sum(size for size, _, _ in files.values()),
+            "sync_lag_s": sync_lag_s,
+        }
+
+    def reset(self):
+        super(IncrementalSyncClient, self).reset()
+        # A running upload cleans up after itself.
+        self._upload = None
+
+    @property
+    def is_running(self):
+        """Returns whether a sync, upload or delete is running."""
+        return super(IncrementalSyncClient, self).is_running or (
+            self._upload is not None and not self._upload[0].done())
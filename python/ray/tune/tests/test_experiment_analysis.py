@@ -3,11 +3,14 @@ import shutil
 import tempfile
 import random
 import os
+from unittest.mock import patch
 import pandas as pd
 from numpy import nan
 
 import ray
 from ray import tune
+from ray.tune import ExperimentAnalysis
+from ray.tune.analysis import result_cache
 from ray.tune.utils.mock import MyTrainableClass
 
 
@@ -202,6 +205,51 @@ class ExperimentAnalysisSuite(unittest.TestCase):
         for df in dataframes.values():
             self.assertEqual(df.training_iteration.max(), 1)
 
+    def testResultCache(self):
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            self.skipTest("Caching results requires pyarrow.")
+
+        dataframes = self.ea.trial_dataframes
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(self.test_path, ".analysis_cache", "csv",
+                             "index.json")))
+
+        with patch.object(result_cache, "read_result_files") as read_files:
+            read_files.return_value = {}
+            cached = ExperimentAnalysis(self.test_path).trial_dataframes
+            read_files.assert_called_once_with([], "csv")
+        self.assertEqual(set(dataframes), set(cached))
+        for path, dataframe in dataframes.items():
+            pd.testing.assert_frame_equal(dataframe, cached[path])
+
+        # Only the selected columns are read.
+        columns = ExperimentAnalysis(self.test_path)._load_trial_dataframes(
+            [self.metric, "missing"])
+        for dataframe in columns.values():
+            self.assertEqual([self.metric], list(dataframe.columns))
+
+        # Changed results are read again.
+        path = next(iter(dataframes))
+        dataframe = pd.concat(
+            [dataframes[path], dataframes[path]], ignore_index=True)
+        dataframe.to_csv(os.path.join(path, "progress.csv"), index=False)
+        reloaded = ExperimentAnalysis(self.test_path).trial_dataframes
+        self.assertEqual(2, len(reloaded[path]))
+
+    def testReadResultFilesInParallel(self):
+        paths = list(self.ea.trial_dataframes)
+        with patch.object(result_cache, "MIN_FILES_PER_THREAD_POOL", 1), \
+                patch.dict(os.environ, {"TUNE_ANALYSIS_MAX_WORKERS": "2"}):
+            dataframes = result_cache.read_result_files(
+                paths + [self.test_dir], "csv")
+        self.assertIsNone(dataframes.pop(self.test_dir))
+        for path, dataframe in dataframes.items():
+            pd.testing.assert_frame_equal(self.ea.trial_dataframes[path],
+                                          dataframe)
+
     def testIgnoreOtherExperiment(self):
         analysis = tune.run(
             MyTrainableClass,
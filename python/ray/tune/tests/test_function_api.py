@@ -3,7 +3,9 @@ import os
 import sys
 import shutil
 import tempfile
+import time
 import unittest
+from unittest.mock import patch
 
 import ray
 from ray.rllib import _register_all
@@ -14,7 +16,8 @@ from ray.tune.utils.placement_groups import PlacementGroupFactory
 from ray.tune.utils.trainable import TrainableUtil
 from ray.tune.function_runner import with_parameters, wrap_function, \
     FuncCheckpointUtil
-from ray.tune.result import DEFAULT_METRIC, TRAINING_ITERATION
+from ray.tune.result import (DEFAULT_METRIC, RESULT_DUPLICATE,
+                             SHOULD_CHECKPOINT, TRAINING_ITERATION)
 from ray.tune.schedulers import ResourceChangingScheduler
 
 
@@ -295,6 +298,91 @@ class FunctionCheckpointingTest(unittest.TestCase):
         assert sum("tmp" in path for path in os.listdir(self.logdir)) == 0
         assert result[TRAINING_ITERATION] == 4
 
+    @patch.dict(os.environ, {"TUNE_FUNCTION_RESULT_BUFFER_LENGTH": "5"})
+    def testReportAhead(self):
+        """Tests that buffered results are returned in batches, which end
+        at a result with a checkpoint."""
+
+        def train(config, checkpoint_dir=None):
+            for step in range(20):
+                if step == 12:
+                    with tune.checkpoint_dir(step=step) as checkpoint_dir:
+                        path = os.path.join(checkpoint_dir, "checkpoint")
+                        with open(path, "w") as f:
+                            f.write(json.dumps({"step": step}))
+                tune.report(test=step)
+
+        wrapped = wrap_function(train)
+        new_trainable = wrapped(logger_creator=self.logger_creator)
+        results = []
+        while not results or not results[-1].get(SHOULD_CHECKPOINT):
+            batch = new_trainable.train_buffered(buffer_time_s=0)
+            for result in batch[:-1]:
+                self.assertFalse(result.get(SHOULD_CHECKPOINT))
+            results += batch
+        self.assertEqual([result["test"] for result in results],
+                         list(range(13)))
+
+        # The function waits until the checkpoint has been saved.
+        checkpoint = new_trainable.save()
+        with open(os.path.join(checkpoint, "checkpoint"), "r") as f:
+            self.assertEqual(json.loads(f.read()), {"step": 12})
+
+        while not results[-1].get(RESULT_DUPLICATE):
+            results += new_trainable.train_buffered(buffer_time_s=0)
+        self.assertEqual([result["test"] for result in results[:-1]],
+                         list(range(20)))
+        new_trainable.stop()
+
+    @patch.dict(os.environ, {"TUNE_FUNCTION_RESULT_BUFFER_LENGTH": "5"})
+    def testReportAheadSave(self):
+        """Tests that saving between buffered batches saves the checkpoint
+        of the last returned result, even if the function checkpointed
+        again since."""
+
+        def train(config, checkpoint_dir=None):
+            for step in range(10):
+                if step in (3, 6):
+                    with tune.checkpoint_dir(step=step) as checkpoint_dir:
+                        path = os.path.join(checkpoint_dir, "checkpoint")
+                        with open(path, "w") as f:
+                            f.write(json.dumps({"step": step}))
+                tune.report(test=step)
+
+        def load(checkpoint):
+            with open(os.path.join(checkpoint, "checkpoint"), "r") as f:
+                return json.loads(f.read())["step"]
+
+        wrapped = wrap_function(train)
+        new_trainable = wrapped(logger_creator=self.logger_creator)
+        results = []
+        while not results or not results[-1].get(SHOULD_CHECKPOINT):
+            results += new_trainable.train_buffered(buffer_time_s=0)
+        self.assertEqual(results[-1]["test"], 3)
+        self.assertEqual(load(new_trainable.save()), 3)
+
+        # Wait until the function reported the result of its next
+        # checkpoint, without returning it.
+        results.append(new_trainable.train())
+        self.assertEqual(results[-1]["test"], 4)
+        deadline = time.time() + 10
+        while new_trainable._results_queue.qsize() < 2:
+            self.assertLess(time.time(), deadline)
+            time.sleep(0.01)
+        self.assertEqual(load(new_trainable.save()), 3)
+
+        while not results[-1].get(SHOULD_CHECKPOINT):
+            results.append(new_trainable.train())
+        self.assertEqual(results[-1]["test"], 6)
+        self.assertEqual(load(new_trainable.save()), 6)
+
+        while not results[-1].get(RESULT_DUPLICATE):
+            results += new_trainable.train_buffered(buffer_time_s=0)
+        self.assertEqual([result["test"] for result in results[:-1]],
+                         list(range(10)))
+        self.assertEqual(load(new_trainable.save()), 6)
+        new_trainable.stop()
+
 
 class FunctionApiTest(unittest.TestCase):
     def setUp(self):
@@ -4,6 +4,7 @@ import json
 import os
 from collections import namedtuple
 import unittest
+from unittest.mock import patch
 import tempfile
 import shutil
 import numpy as np
@@ -12,6 +13,7 @@ from ray.cloudpickle import cloudpickle
 from ray.tune.logger import CSVLoggerCallback, JsonLoggerCallback, \
     JsonLogger, CSVLogger, \
     TBXLoggerCallback, TBXLogger
+from ray.tune.utils.file_writer import AsyncFileWriter
 from ray.tune.result import EXPR_PARAM_FILE, EXPR_PARAM_PICKLE_FILE, \
     EXPR_PROGRESS_FILE, \
     EXPR_RESULT_FILE
@@ -111,6 +113,54 @@ class LoggerSuite(unittest.TestCase):
         logger.on_trial_complete(3, [], t)
         self._validate_json_result(config)
 
+    @patch.dict(os.environ, {"TUNE_LOGGER_FLUSH_PERIOD_S": "1000"})
+    def testJSONFlushOnSave(self):
+        config = {"a": 2}
+        t = Trial(
+            evaluated_params=config, trial_id="json", logdir=self.test_dir)
+        logger = JsonLoggerCallback()
+        logger.on_trial_result(0, [], t, result(0, 4))
+        logger.on_trial_result(1, [], t, result(1, 5))
+
+        result_file = os.path.join(self.test_dir, EXPR_RESULT_FILE)
+        logger.on_trial_save(2, [], t)
+        with open(result_file, "rt") as fp:
+            self.assertEqual(len(fp.readlines()), 2)
+
+        logger.on_trial_result(
+            2, [], t, result(2, 6, score=[1, 2, 3], hello={"world": 1}))
+        logger.on_experiment_end([t])
+        self._validate_json_result(config)
+
+    def testAsyncFileWriter(self):
+        writer = AsyncFileWriter(
+            flush_period_s=1000, max_open_files=2, max_buffer_bytes=100)
+        paths = [os.path.join(self.test_dir, str(i)) for i in range(5)]
+        writer.write(paths[0], "start\n")
+        self.assertFalse(os.path.exists(paths[0]))
+
+        # Exceeding the buffer size writes a batch.
+        for i in range(20):
+            for path in paths:
+                writer.write(path, f"{i}\n")
+        writer.flush()
+        self.assertLessEqual(len(writer._files), 2)
+        expected = "".join(f"{i}\n" for i in range(20))
+        with open(paths[0], "rt") as fp:
+            self.assertEqual(fp.read(), "start\n" + expected)
+        for path in paths[1:]:
+            with open(path, "rt") as fp:
+                self.assertEqual(fp.read(), expected)
+
+        writer.write(paths[1], "end\n")
+        writer.close(paths[1])
+        self.assertNotIn(paths[1], writer._files)
+        with open(paths[1], "rt") as fp:
+            self.assertEqual(fp.read(), expected + "end\n")
+
+        writer.shutdown()
+        self.assertEqual(len(writer._files), 0)
+
     def _validate_json_result(self, config):
         # Check result logs
         results = []
@@ -190,6 +240,26 @@ class LoggerSuite(unittest.TestCase):
             params=(b"float32", b"float64", b"int32", b"int64", b"bool8"),
             excluded_params=(b"bad", ))
 
+    def testTBXManyTrials(self):
+        """Tests that each trial writes a single event file, even if more
+        trials report results than files are kept open."""
+        trials = [
+            Trial(
+                evaluated_params={"a": i},
+                trial_id=f"tbx_{i}",
+                logdir=os.path.join(self.test_dir, str(i))) for i in range(3)
+        ]
+        with patch.dict(os.environ, {"TUNE_LOGGER_MAX_OPEN_FILES": "1"}):
+            logger = TBXLoggerCallback()
+            for i in range(3):
+                for trial in trials:
+                    logger.on_trial_result(i, [], trial, result(i, i))
+            for trial in trials:
+                logger.on_trial_complete(3, [], trial)
+
+        for trial in trials:
+            self.assertEqual(1, len(glob.glob(f"{trial.logdir}/events*")))
+
     def _validate_tbx_result(self, params=None, excluded_params=None):
         try:
             from tensorflow.python.summary.summary_iterator \
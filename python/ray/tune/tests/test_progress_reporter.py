@@ -1,5 +1,4 @@
 import pytest
-import collections
 import os
 import unittest
 from unittest.mock import MagicMock, Mock, patch
@@ -9,8 +8,8 @@ from ray._private.test_utils import run_string_as_driver
 from ray.tune.trial import Trial
 from ray.tune.result import AUTO_RESULT_KEYS
 from ray.tune.progress_reporter import (
-    CLIReporter, JupyterNotebookReporter, _fair_filter_trials, best_trial_str,
-    detect_reporter, trial_progress_str, time_passed_str)
+    CLIReporter, JupyterNotebookReporter, _fair_num_rows, _TrialTracker,
+    best_trial_str, detect_reporter, trial_progress_str, time_passed_str)
 
 EXPECTED_RESULT_1 = """Result logdir: /foo
 Number of trials: 5 (1 PENDING, 3 RUNNING, 1 TERMINATED)
@@ -299,7 +298,7 @@ class ProgressReporterTest(unittest.TestCase):
 
     def testFairFilterTrials(self):
         """Tests that trials are represented fairly."""
-        trials_by_state = collections.defaultdict(list)
+        trials = []
         # States for which trials are under and overrepresented
         states_under = (Trial.PAUSED, Trial.ERROR)
         states_over = (Trial.PENDING, Trial.RUNNING, Trial.TERMINATED)
@@ -311,27 +310,69 @@ class ProgressReporterTest(unittest.TestCase):
         i = 0
         for state in states_under:
             for _ in range(num_trials_under):
-                trials_by_state[state].append(self.mock_trial(state, i))
+                trials.append(self.mock_trial(state, i))
                 i += 1
         for state in states_over:
             for _ in range(num_trials_over):
-                trials_by_state[state].append(self.mock_trial(state, i))
+                trials.append(self.mock_trial(state, i))
                 i += 1
 
-        filtered_trials_by_state = _fair_filter_trials(
-            trials_by_state, max_trials=max_trials)
-        for state in trials_by_state:
+        tracker = _TrialTracker.from_trials(trials)
+        num_rows_by_state = _fair_num_rows(tracker.num_trials_by_state,
+                                           max_trials)
+        for state in states_under + states_over:
             if state in states_under:
                 expected_num_trials = num_trials_under
             else:
                 expected_num_trials = (max_trials - num_trials_under *
                                        len(states_under)) / len(states_over)
-            state_trials = filtered_trials_by_state[state]
+            self.assertEqual(num_rows_by_state[state], expected_num_trials)
+            state_trials = tracker.first_trials(state,
+                                                num_rows_by_state[state])
             self.assertEqual(len(state_trials), expected_num_trials)
             # Make sure trials are sorted newest-first within state.
             for i in range(len(state_trials) - 1):
                 assert state_trials[i].trial_id < state_trials[i + 1].trial_id
 
+    def testTrialTracker(self):
+        """Tests that only changed trials are indexed again."""
+        trials = []
+        for i in range(100):
+            t = self.mock_trial(Trial.RUNNING, i)
+            t.local_dir = "/foo"
+            t.error_file = None
+            t.last_result = {"metric": i % 10}
+            trials.append(t)
+
+        tracker = _TrialTracker.from_trials(trials, "metric", "max")
+        self.assertEqual(tracker.num_trials_by_state, {Trial.RUNNING: 100})
+        self.assertEqual(tracker.best_trial().trial_id, "00009")
+        self.assertEqual(
+            [t.trial_id for t in tracker.first_trials(Trial.RUNNING, 3)],
+            ["00000", "00001", "00002"])
+        self.assertEqual(tracker.update(trials), [])
+
+        trials[50].status = Trial.TERMINATED
+        trials[51].last_result = {"metric": 20}
+        trials[52].status = Trial.ERROR
+        trials[52].error_file = "error.txt"
+        self.assertEqual(tracker.update(trials), trials[50:53])
+        self.assertEqual(tracker.num_trials_by_state, {
+            Trial.RUNNING: 98,
+            Trial.TERMINATED: 1,
+            Trial.ERROR: 1
+        })
+        self.assertEqual(tracker.best_trial(), trials[51])
+        self.assertEqual(list(tracker.errored_trials), [trials[52]])
+        self.assertEqual(
+            tracker.best_trials(Trial.RUNNING, 2), [trials[51], trials[9]])
+
+        # Removed trials are no longer indexed.
+        tracker.update(trials[:50])
+        self.assertEqual(tracker.num_trials_by_state, {Trial.RUNNING: 50})
+        self.assertEqual(tracker.best_trial(), trials[9])
+        self.assertEqual(dict(tracker.errored_trials), {})
+
     def testAddMetricColumn(self):
         """Tests edge cases of add_metric_column."""
 
@@ -100,6 +100,19 @@ class RayTrialExecutorTest(unittest.TestCase):
         self.assertEqual(1, len(running))
         self.trial_executor.stop_trial(trial)
 
+    def testGetNextAvailableTrials(self):
+        trials = [Trial("__fake"), Trial("__fake")]
+        for trial in trials:
+            self.trial_executor.start_trial(trial)
+        running = list(self.trial_executor._running)
+        ray.wait(running, num_returns=len(running))
+        # All ready results are returned at once.
+        ready = self.trial_executor.get_next_available_trials()
+        self.assertEqual(set(trials), set(ready))
+        self.assertEqual(len(trials), len(ready))
+        for trial in trials:
+            self.trial_executor.stop_trial(trial)
+
     def testAsyncSave(self):
         """Tests that saved checkpoint value not immediately set."""
         trial = Trial("__fake")
@@ -137,6 +150,89 @@ class RayTrialExecutorTest(unittest.TestCase):
         self.trial_executor.stop_trial(trial)
         self.assertEqual(Trial.TERMINATED, trial.status)
 
+    def testPooledTrials(self):
+        """Tests that trials share pooled actors and reuse their slots."""
+        trial_executor = RayTrialExecutor(trials_per_actor=2)
+        trials = [Trial("__fake") for _ in range(3)]
+        for trial in trials[:2]:
+            self.assertTrue(trial_executor.has_resources_for_trial(trial))
+            trial_executor.start_trial(trial)
+            self.assertEqual(Trial.RUNNING, trial.status)
+        # The cluster fits a single actor with two slots.
+        self.assertFalse(trial_executor.has_resources_for_trial(trials[2]))
+        self.assertFalse(trial_executor._pg_manager._staging_futures)
+
+        pids = {
+            trial_executor.fetch_result(trial)[-1][PID]
+            for trial in trials[:2]
+        }
+        self.assertEqual(1, len(pids))
+
+        trial_executor.pause_trial(trials[0])
+        self.assertEqual(Trial.PAUSED, trials[0].status)
+        trial_executor.start_trial(trials[2])
+        self.assertEqual(Trial.RUNNING, trials[2].status)
+        self.assertEqual(
+            pids, {trial_executor.fetch_result(trials[2])[-1][PID]})
+
+        for trial in trials[1:]:
+            trial_executor.stop_trial(trial)
+        trial_executor.start_trial(trials[0])
+        self.assertEqual(Trial.RUNNING, trials[0].status)
+        trial_executor.stop_trial(trials[0])
+        trial_executor.cleanup(trials)
+
+    def testPooledFunctionTrainables(self):
+        """Tests that pooled function trainables report to their trial."""
+
+        def train(config):
+            for i in range(3):
+                tune.report(
+                    session_trial_id=tune.get_trial_id(), pid=os.getpid())
+
+        with patch.dict(os.environ, {"TUNE_TRIALS_PER_ACTOR": "2"}):
+            analysis = tune.run(train, num_samples=4)
+
+        for trial in analysis.trials:
+            self.assertEqual(Trial.TERMINATED, trial.status)
+            self.assertEqual(3, trial.last_result[TRAINING_ITERATION])
+            self.assertEqual(trial.trial_id,
+                             trial.last_result["session_trial_id"])
+        self.assertEqual(
+            1, len({trial.last_result["pid"]
+                    for trial in analysis.trials}))
+
+    def testPooledTrainableSetupError(self):
+        """Tests that errors creating pooled trainables fail their trial."""
+
+        class FailingSetup(Trainable):
+            def setup(self, config):
+                raise ValueError("Failing setup")
+
+        with patch.dict(os.environ, {"TUNE_TRIALS_PER_ACTOR": "2"}):
+            analysis = tune.run(
+                FailingSetup, num_samples=2, raise_on_failed_trial=False)
+
+        for trial in analysis.trials:
+            self.assertEqual(Trial.ERROR, trial.status)
+            with open(trial.error_file, "r") as f:
+                self.assertIn("Failing setup", f.read())
+
+    def testPooledTrialsLargerThanNodes(self):
+        """Tests that pooled actors get fewer slots if all slots of an actor
+        don't fit on a node."""
+        trial_executor = RayTrialExecutor(trials_per_actor=8)
+        trials = [Trial("__fake") for _ in range(3)]
+        for trial in trials[:2]:
+            self.assertTrue(trial_executor.has_resources_for_trial(trial))
+            trial_executor.start_trial(trial)
+            self.assertEqual(Trial.RUNNING, trial.status)
+        self.assertFalse(trial_executor.has_resources_for_trial(trials[2]))
+        for trial in trials[:2]:
+            trial_executor.fetch_result(trial)
+            trial_executor.stop_trial(trial)
+        trial_executor.cleanup(trials)
+
     def testSavePauseResumeErrorRestore(self):
         """Tests that pause checkpoint does not replace restore checkpoint."""
         trial = Trial("__fake")
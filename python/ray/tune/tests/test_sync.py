@@ -15,8 +15,10 @@ import ray
 from ray.rllib import _register_all
 
 from ray import tune
+from ray.tune.error import TuneError
 from ray.tune.integration.docker import DockerSyncer
 from ray.tune.integration.kubernetes import KubernetesSyncer
+from ray.tune.sync_client import IncrementalSyncClient
 from ray.tune.syncer import (CommandBasedClient, detect_cluster_syncer,
                              get_cloud_sync_client)
 
@@ -359,6 +361,99 @@ class TestSyncFunctionality(unittest.TestCase):
                 "gs://test-bucket/test-dir/remote_source "
                 "local_target")
 
+    def testIncrementalSyncClient(self):
+        tmpdir = tempfile.mkdtemp()
+        remote_dir = os.path.join(tmpdir, "remote")
+        for trial in ["a", "b"]:
+            os.makedirs(os.path.join(tmpdir, trial, "checkpoint_1"))
+            with open(os.path.join(tmpdir, trial, "params.json"), "w") as f:
+                f.write("{}")
+            with open(os.path.join(tmpdir, trial, "result.json"), "w") as f:
+                f.write(trial)
+            with open(
+                    os.path.join(tmpdir, trial, "checkpoint_1", "checkpoint"),
+                    "w") as f:
+                f.write("checkpoint")
+
+        template = "mkdir -p {target} && cp -r {source}/. {target}"
+
+        def client(upload_template=template):
+            return IncrementalSyncClient(
+                template, template, upload_template=upload_template)
+
+        client_a = client()
+        self.assertTrue(
+            client_a.sync_up(
+                os.path.join(tmpdir, "a"), os.path.join(remote_dir, "a")))
+        client_a.wait()
+        self.assertEqual(client_a.stats["num_files"], 3)
+        self.assertEqual(client_a.stats["num_bytes"], 13)
+        self.assertTrue(
+            os.path.exists(
+                os.path.join(remote_dir, "a", "checkpoint_1", "checkpoint")))
+
+        # Nothing changed.
+        client_a.sync_up(
+            os.path.join(tmpdir, "a"), os.path.join(remote_dir, "a"))
+        client_a.wait()
+        self.assertEqual(client_a.stats["num_files"], 0)
+
+        # Only the changed file is uploaded.
+        with open(os.path.join(tmpdir, "a", "result.json"), "a") as f:
+            f.write("more")
+        client_a.sync_up(
+            os.path.join(tmpdir, "a"), os.path.join(remote_dir, "a"))
+        client_a.wait()
+        self.assertEqual(client_a.stats["num_files"], 1)
+        self.assertEqual(client_a.stats["num_bytes"], 5)
+        with open(os.path.join(remote_dir, "a", "result.json"), "r") as f:
+            self.assertEqual(f.read(), "amore")
+
+        client_b = client()
+        client_b.sync_up(
+            os.path.join(tmpdir, "b"),
+            os.path.join(remote_dir, "b"),
+            exclude=["checkpoint_*"])
+        client_b.wait()
+        self.assertEqual(client_b.stats["num_files"], 2)
+        self.assertTrue(
+            os.path.exists(os.path.join(remote_dir, "b", "params.json")))
+        self.assertFalse(
+            os.path.exists(os.path.join(remote_dir, "b", "checkpoint_1")))
+        shutil.rmtree(tmpdir)
+
+    def testIncrementalSyncClientRunning(self):
+        tmpdir = tempfile.mkdtemp()
+        source = os.path.join(tmpdir, "source")
+        remote_dir = os.path.join(tmpdir, "remote")
+        os.makedirs(source)
+        with open(os.path.join(source, "result.json"), "w") as f:
+            f.write("result")
+        template = "mkdir -p {target} && cp -r {source}/. {target}"
+        marker = os.path.join(tmpdir, "fail")
+        open(marker, "w").close()
+        # Fails while the marker exists, and takes some time.
+        upload_template = f"sleep 1 && [ ! -e {marker} ] && {template}"
+        client = IncrementalSyncClient(
+            template, template, upload_template=upload_template)
+
+        self.assertTrue(client.sync_up(source, remote_dir))
+        self.assertTrue(client.is_running)
+        # Syncs are skipped while the last one is running.
+        self.assertFalse(client.sync_up(source, remote_dir))
+        with self.assertRaises(TuneError):
+            client.wait()
+        self.assertFalse(client.is_running)
+
+        # The files of a failed upload are uploaded again.
+        os.remove(marker)
+        self.assertTrue(client.sync_up(source, remote_dir))
+        client.wait()
+        self.assertEqual(client.stats["num_files"], 1)
+        self.assertTrue(
+            os.path.exists(os.path.join(remote_dir, "result.json")))
+        shutil.rmtree(tmpdir)
+
     def testSyncDetection(self):
         kubernetes_conf = {
             "provider": {
@@ -71,6 +71,43 @@ class TrainableUtilTest(unittest.TestCase):
             path = os.path.join(self.checkpoint_dir, str(i))
             self.assertEquals(loaded["data"][str(i)], open(path, "rb").read())
 
+    def testDictCheckpointToObject(self):
+        class DictTrainable(ray.tune.Trainable):
+            def setup(self, config):
+                self.state = config["state"]
+
+            def step(self):
+                self.state += 1
+                return {}
+
+            def save_checkpoint(self, checkpoint_dir):
+                return {"state": self.state}
+
+            def load_checkpoint(self, checkpoint):
+                self.state = checkpoint["state"]
+
+        trainable = DictTrainable(config={"state": 1})
+        trainable.train()
+        obj = trainable.save_to_object()
+        checkpoint_dict, metadata = TrainableUtil.dict_checkpoint_from_object(
+            obj)
+        self.assertEqual({"state": 2}, checkpoint_dict)
+        self.assertEqual(1, metadata["iteration"])
+
+        restored = DictTrainable(config={"state": 0})
+        restored.restore_from_object(obj)
+        self.assertEqual(2, restored.state)
+        self.assertEqual(1, restored.iteration)
+        trainable.stop()
+        restored.stop()
+
+        # Checkpoints with files are restored from disk.
+        with open(os.path.join(self.checkpoint_dir, "0"), "w") as f:
+            f.write("0")
+        obj = TrainableUtil.checkpoint_to_object(
+            os.path.join(self.checkpoint_dir, "0"))
+        self.assertIsNone(TrainableUtil.dict_checkpoint_from_object(obj))
+
 
 class FlattenDictTest(unittest.TestCase):
     def test_output_type(self):
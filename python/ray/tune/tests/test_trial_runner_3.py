@@ -1,5 +1,6 @@
 import time
 from collections import Counter
+import json
 import os
 import pickle
 import shutil
@@ -18,13 +19,15 @@ from ray.tune.schedulers import TrialScheduler, FIFOScheduler
 from ray.tune.experiment import Experiment
 from ray.tune.suggest import BasicVariantGenerator
 from ray.tune.trial import Trial
-from ray.tune.trial_runner import TrialRunner
+from ray.tune.trial_runner import (TrialRunner, load_experiment_checkpoint,
+                                   load_trials_from_experiment_checkpoint)
 from ray.tune.resources import Resources, json_to_resources, resources_to_json
 from ray.tune.suggest.repeater import Repeater
 from ray.tune.suggest._mock import _MockSuggestionAlgorithm
 from ray.tune.suggest.suggestion import Searcher, ConcurrencyLimiter
 from ray.tune.suggest.search_generator import SearchGenerator
 from ray.tune.syncer import SyncConfig
+from ray.tune.utils.serialization import TuneFunctionDecoder
 
 
 class TrialRunnerTest3(unittest.TestCase):
@@ -608,6 +611,45 @@ class TrialRunnerTest3(unittest.TestCase):
         self.assertEqual(count_checkpoints(tmpdir), 2)
         shutil.rmtree(tmpdir)
 
+    def testCheckpointTrialLog(self):
+        ray.init(num_cpus=2)
+
+        runner = TrialRunner(
+            local_checkpoint_dir=self.tmpdir, checkpoint_period=0)
+        for _ in range(2):
+            runner.add_trial(Trial("__fake", checkpoint_freq=1))
+        for _ in range(6):
+            runner.step()
+
+        # The trials changed after the first checkpoint were appended to the
+        # trial log instead of rewriting the checkpoint file.
+        log_path = os.path.splitext(runner.checkpoint_file)[0] + ".log"
+        with open(log_path) as f:
+            entries = [json.loads(line) for line in f]
+        self.assertTrue(any("trial_id" in entry for entry in entries))
+        # An entry left incomplete by an interrupted driver is ignored.
+        with open(log_path, "a") as f:
+            f.write("{\"trial_id\": ")
+
+        expected = {
+            trial_id: json.loads(cp, cls=TuneFunctionDecoder)
+            for trial_id, cp in runner.trial_executor.get_checkpoints().items()
+        }
+        trials = load_trials_from_experiment_checkpoint(
+            load_experiment_checkpoint(runner.checkpoint_file), stub=True)
+        self.assertEqual(len(trials), 2)
+        for trial in trials:
+            self.assertEqual(trial.last_update_time,
+                             expected[trial.trial_id]["last_update_time"])
+
+        # Forced checkpoints compact the trial log.
+        runner.checkpoint(force=True)
+        self.assertEqual(os.path.getsize(log_path), 0)
+        trials = load_trials_from_experiment_checkpoint(
+            load_experiment_checkpoint(runner.checkpoint_file), stub=True)
+        self.assertEqual(
+            sorted(t.trial_id for t in trials), sorted(expected.keys()))
+
     def testCheckpointFreqBuffered(self):
         os.environ["TUNE_RESULT_BUFFER_LENGTH"] = "7"
         os.environ["TUNE_RESULT_BUFFER_MIN_TIME_S"] = "1"
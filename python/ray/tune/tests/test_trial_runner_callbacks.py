@@ -77,6 +77,11 @@ class _MockTrialExecutor(RayTrialExecutor):
     def get_next_available_trial(self, timeout=None):
         return self.next_trial or super().get_next_available_trial()
 
+    def get_next_available_trials(self, timeout=None):
+        if self.next_trial:
+            return [self.next_trial]
+        return super().get_next_available_trials()
+
     def get_next_failed_trial(self):
         return self.failed_trial or super().get_next_failed_trial()
 
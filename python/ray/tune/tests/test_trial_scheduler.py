@@ -20,6 +20,7 @@ from ray.tune.schedulers import (FIFOScheduler, HyperBandScheduler,
                                  PopulationBasedTraining, MedianStoppingRule,
                                  TrialScheduler, HyperBandForBOHB)
 
+from ray.tune.schedulers.order_statistics import OrderStatistics
 from ray.tune.schedulers.pbt import explore, PopulationBasedTrainingReplay
 from ray.tune.suggest._mock import _MockSearcher
 from ray.tune.suggest.suggestion import ConcurrencyLimiter
@@ -2222,6 +2223,53 @@ class AsyncHyperBandSuite(unittest.TestCase):
         self._testAnonymousMetricEndToEnd(PopulationBasedTraining)
 
 
+class OrderStatisticsSuite(unittest.TestCase):
+    def testPercentile(self):
+        random.seed(1234)
+        # A small load to exercise splitting the sublists.
+        stats = OrderStatistics(load=2)
+        self.assertIsNone(stats.percentile(50))
+        values = {}
+        for i in range(200):
+            key = random.randint(0, 50)
+            value = random.choice([random.random(), float("nan")])
+            if random.random() < 0.2:
+                stats.remove(key)
+                values.pop(key, None)
+            else:
+                stats[key] = value
+                values[key] = value
+            expected = list(values.values())
+            if np.isnan(expected).all():
+                self.assertIsNone(stats.percentile(50))
+                continue
+            for q in [0, 25, 50, 75, 100]:
+                self.assertAlmostEqual(
+                    stats.percentile(q), np.nanpercentile(expected, q))
+            self.assertEqual(len(stats), np.count_nonzero(~np.isnan(expected)))
+
+    def testSelection(self):
+        stats = OrderStatistics(load=2)
+        for key, value in zip("abcdef", [3., 1., 2., 1., 5., 4.]):
+            stats[key] = value
+        self.assertEqual(list(stats), ["b", "d", "c", "a", "f", "e"])
+        self.assertEqual(stats.lowest(2), ["b", "d"])
+        self.assertEqual(stats.highest(2), ["f", "e"])
+        self.assertEqual(stats.at_least(3.), ["a", "f", "e"])
+        self.assertEqual(stats.select(2), ("c", 2.))
+        self.assertEqual(stats.rank(2.), 2)
+
+        # Updating a value keeps the order of ties.
+        stats["b"] = 6.
+        stats["b"] = 1.
+        self.assertEqual(stats.lowest(2), ["b", "d"])
+
+        stats.remove("e")
+        stats.remove("x")
+        self.assertNotIn("e", stats)
+        self.assertEqual(stats.highest(2), ["a", "f"])
+
+
 if __name__ == "__main__":
     import pytest
     sys.exit(pytest.main(["-v", __file__]))
@@ -92,6 +92,68 @@ class PopulationBasedTrainingMemoryTest(unittest.TestCase):
             trial_executor=CustomExecutor(reuse_actors=False),
         )
 
+    def testCheckpointCacheBudget(self):
+        class MyTrainable(Trainable):
+            def setup(self, config):
+                self.large_object = random.getrandbits(int(40e6))
+                self.iter = 0
+                self.a = config["a"]
+
+            def step(self):
+                self.iter += 1
+                return {"metric": self.iter + self.a}
+
+            def save_checkpoint(self, checkpoint_dir):
+                return {
+                    "large_object": self.large_object,
+                    "iter": self.iter,
+                    "a": self.a
+                }
+
+            def load_checkpoint(self, checkpoint):
+                self.large_object = checkpoint["large_object"]
+                self.iter = checkpoint["iter"]
+                self.a = checkpoint["a"]
+
+        max_bytes = 8 * MB
+        pbt = PopulationBasedTraining(
+            time_attr="training_iteration",
+            metric="metric",
+            mode="max",
+            perturbation_interval=1,
+            quantile_fraction=0.5,
+            hyperparam_mutations={"b": [-1]},
+            checkpoint_cache_bytes=max_bytes,
+        )
+
+        saved_trials = set()
+
+        class CustomExecutor(RayTrialExecutor):
+            def save(self, trial, *args, **kwargs):
+                # Checkpoints are about 5 MB, so a single one is kept.
+                assert pbt._checkpoint_cache.total_bytes() <= max_bytes
+                # Running trials keep their checkpoint for failure recovery,
+                # even if PBT dropped it.
+                for saved_trial in saved_trials:
+                    if saved_trial.status == Trial.RUNNING:
+                        checkpoint_manager = saved_trial.checkpoint_manager
+                        assert (checkpoint_manager.newest_memory_checkpoint.
+                                value is not None)
+                saved_trials.add(trial)
+                return super(CustomExecutor, self).save(
+                    trial, *args, **kwargs)
+
+        analysis = tune.run(
+            MyTrainable,
+            scheduler=pbt,
+            stop={"training_iteration": 10},
+            fail_fast=True,
+            config={"a": tune.grid_search([1, 2, 3, 4])},
+            trial_executor=CustomExecutor(reuse_actors=False),
+        )
+        for trial in analysis.trials:
+            self.assertEqual(10, trial.last_result["training_iteration"])
+
 
 class PopulationBasedTrainingFileDescriptorTest(unittest.TestCase):
     def setUp(self):
@@ -419,15 +419,31 @@ class Trainable:
     def save_to_object(self):
         """Saves the current model state to a Python object.
 
-        It also saves to disk but does not return the checkpoint path.
+        Checkpoints returned as a dict by ``save_checkpoint()`` without
+        writing any files are serialized in memory. Otherwise, the
+        checkpoint is also saved to disk, but the path is not returned.
 
         Returns:
             Object holding checkpoint data.
         """
         tmpdir = tempfile.mkdtemp("save_to_object", dir=self.logdir)
-        checkpoint_path = self.save(tmpdir)
-        # Save all files in subtree and delete the tmpdir.
-        obj = TrainableUtil.checkpoint_to_object(checkpoint_path)
+        checkpoint_dir = TrainableUtil.make_checkpoint_dir(
+            tmpdir, index=self.iteration)
+        checkpoint = self.save_checkpoint(checkpoint_dir)
+        trainable_state = self.get_state()
+        if isinstance(checkpoint, dict) and os.listdir(checkpoint_dir) == [
+                ".is_checkpoint"
+        ]:
+            obj = TrainableUtil.dict_checkpoint_to_object(
+                checkpoint, trainable_state)
+        else:
+            checkpoint_path = TrainableUtil.process_checkpoint(
+                checkpoint,
+                parent_dir=checkpoint_dir,
+                trainable_state=trainable_state)
+            self._maybe_save_to_cloud()
+            # Save all files in subtree and delete the tmpdir.
+            obj = TrainableUtil.checkpoint_to_object(checkpoint_path)
         shutil.rmtree(tmpdir)
         return obj
 
@@ -447,11 +463,7 @@ class Trainable:
 
         with open(checkpoint_path + ".tune_metadata", "rb") as f:
             metadata = pickle.load(f)
-        self._experiment_id = metadata["experiment_id"]
-        self._iteration = metadata["iteration"]
-        self._timesteps_total = metadata["timesteps_total"]
-        self._time_total = metadata["time_total"]
-        self._episodes_total = metadata["episodes_total"]
+        self._restore_metadata(metadata)
         saved_as_dict = metadata["saved_as_dict"]
         if saved_as_dict:
             with open(checkpoint_path, "rb") as loaded_state:
@@ -460,6 +472,16 @@ class Trainable:
             self.load_checkpoint(checkpoint_dict)
         else:
             self.load_checkpoint(checkpoint_path)
+        self._on_restored(checkpoint_path)
+
+    def _restore_metadata(self, metadata):
+        self._experiment_id = metadata["experiment_id"]
+        self._iteration = metadata["iteration"]
+        self._timesteps_total = metadata["timesteps_total"]
+        self._time_total = metadata["time_total"]
+        self._episodes_total = metadata["episodes_total"]
+
+    def _on_restored(self, checkpoint_path):
         self._time_since_restore = 0.0
         self._timesteps_since_restore = 0
         self._iterations_since_restore = 0
@@ -478,7 +500,17 @@ class Trainable:
         """Restores training state from a checkpoint object.
 
         These checkpoints are returned from calls to save_to_object().
+        Checkpoints saved as a dict alone are restored without writing them
+        to disk.
         """
+        dict_checkpoint = TrainableUtil.dict_checkpoint_from_object(obj)
+        if dict_checkpoint is not None:
+            checkpoint_dict, metadata = dict_checkpoint
+            self._restore_metadata(metadata)
+            self.load_checkpoint(checkpoint_dict)
+            self._on_restored("<object>")
+            return
+
         tmpdir = tempfile.mkdtemp("restore_from_object", dir=self.logdir)
         checkpoint_path = TrainableUtil.create_from_pickle(obj, tmpdir)
         self.restore(checkpoint_path)
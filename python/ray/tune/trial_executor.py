@@ -118,6 +118,7 @@ class TrialExecutor(metaclass=_WarnOnDirectInheritanceMeta):
         """Initializes a new TrialExecutor.
         """
         self._cached_trial_state = {}
+        self._updated_trial_state = {}
         self._trials_to_cache = set()
         # The next two variables are used to keep track of if there is any
         # "progress" made between subsequent calls to `on_no_available_trials`.
@@ -171,13 +172,26 @@ class TrialExecutor(metaclass=_WarnOnDirectInheritanceMeta):
             logger.exception("Trial %s: Error checkpointing trial metadata.",
                              trial)
 
-    def get_checkpoints(self) -> Dict[str, str]:
-        """Returns a copy of mapping of the trial ID to pickled metadata."""
+    def _cache_trial_states(self) -> None:
         for trial in self._trials_to_cache:
-            self._cached_trial_state[trial.trial_id] = trial.get_json_state()
+            json_state = trial.get_json_state()
+            self._cached_trial_state[trial.trial_id] = json_state
+            self._updated_trial_state[trial.trial_id] = json_state
         self._trials_to_cache.clear()
+
+    def get_checkpoints(self) -> Dict[str, str]:
+        """Returns a copy of mapping of the trial ID to pickled metadata."""
+        self._cache_trial_states()
         return self._cached_trial_state
 
+    def get_updated_checkpoints(self) -> Dict[str, str]:
+        """Returns the mapping of the trial ID to pickled metadata for the
+        trials checkpointed since the last call."""
+        self._cache_trial_states()
+        updated = self._updated_trial_state
+        self._updated_trial_state = {}
+        return updated
+
     @abstractmethod
     def has_resources(self, resources: Resources) -> bool:
         """Returns whether this runner has at least the specified resources."""
@@ -338,6 +352,19 @@ class TrialExecutor(metaclass=_WarnOnDirectInheritanceMeta):
         """
         pass
 
+    def get_next_available_trials(
+            self, timeout: Optional[float] = None) -> List[Trial]:
+        """Blocking call that waits until at least one result is ready.
+
+        Executors able to detect several ready results at once should
+        override this, so the trial runner can process them in a batch.
+
+        Returns:
+            Trial objects that are ready for intermediate processing.
+        """
+        trial = self.get_next_available_trial(timeout=timeout)
+        return [trial] if trial else []
+
     @abstractmethod
     def get_next_failed_trial(self) -> Optional[Trial]:
         """Non-blocking call that detects and returns one failed trial.
@@ -1,4 +1,4 @@
-from typing import Any, List, Mapping, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 import click
 from datetime import datetime
@@ -33,6 +33,10 @@ from ray.util.debug import log_once
 
 MAX_DEBUG_TRIALS = 20
 
+# The experiment checkpoint is compacted once the number of entries in its
+# trial log exceeds the number of trials, or this minimum.
+MIN_TRIAL_LOG_ENTRIES_TO_COMPACT = 100
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +51,55 @@ def find_newest_experiment_checkpoint(ckpt_dir) -> Optional[str]:
     return max(full_paths)
 
 
+def _get_trial_log_path(checkpoint_file: str) -> str:
+    """Returns the path of the trial log of an experiment checkpoint."""
+    return os.path.splitext(checkpoint_file)[0] + ".log"
+
+
+def load_experiment_checkpoint(checkpoint_file: str) -> Dict[str, Any]:
+    """Loads an experiment checkpoint (TrialRunner state dict).
+
+    The trial states and runner data appended to the trial log of the
+    checkpoint since it was last compacted are applied to the checkpoint.
+    """
+    with open(checkpoint_file, "r") as f:
+        runner_state = json.load(f, cls=TuneFunctionDecoder)
+
+    log_name = runner_state.pop("trial_log", None)
+    if not log_name:
+        return runner_state
+    log_path = os.path.join(os.path.dirname(checkpoint_file), log_name)
+    if not os.path.exists(log_path):
+        return runner_state
+
+    updated_checkpoints = {}
+    with open(log_path, "r") as f:
+        for line in f:
+            try:
+                entry = json.loads(line, cls=TuneFunctionDecoder)
+            except ValueError:
+                # The driver may have been interrupted while appending the
+                # last entry.
+                logger.warning(f"Ignoring an incomplete entry of the "
+                               f"experiment trial log {log_path}.")
+                break
+            if "trial_id" in entry:
+                updated_checkpoints[entry["trial_id"]] = entry["state"]
+            else:
+                runner_state.update(entry)
+
+    if updated_checkpoints:
+        checkpoints = {}
+        for cp in runner_state["checkpoints"]:
+            if isinstance(cp, str):
+                cp = json.loads(cp, cls=TuneFunctionDecoder)
+            checkpoints[cp["trial_id"]] = cp
+        for trial_id, cp in updated_checkpoints.items():
+            checkpoints[trial_id] = json.loads(cp, cls=TuneFunctionDecoder)
+        runner_state["checkpoints"] = list(checkpoints.values())
+    return runner_state
+
+
 def load_trials_from_experiment_checkpoint(
         experiment_checkpoint: Mapping[str, Any],
         stub: bool = False) -> List[Trial]:
@@ -76,6 +129,12 @@ class _ExperimentCheckpointManager:
     the state of the trial runner, trial executor, and search algorithm, to
     a specified checkpoint file.
 
+    Only the states of the trials changed since the last checkpoint are
+    written. They are appended to a trial log next to the checkpoint file
+    (see ``load_experiment_checkpoint()``). The log is compacted into the
+    checkpoint file once it has more entries than there are trials, and on
+    forced checkpoints.
+
     The checkpoint period is automatically adjusted to
     ``max(10, time_per_checkpoint * 19)``. This means that at most 5% of the
     time (1/20) will be used for writing checkpoints, while 95% of the time
@@ -104,6 +163,9 @@ class _ExperimentCheckpointManager:
         self._sync_trial_checkpoints = sync_trial_checkpoints
 
         self._last_checkpoint_time = 0.
+        # The number of entries in the trial log of the checkpoint file.
+        # None until the checkpoint file was compacted by this manager.
+        self._num_trial_log_entries = None
 
     @property
     def auto_checkpoint_enabled(self):
@@ -134,14 +196,44 @@ class _ExperimentCheckpointManager:
                 not force):
             return
 
+        def _append_to_trial_log(log_path, updated_checkpoints, runner_data,
+                                 stats):
+            entries = [{
+                "trial_id": trial_id,
+                "state": json_state
+            } for trial_id, json_state in updated_checkpoints.items()]
+            entries.append({"runner_data": runner_data, "stats": stats})
+            with open(log_path, "a") as f:
+                for entry in entries:
+                    f.write(json.dumps(entry, cls=TuneFunctionEncoder) + "\n")
+            self._num_trial_log_entries += len(entries)
+
         def _serialize_and_write():
+            updated_checkpoints = trial_executor.get_updated_checkpoints()
+            checkpoints = trial_executor.get_checkpoints()
+            runner_data = trial_runner.__getstate__()
+            stats = {
+                "start_time": self._start_time,
+                "timestamp": self._last_checkpoint_time
+            }
+            log_path = _get_trial_log_path(checkpoint_file)
+            if self._num_trial_log_entries is not None:
+                # Append the new trial states first, so that the trial log
+                # is consistent with the checkpoint file if the driver is
+                # interrupted while compacting.
+                _append_to_trial_log(log_path, updated_checkpoints,
+                                     runner_data, stats)
+                if not force and self._num_trial_log_entries <= max(
+                        MIN_TRIAL_LOG_ENTRIES_TO_COMPACT, len(checkpoints)):
+                    search_alg.save_to_dir(
+                        self._checkpoint_dir, session_str=self._session_str)
+                    return
+
             runner_state = {
-                "checkpoints": list(trial_executor.get_checkpoints().values()),
-                "runner_data": trial_runner.__getstate__(),
-                "stats": {
-                    "start_time": self._start_time,
-                    "timestamp": self._last_checkpoint_time
-                }
+                "checkpoints": list(checkpoints.values()),
+                "runner_data": runner_data,
+                "stats": stats,
+                "trial_log": os.path.basename(log_path)
             }
             tmp_file_name = os.path.join(self._checkpoint_dir,
                                          ".tmp_checkpoint")
@@ -149,6 +241,9 @@ class _ExperimentCheckpointManager:
                 json.dump(runner_state, f, indent=2, cls=TuneFunctionEncoder)
 
             os.replace(tmp_file_name, checkpoint_file)
+            # Truncate the trial log.
+            open(log_path, "w").close()
+            self._num_trial_log_entries = 0
             search_alg.save_to_dir(
                 self._checkpoint_dir, session_str=self._session_str)
 
@@ -628,9 +723,8 @@ class TrialRunner:
                              f"`{self._local_checkpoint_dir}`, but no "
                              f"experiment checkpoint data was found.")
 
-        with open(newest_ckpt_path, "r") as f:
-            runner_state = json.load(f, cls=TuneFunctionDecoder)
-            self.checkpoint_file = newest_ckpt_path
+        runner_state = load_experiment_checkpoint(newest_ckpt_path)
+        self.checkpoint_file = newest_ckpt_path
 
         logger.warning("".join([
             "Attempting to resume experiment from {}. ".format(
@@ -854,55 +948,62 @@ class TrialRunner:
             with warn_if_slow("process_failed_trial"):
                 self._process_trial_failure(failed_trial, error_msg=error_msg)
         else:
-            # TODO(ujvl): Consider combining get_next_available_trial and
+            # TODO(ujvl): Consider combining get_next_available_trials and
             #  fetch_result functionality so that we don't timeout on fetch.
-            trial = self.trial_executor.get_next_available_trial(
+            trials = self.trial_executor.get_next_available_trials(
                 timeout=timeout)  # blocking
-            if not trial:
-                return
-            if trial.is_restoring:
-                with warn_if_slow("process_trial_restore"):
-                    self._process_trial_restore(trial)
-                with warn_if_slow("callbacks.on_trial_restore"):
-                    self._callbacks.on_trial_restore(
-                        iteration=self._iteration,
-                        trials=self._trials,
-                        trial=trial)
-            elif trial.is_saving:
-                with warn_if_slow("process_trial_save") as _profile:
-                    self._process_trial_save(trial)
-                with warn_if_slow("callbacks.on_trial_save"):
-                    self._callbacks.on_trial_save(
-                        iteration=self._iteration,
-                        trials=self._trials,
-                        trial=trial)
-                if _profile.too_slow and trial.sync_on_checkpoint:
-                    # TODO(ujvl): Suggest using cloud checkpointing once
-                    #  API has converged.
-
-                    msg = (
-                        "Consider turning off forced head-worker trial "
-                        "checkpoint syncs by setting sync_on_checkpoint=False"
-                        ". Note that this may result in faulty trial "
-                        "restoration if a failure occurs while the checkpoint "
-                        "is being synced from the worker to the head node.")
-
-                    if trial.location.hostname and (trial.location.hostname !=
-                                                    get_node_ip_address()):
-                        if log_once("tune_head_worker_checkpoint"):
-                            logger.warning(msg)
+            for i, trial in enumerate(trials):
+                # Processing the events of the previous trials may have
+                # paused or stopped this trial, e.g. by a scheduler.
+                if i > 0 and trial.status != Trial.RUNNING:
+                    continue
+                self._process_trial_event(trial)
+
+    def _process_trial_event(self, trial):
+        """Processes the ready result, save or restore of a trial."""
+        if trial.is_restoring:
+            with warn_if_slow("process_trial_restore"):
+                self._process_trial_restore(trial)
+            with warn_if_slow("callbacks.on_trial_restore"):
+                self._callbacks.on_trial_restore(
+                    iteration=self._iteration,
+                    trials=self._trials,
+                    trial=trial)
+        elif trial.is_saving:
+            with warn_if_slow("process_trial_save") as _profile:
+                self._process_trial_save(trial)
+            with warn_if_slow("callbacks.on_trial_save"):
+                self._callbacks.on_trial_save(
+                    iteration=self._iteration,
+                    trials=self._trials,
+                    trial=trial)
+            if _profile.too_slow and trial.sync_on_checkpoint:
+                # TODO(ujvl): Suggest using cloud checkpointing once
+                #  API has converged.
+
+                msg = (
+                    "Consider turning off forced head-worker trial "
+                    "checkpoint syncs by setting sync_on_checkpoint=False"
+                    ". Note that this may result in faulty trial "
+                    "restoration if a failure occurs while the checkpoint "
+                    "is being synced from the worker to the head node.")
+
+                if trial.location.hostname and (trial.location.hostname !=
+                                                get_node_ip_address()):
+                    if log_once("tune_head_worker_checkpoint"):
+                        logger.warning(msg)
 
-            else:
-                with warn_if_slow("process_trial"):
-                    self._process_trial(trial)
-
-            # `self._queued_trial_decisions` now contains a final decision
-            # based on all results
-            if trial not in self._cached_trial_decisions:
-                final_decision = self._queued_trial_decisions.pop(
-                    trial.trial_id, None)
-                if final_decision:
-                    self._execute_action(trial, final_decision)
+        else:
+            with warn_if_slow("process_trial"):
+                self._process_trial(trial)
+
+        # `self._queued_trial_decisions` now contains a final decision
+        # based on all results
+        if trial not in self._cached_trial_decisions:
+            final_decision = self._queued_trial_decisions.pop(
+                trial.trial_id, None)
+            if final_decision:
+                self._execute_action(trial, final_decision)
 
     def _process_trial(self, trial):
         """Processes a trial result.
@@ -0,0 +1,154 @@
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, TextIO
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFileWriter:
+    """Appends text to files from a background thread.
+
+    Writes are buffered in memory and written in batches, at the latest
+    ``flush_period_s`` seconds after they were made. Every file is flushed
+    once per batch. At most ``max_open_files`` files are kept open, the
+    least recently written ones are closed first and reopened in append
+    mode when they are written to again. Writes block while more than
+    ``max_buffer_bytes`` characters are waiting to be written.
+
+    The writer thread is started on the first write. Errors writing a file
+    are logged and the data of the batch for this file is dropped.
+
+    Args:
+        flush_period_s (float): Maximum time in seconds data is buffered
+            before it is written.
+        max_open_files (int): Maximum number of files kept open.
+        max_buffer_bytes (int): Maximum number of characters buffered
+            before writes block.
+    """
+
+    def __init__(self,
+                 flush_period_s: float = 5.,
+                 max_open_files: int = 256,
+                 max_buffer_bytes: int = 64 * 1024**2):
+        self._flush_period_s = flush_period_s
+        self._max_open_files = max_open_files
+        self._max_buffer_bytes = max_buffer_bytes
+
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        # Path -> text to append, for the batch that is being collected.
+        self._pending: Dict[str, List[str]] = {}
+        self._pending_bytes = 0
+        self._to_close: Set[str] = set()
+        self._flush_requested = False
+        self._stop_requested = False
+        # The index of the batch that is being collected, and the number of
+        # batches written so far.
+        self._next_batch = 0
+        self._num_written = 0
+
+        # Only accessed by the writer thread.
+        self._files: "OrderedDict[str, TextIO]" = OrderedDict()
+
+    def write(self, path: str, data: str):
+        """Appends data to the file at path."""
+        with self._cond:
+            while self._pending_bytes >= self._max_buffer_bytes:
+                self._cond.notify_all()
+                self._cond.wait()
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="AsyncFileWriter", daemon=True)
+                self._thread.start()
+            self._pending.setdefault(path, []).append(data)
+            self._pending_bytes += len(data)
+            if self._pending_bytes >= self._max_buffer_bytes:
+                self._cond.notify_all()
+
+    def flush(self):
+        """Blocks until all previous writes are written and flushed."""
+        with self._cond:
+            if self._thread is None:
+                return
+            batch = self._next_batch
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._num_written <= batch:
+                self._cond.wait()
+
+    def close(self, path: str):
+        """Blocks until all previous writes are written and closes the file
+        at path."""
+        with self._cond:
+            if self._thread is None:
+                return
+            self._to_close.add(path)
+        self.flush()
+
+    def shutdown(self):
+        """Writes all buffered data, closes all files and stops the writer
+        thread. The writer can still be used afterwards."""
+        with self._cond:
+            if self._thread is None:
+                return
+            thread = self._thread
+            self._stop_requested = True
+            self._cond.notify_all()
+        thread.join()
+        with self._cond:
+            self._thread = None
+            self._stop_requested = False
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    self._should_write, timeout=self._flush_period_s)
+                pending, self._pending = self._pending, {}
+                to_close, self._to_close = self._to_close, set()
+                self._pending_bytes = 0
+                self._flush_requested = False
+                stop = self._stop_requested
+                batch = self._next_batch
+                self._next_batch += 1
+                # Unblock writes waiting for buffer space.
+                self._cond.notify_all()
+
+            self._write_batch(pending)
+            for path in (list(self._files) if stop else to_close):
+                self._close_file(path)
+
+            with self._cond:
+                self._num_written = batch + 1
+                self._cond.notify_all()
+            if stop:
+                return
+
+    def _should_write(self) -> bool:
+        return (self._flush_requested or self._stop_requested
+                or self._pending_bytes >= self._max_buffer_bytes)
+
+    def _write_batch(self, pending: Dict[str, List[str]]):
+        for path, chunks in pending.items():
+            try:
+                f = self._files.pop(path, None)
+                if f is None:
+                    f = open(path, "at")
+                self._files[path] = f
+                f.write("".join(chunks))
+                f.flush()
+            except Exception:
+                logger.exception(f"Failed to write to {path}.")
+                self._close_file(path)
+            while len(self._files) > self._max_open_files:
+                self._close_file(next(iter(self._files)))
+
+    def _close_file(self, path: str):
+        f = self._files.pop(path, None)
+        if f is None:
+            return
+        try:
+            f.close()
+        except Exception:
+            logger.exception(f"Failed to close {path}.")
@@ -1,4 +1,4 @@
-from typing import Dict, Any
+from typing import Any, Dict, Optional, Tuple
 
 import glob
 import inspect
@@ -77,6 +77,38 @@ class TrainableUtil:
         out.write(data_dict)
         return out.getvalue()
 
+    @staticmethod
+    def dict_checkpoint_to_object(checkpoint: Dict[str, Any],
+                                  trainable_state: Dict[str, Any]) -> bytes:
+        """Serializes a checkpoint dict like ``checkpoint_to_object``,
+        without writing it to disk."""
+        trainable_state["saved_as_dict"] = True
+        return pickle.dumps({
+            "checkpoint_name": "checkpoint",
+            "data": {
+                ".is_checkpoint": b"",
+                "checkpoint": pickle.dumps(checkpoint),
+                "checkpoint.tune_metadata": pickle.dumps(trainable_state),
+            },
+        })
+
+    @staticmethod
+    def dict_checkpoint_from_object(obj: bytes) -> Optional[Tuple[Dict, Dict]]:
+        """Returns the checkpoint dict and metadata of a checkpoint object,
+        or None if the checkpoint was not saved as a dict alone."""
+        info = pickle.loads(obj)
+        name = info["checkpoint_name"]
+        data = info["data"]
+        metadata_name = name + ".tune_metadata"
+        if set(data) - {name, metadata_name, ".is_checkpoint"}:
+            return None
+        if name not in data or metadata_name not in data:
+            return None
+        metadata = pickle.loads(data[metadata_name])
+        if not metadata.get("saved_as_dict"):
+            return None
+        return pickle.loads(data[name]), metadata
+
     @staticmethod
     def find_checkpoint_dir(checkpoint_path):
         """Returns the directory containing the checkpoint path.
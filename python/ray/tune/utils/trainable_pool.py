@@ -0,0 +1,299 @@
+import asyncio
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import logging
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import ray
+
+if TYPE_CHECKING:
+    from ray.tune.trial import Trial
+
+logger = logging.getLogger(__name__)
+
+# Method name used to create the trainable of a slot.
+_CREATE = "__create__"
+
+# Resources that are not considered when limiting the number of actors.
+_MEMORY_RESOURCES = ("memory", "object_store_memory")
+
+_Bundle = Tuple[Tuple[str, float], ...]
+
+
+class _PooledTrainables:
+    """Actor hosting one trainable per slot.
+
+    The calls of each slot are executed on a thread dedicated to the slot,
+    one after the other and in the order of their sequence numbers. Calls
+    of different slots run concurrently. The result of creating a trainable
+    is not awaited, so if it fails, the error is raised again by the next
+    calls of the slot.
+    """
+
+    def __init__(self):
+        self._trainables: Dict[int, Any] = {}
+        self._creation_errors: Dict[int, Exception] = {}
+        self._executors: Dict[int, ThreadPoolExecutor] = {}
+        self._conditions: Dict[int, asyncio.Condition] = {}
+        # Slot -> sequence number of the next call to execute.
+        self._next_calls: Dict[int, int] = defaultdict(int)
+
+    async def call(self, _slot: int, _seq: int, _method: str, *args,
+                   **kwargs):
+        if _slot not in self._conditions:
+            self._conditions[_slot] = asyncio.Condition()
+            self._executors[_slot] = ThreadPoolExecutor(max_workers=1)
+        condition = self._conditions[_slot]
+        async with condition:
+            await condition.wait_for(lambda: self._next_calls[_slot] == _seq)
+        try:
+            return await asyncio.get_event_loop().run_in_executor(
+                self._executors[_slot],
+                partial(self._call, _slot, _method, args, kwargs))
+        finally:
+            async with condition:
+                self._next_calls[_slot] += 1
+                condition.notify_all()
+
+    def _call(self, slot: int, method: str, args: Tuple, kwargs: Dict):
+        if method == _CREATE:
+            from ray.tune import session
+            from ray.tune.registry import get_trainable_cls
+
+            trainable_name, trainable_kwargs = args
+            self._creation_errors.pop(slot, None)
+            try:
+                # Pooled function trainables report through the session of
+                # their runner thread, the session of the process is unused.
+                session.shutdown()
+                trainable_cls = get_trainable_cls(trainable_name)
+                self._trainables[slot] = trainable_cls(**trainable_kwargs)
+            except Exception as e:
+                self._creation_errors[slot] = e
+                raise
+            return None
+
+        if slot in self._creation_errors:
+            if method == "stop":
+                del self._creation_errors[slot]
+                return None
+            raise self._creation_errors[slot]
+        result = getattr(self._trainables[slot], method)(*args, **kwargs)
+        if method == "stop":
+            del self._trainables[slot]
+        return result
+
+
+class _PoolActor:
+    """Driver side state of a pooled actor."""
+
+    def __init__(self, handle: ray.actor.ActorHandle, bundle: _Bundle,
+                 num_slots: int):
+        self.handle = handle
+        self.bundle = bundle
+        self.num_slots = num_slots
+        self.free_slots = [
+            _TrialSlot(self, index) for index in reversed(range(num_slots))
+        ]
+        # Retired actors don't take new trials and are removed once all
+        # their trials stopped.
+        self.retired = False
+
+
+class _SlotMethod:
+    def __init__(self, slot: "_TrialSlot", method: str):
+        self._slot = slot
+        self._method = method
+
+    def remote(self, *args, **kwargs) -> ray.ObjectRef:
+        return self._slot._call(self._method, args, kwargs)
+
+
+class _TrialSlot:
+    """Stands in for the actor handle of a trial running in a pooled actor.
+
+    ``slot.method.remote(*args, **kwargs)`` calls the method of the
+    trainable in the slot and returns an object ref to its result, like it
+    would on an actor handle.
+    """
+
+    def __init__(self, actor: _PoolActor, index: int):
+        self.actor = actor
+        self.index = index
+        # Sequence number of the next call, kept across the trials run in
+        # this slot so that they are executed in order.
+        self._num_calls = 0
+
+    def create(self, trainable_name: str, kwargs: Dict) -> ray.ObjectRef:
+        """Creates the trainable of the slot."""
+        return self._call(_CREATE, (trainable_name, kwargs), {})
+
+    def _call(self, method: str, args: Tuple, kwargs: Dict) -> ray.ObjectRef:
+        seq = self._num_calls
+        self._num_calls += 1
+        return self.actor.handle.call.remote(self.index, seq, method, *args,
+                                             **kwargs)
+
+    def __getattr__(self, method: str) -> _SlotMethod:
+        if method.startswith("__"):
+            raise AttributeError(method)
+        return _SlotMethod(self, method)
+
+    def __repr__(self):
+        return f"_TrialSlot({self.actor.handle}, {self.index})"
+
+
+class TrainablePool:
+    """Runs trials in the slots of a pool of long-lived actors.
+
+    Each actor hosts up to ``trials_per_actor`` trainables at once and
+    reserves the resources of as many trials. Trials stopping free their
+    slot for the next trial, no placement groups are created. Actors are
+    pooled by the resources their trials require, and at most as many are
+    started as fit into the cluster. Actors get fewer slots if the
+    resources of ``trials_per_actor`` trials don't fit on any node.
+
+    Only trials requesting a single bundle without GPUs are pooled, and
+    only if they don't redirect their stdout or stderr to files, as this
+    would affect all trainables of the process.
+
+    Args:
+        trials_per_actor (int): Number of trials that run concurrently in
+            each actor.
+    """
+
+    def __init__(self, trials_per_actor: int):
+        self._trials_per_actor = trials_per_actor
+        self._cluster_resources: Dict[str, float] = {}
+        self._node_resources: List[Dict[str, float]] = []
+        self._actors: Dict[_Bundle, List[_PoolActor]] = defaultdict(list)
+        self._trial_slots: Dict["Trial", _TrialSlot] = {}
+        self._actor_cls = None
+
+    @staticmethod
+    def get_bundle(trial: "Trial") -> Optional[_Bundle]:
+        """Returns the resources of the trial if it can be pooled, or
+        None."""
+        if ray.worker._mode() == ray.worker.LOCAL_MODE:
+            return None
+        if any(trial.log_to_file):
+            return None
+        pgf = trial.placement_group_factory
+        if pgf.head_bundle_is_empty or len(pgf._bundles) != 1:
+            return None
+        bundle = pgf._bundles[0]
+        if bundle.get("GPU", 0) > 0:
+            return None
+        return tuple(sorted(bundle.items()))
+
+    def supports(self, trial: "Trial") -> bool:
+        return self.get_bundle(trial) is not None
+
+    def set_cluster_resources(
+            self,
+            resources: Dict[str, float],
+            node_resources: Optional[List[Dict[str, float]]] = None):
+        """Sets the total resources of the cluster, and the resources of
+        each of its nodes if known."""
+        self._cluster_resources = resources
+        self._node_resources = node_resources or []
+
+    def has_free_slot(self, trial: "Trial") -> bool:
+        """Returns True if the trial can be started in a slot right away."""
+        bundle = self.get_bundle(trial)
+        actors = self._active_actors(bundle)
+        return any(actor.free_slots for actor in actors) or len(
+            actors) < self._max_actors(bundle)
+
+    def acquire(self, trial: "Trial") -> Optional[_TrialSlot]:
+        """Assigns a slot to the trial, starting a new actor if needed.
+
+        Returns None if all slots are taken and no actor can be started.
+        """
+        bundle = self.get_bundle(trial)
+        actors = self._active_actors(bundle)
+        actor = next((actor for actor in actors if actor.free_slots), None)
+        if actor is None:
+            if len(actors) >= self._max_actors(bundle):
+                return None
+            actor = self._start_actor(bundle)
+            self._actors[bundle].append(actor)
+        slot = actor.free_slots.pop()
+        self._trial_slots[trial] = slot
+        return slot
+
+    def release(self, trial: "Trial", healthy: bool = True):
+        """Frees the slot of the trial.
+
+        If the trial failed, its actor may have died, so it is retired.
+        """
+        slot = self._trial_slots.pop(trial, None)
+        if slot is None:
+            return
+        actor = slot.actor
+        actor.free_slots.append(slot)
+        if not healthy:
+            actor.retired = True
+        if actor.retired and len(actor.free_slots) == actor.num_slots:
+            # The actor is terminated once its handle is dropped.
+            logger.debug("Removing retired pooled actor %s.", actor.handle)
+            self._actors[actor.bundle].remove(actor)
+
+    def occupied_resources(self) -> Dict[str, float]:
+        """Returns the resources reserved by the pooled actors."""
+        resources = defaultdict(float)
+        for bundle, actors in self._actors.items():
+            num_slots = sum(actor.num_slots for actor in actors)
+            for name, amount in bundle:
+                resources[name] += amount * num_slots
+        return dict(resources)
+
+    def shutdown(self):
+        """Removes all actors. The trainables must have been stopped."""
+        self._actors.clear()
+        self._trial_slots.clear()
+
+    def _active_actors(self, bundle: _Bundle) -> List[_PoolActor]:
+        return [actor for actor in self._actors[bundle] if not actor.retired]
+
+    def _trials_per_node(self, bundle: _Bundle) -> List[int]:
+        """Returns the number of trials with the resources that fit on each
+        node, or into the cluster if the nodes are not known."""
+        amounts = [(name, amount) for name, amount in bundle
+                   if amount > 0 and name not in _MEMORY_RESOURCES]
+        nodes = self._node_resources or [self._cluster_resources]
+        if not amounts or not any(nodes):
+            return []
+        return [
+            min(int(node.get(name, 0) // amount) for name, amount in amounts)
+            for node in nodes
+        ]
+
+    def _slots_per_actor(self, bundle: _Bundle) -> int:
+        trials_per_node = self._trials_per_node(bundle)
+        if not trials_per_node:
+            return self._trials_per_actor
+        return max(1, min(self._trials_per_actor, max(trials_per_node)))
+
+    def _max_actors(self, bundle: _Bundle) -> int:
+        num_slots = self._slots_per_actor(bundle)
+        return max(
+            1,
+            sum(num_trials // num_slots
+                for num_trials in self._trials_per_node(bundle)))
+
+    def _start_actor(self, bundle: _Bundle) -> _PoolActor:
+        if self._actor_cls is None:
+            self._actor_cls = ray.remote(_PooledTrainables)
+        num_slots = self._slots_per_actor(bundle)
+        resources = {name: amount * num_slots for name, amount in bundle}
+        options = {"num_cpus": resources.pop("CPU", 0)}
+        for name in _MEMORY_RESOURCES:
+            if name in resources:
+                options[name] = resources.pop(name)
+        handle = self._actor_cls.options(
+            resources=resources, **options).remote()
+        logger.debug("Started pooled actor %s with %d slots.", handle,
+                     num_slots)
+        return _PoolActor(handle, bundle, num_slots)
@@ -95,6 +95,12 @@ def step(*args, **kwargs):
         ... def book_hotel(dest: str) -> Hotel:
         ...    return Hotel(...)
 
+        >>> # The output is not persisted (unless it is the output of the
+        >>> # workflow), and is recomputed on recovery.
+        >>> @workflow.step(checkpoint=False)
+        ... def parse(raw: bytes) -> Dict[str, Any]:
+        ...    return json.loads(raw)
+
     """
     if len(args) == 1 and len(kwargs) == 0 and callable(args[0]):
         options = WorkflowStepRuntimeOptions.make(step_type=StepType.FUNCTION)
@@ -106,6 +112,7 @@ def step(*args, **kwargs):
     name = kwargs.pop("name", None)
     metadata = kwargs.pop("metadata", None)
     allow_inplace = kwargs.pop("allow_inplace", False)
+    checkpoint = kwargs.pop("checkpoint", True)
     ray_options = kwargs
 
     options = WorkflowStepRuntimeOptions.make(
@@ -113,7 +120,8 @@ def step(*args, **kwargs):
         catch_exceptions=catch_exceptions,
         max_retries=max_retries,
         allow_inplace=allow_inplace,
-        ray_options=ray_options)
+        ray_options=ray_options,
+        checkpoint=checkpoint)
     return make_step_decorator(options, name, metadata)
 
 
@@ -155,6 +163,32 @@ class _VirtualActorDecorator:
     def __call__(cls, _cls: type) -> "VirtualActorClass":
         return virtual_actor_class.decorate_actor(_cls)
 
+    @classmethod
+    def incremental(cls, _cls: type) -> "VirtualActorClass":
+        """Create a virtual actor which checkpoints the changes made to its
+        state by every method call, instead of the full state.
+
+        The state (returned by "__getstate__" or the "__dict__" of the actor)
+        should be a dict. Changes to nested dicts are checkpointed entry by
+        entry, and the full state is checkpointed periodically. This makes
+        calls cheaper for actors with large state, e.g. a growing dict.
+
+        Examples:
+            >>> @workflow.virtual_actor.incremental
+            ... class KeyValueStore:
+            ...     def __init__(self):
+            ...         self.items = {}
+            ...
+            ...     def put(self, key, value):
+            ...         self.items[key] = value
+            ...
+            ...     @workflow.virtual_actor.readonly
+            ...     def get(self, key):
+            ...         return self.items.get(key)
+        """
+        _cls.__virtual_actor_incremental__ = True
+        return virtual_actor_class.decorate_actor(_cls)
+
     @classmethod
     def readonly(cls, method: types.FunctionType) -> types.FunctionType:
         if not isinstance(method, types.FunctionType):
@@ -387,7 +421,11 @@ def get_metadata(workflow_id: str,
     If both workflow id and step name are given, this will return
     metadata on workflow step level, which includes step inputs,
     step-level user metadata and step-level running stats (e.g.
-    the start time and end time of the step).
+    the start time and end time of the step). If the workflow storage
+    is instrumented (see "instrumented://" storage URLs), the running
+    stats of a step also include the count, bytes and total latency of
+    the storage operations made while resolving its inputs and running
+    it, under "storage".
 
 
     Args:
@@ -89,6 +89,8 @@ class _VirtualActorDecorator:
     @classmethod
     def __call__(cls, _cls: type) -> "VirtualActorClass": ...
     @classmethod
+    def incremental(cls, _cls: type) -> "VirtualActorClass": ...
+    @classmethod
     def readonly(cls, method: FunctionType) ->  FunctionType: ...
 
 virtual_actor: _VirtualActorDecorator
@@ -0,0 +1,148 @@
+# Resume latency of large workflows on local filesystem storage.
+#
+# The benchmark runs a workflow with many completed steps whose final step
+# fails, then measures how long it takes to construct the recovery workflow
+# (inspecting the steps and loading their checkpoints) for different limits
+# on the number of concurrent storage reads, and how long it takes to resume
+# the workflow end to end.
+#
+# Two step graph shapes are measured:
+#   - wide: the final step consumes the outputs of all completed steps.
+#   - deep: the completed steps form a chain of nested steps, so the whole
+#     chain has to be inspected to find its output.
+
+import json
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+import click
+
+import ray
+from ray import workflow
+from ray.workflow import recovery, storage, workflow_storage
+
+
+@ray.remote
+class Switch:
+    def __init__(self):
+        self.on = False
+
+    def set(self, on: bool):
+        self.on = on
+
+    def get(self) -> bool:
+        return self.on
+
+
+@workflow.step
+def identity(x):
+    return x
+
+
+@workflow.step
+def chain(x, remaining: int):
+    if remaining == 0:
+        return x
+    return chain.step(x + 1, remaining - 1)
+
+
+@workflow.step
+def finish(switch, *args):
+    if not ray.get(switch.get.remote()):
+        raise ValueError("Failing on purpose.")
+    return len(args)
+
+
+def build(shape: str, num_steps: int, switch):
+    if shape == "wide":
+        inputs = [identity.step(i) for i in range(num_steps)]
+        return finish.step(switch, *inputs)
+    elif shape == "deep":
+        return finish.step(switch, chain.step(0, num_steps))
+    raise ValueError(f"Unknown shape '{shape}'.")
+
+
+def time_resume(workflow_id: str, switch, num_trials: int) -> Dict:
+    reader = workflow_storage.WorkflowStorage(workflow_id,
+                                              storage.get_global_storage())
+    step_id = reader.get_entrypoint_step_id()
+    construct_s = []
+    for _ in range(num_trials):
+        start = time.perf_counter()
+        recovery._construct_resume_workflow_from_step(reader, step_id, {})
+        construct_s.append(time.perf_counter() - start)
+
+    ray.get(switch.set.remote(True))
+    start = time.perf_counter()
+    ray.get(workflow.resume(workflow_id))
+    resume_s = time.perf_counter() - start
+    return {
+        "construct_mean_s": sum(construct_s) / len(construct_s),
+        "construct_min_s": min(construct_s),
+        "resume_s": resume_s,
+    }
+
+
+@click.command()
+@click.option(
+    "--num-steps",
+    "num_steps_list",
+    type=int,
+    multiple=True,
+    default=[100, 1000])
+@click.option(
+    "--shape",
+    "shapes",
+    type=click.Choice(["wide", "deep"]),
+    multiple=True,
+    default=["wide", "deep"])
+@click.option(
+    "--concurrency",
+    "concurrencies",
+    type=int,
+    multiple=True,
+    default=[1, recovery.RECOVERY_CONCURRENCY],
+    help="Maximum number of concurrent storage reads during recovery.")
+@click.option("--num-trials", type=int, default=3)
+@click.option(
+    "--output",
+    type=click.Path(),
+    default=None,
+    help="Path to write the JSON results to. Defaults to stdout.")
+def main(num_steps_list: List[int], shapes: List[str],
+         concurrencies: List[int], num_trials: int, output: Optional[str]):
+    ray.init()
+    workflow.init(tempfile.mkdtemp())
+
+    results = []
+    for shape in shapes:
+        for num_steps in num_steps_list:
+            for concurrency in concurrencies:
+                # This only applies to the construction timed in the
+                # driver, the resume runs in a worker with the default.
+                recovery.RECOVERY_CONCURRENCY = concurrency
+                switch = Switch.remote()
+                workflow_id = f"{shape}_{num_steps}_{concurrency}"
+                try:
+                    build(shape, num_steps, switch).run(workflow_id)
+                except Exception:
+                    pass
+                result = time_resume(workflow_id, switch, num_trials)
+                result.update({
+                    "shape": shape,
+                    "num_steps": num_steps,
+                    "concurrency": concurrency,
+                })
+                results.append(result)
+
+    if output is None:
+        json.dump(results, sys.stdout, indent=2)
+    else:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+# Storage operations of representative workflows.
+#
+# The benchmark runs workflows of different shapes on an instrumented
+# storage (see ray/workflow/storage/instrumented.py) and reports the end to
+# end latency together with the count, bytes and latency of the storage
+# operations by type.
+#
+# Three step graph shapes are measured:
+#   - wide: one step consuming the outputs of many independent steps.
+#   - chain: a long chain of nested steps, each returning the next one.
+#   - dynamic: a tree of nested steps, each returning a step consuming the
+#     outputs of two dynamically created child steps.
+#
+# The operations are aggregated from the driver and the stats saved in the
+# metadata of every step. The writes committing the output and metadata of
+# a step are not part of its metadata, they are only exported through
+# ray.util.metrics ("workflow_storage_*").
+#
+# S3 is benchmarked against a local S3 compatible server, i.e.
+#   moto_server s3 -p 5002
+#   python storage_ops.py --storage s3 --s3-endpoint-url http://localhost:5002
+
+import json
+import sys
+import tempfile
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+from urllib import parse
+
+import click
+
+import ray
+from ray import workflow
+from ray.workflow import storage, workflow_storage
+from ray.workflow.storage import instrumented
+
+
+@workflow.step
+def identity(x):
+    return x
+
+
+@workflow.step
+def gather(*args):
+    return len(args)
+
+
+@workflow.step
+def chain(x, remaining: int):
+    if remaining == 0:
+        return x
+    return chain.step(x + 1, remaining - 1)
+
+
+@workflow.step
+def tree(depth: int):
+    if depth == 0:
+        return 1
+    return gather.step(tree.step(depth - 1), tree.step(depth - 1))
+
+
+def build(shape: str, size: int):
+    if shape == "wide":
+        return gather.step(*[identity.step(i) for i in range(size)])
+    elif shape == "chain":
+        return chain.step(0, size)
+    elif shape == "dynamic":
+        # A tree with about "size" steps.
+        return tree.step(max(size.bit_length() - 2, 0))
+    raise ValueError(f"Unknown shape '{shape}'.")
+
+
+def storage_url(storage_type: str, s3_endpoint_url: Optional[str]) -> str:
+    if storage_type == "fs":
+        url = tempfile.mkdtemp()
+    else:
+        import boto3
+        if s3_endpoint_url is None:
+            raise ValueError("--s3-endpoint-url is required for S3.")
+        bucket = str(uuid.uuid4())
+        boto3.client(
+            "s3", region_name="us-west-2",
+            endpoint_url=s3_endpoint_url).create_bucket(Bucket=bucket)
+        url = (f"s3://{bucket}/workflow?region_name=us-west-2"
+               f"&endpoint_url={s3_endpoint_url}")
+    return "instrumented://?storage=" + parse.quote_plus(url)
+
+
+def add_stats(total: Dict[str, Dict[str, Any]],
+              stats: Dict[str, Dict[str, Any]]) -> None:
+    for op, op_stats in stats.items():
+        op_total = total.setdefault(op, {
+            "count": 0,
+            "bytes": 0,
+            "total_latency_s": 0.0
+        })
+        for key in op_total:
+            op_total[key] += op_stats[key]
+
+
+def step_stats(workflow_id: str) -> Dict[str, Dict[str, Any]]:
+    reader = workflow_storage.WorkflowStorage(workflow_id,
+                                              storage.get_global_storage())
+    step_ids = workflow_storage.asyncio_run(
+        reader._scan([workflow_id, workflow_storage.STEPS_DIR]))
+    total = {}
+    for step_id in step_ids:
+        if step_id == workflow_storage.WORKFLOW_PROGRESS:
+            continue
+        stats = reader.load_step_metadata(step_id)["stats"]
+        add_stats(total, stats.get("storage", {}))
+    return total
+
+
+@click.command()
+@click.option(
+    "--storage",
+    "storage_types",
+    type=click.Choice(["fs", "s3"]),
+    multiple=True,
+    default=["fs"])
+@click.option(
+    "--s3-endpoint-url",
+    default=None,
+    help="The endpoint of a local S3 compatible server.")
+@click.option(
+    "--shape",
+    "shapes",
+    type=click.Choice(["wide", "chain", "dynamic"]),
+    multiple=True,
+    default=["wide", "chain", "dynamic"])
+@click.option(
+    "--size",
+    "sizes",
+    type=int,
+    multiple=True,
+    default=[100],
+    help="The approximate number of steps of the workflow.")
+@click.option(
+    "--output",
+    type=click.Path(),
+    default=None,
+    help="Path to write the JSON results to. Defaults to stdout.")
+def main(storage_types: List[str], s3_endpoint_url: Optional[str],
+         shapes: List[str], sizes: List[int], output: Optional[str]):
+    results = []
+    for storage_type in storage_types:
+        # The workflow management actor is bound to a single storage.
+        if ray.is_initialized():
+            ray.shutdown()
+            storage.set_global_storage(None)
+        ray.init()
+        workflow.init(storage_url(storage_type, s3_endpoint_url))
+        for shape in shapes:
+            for size in sizes:
+                workflow_id = f"{shape}_{size}"
+                before = instrumented.get_stats()
+                start = time.perf_counter()
+                build(shape, size).run(workflow_id)
+                latency_s = time.perf_counter() - start
+                stats = instrumented.stats_since(before)
+                add_stats(stats, step_stats(workflow_id))
+                results.append({
+                    "storage": storage_type,
+                    "shape": shape,
+                    "size": size,
+                    "latency_s": latency_s,
+                    "storage_ops": stats,
+                })
+
+    if output is None:
+        json.dump(results, sys.stdout, indent=2)
+    else:
+        with open(output, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from ray import cloudpickle
 from collections import deque
 from enum import Enum, unique
 import hashlib
+import os
 import re
 from typing import (Dict, Generic, List, Optional, Callable, Set, TypeVar,
                     Iterator, Any)
@@ -21,6 +22,10 @@ WorkflowOutputType = ObjectRef
 
 MANAGEMENT_ACTOR_NAMESPACE = "workflow"
 MANAGEMENT_ACTOR_NAME = "WorkflowManagementActor"
+# The workflow management state is sharded across this many actors by the
+# hash of the workflow ID. It must be the same for all drivers of a cluster.
+NUM_MANAGEMENT_ACTOR_SHARDS = int(
+    os.environ.get("RAY_WORKFLOW_NUM_MANAGEMENT_ACTOR_SHARDS", "4"))
 STORAGE_ACTOR_NAME = "StorageManagementActor"
 
 
@@ -127,6 +132,9 @@ class WorkflowStepRuntimeOptions:
     allow_inplace: bool
     # ray_remote options
     ray_options: Dict[str, Any]
+    # Whether to persist the output of the step in storage. If false, the
+    # output only lives in the object store and is recomputed on recovery.
+    checkpoint: bool = True
 
     @classmethod
     def make(cls,
@@ -135,7 +143,8 @@ class WorkflowStepRuntimeOptions:
              catch_exceptions=None,
              max_retries=None,
              allow_inplace=False,
-             ray_options=None):
+             ray_options=None,
+             checkpoint=True):
         if max_retries is None:
             max_retries = 3
         elif not isinstance(max_retries, int) or max_retries < 1:
@@ -153,7 +162,8 @@ class WorkflowStepRuntimeOptions:
             catch_exceptions=catch_exceptions,
             max_retries=max_retries,
             allow_inplace=allow_inplace,
-            ray_options=ray_options)
+            ray_options=ray_options,
+            checkpoint=checkpoint)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -162,6 +172,7 @@ class WorkflowStepRuntimeOptions:
             "catch_exceptions": self.catch_exceptions,
             "allow_inplace": self.allow_inplace,
             "ray_options": self.ray_options,
+            "checkpoint": self.checkpoint,
         }
 
     @classmethod
@@ -172,6 +183,8 @@ class WorkflowStepRuntimeOptions:
             catch_exceptions=value["catch_exceptions"],
             allow_inplace=value["allow_inplace"],
             ray_options=value["ray_options"],
+            # Steps saved before this option existed were always checkpointed.
+            checkpoint=value.get("checkpoint", True),
         )
 
 
@@ -257,6 +270,10 @@ class Workflow(Generic[T]):
         self._result: Optional[WorkflowExecutionResult] = None
         # step id will be generated during runtime
         self._step_id: StepID = None
+        # The number of steps in the DAG taking the output of this step as
+        # input. It is counted when the DAG is checkpointed, and is used to
+        # decide whether the step can be fused into its consumer.
+        self._num_consumers: int = 0
 
     @property
     def _workflow_id(self):
@@ -290,7 +307,7 @@ class Workflow(Generic[T]):
 
         from ray.workflow.workflow_access import \
             get_or_create_management_actor
-        mgr = get_or_create_management_actor()
+        mgr = get_or_create_management_actor(self._workflow_id)
         self._step_id = ray.get(
             mgr.gen_step_id.remote(self._workflow_id, self._name))
         return self._step_id
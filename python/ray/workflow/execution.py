@@ -1,4 +1,5 @@
 import asyncio
+import itertools
 import json
 import logging
 import time
@@ -6,6 +7,7 @@ from typing import Set, List, Tuple, Optional, TYPE_CHECKING, Dict, Any
 import uuid
 
 import ray
+from ray.workflow import status_index
 from ray.workflow import workflow_context
 from ray.workflow import workflow_storage
 from ray.workflow.common import (Workflow, WorkflowStatus, WorkflowMetaData,
@@ -14,7 +16,8 @@ from ray.workflow.step_executor import commit_step
 from ray.workflow.storage import get_global_storage
 from ray.workflow.workflow_access import (flatten_workflow_output,
                                           get_or_create_management_actor,
-                                          get_management_actor)
+                                          get_management_actor,
+                                          get_all_management_actors)
 
 if TYPE_CHECKING:
     from ray.workflow.step_executor import WorkflowExecutionResult
@@ -67,7 +70,7 @@ def run(entry_workflow: Workflow,
         # TODO (yic): follow up with force rerun
         if step_type != StepType.FUNCTION or not wf_exists:
             commit_step(ws, "", entry_workflow, exception=None)
-        workflow_manager = get_or_create_management_actor()
+        workflow_manager = get_or_create_management_actor(workflow_id)
         ignore_existing = (step_type != StepType.FUNCTION)
         # NOTE: It is important to 'ray.get' the returned output. This
         # ensures caller of 'run()' holds the reference to the workflow
@@ -90,7 +93,7 @@ def resume(workflow_id: str) -> ray.ObjectRef:
     storage = get_global_storage()
     logger.info(f"Resuming workflow [id=\"{workflow_id}\", storage_url="
                 f"\"{storage.storage_url}\"].")
-    workflow_manager = get_or_create_management_actor()
+    workflow_manager = get_or_create_management_actor(workflow_id)
     # NOTE: It is important to 'ray.get' the returned output. This
     # ensures caller of 'run()' holds the reference to the workflow
     # result. Otherwise if the actor removes the reference of the
@@ -108,7 +111,7 @@ def get_output(workflow_id: str, name: Optional[str]) -> ray.ObjectRef:
     """
     assert ray.is_initialized()
     try:
-        workflow_manager = get_management_actor()
+        workflow_manager = get_management_actor(workflow_id)
     except ValueError as e:
         raise ValueError(
             "Failed to connect to the workflow management "
@@ -120,7 +123,7 @@ def get_output(workflow_id: str, name: Optional[str]) -> ray.ObjectRef:
 
 def cancel(workflow_id: str) -> None:
     try:
-        workflow_manager = get_management_actor()
+        workflow_manager = get_management_actor(workflow_id)
         ray.get(workflow_manager.cancel_workflow.remote(workflow_id))
     except ValueError:
         wf_store = workflow_storage.get_workflow_storage(workflow_id)
@@ -129,7 +132,7 @@ def cancel(workflow_id: str) -> None:
 
 def get_status(workflow_id: str) -> Optional[WorkflowStatus]:
     try:
-        workflow_manager = get_management_actor()
+        workflow_manager = get_management_actor(workflow_id)
         running = ray.get(
             workflow_manager.is_workflow_running.remote(workflow_id))
     except Exception:
@@ -159,22 +162,29 @@ def get_metadata(workflow_id: str, name: Optional[str]) -> Dict[str, Any]:
 def list_all(status_filter: Set[WorkflowStatus]
              ) -> List[Tuple[str, WorkflowStatus]]:
     try:
-        workflow_manager = get_management_actor()
+        workflow_managers = get_all_management_actors()
     except ValueError:
-        workflow_manager = None
-
-    if workflow_manager is None:
-        runnings = []
-    else:
-        runnings = ray.get(workflow_manager.list_running_workflow.remote())
+        workflow_managers = []
+
+    runnings = list(
+        itertools.chain.from_iterable(
+            ray.get([
+                workflow_manager.list_running_workflow.remote()
+                for workflow_manager in workflow_managers
+            ])))
     if WorkflowStatus.RUNNING in status_filter and len(status_filter) == 1:
         return [(r, WorkflowStatus.RUNNING) for r in runnings]
 
     runnings = set(runnings)
     # Here we don't have workflow id, so use empty one instead
     store = workflow_storage.get_workflow_storage("")
+    statuses, num_log_entries = store.list_workflow()
+    if (workflow_managers
+            and num_log_entries >= status_index.COMPACTION_THRESHOLD):
+        # The first shard compacts the status index.
+        workflow_managers[0].compact_status_index.remote()
     ret = []
-    for (k, s) in store.list_workflow():
+    for (k, s) in statuses:
         if s == WorkflowStatus.RUNNING and k not in runnings:
             s = WorkflowStatus.RESUMABLE
         if s in status_filter:
@@ -188,12 +198,13 @@ def resume_all(with_failed: bool) -> List[Tuple[str, ray.ObjectRef]]:
         filter_set.add(WorkflowStatus.FAILED)
     all_failed = list_all(filter_set)
     try:
-        workflow_manager = get_management_actor()
+        get_all_management_actors()
     except Exception as e:
         raise RuntimeError("Failed to get management actor") from e
 
     async def _resume_one(wid: str) -> Tuple[str, Optional[ray.ObjectRef]]:
         try:
+            workflow_manager = get_management_actor(wid)
             result: "WorkflowExecutionResult" = (
                 await workflow_manager.run_or_resume.remote(wid))
             obj = flatten_workflow_output(wid, result.persisted_output)
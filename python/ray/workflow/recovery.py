@@ -1,3 +1,4 @@
+import asyncio
 from typing import List, Any, Union, Dict, Callable, Tuple, Optional
 
 import ray
@@ -8,6 +9,10 @@ from ray.workflow.common import (Workflow, StepID, WorkflowRef,
 from ray.workflow import storage
 from ray.workflow import workflow_storage
 from ray.workflow.step_function import WorkflowStepFunction
+from ray.workflow.workflow_storage import asyncio_run
+
+# The maximum number of concurrent storage reads when recovering a workflow.
+RECOVERY_CONCURRENCY = 64
 
 
 class WorkflowStepNotRecoverableError(Exception):
@@ -50,6 +55,54 @@ def _recover_workflow_step(args: List[Any], kwargs: Dict[str, Any],
     return func(*args, **kwargs)
 
 
+def _input_step_ids(result: workflow_storage.StepInspectResult
+                    ) -> List[StepID]:
+    """The steps that have to be inspected to recover a step."""
+    if result.output_object_valid:
+        # Completed subtrees are never visited.
+        return []
+    if isinstance(result.output_step_id, str):
+        return [result.output_step_id]
+    if not result.is_recoverable():
+        return []
+    return result.workflows
+
+
+async def _inspect_step_graph(
+        reader: workflow_storage.WorkflowStorage,
+        step_id: StepID) -> Dict[StepID, workflow_storage.StepInspectResult]:
+    """Inspect all steps needed to recover the step, level by level, with
+    the steps of a level inspected concurrently."""
+    semaphore = asyncio.Semaphore(RECOVERY_CONCURRENCY)
+
+    async def _inspect(_step_id: StepID):
+        async with semaphore:
+            return _step_id, await reader._inspect_step(_step_id)
+
+    results: Dict[StepID, workflow_storage.StepInspectResult] = {}
+    frontier = [step_id]
+    while frontier:
+        next_frontier = set()
+        for _step_id, result in await asyncio.gather(
+                *[_inspect(s) for s in frontier]):
+            results[_step_id] = result
+            next_frontier.update(_input_step_ids(result))
+        frontier = [s for s in next_frontier if s not in results]
+    return results
+
+
+async def _load_step_outputs(reader: workflow_storage.WorkflowStorage,
+                             step_ids: List[StepID]) -> Dict[StepID, Any]:
+    semaphore = asyncio.Semaphore(RECOVERY_CONCURRENCY)
+
+    async def _load(step_id: StepID):
+        async with semaphore:
+            return await reader._load_step_output(step_id)
+
+    outputs = await asyncio.gather(*[_load(s) for s in step_ids])
+    return dict(zip(step_ids, outputs))
+
+
 def _construct_resume_workflow_from_step(
         reader: workflow_storage.WorkflowStorage, step_id: StepID,
         input_map: Dict[StepID, Any]) -> Union[Workflow, StepID]:
@@ -57,6 +110,9 @@ def _construct_resume_workflow_from_step(
     If the workflow step already has an output checkpointing file, we return
     the workflow step id instead.
 
+    The steps are inspected and the outputs of completed inputs are loaded
+    concurrently before the workflow is constructed.
+
     Args:
         reader: The storage reader for inspecting the step.
         step_id: The ID of the step we want to recover.
@@ -67,45 +123,81 @@ def _construct_resume_workflow_from_step(
         A workflow that recovers the step, or a ID of a step
         that contains the output checkpoint file.
     """
-    result: workflow_storage.StepInspectResult = reader.inspect_step(step_id)
-    if result.output_object_valid:
+    results = asyncio_run(_inspect_step_graph(reader, step_id))
+    for _step_id, result in results.items():
+        if (not result.output_object_valid
+                and not isinstance(result.output_step_id, str)
+                and not result.is_recoverable()):
+            raise WorkflowStepNotRecoverableError(_step_id)
+
+    # Follow the steps the output is forwarded to.
+    output_step_id = step_id
+    while isinstance(results[output_step_id].output_step_id, str):
+        output_step_id = results[output_step_id].output_step_id
+    if results[output_step_id].output_object_valid:
         # we already have the output
-        return step_id
-    if isinstance(result.output_step_id, str):
-        return _construct_resume_workflow_from_step(
-            reader, result.output_step_id, input_map)
-    # output does not exists or not valid. try to reconstruct it.
-    if not result.is_recoverable():
-        raise WorkflowStepNotRecoverableError(step_id)
+        return output_step_id
 
     with serialization.objectref_cache():
-        input_workflows = []
-        for i, _step_id in enumerate(result.workflows):
-            # Check whether the step has been loaded or not to avoid
-            # duplication
+        # All checkpointed outputs left in the graph are inputs of the steps
+        # to recover.
+        outputs = asyncio_run(
+            _load_step_outputs(reader, [
+                _step_id for _step_id, result in results.items()
+                if result.output_object_valid
+            ]))
+
+        # Construct the steps after their inputs. This is iterative, so that
+        # long chains of steps don't exceed the recursion limit.
+        stack = [(step_id, False)]
+        while stack:
+            _step_id, inputs_constructed = stack.pop()
             if _step_id in input_map:
-                r = input_map[_step_id]
-            else:
-                r = _construct_resume_workflow_from_step(
-                    reader, _step_id, input_map)
-                input_map[_step_id] = r
-            if isinstance(r, Workflow):
-                input_workflows.append(r)
+                continue
+            result = results[_step_id]
+            if result.output_object_valid:
+                input_map[_step_id] = _step_id
+            elif not inputs_constructed:
+                stack.append((_step_id, True))
+                stack.extend((s, False) for s in _input_step_ids(result)
+                             if s not in input_map)
+            elif isinstance(result.output_step_id, str):
+                input_map[_step_id] = input_map[result.output_step_id]
             else:
-                assert isinstance(r, StepID)
-                # TODO (Alex): We should consider caching these outputs too.
-                input_workflows.append(reader.load_step_output(r))
-        workflow_refs = list(map(WorkflowRef, result.workflow_refs))
-
-        args, kwargs = reader.load_step_args(step_id, input_workflows,
-                                             workflow_refs)
-        step_options = result.step_options
-        recovery_workflow: Workflow = _recover_workflow_step.step(
-            args, kwargs, input_workflows, workflow_refs)
-        recovery_workflow._step_id = step_id
-        # override step_options
-        recovery_workflow.data.step_options = step_options
-        return recovery_workflow
+                input_map[_step_id] = _construct_recovery_step(
+                    reader, _step_id, result, input_map, outputs)
+        return input_map[step_id]
+
+
+def _construct_recovery_step(
+        reader: workflow_storage.WorkflowStorage, step_id: StepID,
+        result: workflow_storage.StepInspectResult,
+        input_map: Dict[StepID, Any],
+        outputs: Dict[StepID, Any]) -> Workflow:
+    input_workflows = []
+    for _step_id in result.workflows:
+        r = input_map[_step_id]
+        if isinstance(r, Workflow):
+            # Used to decide whether the step can be fused into its
+            # consumer.
+            r._num_consumers += 1
+            input_workflows.append(r)
+        else:
+            assert isinstance(r, StepID)
+            input_workflows.append(outputs[r])
+    workflow_refs = list(map(WorkflowRef, result.workflow_refs))
+
+    # The arguments are loaded one step at a time, because resolving them
+    # relies on process-wide serializers.
+    args, kwargs = reader.load_step_args(step_id, input_workflows,
+                                         workflow_refs)
+    step_options = result.step_options
+    recovery_workflow: Workflow = _recover_workflow_step.step(
+        args, kwargs, input_workflows, workflow_refs)
+    recovery_workflow._step_id = step_id
+    # override step_options
+    recovery_workflow.data.step_options = step_options
+    return recovery_workflow
 
 
 @ray.remote(num_returns=2)
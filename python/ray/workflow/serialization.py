@@ -7,6 +7,7 @@ from ray import cloudpickle
 from ray.types import ObjectRef
 from ray.workflow import common
 from ray.workflow import storage
+from ray.workflow.storage import content_addressed
 from typing import Any, Dict, Generator, List, Optional, Tuple, TYPE_CHECKING
 
 from collections import ChainMap
@@ -185,17 +186,41 @@ async def dump_to_storage(paths: List[str],
         pickler = ObjectRefPickler(f)
         pickler.dump(obj)
         f.seek(0)
-        task = storage.put(key, f.read())
-        tasks.append(task)
+        data = f.read()
+
+    if len(data) >= content_addressed.MIN_CONTENT_ADDRESSED_SIZE:
+        # Large payloads (e.g. a model passed to many steps) are stored once
+        # per distinct content, and only a pointer is stored at the key.
+        content_ref = await content_addressed.ContentAddressedStore(
+            storage).put(data, workflow_id)
+        data = cloudpickle.dumps(content_ref)
+    tasks.append(storage.put(key, data))
 
     await asyncio.gather(*tasks)
 
 
+async def load_from_storage(key: str, storage: storage.Storage) -> Any:
+    """Loads an object saved by `dump_to_storage`.
+
+    Args:
+        key: The key the object was saved at.
+        storage: The storage to use.
+
+    Returns:
+        The object.
+    """
+    obj = cloudpickle.loads(await storage.get(key))
+    if isinstance(obj, content_addressed.ContentRef):
+        obj = cloudpickle.loads(await content_addressed.ContentAddressedStore(
+            storage).get(obj))
+    return obj
+
+
 @ray.remote
 def _load_ref_helper(key: str, storage: storage.Storage):
     # TODO(Alex): We should stream the data directly into `cloudpickle.load`.
-    serialized = asyncio.get_event_loop().run_until_complete(storage.get(key))
-    return cloudpickle.loads(serialized)
+    return asyncio.get_event_loop().run_until_complete(
+        load_from_storage(key, storage))
 
 
 # TODO (Alex): We should use weakrefs here instead requiring a context manager.
@@ -0,0 +1,184 @@
+"""
+An index of the status of all workflows, so that workflows can be listed
+without scanning the storage and loading the metadata of every workflow.
+
+The index is log-structured. Every status change appends a small log entry
+with a unique name, so any process can update the index without
+coordination. The first shard of the workflow management actor compacts
+the log into a snapshot once it has grown long enough. Loading the index
+reads the snapshot and the few log entries written since the last
+compaction.
+"""
+
+import asyncio
+import re
+import time
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from ray.workflow.common import WorkflowStatus
+from ray.workflow.storage import Storage, KeyNotFoundError
+
+# The directory under the storage root holding the index. It is not a
+# workflow, so it's skipped when scanning for workflows.
+STATUS_INDEX_DIR = "__status_index__"
+SNAPSHOT = "snapshot.json"
+LOG_DIR = "log"
+# Matches the names of complete log entries. Storages may keep temporary
+# files around while an entry is being written.
+_LOG_ENTRY_NAME = re.compile(r"^\d{20}-[0-9a-f]{32}\.json$")
+# The number of log entries after which the log is compacted into the
+# snapshot.
+COMPACTION_THRESHOLD = 100
+
+# Map workflow ID -> (update time in ns, status value).
+IndexEntries = Dict[str, Tuple[int, str]]
+
+
+class WorkflowStatusIndex:
+    def __init__(self, store: Storage):
+        self._store = store
+
+    def _key(self, *names: str) -> str:
+        return self._store.make_key(STATUS_INDEX_DIR, *names)
+
+    async def exists(self) -> bool:
+        """Whether the index has been built for this storage."""
+        return await self._get_snapshot() is not None
+
+    async def update(self, workflow_id: str,
+                     status: Optional[WorkflowStatus]) -> None:
+        """Record the new status of the workflow.
+
+        Args:
+            workflow_id: The ID of the workflow.
+            status: The new status, or None if the workflow was deleted.
+        """
+        update_time = time.time_ns()
+        # Names sort by time, and are unique across writers.
+        name = f"{update_time:020d}-{uuid.uuid4().hex}.json"
+        await self._store.put(
+            self._key(LOG_DIR, name), {
+                "workflow_id": workflow_id,
+                "status": status.value if status is not None else None,
+                "time": update_time,
+            },
+            is_json=True)
+
+    async def load(self) -> Optional[Tuple[Dict[str, WorkflowStatus], int]]:
+        """Load the status of all workflows.
+
+        Returns:
+            The status of every workflow and the number of log entries that
+            haven't been compacted yet, or None if the index hasn't been
+            built.
+        """
+        snapshot, log_names = await asyncio.gather(
+            self._get_snapshot(), self._scan_log())
+        if snapshot is None:
+            return None
+        entries = await self._merge_log(snapshot, log_names)
+        return {
+            workflow_id: WorkflowStatus(status)
+            for workflow_id, (_, status) in entries.items()
+        }, len(log_names)
+
+    async def _get_snapshot(self) -> Optional[Dict[str, Any]]:
+        try:
+            return await self._store.get(self._key(SNAPSHOT), is_json=True)
+        except KeyNotFoundError:
+            return None
+
+    async def _scan_log(self) -> List[str]:
+        log_names = await self._store.scan_prefix(self._key(LOG_DIR))
+        return sorted(
+            name for name in log_names if _LOG_ENTRY_NAME.match(name))
+
+    async def _merge_log(self, snapshot: Optional[Dict[str, Any]],
+                         log_names: List[str]) -> IndexEntries:
+        if snapshot is None:
+            snapshot = {"workflows": {}}
+
+        async def _get_log(name):
+            try:
+                return await self._store.get(
+                    self._key(LOG_DIR, name), is_json=True)
+            except KeyNotFoundError:
+                # Merged into the snapshot by a concurrent compaction.
+                return None
+
+        logs = await asyncio.gather(*[_get_log(name) for name in log_names])
+
+        entries: IndexEntries = {
+            workflow_id: tuple(entry)
+            for workflow_id, entry in snapshot["workflows"].items()
+        }
+        deleted: Dict[str, int] = {}
+        for log in logs:
+            if log is None:
+                continue
+            workflow_id = log["workflow_id"]
+            last_update_time = max(
+                entries.get(workflow_id, (-1, None))[0],
+                deleted.get(workflow_id, -1))
+            # Entries written late (e.g. by a slow writer) don't override
+            # newer updates.
+            if log["time"] < last_update_time:
+                continue
+            if log["status"] is None:
+                entries.pop(workflow_id, None)
+                deleted[workflow_id] = log["time"]
+            else:
+                entries[workflow_id] = (log["time"], log["status"])
+        return entries
+
+    async def compact(self, min_log_entries: int = 0) -> bool:
+        """Merge the log into the snapshot.
+
+        This must only be called by a single process (the first shard of the
+        workflow management actor), but can run concurrently with updates.
+
+        Args:
+            min_log_entries: Skip the compaction if the log has fewer
+                entries than this.
+
+        Returns:
+            Whether the log was compacted.
+        """
+        log_names = await self._scan_log()
+        if not log_names or len(log_names) < min_log_entries:
+            return False
+        # Entries written after the scan are left for the next compaction.
+        entries = await self._merge_log(await self._get_snapshot(), log_names)
+        await self._write_snapshot(entries)
+        # Only delete the entries that were merged, new ones may have been
+        # written in the meantime.
+        await asyncio.gather(*[
+            self._store.delete_prefix(self._key(LOG_DIR, name))
+            for name in log_names
+        ])
+        return True
+
+    async def rebuild(
+            self,
+            workflows: List[Tuple[str, Optional[WorkflowStatus]]]) -> None:
+        """Build the index from the result of a full scan of the storage.
+
+        Args:
+            workflows: The ID and status of every workflow in the storage.
+        """
+        scan_time = time.time_ns()
+        await self._write_snapshot({
+            workflow_id: (scan_time, status.value)
+            for workflow_id, status in workflows if status is not None
+        })
+
+    async def _write_snapshot(self, entries: IndexEntries) -> None:
+        await self._store.put(
+            self._key(SNAPSHOT), {
+                "workflows": {
+                    workflow_id: list(entry)
+                    for workflow_id, entry in entries.items()
+                }
+            },
+            is_json=True)
@@ -1,5 +1,7 @@
 import time
 import asyncio
+import contextlib
+import dataclasses
 from dataclasses import dataclass
 import logging
 from typing import (List, Tuple, Any, Dict, Callable, Optional, TYPE_CHECKING,
@@ -14,6 +16,7 @@ from ray.workflow.workflow_context import get_step_status_info
 from ray.workflow import serialization
 from ray.workflow import serialization_context
 from ray.workflow import workflow_storage
+from ray.workflow.storage import instrumented
 from ray.workflow.workflow_access import (get_or_create_management_actor,
                                           get_management_actor)
 from ray.workflow.common import (
@@ -35,6 +38,17 @@ StepInputTupleToResolve = Tuple[ObjectRef, List[ObjectRef], List[ObjectRef]]
 
 logger = logging.getLogger(__name__)
 
+# The maximum number of non-checkpointed steps that can be fused into the task
+# of a single step. Fused steps are executed recursively, so this bounds the
+# stack depth of the task.
+MAX_FUSED_STEPS = 64
+
+# Step status updates buffered while a workflow is being submitted, see
+# "_batch_step_status_updates()". Each update is the workflow ID, step ID,
+# status and outputs of the step.
+_step_status_buffer: Optional[List[Tuple[str, "StepID", "WorkflowStatus",
+                                         List["ObjectRef"]]]] = None
+
 
 def _resolve_object_ref(ref: ObjectRef) -> Tuple[Any, ObjectRef]:
     """
@@ -63,9 +77,9 @@ def _resolve_dynamic_workflow_refs(workflow_refs: "List[WorkflowRef]"):
        to see whether the output is checkpointed. Load the checkpoint.
     3. If failed to load the checkpoint, resume the step and get the output.
     """
-    workflow_manager = get_or_create_management_actor()
     context = workflow_context.get_workflow_step_context()
     workflow_id = context.workflow_id
+    workflow_manager = get_or_create_management_actor(workflow_id)
     storage_url = context.storage_url
     workflow_ref_mapping = []
     for workflow_ref in workflow_refs:
@@ -119,6 +133,8 @@ def _resolve_step_inputs(
 
     objects_mapping = []
     for obj_ref in step_inputs.workflow_outputs:
+        if isinstance(obj_ref, _FusedWorkflowStep):
+            obj_ref = obj_ref.execute()
         obj, ref = _resolve_object_ref(obj_ref)
         objects_mapping.append(obj)
 
@@ -149,8 +165,16 @@ def execute_workflow(workflow: "Workflow") -> "WorkflowExecutionResult":
     if workflow.executed:
         return workflow.result
     workflow_data = workflow.data
-    baked_inputs = _BakedWorkflowInputs.from_workflow_inputs(
-        workflow_data.inputs)
+    with _batch_step_status_updates():
+        baked_inputs = _BakedWorkflowInputs.from_workflow_inputs(
+            workflow_data.inputs, workflow_data.step_options)
+        return _execute_baked_workflow(workflow, baked_inputs)
+
+
+def _execute_baked_workflow(
+        workflow: "Workflow",
+        baked_inputs: "_BakedWorkflowInputs") -> "WorkflowExecutionResult":
+    workflow_data = workflow.data
     step_options = workflow_data.step_options
     if step_options.allow_inplace:
         # TODO(suquark): For inplace execution, it is impossible
@@ -217,23 +241,34 @@ async def _write_step_inputs(wf_storage: workflow_storage.WorkflowStorage,
     await asyncio.gather(*save_tasks)
 
 
-def commit_step(store: workflow_storage.WorkflowStorage, step_id: "StepID",
-                ret: Union["Workflow", Any], *,
-                exception: Optional[Exception]):
+def commit_step(store: workflow_storage.WorkflowStorage,
+                step_id: "StepID",
+                ret: Union["Workflow", Any],
+                *,
+                exception: Optional[Exception],
+                prerun_metadata: Optional[Dict[str, Any]] = None,
+                postrun_metadata: Optional[Dict[str, Any]] = None):
     """Checkpoint the step output.
     Args:
         store: The storage the current workflow is using.
         step_id: The ID of the step.
         ret: The returned object of the workflow step.
         exception: The exception caught by the step.
+        prerun_metadata: The pre-run metadata of the step to save with the
+            output, if any.
+        postrun_metadata: The post-run metadata of the step to save with the
+            output, if any.
     """
     from ray.workflow.common import Workflow
     if isinstance(ret, Workflow):
         assert not ret.executed
-        tasks = [
-            _write_step_inputs(store, w.step_id, w.data)
-            for w in ret._iter_workflows_in_dag()
-        ]
+        tasks = []
+        for w in ret._iter_workflows_in_dag():
+            for input_workflow in w.data.inputs.workflows:
+                input_workflow._num_consumers += 1
+            tasks.append(_write_step_inputs(store, w.step_id, w.data))
+        # The inputs of the nested workflow must be durable before the
+        # output metadata points to it.
         asyncio.get_event_loop().run_until_complete(asyncio.gather(*tasks))
 
     context = workflow_context.get_workflow_step_context()
@@ -241,7 +276,9 @@ def commit_step(store: workflow_storage.WorkflowStorage, step_id: "StepID",
         step_id,
         ret,
         exception=exception,
-        outer_most_step_id=context.outer_most_step_id)
+        outer_most_step_id=context.outer_most_step_id,
+        prerun_metadata=prerun_metadata,
+        postrun_metadata=postrun_metadata)
 
 
 def _wrap_run(func: Callable, runtime_options: "WorkflowStepRuntimeOptions",
@@ -332,10 +369,12 @@ def _wrap_run(func: Callable, runtime_options: "WorkflowStepRuntimeOptions",
     return persisted_output, volatile_output
 
 
-def _workflow_step_executor(
-        func: Callable, context: "WorkflowStepContext", step_id: "StepID",
-        baked_inputs: "_BakedWorkflowInputs",
-        runtime_options: "WorkflowStepRuntimeOptions") -> Tuple[Any, Any]:
+def _workflow_step_executor(func: Callable,
+                            context: "WorkflowStepContext",
+                            step_id: "StepID",
+                            baked_inputs: "_BakedWorkflowInputs",
+                            runtime_options: "WorkflowStepRuntimeOptions",
+                            is_fused: bool = False) -> Tuple[Any, Any]:
     """Executor function for workflow step.
 
     Args:
@@ -344,6 +383,9 @@ def _workflow_step_executor(
         baked_inputs: The processed inputs for the step.
         context: Workflow step context. Used to access correct storage etc.
         runtime_options: Parameters for workflow step execution.
+        is_fused: Whether the step is executed inside the task of the step
+            consuming its output. The status of fused steps is tracked as
+            part of the consuming step.
 
     Returns:
         Workflow step output.
@@ -354,31 +396,59 @@ def _workflow_step_executor(
     step_type = runtime_options.step_type
 
     # Part 2: resolve inputs
+    storage_stats = instrumented.get_stats()
     args, kwargs = _resolve_step_inputs(baked_inputs)
 
     # Part 3: execute the step
     store = workflow_storage.get_workflow_storage()
+    # The step metadata is committed together with the step output below,
+    # so that a step costs a single round of storage writes.
+    step_prerun_metadata = {"start_time": time.time()}
     try:
-        step_prerun_metadata = {"start_time": time.time()}
-        store.save_step_prerun_metadata(step_id, step_prerun_metadata)
         persisted_output, volatile_output = _wrap_run(func, runtime_options,
                                                       *args, **kwargs)
         step_postrun_metadata = {"end_time": time.time()}
-        store.save_step_postrun_metadata(step_id, step_postrun_metadata)
+        # The operations of an instrumented storage while resolving the
+        # inputs and running the step.
+        storage_stats = instrumented.stats_since(storage_stats)
+        if storage_stats:
+            step_postrun_metadata["storage"] = storage_stats
     except Exception as e:
-        commit_step(store, step_id, None, exception=e)
+        commit_step(
+            store,
+            step_id,
+            None,
+            exception=e,
+            prerun_metadata=step_prerun_metadata)
         raise e
 
     # Part 4: save outputs
     if step_type == StepType.READONLY_ACTOR_METHOD:
+        store.save_step_metadata(step_id, step_prerun_metadata,
+                                 step_postrun_metadata)
         if isinstance(volatile_output, Workflow):
             raise TypeError(
                 "Returning a Workflow from a readonly virtual actor "
                 "is not allowed.")
         assert not isinstance(persisted_output, Workflow)
+    elif (not runtime_options.checkpoint
+          and not isinstance(persisted_output, Workflow)
+          and not context.last_step_of_workflow):
+        # The output is only kept in the object store. Recovery recomputes
+        # it from the checkpointed inputs of the step. The output of the
+        # workflow is always committed, so that finished workflows can be
+        # resumed and their output loaded after the job ends.
+        if not is_fused:
+            _record_step_status(step_id, WorkflowStatus.SUCCESSFUL)
     else:
         store = workflow_storage.get_workflow_storage()
-        commit_step(store, step_id, persisted_output, exception=None)
+        commit_step(
+            store,
+            step_id,
+            persisted_output,
+            exception=None,
+            prerun_metadata=step_prerun_metadata,
+            postrun_metadata=step_postrun_metadata)
         outer_most_step_id = context.outer_most_step_id
         if isinstance(persisted_output, Workflow):
             if step_type == StepType.FUNCTION:
@@ -402,7 +472,8 @@ def _workflow_step_executor(
         elif context.last_step_of_workflow:
             # advance the progress of the workflow
             store.advance_progress(step_id)
-        _record_step_status(step_id, WorkflowStatus.SUCCESSFUL)
+        if not is_fused:
+            _record_step_status(step_id, WorkflowStatus.SUCCESSFUL)
     logger.info(get_step_status_info(WorkflowStatus.SUCCESSFUL))
     if isinstance(volatile_output, Workflow):
         # This is the case where a step method is called in the virtual actor.
@@ -427,25 +498,107 @@ def _workflow_step_executor_remote(
 class _BakedWorkflowInputs:
     """This class stores pre-processed inputs for workflow step execution.
     Especially, all input workflows to the workflow step will be scheduled,
-    and their outputs (ObjectRefs) replace the original workflows."""
+    and their outputs (ObjectRefs) replace the original workflows. Input
+    workflows fused into the step are replaced by the steps to execute
+    instead."""
     args: "ObjectRef"
-    workflow_outputs: "List[ObjectRef]"
+    workflow_outputs: "List[Union[ObjectRef, _FusedWorkflowStep]]"
     workflow_refs: "List[WorkflowRef]"
 
     @classmethod
-    def from_workflow_inputs(cls, inputs: "WorkflowInputs"):
+    def from_workflow_inputs(
+            cls,
+            inputs: "WorkflowInputs",
+            step_options: "Optional[WorkflowStepRuntimeOptions]" = None):
+        workflow_outputs = []
+        num_fused_steps = 0
         with workflow_context.fork_workflow_step_context(
                 outer_most_step_id=None, last_step_of_workflow=False):
-            workflow_outputs = [
-                execute_workflow(w).persisted_output for w in inputs.workflows
-            ]
+            for w in inputs.workflows:
+                if (step_options is None
+                        or not _can_fuse_into(w, step_options)):
+                    workflow_outputs.append(
+                        execute_workflow(w).persisted_output)
+                    continue
+
+                w_inputs = cls.from_workflow_inputs(w.data.inputs,
+                                                    w.data.step_options)
+                context = workflow_context.get_workflow_step_context()
+                fused_step = _FusedWorkflowStep(
+                    w.data.func_body, _copy_context(context), w.step_id,
+                    w_inputs, w.data.step_options)
+                if (num_fused_steps + fused_step.num_fused_steps >
+                        MAX_FUSED_STEPS):
+                    workflow_outputs.append(
+                        _execute_baked_workflow(w, w_inputs).persisted_output)
+                    continue
+                num_fused_steps += fused_step.num_fused_steps
+                # The step is executed by its (only) consumer.
+                w._executed = True
+                workflow_outputs.append(fused_step)
         return cls(inputs.args, workflow_outputs, inputs.workflow_refs)
 
+    @property
+    def num_fused_steps(self) -> int:
+        return sum(
+            output.num_fused_steps for output in self.workflow_outputs
+            if isinstance(output, _FusedWorkflowStep))
+
     def __reduce__(self):
         return _BakedWorkflowInputs, (self.args, self.workflow_outputs,
                                       self.workflow_refs)
 
 
+@dataclass
+class _FusedWorkflowStep:
+    """A non-checkpointed step that is executed inside the task of the step
+    consuming its output, instead of in a task of its own."""
+    func_body: Callable
+    context: "WorkflowStepContext"
+    step_id: "StepID"
+    baked_inputs: _BakedWorkflowInputs
+    runtime_options: "WorkflowStepRuntimeOptions"
+
+    @property
+    def num_fused_steps(self) -> int:
+        return 1 + self.baked_inputs.num_fused_steps
+
+    def execute(self) -> Any:
+        """Execute the step in the current process and return its output."""
+        consumer_context = workflow_context.get_workflow_step_context()
+        try:
+            persisted_output, _ = _workflow_step_executor(
+                self.func_body,
+                self.context,
+                self.step_id,
+                self.baked_inputs,
+                self.runtime_options,
+                is_fused=True)
+        finally:
+            workflow_context.set_workflow_step_context(consumer_context)
+        return persisted_output
+
+
+def _can_fuse_into(workflow: "Workflow",
+                   consumer_options: "WorkflowStepRuntimeOptions") -> bool:
+    """Whether the workflow can be executed inside the task of the step
+    consuming its output."""
+    step_options = workflow.data.step_options
+    return (not workflow.executed and workflow._num_consumers == 1
+            and not step_options.checkpoint
+            and step_options.step_type == StepType.FUNCTION
+            and not step_options.allow_inplace
+            and not consumer_options.allow_inplace
+            and step_options.ray_options == consumer_options.ray_options)
+
+
+def _copy_context(context: "WorkflowStepContext") -> "WorkflowStepContext":
+    # The workflow scope is appended to in place when a step starts, so it
+    # must not be shared with the context of the consuming step.
+    return dataclasses.replace(
+        context, workflow_scope=list(context.workflow_scope))
+
+
 def _record_step_status(step_id: "StepID",
                         status: "WorkflowStatus",
                         outputs: Optional[List["ObjectRef"]] = None) -> None:
@@ -453,7 +606,42 @@ def _record_step_status(step_id: "StepID",
         outputs = []
 
     workflow_id = workflow_context.get_current_workflow_id()
-    workflow_manager = get_management_actor()
+    if _step_status_buffer is not None:
+        _step_status_buffer.append((workflow_id, step_id, status, outputs))
+        return
+    workflow_manager = get_management_actor(workflow_id)
     ray.get(
         workflow_manager.update_step_status.remote(workflow_id, step_id,
                                                    status, outputs))
+
+
+@contextlib.contextmanager
+def _batch_step_status_updates():
+    """Buffer the step status updates made in this context, and send them
+    with one call per workflow when the outermost context exits, instead of
+    blocking on the management actor for every submitted step."""
+    global _step_status_buffer
+    if _step_status_buffer is not None:
+        yield
+        return
+    _step_status_buffer = []
+    try:
+        yield
+    finally:
+        updates, _step_status_buffer = _step_status_buffer, None
+        _send_step_status_updates(updates)
+
+
+def _send_step_status_updates(
+        updates: List[Tuple[str, "StepID", "WorkflowStatus",
+                            List["ObjectRef"]]]) -> None:
+    updates_by_workflow: Dict[str, List[Tuple["StepID", "WorkflowStatus",
+                                              List["ObjectRef"]]]] = {}
+    for workflow_id, step_id, status, outputs in updates:
+        updates_by_workflow.setdefault(workflow_id, []).append(
+            (step_id, status, outputs))
+    ray.get([
+        get_management_actor(workflow_id).update_step_status_batch.remote(
+            workflow_id, workflow_updates)
+        for workflow_id, workflow_updates in updates_by_workflow.items()
+    ])
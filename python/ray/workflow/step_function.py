@@ -72,6 +72,7 @@ class WorkflowStepFunction:
                 name: str = None,
                 metadata: Dict[str, Any] = None,
                 allow_inplace: bool = False,
+                checkpoint: bool = True,
                 **ray_options) -> "WorkflowStepFunction":
         """This function set how the step function is going to be executed.
 
@@ -89,6 +90,10 @@ class WorkflowStepFunction:
                 appending .N suffixes.
             metadata: metadata to add to the step.
             allow_inplace: Execute the workflow step inplace.
+            checkpoint: Whether to persist the output of the step in
+                storage. If false, the output is only kept in the object
+                store and recomputed from the nearest checkpointed ancestor
+                on recovery. Chains of such steps are fused into one task.
             **ray_options: All parameters in this fields will be passed
                 to ray remote function options.
 
@@ -104,6 +109,7 @@ class WorkflowStepFunction:
             max_retries=max_retries,
             allow_inplace=allow_inplace,
             ray_options=ray_options,
+            checkpoint=checkpoint,
         )
         return WorkflowStepFunction(
             self._func,
@@ -26,6 +26,10 @@ def create_storage(storage_url: str) -> Storage:
 
         All parameters are optional and have the same meaning as boto3.client
 
+        Any storage can be wrapped to measure the latency and bytes of its
+        operations, with the URL of the wrapped storage quoted, i.e.:
+           instrumented://?storage=quoted_storage_url
+
     Returns:
         A storage instance.
     """
@@ -46,6 +50,10 @@ def create_storage(storage_url: str) -> Storage:
         params = dict(parse.parse_qsl(parsed_url.query))
         return DebugStorage(
             create_storage(params["storage"]), path=parsed_url.path)
+    elif parsed_url.scheme == "instrumented":
+        from ray.workflow.storage.instrumented import InstrumentedStorage
+        params = dict(parse.parse_qsl(parsed_url.query))
+        return InstrumentedStorage(create_storage(params["storage"]))
     else:
         raise ValueError(f"Invalid url: {storage_url}")
 
@@ -0,0 +1,199 @@
+"""Content-addressed, deduplicated blob store on top of a workflow Storage.
+
+Blobs are keyed by the sha256 digest of their content, so identical payloads
+written by different steps or workflows are only stored once. Every
+workflow referencing a blob leaves a marker under the blob, and the blob is
+deleted once the last workflow referencing it is deleted. Large blobs are
+split into chunks that are uploaded and downloaded concurrently.
+
+The storage has no atomic operations, so deletions are announced with a
+marker before the references are checked one last time:
+    - A workflow referencing the blob before that check keeps it alive.
+    - A workflow referencing it after the check sees the marker, waits for
+      the deletion to finish and uploads the blob again.
+Deletions only remove the manifest and the chunks, never the references,
+which may have been taken in the meantime.
+
+Layout under the storage root:
+    __objects__/<digest>/manifest.json     size and number of chunks
+    __objects__/<digest>/chunks/<i>        the content
+    __objects__/<digest>/refs/<workflow>.ref
+                                           one marker per referencing workflow
+    __objects__/<digest>/deleting/<time>_<uuid>
+                                           one marker per running deletion
+    <workflow>/content_refs/<digest>       blobs referenced by the workflow
+Storages may leave other files next to these, e.g. the temporary and backup
+files of atomic writes, so only names matching these patterns are read.
+"""
+
+import asyncio
+import hashlib
+import re
+import time
+import uuid
+from dataclasses import dataclass
+from typing import List
+
+from ray.workflow.storage.base import Storage, KeyNotFoundError
+
+# The directory under the storage root holding all blobs. It is not a
+# workflow, so it's skipped when listing workflows.
+CONTENT_ADDRESSED_DIR = "__objects__"
+MANIFEST = "manifest.json"
+CHUNKS_DIR = "chunks"
+REFS_DIR = "refs"
+DELETING_DIR = "deleting"
+WORKFLOW_CONTENT_REFS_DIR = "content_refs"
+
+# Serialized objects at least this large are stored content-addressed.
+# Smaller objects are cheaper to store inline than to deduplicate.
+MIN_CONTENT_ADDRESSED_SIZE = 1024 * 1024  # 1MB
+# Size of the chunks large blobs are split into.
+CHUNK_SIZE = 16 * 1024 * 1024  # 16MB
+# Deletion markers older than this are left over from deletions that never
+# finished, e.g. because the process died, and are ignored.
+DELETION_TIMEOUT_S = 60
+# How often to check whether the deletions of a blob are done.
+DELETION_POLL_INTERVAL_S = 0.1
+
+_DIGEST_NAME = re.compile(r"^[0-9a-f]{64}$")
+_REF_NAME = re.compile(r"^.+\.ref$")
+# Deletion markers are named after the time the deletion started.
+_DELETION_MARKER_NAME = re.compile(r"^(\d+\.\d{6})_[0-9a-f]{32}$")
+
+
+@dataclass(frozen=True)
+class ContentRef:
+    """Pointer to a blob, stored in place of the content itself."""
+    digest: str
+    size: int
+    num_chunks: int
+
+
+class ContentAddressedStore:
+    def __init__(self, storage: Storage):
+        self._storage = storage
+
+    def _blob_key(self, digest: str, *names: str) -> str:
+        return self._storage.make_key(CONTENT_ADDRESSED_DIR, digest, *names)
+
+    async def _exists(self, digest: str) -> bool:
+        try:
+            await self._storage.get(
+                self._blob_key(digest, MANIFEST), is_json=True)
+            return True
+        except KeyNotFoundError:
+            return False
+
+    async def _delete(self, key: str) -> None:
+        try:
+            await self._storage.delete_prefix(key)
+        except FileNotFoundError:
+            pass
+
+    def _ref_key(self, digest: str, workflow_id: str) -> str:
+        return self._blob_key(digest, REFS_DIR, f"{workflow_id}.ref")
+
+    async def _is_being_deleted(self, digest: str) -> bool:
+        names = await self._storage.scan_prefix(
+            self._blob_key(digest, DELETING_DIR))
+        now = time.time()
+        for name in names:
+            match = _DELETION_MARKER_NAME.match(name)
+            if match and now - float(match.group(1)) < DELETION_TIMEOUT_S:
+                return True
+        return False
+
+    async def put(self, data: bytes, workflow_id: str) -> ContentRef:
+        """Store the data, unless identical data is already stored, and
+        record that the workflow references it.
+
+        Args:
+            data: The content to store.
+            workflow_id: The workflow referencing the content.
+
+        Returns:
+            A pointer that can be used to load the content.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        num_chunks = max(1, -(-len(data) // CHUNK_SIZE))
+        ref = ContentRef(digest=digest, size=len(data), num_chunks=num_chunks)
+
+        # Take the reference before checking whether the blob exists, so that
+        # a workflow being deleted concurrently sees it and keeps the blob.
+        await asyncio.gather(
+            self._storage.put(
+                self._ref_key(digest, workflow_id), True, is_json=True),
+            self._storage.put(
+                self._storage.make_key(workflow_id, WORKFLOW_CONTENT_REFS_DIR,
+                                       digest), True,
+                is_json=True))
+        # A deletion that missed the reference may still remove the blob, so
+        # only check whether it exists once the deletion is done.
+        while await self._is_being_deleted(digest):
+            await asyncio.sleep(DELETION_POLL_INTERVAL_S)
+        if await self._exists(digest):
+            return ref
+
+        await asyncio.gather(*[
+            self._storage.put(
+                self._blob_key(digest, CHUNKS_DIR, str(i)),
+                data[i * CHUNK_SIZE:(i + 1) * CHUNK_SIZE])
+            for i in range(num_chunks)
+        ])
+        # The manifest is written last, it marks the blob as complete.
+        await self._storage.put(
+            self._blob_key(digest, MANIFEST), {
+                "size": ref.size,
+                "num_chunks": ref.num_chunks
+            },
+            is_json=True)
+        return ref
+
+    async def get(self, ref: ContentRef) -> bytes:
+        """Load the content the pointer refers to."""
+        chunks = await asyncio.gather(*[
+            self._storage.get(self._blob_key(ref.digest, CHUNKS_DIR, str(i)))
+            for i in range(ref.num_chunks)
+        ])
+        return b"".join(chunks)
+
+    async def num_references(self, digest: str) -> int:
+        """The number of workflows referencing the blob."""
+        names = await self._storage.scan_prefix(
+            self._blob_key(digest, REFS_DIR))
+        return sum(1 for name in names if _REF_NAME.match(name))
+
+    async def list_references(self, workflow_id: str) -> List[str]:
+        """The digests of all blobs referenced by the workflow."""
+        names = await self._storage.scan_prefix(
+            self._storage.make_key(workflow_id, WORKFLOW_CONTENT_REFS_DIR))
+        return [name for name in names if _DIGEST_NAME.match(name)]
+
+    async def release_workflow(self, workflow_id: str) -> None:
+        """Drop all references of the workflow, and delete the blobs that are
+        no longer referenced by any workflow."""
+        digests = await self.list_references(workflow_id)
+        await asyncio.gather(*[
+            self._release(digest, workflow_id) for digest in digests
+        ])
+
+    async def _release(self, digest: str, workflow_id: str) -> None:
+        await self._delete(self._ref_key(digest, workflow_id))
+        if await self.num_references(digest) > 0:
+            return
+
+        marker = self._blob_key(digest, DELETING_DIR,
+                                f"{time.time():.6f}_{uuid.uuid4().hex}")
+        await self._storage.put(marker, True, is_json=True)
+        try:
+            # Workflows referencing the blob from now on wait for the marker
+            # to be removed, so this is the last check that is needed.
+            if await self.num_references(digest) > 0:
+                return
+            # The manifest is deleted first, so the blob never looks complete
+            # while chunks are missing.
+            await self._delete(self._blob_key(digest, MANIFEST))
+            await self._delete(self._blob_key(digest, CHUNKS_DIR))
+        finally:
+            await self._delete(marker)
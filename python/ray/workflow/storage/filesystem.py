@@ -1,15 +1,40 @@
 import os
+import asyncio
 import contextlib
 import json
 import shutil
 import pathlib
-from typing import Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
 import uuid
 
 from ray.workflow.storage.base import Storage, KeyNotFoundError
 
 import ray.cloudpickle
 
+# Number of threads used for blocking file I/O. Shared by all filesystem
+# storages in the process.
+IO_THREAD_POOL_SIZE = 16
+
+_io_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_io_executor() -> ThreadPoolExecutor:
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = ThreadPoolExecutor(
+            max_workers=IO_THREAD_POOL_SIZE,
+            thread_name_prefix="workflow_storage_io")
+    return _io_executor
+
+
+async def _run_in_io_thread(func: Callable, *args) -> Any:
+    """Run the blocking function in the I/O thread pool, so that concurrent
+    storage operations (e.g. gathered by the caller) overlap instead of
+    blocking the event loop one after another."""
+    return await asyncio.get_event_loop().run_in_executor(
+        _get_io_executor(), func, *args)
+
 
 @contextlib.contextmanager
 def _open_atomic(path: pathlib.Path, mode="r"):
@@ -46,8 +71,9 @@ def _open_atomic(path: pathlib.Path, mode="r"):
         if path.exists():
             raise FileExistsError(path)
         tmp_new_fn = path.with_suffix(f".{path.name}.{uuid.uuid4().hex}")
-        if not tmp_new_fn.parent.exists():
-            tmp_new_fn.parent.mkdir(parents=True)
+        # Writes to the same directory may run concurrently in the I/O
+        # thread pool, so tolerate the directory being created by another.
+        tmp_new_fn.parent.mkdir(parents=True, exist_ok=True)
         f = open(tmp_new_fn, mode)
         write_ok = True
         try:
@@ -71,8 +97,9 @@ def _open_atomic(path: pathlib.Path, mode="r"):
                 backup_path.unlink()
             path.rename(backup_path)
         tmp_new_fn = path.with_suffix(f".{path.name}.{uuid.uuid4().hex}")
-        if not tmp_new_fn.parent.exists():
-            tmp_new_fn.parent.mkdir(parents=True)
+        # Writes to the same directory may run concurrently in the I/O
+        # thread pool, so tolerate the directory being created by another.
+        tmp_new_fn.parent.mkdir(parents=True, exist_ok=True)
         f = open(tmp_new_fn, mode)
         write_ok = True
         try:
@@ -134,6 +161,18 @@ class FilesystemStorageImpl(Storage):
         return os.path.join(str(self._workflow_root_dir), *names)
 
     async def put(self, key: str, data: Any, is_json: bool = False) -> None:
+        await _run_in_io_thread(self._put_sync, key, data, is_json)
+
+    async def get(self, key: str, is_json: bool = False) -> Any:
+        return await _run_in_io_thread(self._get_sync, key, is_json)
+
+    async def delete_prefix(self, key_prefix: str) -> None:
+        await _run_in_io_thread(self._delete_prefix_sync, key_prefix)
+
+    async def scan_prefix(self, key_prefix: str) -> List[str]:
+        return await _run_in_io_thread(self._scan_prefix_sync, key_prefix)
+
+    def _put_sync(self, key: str, data: Any, is_json: bool) -> None:
         if is_json:
             with _open_atomic(pathlib.Path(key), "w") as f:
                 return json.dump(data, f)
@@ -141,7 +180,7 @@ class FilesystemStorageImpl(Storage):
             with _open_atomic(pathlib.Path(key), "wb") as f:
                 return ray.cloudpickle.dump(data, f)
 
-    async def get(self, key: str, is_json: bool = False) -> Any:
+    def _get_sync(self, key: str, is_json: bool) -> Any:
         if is_json:
             with _open_atomic(pathlib.Path(key)) as f:
                 return json.load(f)
@@ -149,14 +188,14 @@ class FilesystemStorageImpl(Storage):
             with _open_atomic(pathlib.Path(key), "rb") as f:
                 return ray.cloudpickle.load(f)
 
-    async def delete_prefix(self, key_prefix: str) -> None:
+    def _delete_prefix_sync(self, key_prefix: str) -> None:
         path = pathlib.Path(key_prefix)
         if path.is_dir():
             shutil.rmtree(str(path))
         else:
             path.unlink()
 
-    async def scan_prefix(self, key_prefix: str) -> List[str]:
+    def _scan_prefix_sync(self, key_prefix: str) -> List[str]:
         try:
             path = pathlib.Path(key_prefix)
             return [p.name for p in path.iterdir()]
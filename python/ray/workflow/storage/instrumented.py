@@ -0,0 +1,165 @@
+"""A storage wrapper measuring the latency, bytes and number of operations.
+
+The measurements are aggregated per process, exported with ray.util.metrics
+and added to the metadata of every workflow step executed in the process
+(see "workflow.get_metadata()").
+"""
+
+import bisect
+import copy
+import json
+import time
+from typing import Any, Dict, List
+from urllib import parse
+
+from ray import cloudpickle
+from ray.util import metrics
+from ray.workflow.storage.base import Storage
+
+# Upper bounds of the latency histogram buckets, in seconds.
+LATENCY_BUCKETS_S = [
+    0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0
+]
+
+# Operation name -> aggregated measurements, for all instrumented storages
+# in this process.
+_stats: Dict[str, Dict[str, Any]] = {}
+_metrics = None
+
+
+def _get_metrics():
+    # Metrics can only be created once Ray is initialized.
+    global _metrics
+    if _metrics is None:
+        _metrics = (
+            metrics.Histogram(
+                "workflow_storage_op_latency_s",
+                description="The latency of workflow storage operations.",
+                boundaries=LATENCY_BUCKETS_S,
+                tag_keys=("op", )),
+            metrics.Counter(
+                "workflow_storage_bytes",
+                description="The number of bytes moved by workflow storage "
+                "operations.",
+                tag_keys=("op", )),
+        )
+    return _metrics
+
+
+def _size_of(data: Any, is_json: bool) -> int:
+    # This serializes the data a second time, the wrapped storage doesn't
+    # expose the size of what it wrote.
+    if isinstance(data, bytes):
+        return len(data)
+    if is_json:
+        return len(json.dumps(data))
+    return len(cloudpickle.dumps(data))
+
+
+def _record(op: str, latency_s: float, num_bytes: int = 0) -> None:
+    stats = _stats.setdefault(
+        op, {
+            "count": 0,
+            "bytes": 0,
+            "total_latency_s": 0.0,
+            "max_latency_s": 0.0,
+            "latency_histogram": [0] * (len(LATENCY_BUCKETS_S) + 1),
+        })
+    stats["count"] += 1
+    stats["bytes"] += num_bytes
+    stats["total_latency_s"] += latency_s
+    stats["max_latency_s"] = max(stats["max_latency_s"], latency_s)
+    stats["latency_histogram"][bisect.bisect_left(LATENCY_BUCKETS_S,
+                                                  latency_s)] += 1
+
+    latency_metric, bytes_metric = _get_metrics()
+    latency_metric.observe(latency_s, tags={"op": op})
+    if num_bytes > 0:
+        bytes_metric.inc(num_bytes, tags={"op": op})
+
+
+def get_stats() -> Dict[str, Dict[str, Any]]:
+    """Get the measurements of all instrumented storage operations in this
+    process.
+
+    Returns:
+        A dict from operation ("put", "get", "scan" or "delete") to its
+        count, bytes moved, total and max latency, and a histogram of the
+        latency with the buckets in LATENCY_BUCKETS_S (plus one for slower
+        operations).
+    """
+    return copy.deepcopy(_stats)
+
+
+def stats_since(previous: Dict[str, Dict[str, Any]]
+                ) -> Dict[str, Dict[str, Any]]:
+    """The measurements of the operations since "get_stats()" returned
+    "previous". The max latency is not included, it can't be subtracted."""
+    since = {}
+    for op, stats in _stats.items():
+        before = previous.get(op)
+        count = stats["count"] - (before["count"] if before else 0)
+        if count == 0:
+            continue
+        since[op] = {
+            "count": count,
+            "bytes": stats["bytes"] - (before["bytes"] if before else 0),
+            "total_latency_s": stats["total_latency_s"] -
+            (before["total_latency_s"] if before else 0.0),
+        }
+    return since
+
+
+class InstrumentedStorage(Storage):
+    """A storage measuring the operations of the wrapped storage."""
+
+    def __init__(self, wrapped_storage: Storage):
+        self._wrapped_storage = wrapped_storage
+
+    def make_key(self, *names: str) -> str:
+        return self._wrapped_storage.make_key(*names)
+
+    async def put(self, key: str, data: Any, is_json: bool = False) -> None:
+        start = time.perf_counter()
+        await self._wrapped_storage.put(key, data, is_json)
+        _record("put",
+                time.perf_counter() - start, _size_of(data, is_json))
+
+    async def get(self, key: str, is_json: bool = False) -> Any:
+        start = time.perf_counter()
+        try:
+            data = await self._wrapped_storage.get(key, is_json)
+        except Exception:
+            _record("get", time.perf_counter() - start)
+            raise
+        _record("get", time.perf_counter() - start, _size_of(data, is_json))
+        return data
+
+    async def delete_prefix(self, key_prefix: str) -> None:
+        start = time.perf_counter()
+        try:
+            await self._wrapped_storage.delete_prefix(key_prefix)
+        finally:
+            _record("delete", time.perf_counter() - start)
+
+    async def scan_prefix(self, key_prefix: str) -> List[str]:
+        start = time.perf_counter()
+        try:
+            return await self._wrapped_storage.scan_prefix(key_prefix)
+        finally:
+            _record("scan", time.perf_counter() - start)
+
+    @property
+    def storage_url(self) -> str:
+        store_url = parse.quote_plus(self._wrapped_storage.storage_url)
+        parsed_url = parse.ParseResult(
+            scheme="instrumented",
+            path="",
+            netloc="",
+            params="",
+            query=f"storage={store_url}",
+            fragment="")
+        return parse.urlunparse(parsed_url)
+
+    def __reduce__(self):
+        return InstrumentedStorage, (self._wrapped_storage, )
@@ -1,15 +1,57 @@
 import os
+import asyncio
 import tempfile
 import json
 import urllib.parse as parse
+import weakref
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import aioboto3
 import ray
-from typing import Any, List
+from typing import Any, Dict, List
 from ray.workflow.storage.base import Storage, KeyNotFoundError
 import ray.cloudpickle
 
 MAX_RECEIVED_DATA_MEMORY_SIZE = 25 * 1024 * 1024  # 25MB
+# Size of the HTTP connection pool of the S3 client, i.e. the number of
+# requests that can be in flight at the same time.
+MAX_POOL_CONNECTIONS = 64
+
+
+class _LoopClient:
+    """An S3 client bound to an event loop. It is kept open until it is
+    closed explicitly, so that its connection pool is reused."""
+
+    def __init__(self, client_context, loop: asyncio.AbstractEventLoop):
+        self._client_context = client_context
+        # Concurrent requests made before the client is ready wait for the
+        # same task instead of each creating a client.
+        self._enter_task = loop.create_task(client_context.__aenter__())
+
+    async def get(self):
+        return await self._enter_task
+
+    async def close(self) -> None:
+        try:
+            await self._enter_task
+        except Exception:
+            return
+        await self._client_context.__aexit__(None, None, None)
+
+
+def _close_clients(
+        clients: Dict[asyncio.AbstractEventLoop, _LoopClient]) -> None:
+    """Close the clients of the event loops that are still open."""
+    for loop, client in list(clients.items()):
+        if loop.is_closed():
+            continue
+        if loop.is_running():
+            loop.call_soon_threadsafe(
+                lambda loop=loop, client=client: loop.create_task(
+                    client.close()))
+        else:
+            loop.run_until_complete(client.close())
+    clients.clear()
 
 
 class S3StorageImpl(Storage):
@@ -43,6 +85,12 @@ class S3StorageImpl(Storage):
         self._aws_secret_access_key = aws_secret_access_key
         self._aws_session_token = aws_session_token
         self._config = config
+        # Clients are bound to the event loop they were created in. All
+        # requests made in a loop share one client and its connection pool
+        # instead of opening a new connection each. The clients are closed
+        # once the storage is garbage collected, or at exit.
+        self._clients: Dict[asyncio.AbstractEventLoop, _LoopClient] = {}
+        weakref.finalize(self, _close_clients, self._clients)
 
     def make_key(self, *names: str) -> str:
         return os.path.join(self._s3_path, *names)
@@ -56,18 +104,18 @@ class S3StorageImpl(Storage):
             else:
                 ray.cloudpickle.dump(data, tmp_file)
             tmp_file.seek(0)
-            async with self._client() as s3:
-                await s3.upload_fileobj(tmp_file, self._bucket, key)
+            s3 = await self._client()
+            await s3.upload_fileobj(tmp_file, self._bucket, key)
 
     async def get(self, key: str, is_json: bool = False) -> Any:
         try:
             with tempfile.SpooledTemporaryFile(
                     mode="w+b",
                     max_size=MAX_RECEIVED_DATA_MEMORY_SIZE) as tmp_file:
-                async with self._client() as s3:
-                    obj = await s3.get_object(Bucket=self._bucket, Key=key)
-                    async for chunk in obj["Body"]:
-                        tmp_file.write(chunk)
+                s3 = await self._client()
+                obj = await s3.get_object(Bucket=self._bucket, Key=key)
+                async for chunk in obj["Body"]:
+                    tmp_file.write(chunk)
                 tmp_file.seek(0)
                 if is_json:
                     return json.loads(tmp_file.read().decode())
@@ -82,33 +130,61 @@ class S3StorageImpl(Storage):
     async def delete_prefix(self, key_prefix: str) -> None:
         async with self._session.resource(
                 "s3", endpoint_url=self._endpoint_url,
-                config=self._config) as s3:
+                config=self._client_config()) as s3:
             bucket = await s3.Bucket(self._bucket)
             await bucket.objects.filter(Prefix=key_prefix).delete()
 
     async def scan_prefix(self, key_prefix: str) -> List[str]:
         keys = []
-        async with self._client() as s3:
-            if not key_prefix.endswith("/"):
-                key_prefix += "/"
-            paginator = s3.get_paginator("list_objects")
-            operation_parameters = {
-                "Bucket": self._bucket,
-                "Delimiter": "/",
-                "Prefix": key_prefix
-            }
-            page_iterator = paginator.paginate(**operation_parameters)
-            async for page in page_iterator:
-                for o in page.get("CommonPrefixes", []):  # "directories"
-                    keys.append(o.get("Prefix", ""))
-                for o in page.get("Contents", []):  # "files"
-                    keys.append(o.get("Key", ""))
+        if not key_prefix.endswith("/"):
+            key_prefix += "/"
+        operation_parameters = {
+            "Bucket": self._bucket,
+            "Delimiter": "/",
+            "Prefix": key_prefix
+        }
+        s3 = await self._client()
+        paginator = s3.get_paginator("list_objects")
+        page_iterator = paginator.paginate(**operation_parameters)
+        async for page in page_iterator:
+            for o in page.get("CommonPrefixes", []):  # "directories"
+                keys.append(o.get("Prefix", ""))
+            for o in page.get("Contents", []):  # "files"
+                keys.append(o.get("Key", ""))
         keys = [k.rstrip("/").split("/")[-1] for k in keys if k != ""]
         return keys
 
-    def _client(self):
-        return self._session.client(
-            "s3", endpoint_url=self._endpoint_url, config=self._config)
+    def _client_config(self) -> Config:
+        pool_config = Config(max_pool_connections=MAX_POOL_CONNECTIONS)
+        if self._config is None:
+            return pool_config
+        # Settings passed by the user take precedence.
+        return pool_config.merge(self._config)
+
+    async def _client(self):
+        """Get the client of the current event loop, creating it if there
+        is none."""
+        loop = asyncio.get_event_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            # The clients of closed loops can't be used or closed anymore.
+            for closed_loop in [
+                    other for other in self._clients if other.is_closed()
+            ]:
+                del self._clients[closed_loop]
+            client = _LoopClient(
+                self._session.client(
+                    "s3",
+                    endpoint_url=self._endpoint_url,
+                    config=self._client_config()), loop)
+            self._clients[loop] = client
+        try:
+            return await client.get()
+        except Exception:
+            # Retry creating the client with the next request.
+            if self._clients.get(loop) is client:
+                del self._clients[loop]
+            raise
 
     @property
     def storage_url(self) -> str:
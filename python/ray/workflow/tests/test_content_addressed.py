@@ -0,0 +1,182 @@
+from ray.tests.conftest import *  # noqa
+
+import asyncio
+import pytest
+import time
+import uuid
+
+import ray
+from ray import workflow
+from ray.workflow import storage
+from ray.workflow.storage import content_addressed
+from ray.workflow.storage.content_addressed import ContentAddressedStore
+from ray.workflow.workflow_storage import asyncio_run
+
+
+@workflow.step
+def size_of(data):
+    return len(data)
+
+
+def _list_blobs(store: storage.Storage):
+    return asyncio_run(
+        store.scan_prefix(
+            store.make_key(content_addressed.CONTENT_ADDRESSED_DIR)))
+
+
+class _HookedStorage:
+    """Wraps a storage to run a hook once a key with the prefix is
+    written."""
+
+    def __init__(self, storage, prefix, hook):
+        self._storage = storage
+        self._prefix = prefix
+        self._hook = hook
+
+    def __getattr__(self, name):
+        return getattr(self._storage, name)
+
+    async def put(self, key, data, is_json=False):
+        await self._storage.put(key, data, is_json)
+        if key.startswith(self._prefix) and self._hook is not None:
+            hook, self._hook = self._hook, None
+            await hook()
+
+
+@pytest.mark.asyncio
+async def test_chunked_roundtrip(workflow_start_regular, monkeypatch):
+    monkeypatch.setattr(content_addressed, "CHUNK_SIZE", 10)
+    cas = ContentAddressedStore(storage.get_global_storage())
+
+    data = bytes(range(95))
+    ref = await cas.put(data, "workflow")
+    assert ref.size == 95
+    assert ref.num_chunks == 10
+    assert await cas.get(ref) == data
+
+    # Storing the same content again doesn't create a new blob.
+    assert await cas.put(data, "other_workflow") == ref
+    assert await cas.num_references(ref.digest) == 2
+    assert await cas.list_references("workflow") == [ref.digest]
+
+
+def test_dedup_across_workflows(workflow_start_regular):
+    store = storage.get_global_storage()
+    data = b"x" * (2 * content_addressed.MIN_CONTENT_ADDRESSED_SIZE)
+
+    assert size_of.step(data).run("wf_1") == len(data)
+    assert size_of.step(data).run("wf_2") == len(data)
+    # The step arguments are identical, so they're only stored once.
+    blobs = _list_blobs(store)
+    assert len(blobs) == 1
+    # Shared blobs don't show up as workflows.
+    assert {wid for wid, _ in workflow.list_all()} == {"wf_1", "wf_2"}
+
+    workflow.delete("wf_1")
+    assert _list_blobs(store) == blobs
+    cas = ContentAddressedStore(store)
+    assert asyncio_run(cas.num_references(blobs[0])) == 1
+
+    workflow.delete("wf_2")
+    assert asyncio_run(cas.num_references(blobs[0])) == 0
+    assert not asyncio_run(cas._exists(blobs[0]))
+    assert asyncio_run(
+        store.scan_prefix(
+            store.make_key(content_addressed.CONTENT_ADDRESSED_DIR, blobs[0],
+                           content_addressed.CHUNKS_DIR))) == []
+
+
+@pytest.mark.asyncio
+async def test_reference_during_release(workflow_start_regular):
+    store = storage.get_global_storage()
+    cas = ContentAddressedStore(store)
+    data = b"data"
+    ref = await cas.put(data, "wf_1")
+    other_put = None
+
+    async def put_from_other_workflow():
+        # Another workflow references the blob once its deletion started.
+        nonlocal other_put
+        other_put = asyncio.ensure_future(cas.put(data, "wf_2"))
+        while await cas.num_references(ref.digest) == 0:
+            await asyncio.sleep(0.01)
+
+    deleting_prefix = store.make_key(content_addressed.CONTENT_ADDRESSED_DIR,
+                                     ref.digest,
+                                     content_addressed.DELETING_DIR)
+    releasing_cas = ContentAddressedStore(
+        _HookedStorage(store, deleting_prefix, put_from_other_workflow))
+    await releasing_cas.release_workflow("wf_1")
+
+    # The deletion saw the new reference and kept the blob.
+    assert await other_put == ref
+    assert await cas.num_references(ref.digest) == 1
+    assert await cas.get(ref) == data
+
+
+@pytest.mark.asyncio
+async def test_put_waits_for_release(workflow_start_regular):
+    store = storage.get_global_storage()
+    cas = ContentAddressedStore(store)
+    data = b"data"
+    ref = await cas.put(data, "wf_1")
+
+    # A deletion that started before the blob was referenced again.
+    marker = store.make_key(content_addressed.CONTENT_ADDRESSED_DIR,
+                            ref.digest, content_addressed.DELETING_DIR,
+                            f"{time.time():.6f}_{uuid.uuid4().hex}")
+    await store.put(marker, True, is_json=True)
+    put = asyncio.ensure_future(cas.put(data, "wf_2"))
+    await asyncio.sleep(0.5)
+    assert not put.done()
+
+    # The deletion finishes, then the blob is uploaded again.
+    await cas._delete(
+        store.make_key(content_addressed.CONTENT_ADDRESSED_DIR, ref.digest,
+                       content_addressed.MANIFEST))
+    await cas._delete(
+        store.make_key(content_addressed.CONTENT_ADDRESSED_DIR, ref.digest,
+                       content_addressed.CHUNKS_DIR))
+    await cas._delete(marker)
+    assert await put == ref
+    assert await cas.get(ref) == data
+
+
+
+@pytest.mark.asyncio
+async def test_ignore_stray_files(workflow_start_regular):
+    store = storage.get_global_storage()
+    cas = ContentAddressedStore(store)
+    data = b"data"
+    ref = await cas.put(data, "wf.1")
+
+    # Temporary and backup files left by atomic writes of the storage.
+    marker = f"{time.time():.6f}_{uuid.uuid4().hex}"
+    stray_keys = [
+        store.make_key(content_addressed.CONTENT_ADDRESSED_DIR, ref.digest,
+                       content_addressed.DELETING_DIR,
+                       f"{marker[:10]}.{marker}.{uuid.uuid4().hex}"),
+        store.make_key(content_addressed.CONTENT_ADDRESSED_DIR, ref.digest,
+                       content_addressed.REFS_DIR,
+                       f"wf.1.wf.1.ref.{uuid.uuid4().hex}"),
+        store.make_key(content_addressed.CONTENT_ADDRESSED_DIR, ref.digest,
+                       content_addressed.REFS_DIR, ".wf.1.ref.backup"),
+        store.make_key("wf.1", content_addressed.WORKFLOW_CONTENT_REFS_DIR,
+                       f".{ref.digest}.backup"),
+    ]
+    for key in stray_keys:
+        await store.put(key, True, is_json=True)
+
+    assert await cas.put(data, "wf.2") == ref
+    assert await cas.num_references(ref.digest) == 2
+    assert await cas.list_references("wf.1") == [ref.digest]
+
+    await cas.release_workflow("wf.1")
+    await cas.release_workflow("wf.2")
+    assert await cas.num_references(ref.digest) == 0
+    assert not await cas._exists(ref.digest)
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main(["-v", __file__]))
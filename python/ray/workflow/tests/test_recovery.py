@@ -197,6 +197,30 @@ def test_recovery_complex(workflow_start_regular):
     assert ray.get(output) == r
 
 
+def test_recovery_many_inputs(workflow_start_regular):
+    utils.unset_global_mark()
+
+    @workflow.step
+    def identity(x):
+        return x
+
+    @workflow.step
+    def add_all(*args):
+        if not utils.check_global_mark():
+            raise ValueError("Not marked.")
+        return sum(args)
+
+    shared = identity.step(1)
+    inputs = [add_all.step(identity.step(i), shared) for i in range(20)]
+    with pytest.raises(Exception):
+        add_all.step(*inputs).run("many_inputs")
+
+    utils.set_global_mark()
+    # The completed inputs are loaded concurrently, and the shared one is
+    # only loaded once.
+    assert ray.get(workflow.resume("many_inputs")) == sum(range(20)) + 20
+
+
 def test_recovery_non_exists_workflow(workflow_start_regular):
     with pytest.raises(ValueError):
         ray.get(workflow.resume("this_workflow_id_does_not_exist"))
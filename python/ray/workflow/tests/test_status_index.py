@@ -0,0 +1,95 @@
+from ray.tests.conftest import *  # noqa
+
+import pytest
+
+import ray
+from ray import workflow
+from ray.workflow import status_index, storage, workflow_access
+from ray.workflow.common import WorkflowStatus
+from ray.workflow.status_index import WorkflowStatusIndex
+from ray.workflow.workflow_storage import asyncio_run
+
+
+@workflow.step
+def identity(x):
+    return x
+
+
+def _num_log_entries(store: storage.Storage) -> int:
+    return len(
+        asyncio_run(
+            store.scan_prefix(
+                store.make_key(status_index.STATUS_INDEX_DIR,
+                               status_index.LOG_DIR))))
+
+
+@pytest.mark.asyncio
+async def test_status_index_updates(workflow_start_regular):
+    index = WorkflowStatusIndex(storage.get_global_storage())
+    await index.update("a", WorkflowStatus.RUNNING)
+    await index.update("b", WorkflowStatus.RUNNING)
+    await index.update("a", WorkflowStatus.SUCCESSFUL)
+    await index.update("b", None)
+    assert await index.load() == ({"a": WorkflowStatus.SUCCESSFUL}, 4)
+
+    assert await index.compact()
+    assert await index.load() == ({"a": WorkflowStatus.SUCCESSFUL}, 0)
+    await index.update("a", WorkflowStatus.FAILED)
+    assert await index.load() == ({"a": WorkflowStatus.FAILED}, 1)
+
+
+def test_list_all_uses_index(workflow_start_regular, monkeypatch):
+    store = storage.get_global_storage()
+    assert identity.step(1).run("wf_1") == 1
+    assert identity.step(2).run("wf_2") == 2
+    workflow.delete("wf_1")
+    assert workflow.list_all() == [("wf_2", WorkflowStatus.SUCCESSFUL)]
+
+    # Listing doesn't load the metadata of every workflow.
+    def _fail(*args, **kwargs):
+        raise AssertionError("Workflows should not be scanned.")
+
+    monkeypatch.setattr(ray.workflow.workflow_storage.WorkflowStorage,
+                        "_scan_workflows", _fail)
+    assert workflow.list_all() == [("wf_2", WorkflowStatus.SUCCESSFUL)]
+    assert _num_log_entries(store) > 0
+
+
+@pytest.mark.asyncio
+async def test_status_index_compaction(workflow_start_regular):
+    store = storage.get_global_storage()
+    index = WorkflowStatusIndex(store)
+    for i in range(5):
+        await index.update(f"wf_{i}", WorkflowStatus.RUNNING)
+    assert _num_log_entries(store) == 5
+
+    assert not await index.compact(min_log_entries=6)
+    assert _num_log_entries(store) == 5
+    assert await index.compact(min_log_entries=5)
+    assert _num_log_entries(store) == 0
+    await index.update("wf_0", WorkflowStatus.CANCELED)
+    statuses, num_log_entries = await index.load()
+    assert num_log_entries == 1
+    assert statuses.pop("wf_0") == WorkflowStatus.CANCELED
+    assert set(statuses.values()) == {WorkflowStatus.RUNNING}
+
+
+def test_list_all_compacts_index(workflow_start_regular):
+    store = storage.get_global_storage()
+    asyncio_run(WorkflowStatusIndex(store).compact())
+    for i in range(status_index.COMPACTION_THRESHOLD):
+        asyncio_run(
+            WorkflowStatusIndex(store).update(f"wf_{i}",
+                                              WorkflowStatus.FAILED))
+    statuses = workflow.list_all()
+    assert len(statuses) == status_index.COMPACTION_THRESHOLD
+    # The first shard of the management actor compacts the index. The
+    # actor processes calls in order, so it's done after this call.
+    ray.get(workflow_access.get_management_actor().get_storage_url.remote())
+    assert _num_log_entries(store) == 0
+    assert workflow.list_all() == statuses
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main(["-v", __file__]))
@@ -0,0 +1,111 @@
+from ray.tests.conftest import *  # noqa
+
+import pytest
+
+import ray
+from ray import workflow
+from ray.workflow import storage, workflow_storage
+from ray.workflow.tests import utils
+
+
+@workflow.step
+def source():
+    return [ray.get_runtime_context().task_id.hex()]
+
+
+@workflow.step(checkpoint=False)
+def append_task_id(task_ids):
+    return task_ids + [ray.get_runtime_context().task_id.hex()]
+
+
+@workflow.step
+def finish(task_ids):
+    return task_ids + [ray.get_runtime_context().task_id.hex()]
+
+
+def test_checkpoint_false_skips_output(workflow_start_regular):
+    result = finish.options(name="finish").step(
+        append_task_id.options(name="middle", checkpoint=False).step(
+            source.options(name="source").step())).run("skip_output")
+    assert len(result) == 3
+
+    wf_storage = workflow_storage.WorkflowStorage(
+        "skip_output", storage.get_global_storage())
+    assert wf_storage.inspect_step("source").output_object_valid
+    assert wf_storage.inspect_step("finish").output_object_valid
+    middle = wf_storage.inspect_step("middle")
+    assert not middle.output_object_valid
+    # The inputs are still checkpointed so the step can be recomputed.
+    assert middle.is_recoverable()
+
+
+def test_checkpoint_false_output_step(workflow_start_regular):
+    result = append_task_id.options(name="output").step(
+        source.options(name="source").step()).run("output_step")
+    assert len(result) == 2
+
+    # The output of the workflow is checkpointed anyway.
+    wf_storage = workflow_storage.WorkflowStorage(
+        "output_step", storage.get_global_storage())
+    assert wf_storage.inspect_step("output").output_object_valid
+    assert ray.get(workflow.get_output("output_step")) == result
+    assert ray.get(workflow.resume("output_step")) == result
+
+
+def test_non_checkpointed_chain_fused(workflow_start_regular):
+    output = source.step()
+    for _ in range(3):
+        output = append_task_id.step(output)
+    task_ids = finish.step(output).run("fused")
+
+    # The non-checkpointed steps run in the task of the step consuming
+    # their output, the checkpointed source does not.
+    assert len(task_ids) == 5
+    assert len(set(task_ids[1:])) == 1
+    assert task_ids[0] != task_ids[1]
+
+
+def test_shared_step_not_fused(workflow_start_regular):
+    @workflow.step
+    def join(a, b):
+        return a + b
+
+    shared = append_task_id.step(source.step())
+    task_ids = join.step(finish.step(shared), finish.step(shared)).run(
+        "shared")
+
+    # The shared step is executed once in its own task.
+    source_id, shared_id, first_id = task_ids[:3]
+    assert task_ids[3:5] == [source_id, shared_id]
+    assert len({shared_id, first_id, task_ids[5]}) == 3
+
+
+def test_recover_non_checkpointed_step(workflow_start_regular):
+    utils.unset_global_mark()
+
+    @workflow.step
+    def one():
+        return 1
+
+    @workflow.step(checkpoint=False)
+    def double(x):
+        return 2 * x
+
+    @workflow.step
+    def fail_unless_marked(x):
+        if not utils.check_global_mark():
+            raise ValueError("Not marked.")
+        return x + 1
+
+    with pytest.raises(Exception):
+        fail_unless_marked.step(double.step(one.step())).run("recover")
+
+    utils.set_global_mark()
+    # The output of "double" was never checkpointed, so it is recomputed
+    # from the checkpointed output of "one".
+    assert ray.get(workflow.resume("recover")) == 3
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main(["-v", __file__]))
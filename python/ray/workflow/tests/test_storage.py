@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 import ray
 from ray._private import signature
@@ -45,6 +47,22 @@ async def test_kv_storage(workflow_start_regular):
     # TODO(suquark): Test "delete" once fully implemented.
 
 
+@pytest.mark.asyncio
+async def test_kv_storage_concurrent_put(workflow_start_regular):
+    kv_store = storage.get_global_storage()
+    # Concurrent writes into the same (not yet existing) prefix must not
+    # interfere with each other.
+    keys = [kv_store.make_key("concurrent", str(i)) for i in range(50)]
+    await asyncio.gather(
+        *[kv_store.put(key, i, is_json=True) for i, key in enumerate(keys)])
+    results = await asyncio.gather(
+        *[kv_store.get(key, is_json=True) for key in keys])
+    assert results == list(range(50))
+    assert set(await kv_store.scan_prefix(kv_store.make_key(
+        "concurrent"))) == {str(i)
+                            for i in range(50)}
+
+
 def test_delete(workflow_start_regular):
     _storage = storage.get_global_storage()
 
@@ -271,6 +289,40 @@ def test_workflow_storage(workflow_start_regular):
     assert not inspect_result.is_recoverable()
 
 
+def test_instrumented_storage(ray_start_regular, tmp_path, reset_workflow):
+    from urllib import parse
+    from ray.workflow.storage import instrumented
+    url = "instrumented://?storage=" + parse.quote_plus(str(tmp_path))
+    workflow.init(url)
+    store = storage.get_global_storage()
+    assert isinstance(store, instrumented.InstrumentedStorage)
+    assert storage.create_storage(store.storage_url).storage_url == url
+
+    before = instrumented.get_stats()
+    asyncio_run(store.put(store.make_key("a"), b"x" * 100))
+    assert asyncio_run(store.get(store.make_key("a"))) == b"x" * 100
+    asyncio_run(store.scan_prefix(store.make_key("")))
+    stats = instrumented.stats_since(before)
+    assert stats["put"]["count"] == 1
+    assert stats["put"]["bytes"] == 100
+    assert stats["get"]["bytes"] == 100
+    assert stats["scan"]["count"] == 1
+    assert "delete" not in stats
+    assert sum(instrumented.get_stats()["put"]["latency_histogram"]) >= 1
+
+    @workflow.step
+    def load(key):
+        store = storage.get_global_storage()
+        return asyncio_run(store.get(store.make_key(key)))
+
+    assert load.options(name="load").step("a").run("instrumented") == (
+        b"x" * 100)
+    step_stats = workflow.get_metadata("instrumented", "load")["stats"]
+    assert step_stats["storage"]["get"]["count"] == 1
+    assert step_stats["storage"]["get"]["bytes"] == 100
+    assert step_stats["storage"]["get"]["total_latency_s"] > 0
+
+
 if __name__ == "__main__":
     import sys
     sys.exit(pytest.main(["-v", __file__]))
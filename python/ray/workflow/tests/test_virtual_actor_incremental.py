@@ -0,0 +1,118 @@
+from ray.tests.conftest import *  # noqa
+
+import pytest
+
+import ray
+from ray import workflow
+from ray.workflow import virtual_actor_state
+from ray.workflow.recovery import get_latest_output
+from ray.workflow.storage import get_global_storage
+from ray.workflow.workflow_access import get_management_actor
+
+
+@workflow.virtual_actor.incremental
+class KeyValueStore:
+    def __init__(self):
+        self.items = {}
+        self.num_puts = 0
+
+    def put(self, key, value):
+        self.items[key] = value
+        self.num_puts += 1
+
+    def delete(self, key):
+        del self.items[key]
+
+    @workflow.virtual_actor.readonly
+    def get(self, key):
+        return self.items.get(key)
+
+    @workflow.virtual_actor.readonly
+    def size(self):
+        return len(self.items)
+
+
+def test_state_delta():
+    state = {"a": 1, "nested": {"x": [1], "y": 2}, "removed": 3}
+    base = virtual_actor_state.fingerprint(state)
+    # Modify the state in place, like a method of the actor would.
+    state["nested"]["x"].append(2)
+    state["nested"]["z"] = 3
+    del state["removed"]
+    delta, new_fingerprint = virtual_actor_state.diff(base, state)
+
+    assert delta.updated == {}
+    assert delta.removed == ["removed"]
+    assert delta.nested["nested"].updated == {"x": [1, 2], "z": 3}
+    assert virtual_actor_state.apply({
+        "a": 1,
+        "nested": {
+            "x": [1],
+            "y": 2
+        },
+        "removed": 3
+    }, delta) == state
+    assert new_fingerprint == virtual_actor_state.fingerprint(state)
+    delta, _ = virtual_actor_state.diff(new_fingerprint, state)
+    assert not delta
+
+
+def test_incremental_actor(workflow_start_regular, monkeypatch):
+    num_puts = virtual_actor_state.STATE_SNAPSHOT_INTERVAL + 4
+    store = KeyValueStore.get_or_create("kv")
+    for i in range(num_puts):
+        store.put.run(f"key_{i}", i)
+    store.delete.run("key_0")
+    assert store.get.run("key_1") == 1
+    assert store.size.run() == num_puts - 1
+
+    latest = get_latest_output("kv", get_global_storage())
+    assert isinstance(latest, virtual_actor_state.StateDeltaCheckpoint)
+    # Only the changes were checkpointed.
+    assert latest.delta.removed == []
+    assert latest.delta.nested["items"].removed == ["key_0"]
+    assert latest.depth < virtual_actor_state.STATE_SNAPSHOT_INTERVAL
+
+    # The state can be reconstructed from the checkpoints alone.
+    monkeypatch.setattr(virtual_actor_state, "_get_cached_state",
+                        lambda *args: None)
+    state = virtual_actor_state.load_latest_state("kv")
+    assert state["num_puts"] == num_puts
+    assert state["items"] == {f"key_{i}": i for i in range(1, num_puts)}
+
+
+def test_latest_state_cached(workflow_start_regular, monkeypatch):
+    store = KeyValueStore.get_or_create("kv")
+    store.put.run("key", 1)
+
+    # The committed state is cached, so its checkpoint isn't loaded.
+    def _fail(*args, **kwargs):
+        raise AssertionError("The checkpoint should not be loaded.")
+
+    monkeypatch.setattr(virtual_actor_state.WorkflowStorage,
+                        "load_step_output", _fail)
+    state = virtual_actor_state.load_latest_state("kv")
+    assert state == {"items": {"key": 1}, "num_puts": 1}
+
+
+def test_uncommitted_state_not_used(workflow_start_regular):
+    store = KeyValueStore.get_or_create("kv")
+    store.put.run("key", "committed")
+
+    # A step caches its state, but fails before committing it.
+    uncommitted = {"items": {"key": "uncommitted"}, "num_puts": 2}
+    ray.get(
+        get_management_actor("kv").update_actor_state.remote(
+            "kv", "uncommitted_step", [
+                ray.put(uncommitted),
+                ray.put(virtual_actor_state.fingerprint(uncommitted))
+            ]))
+    assert store.get.run("key") == "committed"
+    store.put.run("other", 1)
+    assert store.get.run("key") == "committed"
+    assert store.size.run() == 2
+
+
+if __name__ == "__main__":
+    import sys
+    sys.exit(pytest.main(["-v", __file__]))
@@ -3,6 +3,7 @@ import time
 import pytest
 import ray
 from ray import workflow
+from ray.workflow import common, storage, workflow_access, workflow_storage
 from filelock import FileLock
 
 
@@ -146,6 +147,85 @@ def test_actor_manager(workflow_start_regular, tmp_path):
     assert ray.get(v) == 1
 
 
+def test_sharded_workflow_manager(workflow_start_regular):
+    @workflow.step
+    def identity(x):
+        return x
+
+    managers = workflow_access.get_all_management_actors()
+    assert len(managers) == common.NUM_MANAGEMENT_ACTOR_SHARDS
+    workflow_ids = [f"sharded_{i}" for i in range(20)]
+    assert len({workflow_access._shard_index(w)
+                for w in workflow_ids}) == len(managers)
+
+    outputs = [
+        identity.step(i).run_async(workflow_id=w)
+        for i, w in enumerate(workflow_ids)
+    ]
+    assert ray.get(outputs) == list(range(20))
+    assert sorted(workflow.list_all()) == sorted(
+        (w, workflow.SUCCESSFUL) for w in workflow_ids)
+
+
+def test_step_status_out_of_order(workflow_start_regular):
+    actor = workflow_access.WorkflowManagementActor.remote(
+        storage.get_global_storage())
+    running = common.WorkflowStatus.RUNNING
+    successful = common.WorkflowStatus.SUCCESSFUL
+
+    ray.get(actor.update_step_status.remote("wf", "a", running, []))
+    # "b" finishes before the update marking it as running arrives.
+    ray.get(actor.update_step_status.remote("wf", "b", successful, []))
+    assert ray.get(actor.list_running_workflow.remote()) == ["wf"]
+    ray.get(
+        actor.update_step_status_batch.remote("wf", [("b", running, []),
+                                                     ("a", successful, [])]))
+    assert ray.get(actor.list_running_workflow.remote()) == []
+    wf_storage = workflow_storage.get_workflow_storage("wf")
+    assert wf_storage.load_workflow_meta().status == successful
+
+
+def test_step_finished_before_batch(workflow_start_regular):
+    actor = workflow_access.WorkflowManagementActor.remote(
+        storage.get_global_storage())
+    running = common.WorkflowStatus.RUNNING
+    successful = common.WorkflowStatus.SUCCESSFUL
+
+    # "a" finishes before the batch registering "a" and "b" arrives.
+    ray.get(actor.update_step_status.remote("wf", "a", successful, []))
+    ray.get(
+        actor.update_step_status_batch.remote("wf", [("a", running, []),
+                                                     ("b", running, [])]))
+    # "b" is still running, so the workflow is not done.
+    assert ray.get(actor.list_running_workflow.remote()) == ["wf"]
+    wf_storage = workflow_storage.get_workflow_storage("wf")
+    assert wf_storage.load_workflow_meta() is None
+
+    ray.get(actor.update_step_status.remote("wf", "b", successful, []))
+    assert ray.get(actor.list_running_workflow.remote()) == []
+    assert wf_storage.load_workflow_meta().status == successful
+
+
+
+def test_step_status_after_failure(workflow_start_regular):
+    actor = workflow_access.WorkflowManagementActor.remote(
+        storage.get_global_storage())
+    running = common.WorkflowStatus.RUNNING
+    failed = common.WorkflowStatus.FAILED
+
+    ray.get(actor.update_step_status.remote("wf", "a", running, []))
+    ray.get(actor.update_step_status.remote("wf", "a", failed, []))
+    assert ray.get(actor.list_running_workflow.remote()) == []
+
+    # Updates buffered while the workflow failed arrive afterwards.
+    ray.get(
+        actor.update_step_status_batch.remote("wf", [("b", running, []),
+                                                     ("c", running, [])]))
+    assert ray.get(actor.list_running_workflow.remote()) == []
+    wf_storage = workflow_storage.get_workflow_storage("wf")
+    assert wf_storage.load_workflow_meta().status == failed
+
+
 if __name__ == "__main__":
     import sys
     sys.exit(pytest.main(["-v", __file__]))
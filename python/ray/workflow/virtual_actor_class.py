@@ -14,6 +14,7 @@ from ray._private import signature
 from ray.workflow.common import (slugify, WorkflowData, Workflow, WorkflowRef,
                                  StepType, WorkflowStepRuntimeOptions)
 from ray.workflow import serialization_context
+from ray.workflow import virtual_actor_state
 from ray.workflow.storage import Storage, get_global_storage
 from ray.workflow.workflow_storage import WorkflowStorage
 from ray.workflow.recovery import get_latest_output
@@ -171,6 +172,20 @@ def __setstate(instance, v):
         instance.__dict__ = json.loads(v)
 
 
+def _get_incremental_state(instance):
+    # The state of incremental actors is kept as a dict, so that the changes
+    # made to it can be checkpointed entry by entry.
+    if hasattr(instance, "__getstate__"):
+        return instance.__getstate__()
+    return dict(instance.__dict__)
+
+
+def _set_incremental_state(instance, state):
+    if hasattr(instance, "__setstate__"):
+        return instance.__setstate__(state)
+    instance.__dict__ = state
+
+
 class _VirtualActorMethodHelper:
     """This is a helper class for managing options and creating workflow steps
     from raw class methods."""
@@ -287,6 +302,8 @@ class VirtualActorMetadata:
                                            is_function_or_method)
 
         self.cls = original_class
+        self.incremental = getattr(original_class,
+                                   "__virtual_actor_incremental__", False)
         self.module = original_class.__module__
         self.name = original_class.__name__
         self.qualname = original_class.__qualname__
@@ -445,19 +462,27 @@ class VirtualActorClass(VirtualActorClassBase):
 
 
 def _wrap_readonly_actor_method(actor_id: str, cls: type, method_name: str):
+    incremental = getattr(cls, "__virtual_actor_incremental__", False)
+
     # generate better step names
     @functools.wraps(getattr(cls, method_name))
     def _readonly_actor_method(*args, **kwargs):
         storage = get_global_storage()
         instance = cls.__new__(cls)
         try:
-            state = get_latest_output(actor_id, storage)
+            if incremental:
+                state = virtual_actor_state.load_latest_state(actor_id)
+            else:
+                state = get_latest_output(actor_id, storage)
         except Exception as e:
             raise VirtualActorNotInitializedError(
                 f"Virtual actor '{actor_id}' has not been initialized. "
                 "We cannot get the latest state for the "
                 "readonly virtual actor.") from e
-        __setstate(instance, state)
+        if incremental:
+            _set_incremental_state(instance, state)
+        else:
+            __setstate(instance, state)
         method = getattr(instance, method_name)
         return method(*args, **kwargs)
 
@@ -465,6 +490,8 @@ def _wrap_readonly_actor_method(actor_id: str, cls: type, method_name: str):
 
 
 def _wrap_actor_method(cls: type, method_name: str):
+    incremental = getattr(cls, "__virtual_actor_incremental__", False)
+
     @ray.workflow.step
     def deref(*args):
         return args
@@ -472,17 +499,29 @@ def _wrap_actor_method(cls: type, method_name: str):
     @functools.wraps(getattr(cls, method_name))
     def _actor_method(state, *args, **kwargs):
         instance = cls.__new__(cls)
-        if method_name != "__init__":
+        if incremental:
+            # "state" is the checkpoint written by the previous step.
+            base, base_fingerprint = state, None
+            if method_name != "__init__":
+                loaded, base_fingerprint = virtual_actor_state.load_state(
+                    workflow_context.get_current_workflow_id(), base)
+                _set_incremental_state(instance, loaded)
+        elif method_name != "__init__":
             __setstate(instance, state)
         method = getattr(instance, method_name)
         output = method(*args, **kwargs)
+        if incremental:
+            new_state = virtual_actor_state.save_state(
+                _get_incremental_state(instance), base, base_fingerprint)
+        else:
+            new_state = __getstate(instance)
         if isinstance(output, Workflow):
             if output.data.step_options.step_type == StepType.FUNCTION:
-                next_step = deref.step(__getstate(instance), output)
+                next_step = deref.step(new_state, output)
                 next_step.data.step_options.step_type = StepType.ACTOR_METHOD
                 return next_step, None
-            return __getstate(instance), output
-        return __getstate(instance), output
+            return new_state, output
+        return new_state, output
 
     return _actor_method
 
@@ -501,7 +540,7 @@ class VirtualActor:
         workflow_storage.save_actor_class_body(self._metadata.cls)
         method_helper = self._metadata.methods["__init__"]
         ref = self._actor_method_call(method_helper, args, kwargs)
-        workflow_manager = get_or_create_management_actor()
+        workflow_manager = get_or_create_management_actor(self._actor_id)
         # keep the ref in a list to prevent dereference
         ray.get(workflow_manager.init_actor.remote(self._actor_id, [ref]))
 
@@ -514,7 +553,7 @@ class VirtualActor:
         """Return a future. If 'ray.get()' runs successfully, then the actor
         is fully initialized."""
         # TODO(suquark): should ray.get(xxx.ready()) always be true?
-        workflow_manager = get_or_create_management_actor()
+        workflow_manager = get_or_create_management_actor(self._actor_id)
         return ray.get(workflow_manager.actor_ready.remote(self._actor_id))
 
     def __getattr__(self, method_name):
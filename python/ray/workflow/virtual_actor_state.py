@@ -0,0 +1,282 @@
+"""
+Incremental state persistence for virtual actors.
+
+By default, every method call of a virtual actor checkpoints the full state
+of the actor. Actors decorated with "@workflow.virtual_actor.incremental"
+checkpoint only the changes to their state instead. Nested dicts in the
+state are compared key by key, so adding an entry to a large dict only
+writes the entry. Every STATE_SNAPSHOT_INTERVAL calls, the full state is
+checkpointed again, which bounds the number of checkpoints that have to be
+loaded to reconstruct the state.
+
+The changes are found by comparing the state against its fingerprint from
+before the method call. Computing the changes also fingerprints the new
+state, so every value is serialized once per call.
+
+The latest state of an actor and its fingerprint are also kept in the
+object store and registered with the workflow management actor, together
+with the step which wrote them. The cached state is only used if that step
+wrote the latest committed checkpoint, so readonly methods and the next
+method call usually don't need to load checkpoints at all, while a step
+which failed or is retried after caching its state never leaks it.
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import ray
+from ray import cloudpickle
+from ray.workflow import workflow_context
+from ray.workflow.common import StepID
+from ray.workflow.storage import get_global_storage
+from ray.workflow.workflow_access import get_management_actor
+from ray.workflow.workflow_storage import WorkflowStorage
+
+logger = logging.getLogger(__name__)
+
+# The maximum number of deltas checkpointed after a full snapshot of the
+# state.
+STATE_SNAPSHOT_INTERVAL = 16
+
+# The fingerprint of a state has the same structure as the state, but every
+# value which is not a dict is replaced by the digest of its serialization.
+Fingerprint = Union[bytes, Dict[Any, "Fingerprint"]]
+
+
+@dataclass
+class StateDelta:
+    """The changes to a dict."""
+    # New or replaced entries.
+    updated: Dict[Any, Any] = field(default_factory=dict)
+    # Changes to entries which are dicts themselves.
+    nested: Dict[Any, "StateDelta"] = field(default_factory=dict)
+    removed: List[Any] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.updated or self.nested or self.removed)
+
+
+@dataclass
+class StateSnapshot:
+    """A checkpoint of the full state, written by a step."""
+    step_id: StepID
+    state: Any
+
+
+@dataclass
+class StateDeltaCheckpoint:
+    """A checkpoint of the changes a step made to the state written by the
+    base step."""
+    step_id: StepID
+    base_step_id: StepID
+    # The number of deltas since the last snapshot, including this one.
+    depth: int
+    delta: StateDelta
+
+
+StateCheckpoint = Union[StateSnapshot, StateDeltaCheckpoint]
+
+
+def _digest(value: Any) -> bytes:
+    return hashlib.sha1(cloudpickle.dumps(value)).digest()
+
+
+def fingerprint(state: Any) -> Fingerprint:
+    """Fingerprint the state, so that the changes made to it can be found
+    even if it is modified in place."""
+    if isinstance(state, dict):
+        return {key: fingerprint(value) for key, value in state.items()}
+    return _digest(state)
+
+
+def diff(old: Fingerprint,
+         new: Any) -> Tuple[Optional[StateDelta], Fingerprint]:
+    """Compute the changes between the fingerprinted state and the new
+    state, and the fingerprint of the new state. The changes are None if the
+    new state can't be expressed as a delta."""
+    if not isinstance(old, dict) or not isinstance(new, dict):
+        return None, fingerprint(new)
+    delta = StateDelta(removed=[key for key in old if key not in new])
+    new_fingerprint = {}
+    for key, value in new.items():
+        if key not in old:
+            delta.updated[key] = value
+            new_fingerprint[key] = fingerprint(value)
+            continue
+        nested, new_fingerprint[key] = diff(old[key], value)
+        if nested is not None:
+            if nested:
+                delta.nested[key] = nested
+        elif (isinstance(old[key], dict)
+              or old[key] != new_fingerprint[key]):
+            delta.updated[key] = value
+    return delta, new_fingerprint
+
+
+def apply(state: Dict[Any, Any], delta: StateDelta) -> Dict[Any, Any]:
+    """Apply the changes to the state in place."""
+    for key in delta.removed:
+        state.pop(key, None)
+    state.update(delta.updated)
+    for key, nested in delta.nested.items():
+        apply(state[key], nested)
+    return state
+
+
+def _find_output_step(ws: WorkflowStorage, actor_id: str,
+                      step_id: StepID) -> StepID:
+    """Find the step which wrote the output of the step."""
+    while True:
+        result = ws.inspect_step(step_id)
+        if result.output_object_valid:
+            return step_id
+        if not isinstance(result.output_step_id, str):
+            raise ValueError(f"The state written by step {step_id} of "
+                             f"virtual actor '{actor_id}' does not exist.")
+        step_id = result.output_step_id
+
+
+def _load_checkpoint(actor_id: str, step_id: StepID) -> StateCheckpoint:
+    ws = WorkflowStorage(actor_id, get_global_storage())
+    return ws.load_step_output(_find_output_step(ws, actor_id, step_id))
+
+
+def _get_cached_state(actor_id: str, step_id: StepID,
+                      with_fingerprint: bool = False
+                      ) -> Optional[Tuple[Any, Optional[Fingerprint]]]:
+    """Get the latest state of the actor from the object store.
+
+    Args:
+        actor_id: The ID of the virtual actor.
+        step_id: The step which wrote the checkpoint of the state. The cached
+            state is only returned if it was written by the same step.
+        with_fingerprint: Whether to also get the fingerprint of the state.
+
+    Returns:
+        The state and its fingerprint (None unless requested), or None if
+        the state is not cached.
+    """
+    try:
+        cached = ray.get(
+            get_management_actor(actor_id).get_actor_state.remote(actor_id))
+        if cached is None:
+            return None
+        cached_step_id, (state_ref, fingerprint_ref) = cached
+        if cached_step_id != step_id:
+            return None
+        if with_fingerprint:
+            return tuple(ray.get([state_ref, fingerprint_ref]))
+        return ray.get(state_ref), None
+    except Exception:
+        # The worker owning the state may have exited.
+        logger.debug(f"Failed to get the cached state of virtual actor "
+                     f"'{actor_id}'.")
+        return None
+
+
+def _load_state(actor_id: str,
+                checkpoint: Any,
+                with_fingerprint: bool,
+                use_cache: bool = True
+                ) -> Tuple[Any, Optional[Fingerprint]]:
+    if not isinstance(checkpoint, (StateSnapshot, StateDeltaCheckpoint)):
+        # A full state, written before the actor was incremental.
+        return checkpoint, None
+    # Snapshots contain the state, only its fingerprint may be cached.
+    if use_cache and (with_fingerprint
+                      or isinstance(checkpoint, StateDeltaCheckpoint)):
+        cached = _get_cached_state(actor_id, checkpoint.step_id,
+                                   with_fingerprint)
+        if cached is not None:
+            return cached
+
+    deltas = []
+    while isinstance(checkpoint, StateDeltaCheckpoint):
+        deltas.append(checkpoint.delta)
+        checkpoint = _load_checkpoint(actor_id, checkpoint.base_step_id)
+    state = checkpoint.state
+    for delta in reversed(deltas):
+        state = apply(state, delta)
+    return state, fingerprint(state) if with_fingerprint else None
+
+
+def load_state(actor_id: str,
+               checkpoint: Any) -> Tuple[Any, Optional[Fingerprint]]:
+    """Load the state from the checkpoint written by the previous step.
+
+    Returns:
+        The state and its fingerprint. The fingerprint is None if the
+        checkpoint is a full state written before the actor was incremental.
+    """
+    return _load_state(actor_id, checkpoint, with_fingerprint=True)
+
+
+def load_latest_state(actor_id: str) -> Any:
+    """Load the state from the latest committed checkpoint of the actor.
+
+    The checkpoint is not loaded if the cached state was written by the step
+    which wrote it.
+    """
+    ws = WorkflowStorage(actor_id, get_global_storage())
+    step_id = _find_output_step(ws, actor_id, ws.get_latest_progress())
+    cached = _get_cached_state(actor_id, step_id)
+    if cached is not None:
+        return cached[0]
+    checkpoint = ws.load_step_output(step_id)
+    # The state cached by the step which wrote the checkpoint was already
+    # looked up, unless the output of the step was written by another one.
+    state, _ = _load_state(
+        actor_id,
+        checkpoint,
+        with_fingerprint=False,
+        use_cache=getattr(checkpoint, "step_id", step_id) != step_id)
+    return state
+
+
+def save_state(state: Any, base: Any,
+               base_fingerprint: Optional[Fingerprint]) -> StateCheckpoint:
+    """Create the checkpoint of the state written by the current step, and
+    cache the state in the object store.
+
+    Args:
+        state: The new state.
+        base: The checkpoint the state was loaded from, or None if the actor
+            is being created.
+        base_fingerprint: The fingerprint of the state before the step
+            changed it, or None if it's unknown.
+
+    Returns:
+        The checkpoint to persist as the output of the step.
+    """
+    actor_id = workflow_context.get_current_workflow_id()
+    step_id = workflow_context.get_current_step_id()
+
+    checkpoint = None
+    new_fingerprint = None
+    if (isinstance(base, (StateSnapshot, StateDeltaCheckpoint))
+            and base_fingerprint is not None):
+        depth = getattr(base, "depth", 0) + 1
+        delta, new_fingerprint = diff(base_fingerprint, state)
+        if delta is not None and depth <= STATE_SNAPSHOT_INTERVAL:
+            checkpoint = StateDeltaCheckpoint(
+                step_id=step_id,
+                base_step_id=base.step_id,
+                depth=depth,
+                delta=delta)
+    if checkpoint is None:
+        checkpoint = StateSnapshot(step_id=step_id, state=state)
+    if new_fingerprint is None:
+        new_fingerprint = fingerprint(state)
+
+    try:
+        ray.get(
+            get_management_actor(actor_id).update_actor_state.remote(
+                actor_id, step_id,
+                [ray.put(state), ray.put(new_fingerprint)]))
+    except Exception:
+        # The state can always be loaded from the checkpoints.
+        logger.warning(f"Failed to cache the state of virtual actor "
+                       f"'{actor_id}'.")
+    return checkpoint
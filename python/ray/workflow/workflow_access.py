@@ -1,11 +1,13 @@
 import logging
 import time
-from typing import Any, Dict, List, Tuple, Optional, TYPE_CHECKING
+import zlib
+from typing import Any, Dict, List, Set, Tuple, Optional, TYPE_CHECKING
 
 from dataclasses import dataclass
 import ray
 from ray.workflow import common
 from ray.workflow import recovery
+from ray.workflow import status_index
 from ray.workflow import storage
 from ray.workflow import workflow_storage
 from ray.util.annotations import PublicAPI
@@ -66,7 +68,7 @@ def _resolve_workflow_output(workflow_id: Optional[str],
     """
     if workflow_id is not None:
         try:
-            actor = get_management_actor()
+            actor = get_management_actor(workflow_id)
         except ValueError as e:
             raise ValueError(
                 "Failed to connect to the workflow management actor.") from e
@@ -114,14 +116,21 @@ class LatestWorkflowOutput:
     step_id: "StepID"
 
 
-# TODO(suquark): we may use an actor pool in the future if too much
-# concurrent workflow access blocks the actor.
 @ray.remote(num_cpus=0)
 class WorkflowManagementActor:
-    """Keep the ownership and manage the workflow output."""
+    """Keep the ownership and manage the workflow output.
 
-    def __init__(self, store: "storage.Storage"):
+    The actor is sharded, each shard manages the workflows whose ID hashes
+    to it. See "get_management_actor()".
+    """
+
+    def __init__(self,
+                 store: "storage.Storage",
+                 shard_index: int = 0,
+                 num_shards: int = 1):
         self._store = store
+        self._shard_index = shard_index
+        self._num_shards = num_shards
         self._workflow_outputs: Dict[str, LatestWorkflowOutput] = {}
         # Cache step output. It is used for step output lookup of
         # "WorkflowRef". The dictionary entry is removed when the status of
@@ -129,12 +138,63 @@ class WorkflowManagementActor:
         self._step_output_cache: Dict[Tuple[str, str],
                                       LatestWorkflowOutput] = {}
         self._actor_initialized: Dict[str, ray.ObjectRef] = {}
+        # The latest state of incremental virtual actors, and the step that
+        # wrote it. The ref is wrapped in a list so that it is not resolved.
+        self._actor_states: Dict[str, Tuple[str, List[ray.ObjectRef]]] = {}
         self._step_status: Dict[str, Dict[str, common.WorkflowStatus]] = {}
+        # Steps that finished before the update marking them as running
+        # arrived. Step executors batch their updates, so they can arrive
+        # out of order.
+        self._steps_finished_early: Dict[str, Set[str]] = {}
+        # Workflows that failed or were canceled since they were last run.
+        # Updates of their steps may still be buffered, and are dropped
+        # once they arrive.
+        self._stopped_workflows: Set[str] = set()
+        # Workflow status changes are appended to the status index. The
+        # index only allows a single compacting process, so the first shard
+        # compacts it, and the other shards ask it to. Every shard checks
+        # the index after its share of the updates that make the log long
+        # enough to be compacted.
+        self._num_status_updates = 0
+        self._compaction_interval = max(
+            1, status_index.COMPACTION_THRESHOLD // self._num_shards)
+        if self._shard_index == 0:
+            workflow_storage.WorkflowStorage(
+                "", self._store).ensure_status_index()
+
+    def _save_workflow_meta(self, wf_store: workflow_storage.WorkflowStorage,
+                            status: common.WorkflowStatus) -> None:
+        wf_store.save_workflow_meta(common.WorkflowMetaData(status))
+        self._num_status_updates += 1
+        if self._num_status_updates < self._compaction_interval:
+            return
+        self._num_status_updates = 0
+        if self._shard_index == 0:
+            self.compact_status_index()
+        else:
+            get_management_actor().compact_status_index.remote()
+
+    def compact_status_index(self) -> bool:
+        """Compact the status index if its log has grown long enough.
+
+        Only the first shard compacts the index.
+
+        Returns:
+            Whether the index was compacted.
+        """
+        assert self._shard_index == 0
+        return workflow_storage.WorkflowStorage(
+            "", self._store).compact_status_index(
+                status_index.COMPACTION_THRESHOLD)
 
     def get_storage_url(self) -> str:
         """Get hte storage URL."""
         return self._store.storage_url
 
+    def get_num_shards(self) -> int:
+        """Get the number of shards of the management actor."""
+        return self._num_shards
+
     def get_cached_step_output(self, workflow_id: str,
                                step_id: "StepID") -> ray.ObjectRef:
         """Get the cached result of a step.
@@ -169,6 +229,7 @@ class WorkflowManagementActor:
         if workflow_id in self._workflow_outputs and not ignore_existing:
             raise RuntimeError(f"The output of workflow[id={workflow_id}] "
                                "already exists.")
+        self._stopped_workflows.discard(workflow_id)
         wf_store = workflow_storage.WorkflowStorage(workflow_id, self._store)
         workflow_prerun_metadata = {"start_time": time.time()}
         wf_store.save_workflow_prerun_metadata(workflow_prerun_metadata)
@@ -186,8 +247,7 @@ class WorkflowManagementActor:
                     f"{result.persisted_output}")
         self._step_output_cache[(workflow_id, step_id)] = latest_output
 
-        wf_store.save_workflow_meta(
-            common.WorkflowMetaData(common.WorkflowStatus.RUNNING))
+        self._save_workflow_meta(wf_store, common.WorkflowStatus.RUNNING)
 
         if workflow_id not in self._step_status:
             self._step_status[workflow_id] = {}
@@ -205,42 +265,83 @@ class WorkflowManagementActor:
     def update_step_status(self, workflow_id: str, step_id: str,
                            status: common.WorkflowStatus,
                            outputs: List[ray.ObjectRef]):
+        self.update_step_status_batch(workflow_id,
+                                      [(step_id, status, outputs)])
+
+    def update_step_status_batch(
+            self, workflow_id: str,
+            updates: List[Tuple[str, common.WorkflowStatus,
+                                List[ray.ObjectRef]]]) -> None:
+        """Apply the step status updates of a workflow in order, then check
+        whether the workflow is done.
+
+        All updates are applied before the check, so that a workflow isn't
+        considered done while the batch still registers running steps.
+
+        Args:
+            workflow_id: The ID of the workflow.
+            updates: The step ID, status and outputs of every update.
+        """
         # Note: For virtual actor, we could add more steps even if
         # the workflow finishes.
 
-        self._step_status.setdefault(workflow_id, {})
-        if status == common.WorkflowStatus.SUCCESSFUL:
-            self._step_status[workflow_id].pop(step_id, None)
-        else:
-            self._step_status.setdefault(workflow_id, {})[step_id] = status
-        remaining = len(self._step_status[workflow_id])
-        if status != common.WorkflowStatus.RUNNING:
-            self._step_output_cache.pop((workflow_id, step_id), None)
+        if workflow_id in self._stopped_workflows:
+            for step_id, _, _ in updates:
+                self._step_output_cache.pop((workflow_id, step_id), None)
+            return
 
-        if status != common.WorkflowStatus.FAILED and remaining != 0:
+        step_status = self._step_status.setdefault(workflow_id, {})
+        finished_early = self._steps_finished_early.setdefault(
+            workflow_id, set())
+        # Whether a running step finished or failed with these updates.
+        step_finished = False
+        step_failed = False
+        for step_id, status, _ in updates:
+            if status != common.WorkflowStatus.RUNNING:
+                self._step_output_cache.pop((workflow_id, step_id), None)
+            if status == common.WorkflowStatus.SUCCESSFUL:
+                if step_status.pop(step_id, None) is None:
+                    # The update marking the step as running is still
+                    # buffered, it consumes this record once it arrives.
+                    finished_early.add(step_id)
+                else:
+                    step_finished = True
+            elif (status == common.WorkflowStatus.RUNNING
+                  and step_id in finished_early):
+                finished_early.remove(step_id)
+                step_finished = True
+            else:
+                step_status[step_id] = status
+                if status == common.WorkflowStatus.FAILED:
+                    step_failed = True
+
+        if not step_failed and (not step_finished or step_status
+                                or finished_early):
             return
 
         wf_store = workflow_storage.WorkflowStorage(workflow_id, self._store)
 
-        if status == common.WorkflowStatus.FAILED:
+        if step_failed:
             if workflow_id in self._workflow_outputs:
                 cancel_job(self._workflow_outputs.pop(workflow_id).output)
-            wf_store.save_workflow_meta(
-                common.WorkflowMetaData(common.WorkflowStatus.FAILED))
+            self._save_workflow_meta(wf_store, common.WorkflowStatus.FAILED)
             self._step_status.pop(workflow_id)
+            self._stopped_workflows.add(workflow_id)
         else:
-            wf_store.save_workflow_meta(
-                common.WorkflowMetaData(common.WorkflowStatus.SUCCESSFUL))
+            self._save_workflow_meta(wf_store,
+                                     common.WorkflowStatus.SUCCESSFUL)
             self._step_status.pop(workflow_id)
+        self._steps_finished_early.pop(workflow_id, None)
         workflow_postrun_metadata = {"end_time": time.time()}
         wf_store.save_workflow_postrun_metadata(workflow_postrun_metadata)
 
     def cancel_workflow(self, workflow_id: str) -> None:
         self._step_status.pop(workflow_id)
+        self._steps_finished_early.pop(workflow_id, None)
+        self._stopped_workflows.add(workflow_id)
         cancel_job(self._workflow_outputs.pop(workflow_id).output)
         wf_store = workflow_storage.WorkflowStorage(workflow_id, self._store)
-        wf_store.save_workflow_meta(
-            common.WorkflowMetaData(common.WorkflowStatus.CANCELED))
+        self._save_workflow_meta(wf_store, common.WorkflowStatus.CANCELED)
 
     def is_workflow_running(self, workflow_id: str) -> bool:
         return workflow_id in self._step_status and \
@@ -287,6 +388,23 @@ class WorkflowManagementActor:
                              "it has failed before initialization.")
         return self._actor_initialized[actor_id]
 
+    def update_actor_state(self, actor_id: str, step_id: "StepID",
+                           state: List[ray.ObjectRef]) -> None:
+        """Cache the latest state of an incremental virtual actor.
+
+        Args:
+            actor_id: The ID of a workflow virtual actor.
+            step_id: The step which wrote the state.
+            state: The refs of the state and its fingerprint.
+        """
+        self._actor_states[actor_id] = (step_id, state)
+
+    def get_actor_state(self, actor_id: str
+                        ) -> Optional[Tuple[str, List[ray.ObjectRef]]]:
+        """Get the cached state of an incremental virtual actor, and the
+        step which wrote it. Returns None if it is not cached."""
+        return self._actor_states.get(actor_id)
+
     def get_output(self, workflow_id: str,
                    name: Optional[str]) -> "ray.ObjectRef":
         """Get the output of a running workflow.
@@ -329,7 +447,7 @@ class WorkflowManagementActor:
                 # we already have the output
                 return wf_store.load_step_output(step_id)
             if isinstance(result.output_step_id, str):
-                actor = get_management_actor()
+                actor = get_management_actor(workflow_id)
                 return actor.get_output.remote(workflow_id,
                                                result.output_step_id)
             raise ValueError(f"Cannot load output from step id {step_id} "
@@ -364,8 +482,32 @@ class WorkflowManagementActor:
         self._workflow_outputs.pop(workflow_id, None)
 
 
+def _shard_name(shard_index: int) -> str:
+    # The first shard keeps the name of the unsharded actor.
+    if shard_index == 0:
+        return common.MANAGEMENT_ACTOR_NAME
+    return f"{common.MANAGEMENT_ACTOR_NAME}_{shard_index}"
+
+
+def _shard_index(workflow_id: Optional[str]) -> int:
+    if workflow_id is None:
+        return 0
+    # "hash()" of strings differs between processes.
+    return (zlib.crc32(workflow_id.encode()) %
+            common.NUM_MANAGEMENT_ACTOR_SHARDS)
+
+
+def _create_management_actor(store: "storage.Storage",
+                             shard_index: int) -> "ActorHandle":
+    return WorkflowManagementActor.options(
+        name=_shard_name(shard_index),
+        namespace=common.MANAGEMENT_ACTOR_NAMESPACE,
+        lifetime="detached").remote(store, shard_index,
+                                    common.NUM_MANAGEMENT_ACTOR_SHARDS)
+
+
 def init_management_actor() -> None:
-    """Initialize WorkflowManagementActor"""
+    """Initialize all shards of WorkflowManagementActor"""
     store = storage.get_global_storage()
     try:
         workflow_manager = get_management_actor()
@@ -374,31 +516,54 @@ def init_management_actor() -> None:
             raise RuntimeError("The workflow is using a storage "
                                f"({store.storage_url}) different from the "
                                f"workflow manager({storage_url}).")
+        num_shards = ray.get(workflow_manager.get_num_shards.remote())
+        if num_shards != common.NUM_MANAGEMENT_ACTOR_SHARDS:
+            raise RuntimeError(
+                "The workflow manager has a different number of shards "
+                f"({num_shards}) than configured for this driver "
+                f"({common.NUM_MANAGEMENT_ACTOR_SHARDS}).")
     except ValueError:
         logger.info("Initializing workflow manager...")
-        # the actor does not exist
-        actor = WorkflowManagementActor.options(
-            name=common.MANAGEMENT_ACTOR_NAME,
-            namespace=common.MANAGEMENT_ACTOR_NAMESPACE,
-            lifetime="detached").remote(store)
-        # No-op to ensure the actor is created before the driver exits.
-        ray.get(actor.get_storage_url.remote())
+        # the actors do not exist
+        actors = [
+            _create_management_actor(store, i)
+            for i in range(common.NUM_MANAGEMENT_ACTOR_SHARDS)
+        ]
+        # No-op to ensure the actors are created before the driver exits.
+        ray.get([actor.get_storage_url.remote() for actor in actors])
 
 
-def get_management_actor() -> "ActorHandle":
+def get_management_actor(workflow_id: Optional[str] = None) -> "ActorHandle":
+    """Get the shard of WorkflowManagementActor managing the workflow.
+
+    Args:
+        workflow_id: The ID of the workflow. The first shard is returned if
+            it is None.
+    """
     return ray.get_actor(
-        common.MANAGEMENT_ACTOR_NAME,
+        _shard_name(_shard_index(workflow_id)),
         namespace=common.MANAGEMENT_ACTOR_NAMESPACE)
 
 
-def get_or_create_management_actor() -> "ActorHandle":
-    """Get or create WorkflowManagementActor"""
+def get_all_management_actors() -> List["ActorHandle"]:
+    """Get all shards of WorkflowManagementActor."""
+    return [
+        ray.get_actor(
+            _shard_name(i), namespace=common.MANAGEMENT_ACTOR_NAMESPACE)
+        for i in range(common.NUM_MANAGEMENT_ACTOR_SHARDS)
+    ]
+
+
+def get_or_create_management_actor(
+        workflow_id: Optional[str] = None) -> "ActorHandle":
+    """Get or create the shard of WorkflowManagementActor managing the
+    workflow."""
     # TODO(suquark): We should not get the actor everytime. We also need to
     # resume the actor if it failed. Using a global variable to cache the
     # actor seems not enough to resume the actor, because there is no
     # aliveness detection for an actor.
     try:
-        workflow_manager = get_management_actor()
+        workflow_manager = get_management_actor(workflow_id)
     except ValueError:
         store = storage.get_global_storage()
         # the actor does not exist
@@ -406,8 +571,6 @@ def get_or_create_management_actor() -> "ActorHandle":
                        "the workflow manager exited unexpectedly. A new "
                        "workflow manager is being created with storage "
                        f"'{store}'.")
-        workflow_manager = WorkflowManagementActor.options(
-            name=common.MANAGEMENT_ACTOR_NAME,
-            namespace=common.MANAGEMENT_ACTOR_NAMESPACE,
-            lifetime="detached").remote(store)
+        workflow_manager = _create_management_actor(
+            store, _shard_index(workflow_id))
     return workflow_manager
@@ -9,7 +9,6 @@ from dataclasses import dataclass
 import logging
 
 import ray
-from ray import cloudpickle
 from ray._private import signature
 from ray.workflow import storage
 from ray.workflow.common import (
@@ -18,8 +17,10 @@ from ray.workflow.common import (
 from ray.workflow import workflow_context
 from ray.workflow import serialization
 from ray.workflow import serialization_context
+from ray.workflow import status_index
 from ray.workflow.storage import (DataLoadError, DataSaveError,
                                   KeyNotFoundError)
+from ray.workflow.storage import content_addressed
 from ray.types import ObjectRef
 
 logger = logging.getLogger(__name__)
@@ -100,13 +101,15 @@ class WorkflowStorage:
         Returns:
             Output of the workflow step.
         """
+        return asyncio_run(self._load_step_output(step_id))
 
+    async def _load_step_output(self, step_id: StepID) -> Any:
         tasks = [
             self._get(self._key_step_output(step_id), no_exception=True),
             self._get(self._key_step_exception(step_id), no_exception=True)
         ]
         ((output_ret, output_err), (exception_ret, exception_err)) = \
-            asyncio_run(asyncio.gather(*tasks))
+            await asyncio.gather(*tasks)
         # When we have output, always return output first
         if output_err is None:
             return output_ret
@@ -118,9 +121,15 @@ class WorkflowStorage:
         # In this case, there is no such step
         raise output_err
 
-    def save_step_output(self, step_id: StepID, ret: Union[Workflow, Any], *,
-                         exception: Optional[Exception],
-                         outer_most_step_id: StepID) -> None:
+    def save_step_output(
+            self,
+            step_id: StepID,
+            ret: Union[Workflow, Any],
+            *,
+            exception: Optional[Exception],
+            outer_most_step_id: StepID,
+            prerun_metadata: Optional[Dict[str, Any]] = None,
+            postrun_metadata: Optional[Dict[str, Any]] = None) -> None:
         """When a workflow step returns,
         1. If the returned object is a workflow, this means we are a nested
            workflow. We save the output metadata that points to the workflow.
@@ -132,8 +141,42 @@ class WorkflowStorage:
             ret: The returned object from a workflow step.
             exception: This step should throw exception.
             outer_most_step_id: See WorkflowStepContext.
+            prerun_metadata: If set, the pre-run metadata of the step is
+                saved together with the output.
+            postrun_metadata: If set, the post-run metadata of the step is
+                saved together with the output.
         """
+        asyncio_run(
+            self._save_step_output(
+                step_id,
+                ret,
+                exception=exception,
+                outer_most_step_id=outer_most_step_id,
+                prerun_metadata=prerun_metadata,
+                postrun_metadata=postrun_metadata))
+
+    async def _save_step_output(
+            self,
+            step_id: StepID,
+            ret: Union[Workflow, Any],
+            *,
+            exception: Optional[Exception],
+            outer_most_step_id: StepID,
+            prerun_metadata: Optional[Dict[str, Any]] = None,
+            postrun_metadata: Optional[Dict[str, Any]] = None) -> None:
+        # All writes of the step are independent, so they are issued at once
+        # instead of paying for a storage round trip each.
         tasks = []
+        if prerun_metadata is not None:
+            tasks.append(
+                self._put(
+                    self._key_step_prerun_metadata(step_id), prerun_metadata,
+                    True))
+        if postrun_metadata is not None:
+            tasks.append(
+                self._put(
+                    self._key_step_postrun_metadata(step_id),
+                    postrun_metadata, True))
         if isinstance(ret, Workflow):
             # This workflow step returns a nested workflow.
             assert step_id != ret.step_id
@@ -166,7 +209,7 @@ class WorkflowStorage:
                 # tasks.append(
                 #     self._put(self._key_step_exception(step_id), exception))
 
-        asyncio_run(asyncio.gather(*tasks))
+        await asyncio.gather(*tasks)
 
     def load_step_func_body(self, step_id: StepID) -> Callable:
         """Load the function body of the workflow step.
@@ -371,36 +414,28 @@ class WorkflowStorage:
         """
         asyncio_run(self._put(self._key_class_body(), cls))
 
-    def save_step_prerun_metadata(self, step_id: StepID,
-                                  metadata: Dict[str, Any]):
-        """Save pre-run metadata of the current step.
-
-        Args:
-            step_id: ID of the workflow step.
-            metadata: pre-run metadata of the current step.
-
-        Raises:
-            DataSaveError: if we fail to save the pre-run metadata.
-        """
-
-        asyncio_run(
-            self._put(self._key_step_prerun_metadata(step_id), metadata, True))
-
-    def save_step_postrun_metadata(self, step_id: StepID,
-                                   metadata: Dict[str, Any]):
-        """Save post-run metadata of the current step.
+    def save_step_metadata(self, step_id: StepID,
+                           prerun_metadata: Dict[str, Any],
+                           postrun_metadata: Dict[str, Any]):
+        """Save both the pre-run and post-run metadata of the current step.
 
         Args:
             step_id: ID of the workflow step.
-            metadata: post-run metadata of the current step.
+            prerun_metadata: pre-run metadata of the current step.
+            postrun_metadata: post-run metadata of the current step.
 
         Raises:
-            DataSaveError: if we fail to save the post-run metadata.
+            DataSaveError: if we fail to save the metadata.
         """
 
         asyncio_run(
-            self._put(
-                self._key_step_postrun_metadata(step_id), metadata, True))
+            asyncio.gather(
+                self._put(
+                    self._key_step_prerun_metadata(step_id), prerun_metadata,
+                    True),
+                self._put(
+                    self._key_step_postrun_metadata(step_id),
+                    postrun_metadata, True)))
 
     def save_workflow_user_metadata(self, metadata: Dict[str, Any]):
         """Save user metadata of the current workflow.
@@ -528,10 +563,15 @@ class WorkflowStorage:
             DataSaveError: if we fail to save the class body.
         """
 
+        status = metadata.status
         metadata = {
-            "status": metadata.status.value,
+            "status": status.value,
         }
-        asyncio_run(self._put(self._key_workflow_metadata(), metadata, True))
+        index = status_index.WorkflowStatusIndex(self._storage)
+        asyncio_run(
+            asyncio.gather(
+                self._put(self._key_workflow_metadata(), metadata, True),
+                index.update(self._workflow_id, status)))
 
     def load_workflow_meta(self) -> Optional[WorkflowMetaData]:
         """Load the metadata of the current workflow.
@@ -548,9 +588,23 @@ class WorkflowStorage:
         except KeyNotFoundError:
             return None
 
-    async def _list_workflow(self) -> List[Tuple[str, WorkflowStatus]]:
+    async def _list_workflow(
+            self) -> Tuple[List[Tuple[str, WorkflowStatus]], int]:
+        index = status_index.WorkflowStatusIndex(self._storage)
+        loaded = await index.load()
+        if loaded is not None:
+            statuses, num_log_entries = loaded
+            return list(statuses.items()), num_log_entries
+        return await self._scan_workflows(), 0
+
+    async def _scan_workflows(self) -> List[Tuple[str, WorkflowStatus]]:
         prefix = self._storage.make_key("")
-        workflow_ids = await self._storage.scan_prefix(prefix)
+        workflow_ids = [
+            workflow_id
+            for workflow_id in await self._storage.scan_prefix(prefix)
+            if workflow_id not in (content_addressed.CONTENT_ADDRESSED_DIR,
+                                   status_index.STATUS_INDEX_DIR)
+        ]
         metadata = await asyncio.gather(*[
             self._get([workflow_id, WORKFLOW_META], True)
             for workflow_id in workflow_ids
@@ -558,9 +612,43 @@ class WorkflowStorage:
         return [(wid, WorkflowStatus(meta["status"]) if meta else None)
                 for (wid, meta) in zip(workflow_ids, metadata)]
 
-    def list_workflow(self) -> List[Tuple[str, WorkflowStatus]]:
+    def list_workflow(self) -> Tuple[List[Tuple[str, WorkflowStatus]], int]:
+        """List the status of all workflows.
+
+        The status index is used if it has been built, otherwise the
+        metadata of every workflow is loaded.
+
+        Returns:
+            The ID and status of every workflow, and the number of updates
+            of the status index that haven't been compacted yet.
+        """
         return asyncio_run(self._list_workflow())
 
+    def ensure_status_index(self) -> None:
+        """Build the status index from a full scan of the storage, if it
+        hasn't been built yet."""
+
+        async def _ensure_status_index():
+            index = status_index.WorkflowStatusIndex(self._storage)
+            if not await index.exists():
+                await index.rebuild(await self._scan_workflows())
+
+        asyncio_run(_ensure_status_index())
+
+    def compact_status_index(self, min_log_entries: int = 0) -> bool:
+        """Merge the updates of the status index into its snapshot.
+
+        Args:
+            min_log_entries: Skip the compaction if there are fewer updates
+                than this.
+
+        Returns:
+            Whether the updates were merged.
+        """
+        return asyncio_run(
+            status_index.WorkflowStatusIndex(self._storage).compact(
+                min_log_entries))
+
     def advance_progress(self, finished_step_id: "StepID") -> None:
         """Save the latest progress of a workflow. This is used by a
         virtual actor.
@@ -594,12 +682,17 @@ class WorkflowStorage:
 
         scan = []
         scan_future = self._storage.scan_prefix(prefix)
+        release_future = content_addressed.ContentAddressedStore(
+            self._storage).release_workflow(self._workflow_id)
         delete_future = self._storage.delete_prefix(prefix)
 
         try:
             # TODO (Alex): There's a race condition here if someone tries to
             # start the workflow between thesea ops.
             scan = asyncio_run(scan_future)
+            # Drop the references to shared objects before deleting the
+            # workflow, which holds the list of them.
+            asyncio_run(release_future)
             asyncio_run(delete_future)
         except FileNotFoundError:
             # TODO (Alex): Different file systems seem to have different
@@ -609,6 +702,9 @@ class WorkflowStorage:
 
         if not scan:
             raise WorkflowNotFoundError(self._workflow_id)
+        asyncio_run(
+            status_index.WorkflowStatusIndex(self._storage).update(
+                self._workflow_id, None))
 
     async def _put(self, paths: List[str], data: Any,
                    is_json: bool = False) -> str:
@@ -649,11 +745,11 @@ class WorkflowStorage:
         ret = None
         try:
             key = self._storage.make_key(*paths)
-            unmarshaled = await self._storage.get(key, is_json=is_json)
             if is_json:
-                ret = unmarshaled
+                ret = await self._storage.get(key, is_json=True)
             else:
-                ret = cloudpickle.loads(unmarshaled)
+                ret = await serialization.load_from_storage(
+                    key, self._storage)
         except KeyNotFoundError as e:
             err = e
         except Exception as e:
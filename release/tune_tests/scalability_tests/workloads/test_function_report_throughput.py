@@ -0,0 +1,103 @@
+"""Training throughput of functions reporting very often (1 node, 16 trials)
+
+In this run, we will start 16 trials whose training function does almost
+no work between two calls to ``tune.report()``. We run the experiment once
+with the default blocking reports and once with the results buffered on
+the workers (``TUNE_FUNCTION_RESULT_BUFFER_LENGTH``), and measure the
+number of training iterations per second of the training functions.
+
+Cluster: cluster_1x16.yaml
+
+Test owner: krfricke
+
+Acceptance criteria: Buffering the results should train at least twice as
+fast as blocking reports.
+"""
+import json
+import os
+import time
+
+import ray
+from ray import tune
+
+
+def train(config):
+    start_time = time.monotonic()
+    for i in range(config["num_iters"]):
+        # A very short training iteration.
+        time.sleep(config["sleep_time"])
+        tune.report(
+            iterations_per_second=(i + 1) / (time.monotonic() - start_time))
+
+
+def run(result_buffer_length: int, num_samples: int, num_iters: int,
+        sleep_time: float) -> float:
+    ray.init(
+        address="auto",
+        runtime_env={
+            "env_vars": {
+                "TUNE_FUNCTION_RESULT_BUFFER_LENGTH": str(
+                    result_buffer_length)
+            }
+        })
+    analysis = tune.run(
+        train,
+        config={
+            "num_iters": num_iters,
+            "sleep_time": sleep_time,
+        },
+        num_samples=num_samples,
+        resources_per_trial={"cpu": 1},
+        verbose=1)
+    ray.shutdown()
+    return sum(trial.last_result["iterations_per_second"]
+               for trial in analysis.trials) / num_samples
+
+
+def main():
+    os.environ["TUNE_DISABLE_AUTO_CALLBACK_LOGGERS"] = "1"  # Tweak
+
+    num_samples = 16
+    num_iters = 20000
+    sleep_time = 0.0001
+
+    min_speedup = 2.
+
+    start_time = time.monotonic()
+    blocking = run(0, num_samples, num_iters, sleep_time)
+    buffered = run(1000, num_samples, num_iters, sleep_time)
+    time_taken = time.monotonic() - start_time
+    speedup = buffered / blocking
+
+    result = {
+        "time_taken": time_taken,
+        "blocking_iterations_per_second": blocking,
+        "buffered_iterations_per_second": buffered,
+        "speedup": speedup,
+        "last_update": time.time()
+    }
+
+    test_output_json = os.environ.get("TEST_OUTPUT_JSON",
+                                      "/tmp/tune_test.json")
+    with open(test_output_json, "wt") as f:
+        json.dump(result, f)
+
+    name = "function report throughput"
+    if speedup < min_speedup:
+        print(f"The {name} test trained {buffered:.2f} iterations per "
+              f"second with buffered results and {blocking:.2f} with "
+              f"blocking reports, a speedup of {speedup:.2f}, but should "
+              f"have been at least {min_speedup:.2f}. Test failed. \n\n"
+              f"--- FAILED: {name.upper()} ::: "
+              f"{speedup:.2f} < {min_speedup:.2f} ---")
+    else:
+        print(f"The {name} test trained {buffered:.2f} iterations per "
+              f"second with buffered results and {blocking:.2f} with "
+              f"blocking reports, a speedup of {speedup:.2f}. Test "
+              f"successful. \n\n"
+              f"--- PASSED: {name.upper()} ::: "
+              f"{speedup:.2f} >= {min_speedup:.2f} ---")
+
+
+if __name__ == "__main__":
+    main()
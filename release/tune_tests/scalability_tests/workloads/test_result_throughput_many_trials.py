@@ -0,0 +1,113 @@
+"""Result throughput with many concurrent trials (1 node, 2k trials)
+
+In this run, we will start 2000 trials concurrently, each using a small
+fraction of a CPU. The trainable does no work and reports a result a few
+times per second, so the cluster is able to produce results faster than
+the driver can process them. We thus measure the number of results per
+second the Tune event loop processes.
+
+Cluster: cluster_1x96.yaml
+
+Test owner: krfricke
+
+Acceptance criteria: Should process more than 1000 results per second.
+"""
+import json
+import os
+import time
+
+import ray
+from ray import tune
+
+
+class MockTrainable(tune.Trainable):
+    def setup(self, config):
+        self._num_iters = config["num_iters"]
+        self._sleep_time = config["sleep_time"]
+
+    def step(self):
+        time.sleep(self._sleep_time)
+        return {
+            "score": self.iteration,
+            "done": self.iteration >= self._num_iters
+        }
+
+
+class ResultThroughputCallback(tune.callback.Callback):
+    def __init__(self):
+        self.num_results = 0
+        self.first_result_time = None
+        self.last_result_time = None
+
+    def on_trial_result(self, iteration, trials, trial, result, **info):
+        now = time.monotonic()
+        if self.first_result_time is None:
+            self.first_result_time = now
+        self.last_result_time = now
+        self.num_results += 1
+
+    def results_per_second(self):
+        if self.num_results < 2:
+            return 0.
+        return self.num_results / (
+            self.last_result_time - self.first_result_time)
+
+
+def main():
+    os.environ["TUNE_DISABLE_AUTO_CALLBACK_LOGGERS"] = "1"  # Tweak
+    os.environ["TUNE_GLOBAL_CHECKPOINT_S"] = "100"  # Tweak
+    # Schedule all trials at once.
+    os.environ["TUNE_MAX_PENDING_TRIALS_PG"] = "2000"
+
+    ray.init(address="auto")
+
+    num_samples = 2000
+    trial_length_s = 60
+    sleep_time = 0.2
+
+    min_results_per_second = 1000
+
+    callback = ResultThroughputCallback()
+    start_time = time.monotonic()
+    tune.run(
+        MockTrainable,
+        config={
+            "num_iters": int(trial_length_s / sleep_time),
+            "sleep_time": sleep_time,
+        },
+        num_samples=num_samples,
+        resources_per_trial={"cpu": 0.04},
+        callbacks=[callback],
+        reuse_actors=True,
+        verbose=1)
+    time_taken = time.monotonic() - start_time
+    results_per_second = callback.results_per_second()
+
+    result = {
+        "time_taken": time_taken,
+        "num_results": callback.num_results,
+        "results_per_second": results_per_second,
+        "last_update": time.time()
+    }
+
+    test_output_json = os.environ.get("TEST_OUTPUT_JSON",
+                                      "/tmp/tune_test.json")
+    with open(test_output_json, "wt") as f:
+        json.dump(result, f)
+
+    name = "result throughput many trials"
+    if results_per_second < min_results_per_second:
+        print(f"The {name} test processed {results_per_second:.2f} results "
+              f"per second, but should have processed at least "
+              f"{min_results_per_second:.2f}. Test failed. \n\n"
+              f"--- FAILED: {name.upper()} ::: "
+              f"{results_per_second:.2f} < {min_results_per_second:.2f} ---")
+    else:
+        print(f"The {name} test processed {results_per_second:.2f} results "
+              f"per second. Test successful. \n\n"
+              f"--- PASSED: {name.upper()} ::: "
+              f"{results_per_second:.2f} >= {min_results_per_second:.2f} ---")
+
+
+if __name__ == "__main__":
+    main()
@@ -95,6 +95,10 @@ DEFAULT_CONFIG = with_common_config({
     "replay_buffer_config": {
         "type": "LocalReplayBuffer",
         "capacity": 50000,
+        # Store the timesteps in one preallocated array per column instead
+        # of a list of SampleBatches. This speeds up sampling. Ignored if
+        # `replay_sequence_length` > 1.
+        "columnar_storage": False,
     },
     # Set this to True, if you want the contents of your buffer(s) to be
     # stored in any saved checkpoints as well.
@@ -1977,6 +1977,8 @@ class Trainer(Trainable):
             replay_sequence_length=config.get("replay_sequence_length", 1),
             replay_burn_in=config.get("burn_in", 0),
             replay_zero_init_states=config.get("zero_init_states", True),
+            columnar_storage=replay_buffer_config.get("columnar_storage",
+                                                      False),
             **prio_args)
 
     @DeveloperAPI
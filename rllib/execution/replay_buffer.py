@@ -1,9 +1,10 @@
 import collections
 import logging
+import math
 import numpy as np
 import platform
 import random
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Import ray before psutil will make sure we use psutil's bundled version
 import ray  # noqa F401
@@ -53,18 +54,128 @@ def warn_replay_buffer_size(*, item: SampleBatchType, num_items: int) -> None:
     return warn_replay_capacity(item=item, num_items=num_items)
 
 
+class _ColumnarStorage:
+    """Replay buffer storage keeping one preallocated array per column.
+
+    Used instead of a list of SampleBatches if all items are SampleBatches
+    with the same columns, column shapes and number of timesteps, like the
+    timestep slices added by the LocalReplayBuffer. The arrays are sized
+    from the first item and hold ``num_slots`` items each. New items are
+    written into the rows of their slot, and sampling gathers the rows of
+    all sampled items with one index operation per column instead of
+    concatenating the items.
+
+    Compressed columns (see ``SampleBatch.compress``) hold the compressed
+    timesteps in object arrays and are decompressed after sampling.
+    """
+
+    def __init__(self, item: SampleBatch, num_slots: int):
+        self.item_count = item.count
+        self._num_slots = num_slots
+        self._len = 0
+        # Column -> array of shape [num_slots, item_count, ...].
+        self._columns: Dict[str, np.ndarray] = {}
+        # Column -> dtype of the column in the items.
+        self._dtypes: Dict[str, np.dtype] = {}
+        for key, value in item.items():
+            self._dtypes[key] = value.dtype
+            self._columns[key] = np.empty(
+                (num_slots, ) + value.shape, dtype=self._storage_dtype(value))
+
+    @staticmethod
+    def supports(item: SampleBatchType) -> bool:
+        """Returns whether items like this one can be stored in columns."""
+        return (type(item) is SampleBatch and item.count > 0
+                and SampleBatch.SEQ_LENS not in item and not item.zero_padded
+                and all(
+                    isinstance(value, np.ndarray) and value.ndim > 0
+                    for value in item.values()))
+
+    def fits(self, item: SampleBatchType) -> bool:
+        """Returns whether the item has the layout of the stored items."""
+        if not self.supports(item) or item.count != self.item_count or \
+                len(item.keys()) != len(self._columns):
+            return False
+        for key, value in item.items():
+            column = self._columns.get(key)
+            if column is None or value.shape != column.shape[1:] or \
+                    self._storage_dtype(value) != column.dtype:
+                return False
+        return True
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __getitem__(self, idx: int) -> SampleBatch:
+        return self.gather([idx])
+
+    def __setitem__(self, idx: int, item: SampleBatch) -> None:
+        for key, column in self._columns.items():
+            column[idx] = item[key]
+
+    def append(self, item: SampleBatch) -> None:
+        self[self._len] = item
+        self._len += 1
+
+    def gather(self, idxes: List[int]) -> SampleBatch:
+        """Returns the items at the given indices as one SampleBatch."""
+        idxes = np.asarray(idxes)
+        data = {}
+        for key, column in self._columns.items():
+            # Fancy indexing copies the rows, which are then merged into
+            # the batch dimension without another copy.
+            value = column[idxes].reshape((-1, ) + column.shape[2:])
+            if value.dtype != self._dtypes[key]:
+                # Strings are kept in object arrays, as their lengths vary.
+                value = value.astype(self._dtypes[key].kind)
+            data[key] = value
+        return SampleBatch(data)
+
+    def to_list(self) -> List[SampleBatch]:
+        return [self[idx] for idx in range(self._len)]
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # Only the stored items are serialized.
+        state["_columns"] = {
+            key: column[:self._len]
+            for key, column in self._columns.items()
+        }
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        for key, stored in state["_columns"].items():
+            column = np.empty(
+                (self._num_slots, ) + stored.shape[1:], dtype=stored.dtype)
+            column[:len(stored)] = stored
+            self._columns[key] = column
+
+    @staticmethod
+    def _storage_dtype(value: np.ndarray) -> np.dtype:
+        if value.dtype.kind in "USO":
+            return np.dtype(object)
+        return value.dtype
+
+
 @DeveloperAPI
 class ReplayBuffer:
     @DeveloperAPI
     def __init__(self,
                  capacity: int = 10000,
-                 size: Optional[int] = DEPRECATED_VALUE):
+                 size: Optional[int] = DEPRECATED_VALUE,
+                 columnar: bool = False):
         """Initializes a Replaybuffer instance.
 
         Args:
             capacity (int): Max number of timesteps to store in the FIFO
                 buffer. After reaching this number, older samples will be
                 dropped to make space for new ones.
+            columnar (bool): Whether to store the items in one preallocated
+                array per column, if they all have the same columns and
+                number of timesteps, instead of a list of SampleBatches.
+                This makes sampling much faster. Items of other layouts
+                are stored in a list.
         """
         # Deprecated args.
         if size != DEPRECATED_VALUE:
@@ -72,8 +183,9 @@ class ReplayBuffer:
                 "ReplayBuffer(size)", "ReplayBuffer(capacity)", error=False)
             capacity = size
 
-        # The actual storage (list of SampleBatches).
+        # The actual storage (list of SampleBatches or _ColumnarStorage).
         self._storage = []
+        self._columnar = columnar
 
         self.capacity = capacity
         # The next index to override in the buffer.
@@ -101,6 +213,9 @@ class ReplayBuffer:
         self._num_timesteps_added += item.count
         self._num_timesteps_added_wrap += item.count
 
+        if self._columnar:
+            self._maybe_change_storage(item)
+
         if self._next_idx >= len(self._storage):
             self._storage.append(item)
             self._est_size_bytes += item.size_bytes()
@@ -119,8 +234,50 @@ class ReplayBuffer:
             self._evicted_hit_stats.push(self._hit_count[self._next_idx])
             self._hit_count[self._next_idx] = 0
 
+    def _maybe_change_storage(self, item: SampleBatchType) -> None:
+        """Switches to columnar storage for the first item, and back to a
+        list if the item can't be stored in the columns."""
+        if isinstance(self._storage, _ColumnarStorage):
+            if not self._storage.fits(item):
+                if log_once("replay_columnar_storage_fallback"):
+                    logger.warning(
+                        "Replay buffer item does not match the layout of "
+                        "the columnar storage, falling back to storing "
+                        "a list of items.")
+                self._storage = self._storage.to_list()
+                self._columnar = False
+        elif not self._storage:
+            if _ColumnarStorage.supports(item):
+                # Items are added until their timesteps exceed the capacity.
+                num_slots = int(math.ceil(self.capacity / item.count))
+                self._storage = _ColumnarStorage(item, num_slots)
+            else:
+                self._columnar = False
+
+    def _item_sizes(self,
+                    idxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the number of timesteps of the items at idxes and the
+        number of rows they have once sampled (including zero-padding)."""
+        if isinstance(self._storage, _ColumnarStorage):
+            counts = np.full(len(idxes), self._storage.item_count)
+            return counts, counts
+        counts = np.empty(len(idxes), dtype=np.int64)
+        actual_sizes = np.empty(len(idxes), dtype=np.int64)
+        for i, idx in enumerate(idxes):
+            item = self._storage[idx]
+            counts[i] = actual_sizes[i] = item.count
+            # If zero-padded, count will not be the actual batch size of the
+            # data.
+            if isinstance(item, SampleBatch) and item.zero_padded:
+                actual_sizes[i] = item.max_seq_len
+        return counts, actual_sizes
+
     def _encode_sample(self, idxes: List[int]) -> SampleBatchType:
-        out = SampleBatch.concat_samples([self._storage[i] for i in idxes])
+        if isinstance(self._storage, _ColumnarStorage):
+            out = self._storage.gather(idxes)
+        else:
+            out = SampleBatch.concat_samples(
+                [self._storage[i] for i in idxes])
         out.decompress_if_needed()
         return out
 
@@ -138,8 +295,9 @@ class ReplayBuffer:
             random.randint(0,
                            len(self._storage) - 1) for _ in range(num_items)
         ]
-        self._num_sampled += num_items
-        return self._encode_sample(idxes)
+        batch = self._encode_sample(idxes)
+        self._num_timesteps_sampled += batch.count
+        return batch
 
     @DeveloperAPI
     def stats(self, debug=False) -> dict:
@@ -176,6 +334,7 @@ class ReplayBuffer:
         """
         # The actual storage.
         self._storage = state["_storage"]
+        self._columnar = isinstance(self._storage, _ColumnarStorage)
         self._next_idx = state["_next_idx"]
         # Stats and counts.
         self._num_timesteps_added = state["added_count"]
@@ -191,7 +350,8 @@ class PrioritizedReplayBuffer(ReplayBuffer):
     def __init__(self,
                  capacity: int = 10000,
                  alpha: float = 1.0,
-                 size: Optional[int] = DEPRECATED_VALUE):
+                 size: Optional[int] = DEPRECATED_VALUE,
+                 columnar: bool = False):
         """Initializes a PrioritizedReplayBuffer instance.
 
         Args:
@@ -200,8 +360,11 @@ class PrioritizedReplayBuffer(ReplayBuffer):
                 dropped to make space for new ones.
             alpha (float): How much prioritization is used
                 (0.0=no prioritization, 1.0=full prioritization).
+            columnar (bool): Whether to store the items in one preallocated
+                array per column. See ``ReplayBuffer``.
         """
-        super(PrioritizedReplayBuffer, self).__init__(capacity, size)
+        super(PrioritizedReplayBuffer, self).__init__(
+            capacity, size, columnar=columnar)
         assert alpha > 0
         self._alpha = alpha
 
@@ -224,14 +387,11 @@ class PrioritizedReplayBuffer(ReplayBuffer):
         self._it_sum[idx] = weight**self._alpha
         self._it_min[idx] = weight**self._alpha
 
-    def _sample_proportional(self, num_items: int) -> List[int]:
-        res = []
-        for _ in range(num_items):
-            # TODO(szymon): should we ensure no repeats?
-            mass = random.random() * self._it_sum.sum(0, len(self._storage))
-            idx = self._it_sum.find_prefixsum_idx(mass)
-            res.append(idx)
-        return res
+    def _sample_proportional(self, num_items: int) -> np.ndarray:
+        # TODO(szymon): should we ensure no repeats?
+        masses = np.random.random(num_items) * self._it_sum.sum(
+            0, len(self._storage))
+        return self._it_sum.find_prefixsum_idx(masses)
 
     @DeveloperAPI
     @override(ReplayBuffer)
@@ -252,31 +412,19 @@ class PrioritizedReplayBuffer(ReplayBuffer):
 
         idxes = self._sample_proportional(num_items)
 
-        weights = []
-        batch_indexes = []
         p_min = self._it_min.min() / self._it_sum.sum()
         max_weight = (p_min * len(self._storage))**(-beta)
 
-        for idx in idxes:
-            p_sample = self._it_sum[idx] / self._it_sum.sum()
-            weight = (p_sample * len(self._storage))**(-beta)
-            count = self._storage[idx].count
-            # If zero-padded, count will not be the actual batch size of the
-            # data.
-            if isinstance(self._storage[idx], SampleBatch) and \
-                    self._storage[idx].zero_padded:
-                actual_size = self._storage[idx].max_seq_len
-            else:
-                actual_size = count
-            weights.extend([weight / max_weight] * actual_size)
-            batch_indexes.extend([idx] * actual_size)
-            self._num_timesteps_sampled += count
+        p_samples = self._it_sum.get_many(idxes) / self._it_sum.sum()
+        weights = (p_samples * len(self._storage))**(-beta) / max_weight
+        counts, actual_sizes = self._item_sizes(idxes)
+        self._num_timesteps_sampled += int(counts.sum())
         batch = self._encode_sample(idxes)
 
         # Note: prioritization is not supported in lockstep replay mode.
         if isinstance(batch, SampleBatch):
-            batch["weights"] = np.array(weights)
-            batch["batch_indexes"] = np.array(batch_indexes)
+            batch["weights"] = np.repeat(weights, actual_sizes)
+            batch["batch_indexes"] = np.repeat(idxes, actual_sizes)
 
         return batch
 
@@ -302,15 +450,19 @@ class PrioritizedReplayBuffer(ReplayBuffer):
             "ERROR: `idxes` is not a list or np.ndarray, but " \
             "{}!".format(type(idxes).__name__)
         assert len(idxes) == len(priorities)
-        for idx, priority in zip(idxes, priorities):
-            assert priority > 0
-            assert 0 <= idx < len(self._storage)
-            delta = priority**self._alpha - self._it_sum[idx]
+        if len(idxes) == 0:
+            return
+        idxes = np.asarray(idxes, dtype=np.int64)
+        priorities = np.asarray(priorities, dtype=np.float64)
+        assert np.all(priorities > 0)
+        assert np.all((0 <= idxes) & (idxes < len(self._storage)))
+        new_priorities = priorities**self._alpha
+        for delta in new_priorities - self._it_sum.get_many(idxes):
             self._prio_change_stats.push(delta)
-            self._it_sum[idx] = priority**self._alpha
-            self._it_min[idx] = priority**self._alpha
+        self._it_sum.set_many(idxes, new_priorities)
+        self._it_min.set_many(idxes, new_priorities)
 
-            self._max_priority = max(self._max_priority, priority)
+        self._max_priority = max(self._max_priority, float(priorities.max()))
 
     @DeveloperAPI
     @override(ReplayBuffer)
@@ -376,6 +528,7 @@ class LocalReplayBuffer(ParallelIteratorWorker):
             replay_sequence_length: int = 1,
             replay_burn_in: int = 0,
             replay_zero_init_states: bool = True,
+            columnar_storage: bool = False,
             buffer_size=DEPRECATED_VALUE,
     ):
         """Initializes a LocalReplayBuffer instance.
@@ -412,6 +565,11 @@ class LocalReplayBuffer(ParallelIteratorWorker):
             replay_zero_init_states (bool): Whether the initial states in the
                 buffer (if replay_sequence_length > 0) are alwayas 0.0 or
                 should be updated with the previous train_batch state outputs.
+            columnar_storage (bool): Whether the buffers store the timesteps
+                in one preallocated array per column instead of a list of
+                SampleBatches, to speed up sampling. Only used if
+                `replay_sequence_length` is 1 and `replay_mode` is
+                "independent".
         """
         # Deprecated args.
         if buffer_size != DEPRECATED_VALUE:
@@ -447,9 +605,14 @@ class LocalReplayBuffer(ParallelIteratorWorker):
 
         ParallelIteratorWorker.__init__(self, gen_replay, False)
 
+        columnar = columnar_storage and replay_mode == "independent" and \
+            replay_sequence_length == 1
+
         def new_buffer():
             return PrioritizedReplayBuffer(
-                self.capacity, alpha=prioritized_replay_alpha)
+                self.capacity,
+                alpha=prioritized_replay_alpha,
+                columnar=columnar)
 
         self.replay_buffers = collections.defaultdict(new_buffer)
 
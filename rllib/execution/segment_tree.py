@@ -1,5 +1,9 @@
+import numpy as np
 import operator
-from typing import Any, Optional
+from typing import Any, Optional, Union
+
+# Vectorized versions of the supported reduction operations.
+_UFUNCS = {operator.add: np.add, min: np.minimum, max: np.maximum}
 
 
 class SegmentTree:
@@ -15,8 +19,8 @@ class SegmentTree:
          over some specified contiguous subsequence of items in the array.
          Operation could be e.g. min/max/sum.
 
-    The data is stored in a list, where the length is 2 * capacity.
-    The second half of the list stores the actual values for each index, so if
+    The data is stored in a numpy array, where the length is 2 * capacity.
+    The second half of the array stores the actual values for each index, so if
     capacity=8, values are stored at indices 8 to 15. The first half of the
     array contains the reduced-values of the different (binary divided)
     segments, e.g. (capacity=4):
@@ -27,6 +31,10 @@ class SegmentTree:
     4-7: values of the tree.
     NOTE that the values of the tree are accessed by indices starting at 0, so
     `tree[0]` accesses `internal_array[4]` in the above example.
+
+    Many values can be read and written at once with `get_many` and
+    `set_many`, which update the reduced-values level by level instead of
+    walking up the tree once per value.
     """
 
     def __init__(self,
@@ -53,8 +61,12 @@ class SegmentTree:
             neutral_element = 0.0 if operation is operator.add else \
                 float("-inf") if operation is max else float("inf")
         self.neutral_element = neutral_element
-        self.value = [self.neutral_element for _ in range(2 * capacity)]
+        self.value = np.full(
+            2 * capacity, self.neutral_element, dtype=np.float64)
         self.operation = operation
+        # None for operations that can't be applied to arrays, in which case
+        # `set_many` sets the values one by one.
+        self._ufunc = _UFUNCS.get(operation)
 
     def reduce(self, start: int = 0, end: Optional[int] = None) -> Any:
         """Applies `self.operation` to subsequence of our values.
@@ -77,6 +89,10 @@ class SegmentTree:
         elif end < 0:
             end += self.capacity
 
+        # The root holds the reduced-value over all elements.
+        if start == 0 and end == self.capacity:
+            return self.value[1]
+
         # Init result with neutral element.
         result = self.neutral_element
         # Map start/end to our actual index space (second half of array).
@@ -155,12 +171,58 @@ class SegmentTree:
         assert 0 <= idx < self.capacity
         return self.value[idx + self.capacity]
 
+    def set_many(self, idxes: np.ndarray, values: np.ndarray) -> None:
+        """Inserts/overwrites many values in/into the tree.
+
+        If an index is given more than once, its last value is inserted,
+        as if the values were set one after the other.
+
+        Args:
+            idxes (np.ndarray): The indices to insert to. Must be in
+                [0, `self.capacity`[
+            values (np.ndarray): The values to insert, one per index.
+        """
+        idxes = np.asarray(idxes, dtype=np.int64).reshape(-1)
+        values = np.broadcast_to(
+            np.asarray(values, dtype=np.float64), idxes.shape)
+        if idxes.size == 0:
+            return
+        assert 0 <= idxes.min() and idxes.max() < self.capacity, \
+            f"idxes={idxes} capacity={self.capacity}"
+        if self._ufunc is None:
+            for idx, val in zip(idxes, values):
+                self[idx] = val
+            return
+
+        # Keep the last value of each index (np.unique returns the first
+        # occurrence of each index in the reversed arrays), sorted by index.
+        idxes, last = np.unique(idxes[::-1], return_index=True)
+        idxes += self.capacity
+        self.value[idxes] = values[::-1][last]
+
+        # Recalculate the affected reduction values, one level at a time.
+        # All indices are on the same level, so they reach the root together.
+        while idxes[0] > 1:
+            idxes = idxes >> 1
+            # Siblings have the same parent, which is only updated once.
+            idxes = idxes[np.append(True, idxes[1:] != idxes[:-1])]
+            self.value[idxes] = self._ufunc(self.value[2 * idxes],
+                                            self.value[2 * idxes + 1])
+
+    def get_many(self, idxes: np.ndarray) -> np.ndarray:
+        """Returns the values at many indices."""
+        idxes = np.asarray(idxes, dtype=np.int64)
+        assert idxes.size == 0 or (0 <= idxes.min()
+                                   and idxes.max() < self.capacity)
+        return self.value[idxes + self.capacity]
+
     def get_state(self):
         return self.value
 
     def set_state(self, state):
         assert len(state) == self.capacity * 2
-        self.value = state
+        # States saved before the tree was stored in an array are lists.
+        self.value = np.array(state, dtype=np.float64)
 
 
 class SumSegmentTree(SegmentTree):
@@ -174,15 +236,22 @@ class SumSegmentTree(SegmentTree):
         """Returns the sum over a sub-segment of the tree."""
         return self.reduce(start, end)
 
-    def find_prefixsum_idx(self, prefixsum: float) -> int:
+    def find_prefixsum_idx(self, prefixsum: Union[float, np.ndarray]
+                           ) -> Union[int, np.ndarray]:
         """Finds highest i, for which: sum(arr[0]+..+arr[i - i]) <= prefixsum.
 
         Args:
-            prefixsum (float): `prefixsum` upper bound in above constraint.
+            prefixsum (Union[float, np.ndarray]): `prefixsum` upper bound in
+                above constraint. If an array is given, the index is found
+                for each of its values at once.
 
         Returns:
-            int: Largest possible index (i) satisfying above constraint.
+            Union[int, np.ndarray]: Largest possible index (i) satisfying
+                above constraint, or an array of them.
         """
+        if isinstance(prefixsum, (np.ndarray, list, tuple)):
+            return self._find_prefixsum_idxes(prefixsum)
+
         assert 0 <= prefixsum <= self.sum() + 1e-5
         # Global sum node.
         idx = 1
@@ -197,6 +266,21 @@ class SumSegmentTree(SegmentTree):
                 idx = update_idx + 1
         return idx - self.capacity
 
+    def _find_prefixsum_idxes(self, prefixsums: np.ndarray) -> np.ndarray:
+        prefixsums = np.array(prefixsums, dtype=np.float64)
+        assert prefixsums.size == 0 or (
+            0 <= prefixsums.min()
+            and prefixsums.max() <= self.sum() + 1e-5)
+        # Walk down all paths at once, one level at a time.
+        idxes = np.ones(prefixsums.shape, dtype=np.int64)
+        for _ in range(self.capacity.bit_length() - 1):
+            update_idxes = 2 * idxes
+            left_values = self.value[update_idxes]
+            go_right = left_values <= prefixsums
+            prefixsums -= np.where(go_right, left_values, 0.0)
+            idxes = update_idxes + go_right
+        return idxes - self.capacity
+
 
 class MinSegmentTree(SegmentTree):
     def __init__(self, capacity: int):
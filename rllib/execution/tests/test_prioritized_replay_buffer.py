@@ -1,5 +1,6 @@
 from collections import Counter
 import numpy as np
+import time
 import unittest
 
 from ray.rllib.execution.replay_buffer import PrioritizedReplayBuffer
@@ -282,6 +283,48 @@ class TestPrioritizedReplayBuffer(unittest.TestCase):
             counts[i] += 1
         self.assertTrue(any(100 < i < 300 for i in counts.values()))
 
+    def test_sample_weights(self):
+        memory = PrioritizedReplayBuffer(self.capacity, alpha=self.alpha)
+        priorities = [1.0, 2.0, 4.0, 0.5]
+        for priority in priorities:
+            memory.add(self._generate_data(), weight=priority)
+
+        batch = memory.sample(100, beta=0.5)
+        indices = batch["batch_indexes"]
+        p_samples = np.array(priorities)[indices] / sum(priorities)
+        p_min = min(priorities) / sum(priorities)
+        check(batch["weights"], (p_samples / p_min)**-0.5)
+        self.assertEqual(memory.stats()["sampled_count"], 100)
+
+        # Updating the same index twice keeps the last priority.
+        memory.update_priorities(
+            np.array([1, 3, 1]), np.array([0.1, 1.0, 8.0]))
+        self.assertEqual(memory._max_priority, 8.0)
+        check(memory._it_sum.get_many([0, 1, 2, 3]), [1.0, 8.0, 4.0, 1.0])
+        check(memory._it_sum.sum(), 14.0)
+        check(memory._it_min.min(), 1.0)
+
+    # Samples 512-item batches from a buffer with a capacity of 1M
+    # timesteps and updates their priorities, like DQN does.
+    def test_sample_performance(self):
+        memory = PrioritizedReplayBuffer(2**20, alpha=0.6, columnar=True)
+        for _ in range(10000):
+            memory.add(self._generate_data(), weight=None)
+        memory.update_priorities(
+            np.arange(10000), np.random.random(10000) + 0.01)
+
+        start = time.time()
+        count = 0
+        while time.time() - start < 1:
+            batch = memory.sample(512, beta=0.4)
+            memory.update_priorities(batch["batch_indexes"],
+                                     np.random.random(512) + 0.01)
+            count += 1
+        print()
+        print("Sampled batches per second {}".format(
+            count / (time.time() - start)))
+        print()
+
 
 if __name__ == "__main__":
     import pytest
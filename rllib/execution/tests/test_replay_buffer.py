@@ -0,0 +1,85 @@
+import numpy as np
+import pickle
+import unittest
+
+from ray.rllib.execution.replay_buffer import PrioritizedReplayBuffer, \
+    ReplayBuffer, _ColumnarStorage
+from ray.rllib.policy.sample_batch import SampleBatch
+from ray.rllib.utils.test_utils import check
+
+
+class TestReplayBuffer(unittest.TestCase):
+    """
+    Tests the columnar storage of the ReplayBuffer.
+    """
+
+    def _generate_data(self, i):
+        return SampleBatch({
+            "obs": [np.full((4, ), i, dtype=np.float32)],
+            "actions": [i % 2],
+            "rewards": [float(i)],
+            "new_obs": [np.full((4, ), i + 1, dtype=np.float32)],
+            "dones": [i % 3 == 0],
+        })
+
+    def test_columnar_storage(self):
+        memory = ReplayBuffer(capacity=5, columnar=True)
+        list_memory = ReplayBuffer(capacity=5)
+        for i in range(8):
+            memory.add(self._generate_data(i), weight=None)
+            list_memory.add(self._generate_data(i), weight=None)
+        self.assertIsInstance(memory._storage, _ColumnarStorage)
+        self.assertEqual(len(memory), 5)
+        self.assertEqual(memory._next_idx, 3)
+
+        # The columns hold the same items as the list.
+        idxes = [4, 0, 2, 2]
+        batch = memory._encode_sample(idxes)
+        expected = list_memory._encode_sample(idxes)
+        self.assertEqual(batch.count, 4)
+        for key in expected.keys():
+            check(batch[key], expected[key])
+            self.assertEqual(batch[key].dtype, expected[key].dtype)
+        check(batch["rewards"], [4.0, 5.0, 7.0, 7.0])
+
+        # Test get_state/set_state. Only the stored items are serialized.
+        new_memory = ReplayBuffer(capacity=5, columnar=True)
+        new_memory.set_state(pickle.loads(pickle.dumps(memory.get_state())))
+        self.assertEqual(len(new_memory), 5)
+        check(new_memory._encode_sample(idxes)["obs"], batch["obs"])
+        new_memory.add(self._generate_data(8), weight=None)
+        check(new_memory._encode_sample([3])["rewards"], [8.0])
+
+    def test_columnar_storage_compressed(self):
+        memory = PrioritizedReplayBuffer(capacity=10, columnar=True)
+        for i in range(10):
+            data = self._generate_data(i)
+            data.compress()
+            memory.add(data, weight=None)
+        self.assertIsInstance(memory._storage, _ColumnarStorage)
+
+        batch = memory.sample(16, beta=0.5)
+        self.assertEqual(batch.count, 16)
+        self.assertEqual(len(batch["weights"]), 16)
+        check(batch["obs"][:, 0], batch["rewards"])
+        check(batch["new_obs"][:, 0], batch["rewards"] + 1)
+
+    def test_columnar_storage_fallback(self):
+        memory = ReplayBuffer(capacity=10, columnar=True)
+        for i in range(3):
+            memory.add(self._generate_data(i), weight=None)
+        self.assertIsInstance(memory._storage, _ColumnarStorage)
+
+        # Items with other columns are stored in a list.
+        data = self._generate_data(3)
+        data["infos"] = np.array([{}])
+        memory.add(data, weight=None)
+        self.assertIsInstance(memory._storage, list)
+        self.assertEqual(len(memory), 4)
+        check(memory._encode_sample([0, 2])["rewards"], [0.0, 2.0])
+
+
+if __name__ == "__main__":
+    import pytest
+    import sys
+    sys.exit(pytest.main(["-v", __file__]))
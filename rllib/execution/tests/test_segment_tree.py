@@ -2,6 +2,7 @@ import numpy as np
 import unittest
 
 from ray.rllib.execution.segment_tree import SumSegmentTree, MinSegmentTree
+from ray.rllib.utils.test_utils import check
 
 
 class TestSegmentTree(unittest.TestCase):
@@ -94,6 +95,50 @@ class TestSegmentTree(unittest.TestCase):
         assert np.isclose(tree.min(2, -1), 4.0)
         assert np.isclose(tree.min(3, 4), 3.0)
 
+    def test_set_many(self):
+        tree = SumSegmentTree(8)
+        min_tree = MinSegmentTree(8)
+        expected = SumSegmentTree(8)
+        expected_min = MinSegmentTree(8)
+
+        idxes = np.array([5, 0, 2, 5, 7, 3])
+        values = np.array([1.0, 0.5, 2.0, 3.0, 0.25, 1.5])
+        tree.set_many(idxes, values)
+        min_tree.set_many(idxes, values)
+        for idx, value in zip(idxes, values):
+            expected[idx] = value
+            expected_min[idx] = value
+
+        # The last value of index 5 is kept.
+        check(tree.get_many([5, 0, 1]), [3.0, 0.5, 0.0])
+        check(tree.value, expected.value)
+        check(min_tree.value, expected_min.value)
+        assert np.isclose(tree.sum(), 7.25)
+        assert np.isclose(tree.sum(2, 6), 6.5)
+        assert np.isclose(min_tree.min(), 0.25)
+        assert np.isclose(min_tree.min(0, 4), 0.5)
+
+        # Nothing to set.
+        tree.set_many([], [])
+        check(tree.value, expected.value)
+
+    def test_prefixsum_idx_batched(self):
+        tree = SumSegmentTree(4)
+
+        tree.set_many([0, 1, 2, 3], [0.5, 1.0, 1.0, 3.0])
+
+        prefixsums = np.array([0.0, 0.55, 0.99, 1.51, 3.0, 5.5])
+        idxes = tree.find_prefixsum_idx(prefixsums)
+        check(idxes, [0, 1, 1, 2, 3, 3])
+        check(idxes, [tree.find_prefixsum_idx(p) for p in prefixsums])
+
+        tree = SumSegmentTree(1024)
+        tree.set_many(np.arange(1000), np.random.random(1000))
+        prefixsums = np.random.random(500) * tree.sum()
+        check(
+            tree.find_prefixsum_idx(prefixsums),
+            [tree.find_prefixsum_idx(p) for p in prefixsums])
+
 
 if __name__ == "__main__":
     import pytest